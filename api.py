@@ -1,80 +1,422 @@
 from aiohttp import web
 import os
 import json
+import asyncio
 import folder_paths
-from PIL import Image
 import server # Import server for node_info
 import uuid # For generating unique filenames
+import hashlib
+import inspect
+import time
+from urllib.parse import urlencode
+
+from .gallery_index import gallery_index, GALLERY_EXTENSIONS
+from .metadata_index import metadata_index
+from .gallery_export import folder_entries, write_zip
+from .uploads import (finalize_upload, normalize_upload, normalize_pool, enforce_upload_budget, upload_extension,
+                      partial_uploads, UploadError, UPLOAD_CHUNK_SIZE, TEMP_PREFIX)
+from .choice_registry import choice_registry
+from .workflow_compiler import load_compiled_workflow, WorkflowCompileError, FILE_INPUT_FIELDS
+from .sweep import expand_sweep, SweepError
+from .result_events import result_events
+from . import metrics
+from .media_cache import media_cache, THUMBNAIL_EXTENSIONS, THUMBNAIL_FORMATS, VIDEO_EXTENSIONS, VIDEO_PREVIEW_KINDS
+
+# Width of the thumbnails linked from gallery listings
+DEFAULT_THUMBNAIL_WIDTH = 384
+
+# Outputs are written once, so a media URL that names the file's version can be cached for good
+MEDIA_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Set explicitly, as older Pythons' mimetypes miss some of these
+MEDIA_CONTENT_TYPES = {
+    '.png': 'image/png', '.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.gif': 'image/gif',
+    '.webp': 'image/webp', '.avif': 'image/avif', '.mp4': 'video/mp4', '.webm': 'video/webm',
+    '.mp3': 'audio/mpeg', '.wav': 'audio/wav', '.flac': 'audio/flac',
+}
+
+# Optional cap on the total size of uploaded images kept in the input directory
+UPLOAD_MAX_BYTES = int(float(os.environ.get("COZYGEN_UPLOAD_MAX_MB", "0")) * 1024 * 1024)
+
+# Largest number of prompts a single /cozygen/sweep request may queue
+SWEEP_MAX_VARIANTS = int(os.environ.get("COZYGEN_SWEEP_MAX_VARIANTS", "1000"))
 
 async def get_hello(request: web.Request) -> web.Response:
     return web.json_response({"status": "success", "message": "Hello from the CozyGen API!"})
 
-async def get_gallery_files(request: web.Request) -> web.Response:
-    subfolder = request.rel_url.query.get('subfolder', '')
+def _resolve_safe_path(base_directory, relative_path):
+    # Security: Prevent directory traversal
+    base_directory = os.path.normpath(base_directory)
+    target_path = os.path.normpath(os.path.join(base_directory, relative_path))
+    if os.path.commonpath([base_directory, target_path]) != base_directory:
+        return None
+    return target_path
+
+def _thumbnail_url(filename, subfolder, file_type, width=DEFAULT_THUMBNAIL_WIDTH):
+    return "/cozygen/thumb?" + urlencode({"filename": filename, "subfolder": subfolder, "type": file_type, "width": width})
+
+def _video_preview_url(filename, subfolder, file_type, kind):
+    return "/cozygen/video_preview?" + urlencode({"filename": filename, "subfolder": subfolder, "type": file_type, "kind": kind})
+
+def _media_url(filename, subfolder, file_type, mtime_ns=None):
+    query = {"filename": filename, "subfolder": subfolder, "type": file_type}
+    if mtime_ns is not None:
+        query["v"] = f"{mtime_ns:x}"
+    return "/cozygen/media?" + urlencode(query)
+
+def _gallery_item(filename, subfolder, mtime_ns=None):
+    item = {
+        "filename": filename,
+        "type": "output",
+        "subfolder": subfolder,
+        "url": _media_url(filename, subfolder, "output", mtime_ns),
+    }
+    if filename.lower().endswith(VIDEO_EXTENSIONS):
+        item["poster"] = _video_preview_url(filename, subfolder, "output", "poster")
+        item["preview"] = _video_preview_url(filename, subfolder, "output", "preview")
+    elif filename.lower().endswith(THUMBNAIL_EXTENSIONS):
+        item["thumbnail"] = _thumbnail_url(filename, subfolder, "output")
+    return item
+
+def _parse_paging(request):
+    # Returns (page, per_page), or None if they are invalid
     try:
         page = int(request.rel_url.query.get('page', '1'))
         per_page = int(request.rel_url.query.get('per_page', '20'))
     except ValueError:
+        return None
+    if page < 1 or per_page < 1:
+        return None
+    return page, per_page
+
+async def get_gallery_files(request: web.Request) -> web.Response:
+    subfolder = request.rel_url.query.get('subfolder', '')
+    cursor = request.rel_url.query.get('cursor')
+    paging = _parse_paging(request)
+    if paging is None:
         return web.json_response({"error": "Invalid page or per_page parameter"}, status=400)
+    page, per_page = paging
 
     output_directory = folder_paths.get_output_directory()
 
-    # Security: Prevent directory traversal
-    gallery_path = os.path.normpath(os.path.join(output_directory, subfolder))
-    if not gallery_path.startswith(output_directory):
+    gallery_path = _resolve_safe_path(output_directory, subfolder)
+    if gallery_path is None:
         return web.json_response({"error": "Unauthorized path"}, status=403)
 
     if not os.path.exists(gallery_path) or not os.path.isdir(gallery_path):
         return web.json_response({"error": "Gallery directory not found"}, status=404)
 
-    items = os.listdir(gallery_path)
-    gallery_items = []
+    # The index is kept sorted (directories first, then newest first), so a page
+    # is a slice of it. Scans of unindexed or changed folders run off the event loop.
+    started = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    if cursor:
+        try:
+            entries, total_items, next_cursor = await loop.run_in_executor(
+                None, gallery_index.page_after, gallery_path, cursor, per_page)
+        except ValueError as e:
+            return web.json_response({"error": str(e)}, status=400)
+    else:
+        entries, total_items, next_cursor = await loop.run_in_executor(
+            None, gallery_index.page, gallery_path, (page - 1) * per_page, per_page)
 
-    for item_name in items:
-        item_path = os.path.join(gallery_path, item_name)
-        
-        if os.path.isdir(item_path):
-            mod_time = os.path.getmtime(item_path)
-            gallery_items.append({
+    paginated_items = []
+    for item_name, is_dir, mtime_ns in entries:
+        if is_dir:
+            paginated_items.append({
                 "filename": item_name,
                 "type": "directory",
                 "subfolder": os.path.join(subfolder, item_name),
-                "mod_time": mod_time
             })
-        elif item_name.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp4', '.webm', '.mp3', '.wav', '.flac')):
-            mod_time = os.path.getmtime(item_path)
+        else:
+            paginated_items.append(_gallery_item(item_name, subfolder, mtime_ns))
 
-            gallery_items.append({
-                "filename": item_name,
-                "type": "output",
-                "subfolder": subfolder,
-                "mod_time": mod_time
-            })
-
-    # Sort items: directories first, then by modification time
-    gallery_items.sort(key=lambda x: (x['type'] == 'directory', x.get('mod_time', 0)), reverse=True)
-
-    # Pagination
-    total_items = len(gallery_items)
     total_pages = (total_items + per_page - 1) // per_page
-    start_index = (page - 1) * per_page
-    end_index = start_index + per_page
-    paginated_items = gallery_items[start_index:end_index]
-
-    # Remove mod_time before sending
-    for item in paginated_items:
-        if 'mod_time' in item:
-            del item['mod_time']
+    metrics.gallery_items_listed.inc(len(paginated_items))
+    metrics.gallery_request_seconds.observe(time.perf_counter() - started)
 
     return web.json_response({
         "items": paginated_items,
         "page": page,
         "per_page": per_page,
         "total_pages": total_pages,
-        "total_items": total_items
+        "total_items": total_items,
+        "next_cursor": next_cursor
+    })
+
+async def get_gallery_timeline(request: web.Request) -> web.Response:
+    # ?subfolder=&per_page=&cursor= : the files of the whole tree under subfolder, newest first
+    subfolder = request.rel_url.query.get('subfolder', '')
+    cursor = request.rel_url.query.get('cursor') or None
+    paging = _parse_paging(request)
+    if paging is None:
+        return web.json_response({"error": "Invalid page or per_page parameter"}, status=400)
+    _, per_page = paging
+
+    timeline_path = _resolve_safe_path(folder_paths.get_output_directory(), subfolder)
+    if timeline_path is None:
+        return web.json_response({"error": "Unauthorized path"}, status=403)
+    if not os.path.isdir(timeline_path):
+        return web.json_response({"error": "Gallery directory not found"}, status=404)
+
+    started = time.perf_counter()
+    try:
+        entries, total_items, next_cursor = await asyncio.get_running_loop().run_in_executor(
+            None, gallery_index.timeline, timeline_path, per_page, cursor)
+    except ValueError as e:
+        return web.json_response({"error": str(e)}, status=400)
+
+    items = []
+    for relative_folder, name, mtime_ns in entries:
+        item = _gallery_item(name, os.path.join(subfolder, relative_folder) if relative_folder else subfolder, mtime_ns)
+        item["mtime"] = mtime_ns / 1e9
+        items.append(item)
+    metrics.gallery_items_listed.inc(len(items))
+    metrics.gallery_request_seconds.observe(time.perf_counter() - started)
+
+    return web.json_response({
+        "items": items,
+        "per_page": per_page,
+        "total_items": total_items,
+        "next_cursor": next_cursor,
+    })
+
+async def search_gallery(request: web.Request) -> web.Response:
+    # ?q=<words>&seed=<int>&model=<substring>&param.<param_name>=<value>&subfolder=&page=&per_page=
+    if not metadata_index.enabled:
+        return web.json_response({"error": "The gallery search index is disabled"}, status=404)
+    query = request.rel_url.query
+    paging = _parse_paging(request)
+    if paging is None:
+        return web.json_response({"error": "Invalid page or per_page parameter"}, status=400)
+    page, per_page = paging
+    seed = query.get('seed') or None
+    if seed is not None:
+        try:
+            seed = int(seed)
+        except ValueError:
+            return web.json_response({"error": "Invalid seed parameter"}, status=400)
+    subfolder = query.get('subfolder', '')
+    if _resolve_safe_path(folder_paths.get_output_directory(), subfolder) is None:
+        return web.json_response({"error": "Unauthorized path"}, status=403)
+    params = {key[len('param.'):]: value for key, value in query.items() if key.startswith('param.')}
+
+    # SQLite calls block, so they run off the event loop; no image file is opened
+    started = time.perf_counter()
+    def search():
+        results, total_items = metadata_index.search(query.get('q', ''), seed, query.get('model'),
+                                                     params, subfolder, (page - 1) * per_page, per_page)
+        return results, total_items, metadata_index.stats()
+    results, total_items, index_stats = await asyncio.get_running_loop().run_in_executor(None, search)
+
+    items = []
+    for result in results:
+        item = _gallery_item(result["filename"], result["subfolder"], result["mtime_ns"])
+        item["mtime"] = result["mtime"]
+        item["metadata"] = {"seeds": result["seeds"], "models": result["models"], "params": result["params"]}
+        items.append(item)
+    metrics.search_request_seconds.observe(time.perf_counter() - started)
+
+    return web.json_response({
+        "items": items,
+        "page": page,
+        "per_page": per_page,
+        "total_pages": (total_items + per_page - 1) // per_page,
+        "total_items": total_items,
+        "index": index_stats,
+    })
+
+def _export_filename(subfolder):
+    name = os.path.basename(os.path.normpath(subfolder)) if subfolder else "gallery"
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in name) + ".zip"
+
+async def export_gallery(request: web.Request) -> web.StreamResponse:
+    # GET ?subfolder=&recursive=1 exports a folder. POST exports a selection:
+    # JSON {"subfolder": "", "files": ["a.png", "sub/b.mp4"]}, or the same as
+    # form fields (files repeated), so a plain form can start a download.
+    if request.method == 'POST':
+        if request.content_type == 'application/json':
+            try:
+                data = await request.json()
+                subfolder = str(data.get('subfolder', ''))
+                files = [str(f) for f in data.get('files', [])]
+            except (ValueError, AttributeError, TypeError):
+                return web.json_response({"error": "Invalid JSON body"}, status=400)
+        else:
+            form = await request.post()
+            subfolder = form.get('subfolder', '')
+            files = form.getall('files', [])
+        if not files:
+            return web.json_response({"error": "No files selected"}, status=400)
+    else:
+        subfolder = request.rel_url.query.get('subfolder', '')
+        recursive = request.rel_url.query.get('recursive', '0').lower() in ('1', 'true', 'yes')
+        files = None
+
+    export_path = _resolve_safe_path(folder_paths.get_output_directory(), subfolder)
+    if export_path is None:
+        return web.json_response({"error": "Unauthorized path"}, status=403)
+    if not os.path.isdir(export_path):
+        return web.json_response({"error": "Gallery directory not found"}, status=404)
+
+    if files is None:
+        entries = folder_entries(export_path, recursive)
+    else:
+        # A selection is checked up front, so a bad name is an error rather than a short archive
+        entries = []
+        for name in dict.fromkeys(files):
+            path = _resolve_safe_path(export_path, name)
+            if path is None:
+                return web.json_response({"error": "Unauthorized path"}, status=403)
+            if not name.lower().endswith(GALLERY_EXTENSIONS) or not os.path.isfile(path):
+                return web.json_response({"error": f"File not found: {name}"}, status=404)
+            entries.append((path, os.path.relpath(path, export_path).replace(os.sep, "/")))
+
+    response = web.StreamResponse(headers={
+        "Content-Type": "application/zip",
+        "Content-Disposition": f'attachment; filename="{_export_filename(subfolder)}"',
+        "Cache-Control": "no-store",
+    })
+    await response.prepare(request)
+    try:
+        size = await write_zip(response, entries)
+    except ConnectionResetError:
+        # The client went away; nothing is left to send it
+        metrics.gallery_exports.labels("aborted").inc()
+        return response
+    except asyncio.CancelledError:
+        metrics.gallery_exports.labels("aborted").inc()
+        raise
+    except Exception:
+        metrics.gallery_exports.labels("failed").inc()
+        raise
+    metrics.gallery_export_bytes.inc(size)
+    metrics.gallery_exports.labels("complete").inc()
+    await response.write_eof()
+    return response
+
+def _resolve_media_source(request, extensions):
+    # Returns (source_path, None) or (None, error_response) for filename/subfolder/type queries
+    filename = request.rel_url.query.get('filename', '')
+    subfolder = request.rel_url.query.get('subfolder', '')
+    file_type = request.rel_url.query.get('type', 'output')
+
+    if file_type == 'output':
+        base_directory = folder_paths.get_output_directory()
+    elif file_type == 'input':
+        base_directory = folder_paths.get_input_directory()
+    else:
+        return None, web.json_response({"error": f"Invalid type: {file_type}"}, status=400)
+
+    source_path = _resolve_safe_path(base_directory, os.path.join(subfolder, filename))
+    if source_path is None:
+        return None, web.json_response({"error": "Unauthorized path"}, status=403)
+    if not filename.lower().endswith(extensions) or not os.path.isfile(source_path):
+        return None, web.json_response({"error": "File not found"}, status=404)
+    return source_path, None
+
+async def get_media(request: web.Request) -> web.StreamResponse:
+    # ?filename=&subfolder=&type=output|input&v=<mtime_ns in hex, as in gallery item urls>
+    source_path, error_response = _resolve_media_source(request, GALLERY_EXTENSIONS)
+    if error_response is not None:
+        return error_response
+
+    # FileResponse sends the file with sendfile, answers Range requests with 206
+    # and derives its ETag from the file's mtime and size, answering a matching
+    # If-None-Match with 304. Only a URL that names the current version can be
+    # cached without revalidation; a file rewritten in place gets a new version.
+    try:
+        mtime_ns = os.stat(source_path).st_mtime_ns
+    except FileNotFoundError:
+        return web.json_response({"error": "File not found"}, status=404)
+    versioned = request.rel_url.query.get('v') == f"{mtime_ns:x}"
+    extension = os.path.splitext(source_path)[1].lower()
+    return web.FileResponse(source_path, headers={
+        "Content-Type": MEDIA_CONTENT_TYPES[extension],
+        "Cache-Control": MEDIA_IMMUTABLE_CACHE_CONTROL if versioned else "no-cache",
+    })
+
+async def _cached_media(lookup, *args):
+    # The cache lookup stats the source and touches the cache directory, so it
+    # runs off the event loop too; it hands back a future for the render job.
+    future = await asyncio.get_running_loop().run_in_executor(None, lookup, *args)
+    return await asyncio.wrap_future(future)
+
+async def get_thumbnail(request: web.Request) -> web.Response:
+    fmt = request.rel_url.query.get('format', 'webp')
+    try:
+        width = int(request.rel_url.query.get('width', str(DEFAULT_THUMBNAIL_WIDTH)))
+    except ValueError:
+        return web.json_response({"error": "Invalid width parameter"}, status=400)
+    if fmt not in THUMBNAIL_FORMATS:
+        return web.json_response({"error": f"Invalid format: {fmt}"}, status=400)
+    if width < 1:
+        return web.json_response({"error": "Invalid width parameter"}, status=400)
+
+    source_path, error_response = _resolve_media_source(request, THUMBNAIL_EXTENSIONS)
+    if error_response is not None:
+        return error_response
+
+    from PIL import Image
+    try:
+        thumbnail_path = await _cached_media(media_cache.thumbnail, source_path, width, fmt)
+    except (OSError, Image.DecompressionBombError) as e:
+        return web.json_response({"error": f"Could not create thumbnail: {e}"}, status=500)
+
+    return web.FileResponse(thumbnail_path, headers={
+        "Content-Type": THUMBNAIL_FORMATS[fmt][1],
+        "Cache-Control": "public, max-age=86400",
+    })
+
+async def get_video_preview(request: web.Request) -> web.Response:
+    kind = request.rel_url.query.get('kind', 'poster')
+    if kind not in VIDEO_PREVIEW_KINDS:
+        return web.json_response({"error": f"Invalid kind: {kind}"}, status=400)
+
+    source_path, error_response = _resolve_media_source(request, VIDEO_EXTENSIONS)
+    if error_response is not None:
+        return error_response
+
+    try:
+        preview_path = await _cached_media(media_cache.video_preview, source_path, kind)
+    except Exception as e:
+        return web.json_response({"error": f"Could not create video preview: {e}"}, status=500)
+
+    return web.FileResponse(preview_path, headers={
+        "Content-Type": VIDEO_PREVIEW_KINDS[kind][1],
+        "Cache-Control": "public, max-age=86400",
     })
 
+def _normalize_options(values):
+    # (normalize, max_side) from ?normalize=&max_side= or a JSON body; giving
+    # max_side implies normalize. None if they are invalid.
+    try:
+        max_side = int(values.get('max_side') or 0)
+    except (TypeError, ValueError):
+        return None
+    if max_side < 0:
+        return None
+    return str(values.get('normalize', '')).lower() in ('1', 'true') or max_side > 0, max_side
+
+def _upload_error_response(e):
+    body = {"error": str(e)}
+    if e.offset is not None:
+        body["offset"] = e.offset
+    return web.json_response(body, status=e.status)
+
+async def _after_upload(input_dir, filename, size, deduplicated):
+    metrics.uploads.labels("deduplicated" if deduplicated else "new").inc()
+    if UPLOAD_MAX_BYTES and not deduplicated:
+        await asyncio.get_running_loop().run_in_executor(None, enforce_upload_budget, input_dir, UPLOAD_MAX_BYTES, (filename,))
+    return web.json_response({"filename": filename, "size": size, "deduplicated": deduplicated})
+
 async def upload_image(request: web.Request) -> web.Response:
+    # ?normalize=1&max_side=<px> applies EXIF orientation and downscales before storing
+    options = _normalize_options(request.rel_url.query)
+    if options is None:
+        return web.json_response({"error": "Invalid max_side parameter"}, status=400)
+    normalize, max_side = options
+
     reader = await request.multipart()
     field = await reader.next()
 
@@ -85,65 +427,295 @@ async def upload_image(request: web.Request) -> web.Response:
     if not filename:
         return web.json_response({"error": "No filename provided"}, status=400)
 
-    # Generate a unique filename to prevent collisions
-    unique_filename = f"{uuid.uuid4()}_{filename}"
-    
-    # Save to the input directory of ComfyUI
+    # Save to the input directory of ComfyUI under the hash of the content, so
+    # re-uploading the same image reuses the existing file. The stream is
+    # hashed while it is written to a temp file, then renamed into place.
     input_dir = folder_paths.get_input_directory()
-    save_path = os.path.join(input_dir, unique_filename)
+    tmp_path = os.path.join(input_dir, f"{TEMP_PREFIX}{uuid.uuid4().hex}.tmp")
 
+    hasher = hashlib.sha256()
     size = 0
-    with open(save_path, 'wb') as f:
-        while True:
-            chunk = await field.read_chunk()
-            if not chunk:
-                break
-            f.write(chunk)
-            size += len(chunk)
+    started = time.perf_counter()
+    try:
+        with metrics.uploads_in_progress.track_inprogress(), open(tmp_path, 'wb') as f:
+            while True:
+                chunk = await field.read_chunk()
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+        if normalize:
+            unique_filename, deduplicated = await asyncio.get_running_loop().run_in_executor(
+                normalize_pool, normalize_upload, tmp_path, hasher.hexdigest(), upload_extension(filename), input_dir, max_side)
+        else:
+            unique_filename, deduplicated = finalize_upload(tmp_path, hasher.hexdigest(), upload_extension(filename), input_dir)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    metrics.upload_bytes.inc(size)
+    metrics.upload_seconds.observe(time.perf_counter() - started)
+    return await _after_upload(input_dir, unique_filename, size, deduplicated)
 
-    return web.json_response({"filename": unique_filename, "size": size})
+async def create_upload(request: web.Request) -> web.Response:
+    # JSON {"filename", "size"}: starts a resumable upload. The client PUTs
+    # chunks to /cozygen/upload/{upload_id}?offset=<bytes sent so far>, can
+    # GET that URL for the offset after a dropped connection, and then POSTs
+    # to .../finalize, optionally with {"normalize": true, "max_side": <px>}.
+    try:
+        data = await request.json()
+        filename = str(data['filename'])
+        size = int(data['size'])
+    except (ValueError, KeyError, TypeError):
+        return web.json_response({"error": "Expected JSON with filename and size"}, status=400)
+    if not filename or size < 0:
+        return web.json_response({"error": "Invalid filename or size"}, status=400)
+
+    input_dir = folder_paths.get_input_directory()
+    # Drops uploads abandoned for COZYGEN_UPLOAD_EXPIRY_HOURS; throttled internally
+    await asyncio.get_running_loop().run_in_executor(None, partial_uploads.expire, input_dir)
+    upload_id = partial_uploads.create(input_dir, filename, size)
+    return web.json_response({"upload_id": upload_id, "offset": 0, "size": size, "chunk_size": UPLOAD_CHUNK_SIZE})
+
+async def get_upload_status(request: web.Request) -> web.Response:
+    info = partial_uploads.status(folder_paths.get_input_directory(), request.match_info['upload_id'])
+    if info is None:
+        return web.json_response({"error": "Unknown or expired upload"}, status=404)
+    return web.json_response({"offset": info["offset"], "size": info["size"]})
+
+async def append_upload(request: web.Request) -> web.Response:
+    try:
+        offset = int(request.rel_url.query['offset'])
+    except (KeyError, ValueError):
+        return web.json_response({"error": "Expected an offset parameter"}, status=400)
+    with metrics.uploads_in_progress.track_inprogress():
+        try:
+            offset = await partial_uploads.append(folder_paths.get_input_directory(), request.match_info['upload_id'],
+                                                  offset, request.content, metrics.upload_bytes.inc)
+        except UploadError as e:
+            return _upload_error_response(e)
+    return web.json_response({"offset": offset})
+
+async def finalize_resumable_upload(request: web.Request) -> web.Response:
+    try:
+        data = await request.json() if request.can_read_body else {}
+    except ValueError:
+        return web.json_response({"error": "Invalid JSON"}, status=400)
+    options = _normalize_options(data) if isinstance(data, dict) else None
+    if options is None:
+        return web.json_response({"error": "Invalid max_side parameter"}, status=400)
+    normalize, max_side = options
+
+    input_dir = folder_paths.get_input_directory()
+    upload_id = request.match_info['upload_id']
+    info = partial_uploads.status(input_dir, upload_id)
+    try:
+        filename, deduplicated = await partial_uploads.finalize(input_dir, upload_id, normalize, max_side)
+    except UploadError as e:
+        return _upload_error_response(e)
+    return await _after_upload(input_dir, filename, info["size"], deduplicated)
+
+async def cancel_upload(request: web.Request) -> web.Response:
+    if not partial_uploads.cancel(folder_paths.get_input_directory(), request.match_info['upload_id']):
+        return web.json_response({"error": "Unknown or busy upload"}, status=404)
+    return web.json_response({"status": "cancelled"})
+
+def _etag_matches(request, etag):
+    if_none_match = request.headers.get('If-None-Match')
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in candidates or etag in candidates or f"W/{etag}" in candidates
+
+def _cached_json_response(request, body, etag):
+    # "no-cache" makes browsers revalidate every time, which costs a 304 with
+    # no body as long as the content is unchanged.
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return web.Response(status=304, headers=headers)
+    return web.Response(body=body, content_type='application/json', headers=headers)
 
 async def get_workflow_list(request: web.Request) -> web.Response:
-    workflows_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "workflows")
+    workflows_dir = _workflows_dir()
     if not os.path.exists(workflows_dir):
         return web.json_response({"error": "Workflows directory not found"}, status=404)
-    
+
+    # Adding, removing or renaming a workflow changes the directory mtime
+    etag = f'"{os.stat(workflows_dir).st_mtime_ns:x}"'
+    if _etag_matches(request, etag):
+        return web.Response(status=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
     workflow_files = [f for f in os.listdir(workflows_dir) if f.endswith('.json')]
-    return web.json_response({"workflows": workflow_files})
+    return _cached_json_response(request, json.dumps({"workflows": workflow_files}).encode('utf-8'), etag)
+
+def _load_workflow(filename):
+    """Returns ``(compiled_workflow, error_response)`` for a file in the workflows directory."""
+    workflow_path = _resolve_safe_path(_workflows_dir(), filename)
+    if workflow_path is None:
+        return None, web.json_response({"error": "Unauthorized path"}, status=403)
+    if not filename or not os.path.isfile(workflow_path):
+        return None, web.json_response({"error": f"Workflow file '{filename}' not found"}, status=404)
+    try:
+        return load_compiled_workflow(workflow_path), None
+    except json.JSONDecodeError:
+        return None, web.json_response({"error": f"Invalid JSON in workflow file '{filename}'"}, status=400)
+    except Exception as e:
+        return None, web.json_response({"error": f"Error reading workflow file: {e}"}, status=500)
 
 async def get_workflow_file(request: web.Request) -> web.Response:
-    filename = request.match_info.get('filename', '')
-    workflows_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "workflows")
-    workflow_path = os.path.join(workflows_dir, filename)
+    compiled, error = _load_workflow(request.match_info.get('filename', ''))
+    if error is not None:
+        return error
+    return _cached_json_response(request, compiled.body, compiled.etag)
 
-    if not os.path.exists(workflow_path):
-        return web.json_response({"error": f"Workflow file '{filename}' not found"}, status=404)
-    
+async def _validate_prompt(execution, prompt_id, prompt):
+    # validate_prompt() has been sync with just the prompt, then async with a
+    # prompt id, then gained partial_execution_targets; pass what it takes
+    params = inspect.signature(execution.validate_prompt).parameters
+    args = [prompt_id, prompt] if "prompt_id" in params else [prompt]
+    if "partial_execution_targets" in params:
+        args.append(None)
+    result = execution.validate_prompt(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+async def _queue_prompt(prompt, client_id=None, extra_data=None):
+    """Validates ``prompt`` and puts it on ComfyUI's queue.
+
+    Follows the steps of ComfyUI's POST /prompt handler (on_prompt hooks,
+    numbering, execution.validate_prompt, prompt_queue.put), so the prompt is
+    treated like one posted by the browser. The parts that differ between
+    ComfyUI releases are detected rather than assumed. Returns the body and
+    status that handler would respond with, including its
+    ``{"error", "node_errors"}`` shape for prompts that fail validation.
+    """
+    import execution
+    prompt_server = server.PromptServer.instance
+    json_data = {"prompt": prompt}
+    if client_id:
+        json_data["client_id"] = client_id
+    if extra_data:
+        json_data["extra_data"] = extra_data
+    trigger_on_prompt = getattr(prompt_server, "trigger_on_prompt", None)
+    if trigger_on_prompt is not None:
+        json_data = trigger_on_prompt(json_data)
+    prompt = json_data["prompt"]
+    number = prompt_server.number
+    prompt_server.number += 1
+    prompt_id = str(uuid.uuid4())
+
+    valid, error, outputs_to_execute, node_errors = (await _validate_prompt(execution, prompt_id, prompt))[:4]
+    if not valid:
+        return {"error": error, "node_errors": node_errors}, 400
+
+    extra_data = dict(json_data.get("extra_data", {}))
+    if "client_id" in json_data:
+        extra_data["client_id"] = json_data["client_id"]
+    sensitive_keys = getattr(execution, "SENSITIVE_EXTRA_DATA_KEYS", None)
+    if sensitive_keys is None:
+        # Releases before sensitive data was split out queue five-item entries
+        prompt_server.prompt_queue.put((number, prompt_id, prompt, extra_data, outputs_to_execute))
+    else:
+        # Secrets such as API keys travel beside extra_data so they aren't kept in the history
+        sensitive = {key: extra_data.pop(key) for key in sensitive_keys if key in extra_data}
+        prompt_server.prompt_queue.put((number, prompt_id, prompt, extra_data, outputs_to_execute, sensitive))
+    return {"prompt_id": prompt_id, "number": number, "node_errors": node_errors}, 200
+
+def _workflows_dir():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "workflows")
+
+def _check_generate_body(data):
+    # Shared by /generate and /sweep; returns an error response for fields of the wrong type
+    if not isinstance(data.get('workflow', ''), str):
+        return web.json_response({"error": "workflow must be a file name"}, status=400)
+    if not isinstance(data.get('values', {}), dict):
+        return web.json_response({"error": "values must be an object mapping parameter names to values"}, status=400)
+    # Keyed by param_name like values. Names the workflow doesn't have are
+    # ignored: the web UI keeps bypass state per workflow file, so it can
+    # still hold names from an older version of it.
+    bypass = data.get('bypass', {})
+    if not isinstance(bypass, dict) or not all(isinstance(value, bool) for value in bypass.values()):
+        return web.json_response({"error": "bypass must be an object mapping parameter names to true or false"}, status=400)
+    client_id = data.get('client_id')
+    if client_id is not None and not isinstance(client_id, str):
+        return web.json_response({"error": "client_id must be a string"}, status=400)
+    return None
+
+async def generate(request: web.Request) -> web.Response:
     try:
-        with open(workflow_path, 'r', encoding='utf-8') as f:
-            workflow_content = json.load(f)
-        return web.json_response(workflow_content)
+        data = await request.json()
     except json.JSONDecodeError:
-        return web.json_response({"error": f"Invalid JSON in workflow file '{filename}'"}, status=400)
-    except Exception as e:
-        return web.json_response({"error": f"Error reading workflow file: {e}"}, status=500)
+        return web.json_response({"error": "Invalid JSON body"}, status=400)
+    if not isinstance(data, dict):
+        return web.json_response({"error": "Expected a JSON object"}, status=400)
+    error = _check_generate_body(data)
+    if error is not None:
+        return error
 
-import comfy.samplers
+    compiled, error = _load_workflow(data.get('workflow', ''))
+    if error is not None:
+        return error
 
-# Get all valid model folder types from ComfyUI itself
-valid_model_types = folder_paths.folder_names_and_paths.keys()
+    try:
+        prompt = compiled.compile(data.get('values', {}), data.get('bypass', {}))
+    except WorkflowCompileError as e:
+        return web.json_response({"error": str(e)}, status=400)
 
-# A map for aliases to official folder_paths names
-alias_map = {
-    "unet": "unet_gguf"
-}
+    body, status = await _queue_prompt(prompt, data.get('client_id'))
+    return web.json_response(body, status=status)
 
-async def get_choices(request: web.Request) -> web.Response:
-    choice_type = request.rel_url.query.get('type', '')
+async def queue_sweep(request: web.Request) -> web.Response:
+    # Body: {"workflow", "values", "bypass", "client_id", "axes": [{"param", "values" | "range" | "random"}]}
+    try:
+        data = await request.json()
+    except json.JSONDecodeError:
+        return web.json_response({"error": "Invalid JSON body"}, status=400)
+    if not isinstance(data, dict):
+        return web.json_response({"error": "Expected a JSON object"}, status=400)
+    error = _check_generate_body(data)
+    if error is not None:
+        return error
 
-    if not choice_type:
-        return web.json_response({"error": "Missing 'type' query parameter"}, status=400)
+    compiled, error = _load_workflow(data.get('workflow', ''))
+    if error is not None:
+        return error
+
+    base_values = data.get('values', {})
+    bypass = data.get('bypass', {})
+    try:
+        variants, duplicates = expand_sweep(compiled, data.get('axes'), SWEEP_MAX_VARIANTS)
+        # Compile every variant first, so a bad combination fails before anything is queued
+        prompts = [compiled.compile({**base_values, **variant}, bypass) for variant in variants]
+    except (SweepError, WorkflowCompileError) as e:
+        return web.json_response({"error": str(e)}, status=400)
+
+    sweep_id = uuid.uuid4().hex
+    results = []
+    for index, (variant, prompt) in enumerate(zip(variants, prompts)):
+        body, status = await _queue_prompt(prompt, data.get('client_id'),
+                                           extra_data={"cozygen_sweep": {"id": sweep_id, "index": index}})
+        result = {"values": variant}
+        if status == 200:
+            result["prompt_id"] = body["prompt_id"]
+            result["number"] = body["number"]
+        else:
+            result["error"] = body["error"]
+            if body.get("node_errors"):
+                result["node_errors"] = body["node_errors"]
+        results.append(result)
 
+    queued = sum(1 for result in results if "prompt_id" in result)
+    return web.json_response({
+        "sweep_id": sweep_id,
+        "queued": queued,
+        "failed": len(results) - queued,
+        "duplicates_dropped": duplicates,
+        "variants": results,
+    })
+
+def _resolve_choices(choice_type):
+    """Returns the list of choices for ``choice_type``, or None if it is not a valid type."""
     # Alias map for backward compatibility
     alias_map = {
         "samplers_list": "sampler",
@@ -152,23 +724,142 @@ async def get_choices(request: web.Request) -> web.Response:
     }
     resolved_choice_type = alias_map.get(choice_type, choice_type)
 
-    choices = []
-    if resolved_choice_type == "scheduler":
-        choices = comfy.samplers.KSampler.SCHEDULERS
-    elif resolved_choice_type == "sampler":
-        choices = comfy.samplers.KSampler.SAMPLERS
-    elif resolved_choice_type in valid_model_types:
-        choices = folder_paths.get_filename_list(resolved_choice_type)
-    else:
+    try:
+        return choice_registry.get(resolved_choice_type)
+    except KeyError:
+        return None
+
+async def get_choices(request: web.Request) -> web.Response:
+    choice_type = request.rel_url.query.get('type', '')
+    choice_types = request.rel_url.query.get('types', '')
+
+    if choice_types:
+        # Batch form: ?types=a,b,c resolves several types in one request
+        choices = {}
+        invalid = []
+        for name in dict.fromkeys(t.strip() for t in choice_types.split(',') if t.strip()):
+            resolved = _resolve_choices(name)
+            if resolved is None:
+                invalid.append(name)
+            else:
+                choices[name] = resolved
+        return web.json_response({"choices": choices, "invalid": invalid})
+
+    if not choice_type:
+        return web.json_response({"error": "Missing 'type' query parameter"}, status=400)
+
+    choices = _resolve_choices(choice_type)
+    if choices is None:
         return web.json_response({"error": f"Invalid choice type: {choice_type}"}, status=400)
     
     return web.json_response({"choices": choices})
 
+async def refresh_choices(request: web.Request) -> web.Response:
+    # Drops cached choice lists, e.g. after copying models onto a share whose
+    # directory mtimes are unreliable. Without ?type= every list is dropped.
+    choice_type = request.rel_url.query.get('type') or None
+    choice_registry.invalidate(choice_type)
+    return web.json_response({"status": "success"})
+
+# Choice types for Dynamic dropdowns saved before nodes had a choice_type
+LEGACY_CHOICE_TYPES = {
+    "clip_name1": "clip",
+    "clip_name2": "clip",
+    "unet_name": "unet",
+    "vae_name": "vae",
+    "sampler_name": "sampler",
+    "scheduler": "scheduler",
+}
+
+def _bundle_inputs(compiled):
+    # The CozyGen input nodes as the web UI renders them: in priority order,
+    # tagged with their node id, with dropdown choices filled in.
+    resolved = {}
+    bundle_inputs = []
+    for node_id, class_type, param_name in compiled.input_nodes:
+        node = compiled.workflow[node_id]
+        node_inputs = dict(node.get('inputs', {}))
+        if class_type in FILE_INPUT_FIELDS:
+            node_inputs['param_name'] = param_name
+
+        is_dynamic_dropdown = class_type == 'CozyGenDynamicInput' and node_inputs.get('param_type') == 'DROPDOWN'
+        if is_dynamic_dropdown or class_type == 'CozyGenChoiceInput':
+            choice_type = node_inputs.get('choice_type') or (node.get('properties') or {}).get('choice_type')
+            if not choice_type and is_dynamic_dropdown:
+                choice_type = LEGACY_CHOICE_TYPES.get(param_name)
+            if choice_type:
+                if choice_type not in resolved:
+                    resolved[choice_type] = _resolve_choices(choice_type) or []
+                node_inputs['choices'] = resolved[choice_type]
+
+        bundle_inputs.append({**node, 'inputs': node_inputs, 'id': node_id})
+    return bundle_inputs
+
+async def get_workflow_bundle(request: web.Request) -> web.Response:
+    compiled, error = _load_workflow(request.match_info.get('filename', ''))
+    if error is not None:
+        return error
+
+    # Everything the form needs in one response. Model lists can change while
+    # the workflow doesn't, so the ETag is taken from the content.
+    body = json.dumps({"workflow": compiled.workflow, "inputs": _bundle_inputs(compiled)}).encode('utf-8')
+    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+    return _cached_json_response(request, body, etag)
+
+async def get_metrics(request: web.Request) -> web.Response:
+    if not metrics.registry.enabled:
+        return web.json_response({"error": "Metrics are disabled"}, status=404)
+    return web.Response(text=metrics.registry.render(), content_type="text/plain", charset="utf-8",
+                        headers={"Cache-Control": "no-store"})
+
+# Longest a long-polling /cozygen/events request may wait for a new event
+EVENTS_MAX_WAIT_SECONDS = 30
+
+async def get_events(request: web.Request) -> web.Response:
+    # Result events after ?since=<seq> for ?client_id=, waiting up to ?wait= seconds for one
+    try:
+        since = int(request.rel_url.query.get('since', '0'))
+        wait = float(request.rel_url.query.get('wait', '0'))
+    except ValueError:
+        return web.json_response({"error": "Invalid since or wait parameter"}, status=400)
+    client_id = request.rel_url.query.get('client_id') or None
+
+    epoch = request.rel_url.query.get('epoch')
+    if epoch and epoch != result_events.epoch:
+        # The server restarted, so every buffered event is new to this client
+        since = 0
+
+    events, complete = await result_events.wait_for_events(since, client_id, min(max(wait, 0.0), EVENTS_MAX_WAIT_SECONDS))
+    return web.json_response({
+        "epoch": result_events.epoch,
+        "latest_seq": result_events.latest_seq,
+        "complete": complete,
+        "events": events,
+    })
+
 routes = [
     web.get('/cozygen/hello', get_hello),
     web.get('/cozygen/gallery', get_gallery_files),
+    web.get('/cozygen/gallery/timeline', get_gallery_timeline),
+    web.get('/cozygen/gallery/search', search_gallery),
+    web.get('/cozygen/gallery/export', export_gallery),
+    web.post('/cozygen/gallery/export', export_gallery),
+    web.get('/cozygen/media', get_media),
+    web.get('/cozygen/thumb', get_thumbnail),
+    web.get('/cozygen/video_preview', get_video_preview),
     web.post('/cozygen/upload_image', upload_image),
+    web.post('/cozygen/upload', create_upload),
+    web.get('/cozygen/upload/{upload_id}', get_upload_status),
+    web.put('/cozygen/upload/{upload_id}', append_upload),
+    web.post('/cozygen/upload/{upload_id}/finalize', finalize_resumable_upload),
+    web.delete('/cozygen/upload/{upload_id}', cancel_upload),
     web.get('/cozygen/workflows', get_workflow_list),
     web.get('/cozygen/workflows/{filename}', get_workflow_file),
+    web.get('/cozygen/workflows/{filename}/bundle', get_workflow_bundle),
     web.get('/cozygen/get_choices', get_choices),
+    web.post('/cozygen/choices/refresh', refresh_choices),
+    web.post('/cozygen/generate', generate),
+    web.post('/cozygen/sweep', queue_sweep),
+    web.get('/cozygen/events', get_events),
+    web.get('/cozygen/metrics', get_metrics),
 ]
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""Stand-ins for the ComfyUI modules CozyGen imports, shared by the benchmarks.
+
+The stubs are written to a temporary directory that goes in front of
+``sys.path``. ``folder_paths`` reads its base directory from the
+``COZYGEN_BENCH_ROOT`` environment variable.
+"""
+import os
+import sys
+import importlib.util
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_NAME = "cozygen"
+
+COMFY_STUBS = {
+    "folder_paths.py": '''
+import os
+import re
+base_path = os.environ["COZYGEN_BENCH_ROOT"]
+models_dir = os.path.join(base_path, "models")
+supported_pt_extensions = {".ckpt", ".pt", ".bin", ".pth", ".safetensors"}
+folder_names_and_paths = {
+    name: ([os.path.join(models_dir, name)], supported_pt_extensions)
+    for name in ("checkpoints", "loras", "vae", "clip", "unet")
+}
+def get_output_directory(): return os.path.join(base_path, "output")
+def get_input_directory(): return os.path.join(base_path, "input")
+def get_temp_directory(): return os.path.join(base_path, "temp")
+def get_user_directory(): return os.path.join(base_path, "user")
+def get_annotated_filepath(name, default_dir=None):
+    # "<name> [output]" etc. pick the directory; plain names are inputs
+    for suffix, get_directory in (("[output]", get_output_directory), ("[input]", get_input_directory), ("[temp]", get_temp_directory)):
+        if name.endswith(suffix):
+            return os.path.join(get_directory(), name[:-len(suffix) - 1])
+    return os.path.join(default_dir or get_input_directory(), name)
+def get_filename_list(folder_name):
+    # Same result as ComfyUI: relative paths of matching files, sorted
+    paths, extensions = folder_names_and_paths[folder_name]
+    names = set()
+    for path in paths:
+        for root, _, files in os.walk(path, followlinks=True):
+            for name in files:
+                if os.path.splitext(name)[1].lower() in extensions:
+                    names.add(os.path.relpath(os.path.join(root, name), path).replace(os.sep, "/"))
+    return sorted(names)
+def get_save_image_path(filename_prefix, output_dir, image_width=0, image_height=0):
+    subfolder = os.path.dirname(os.path.normpath(filename_prefix))
+    filename = os.path.basename(os.path.normpath(filename_prefix))
+    full_output_folder = os.path.join(output_dir, subfolder)
+    os.makedirs(full_output_folder, exist_ok=True)
+    pattern = re.compile(re.escape(filename) + r"_(\\d+)_")
+    counters = [int(m.group(1)) for m in map(pattern.match, os.listdir(full_output_folder)) if m]
+    return full_output_folder, filename, max(counters, default=0) + 1, subfolder, filename_prefix
+''',
+    "server.py": '''
+class _Router:
+    def add_route(self, *args, **kwargs): pass
+    def add_get(self, *args, **kwargs): pass
+    def add_static(self, *args, **kwargs): pass
+class _App:
+    router = _Router()
+class PromptServer:
+    instance = None
+    def __init__(self):
+        self.app = _App()
+        self.routes = []
+        self.client_id = None
+        self.messages_sent = 0
+    def send_sync(self, event, data, sid=None):
+        self.messages_sent += 1
+PromptServer.instance = PromptServer()
+''',
+    "nodes.py": '''
+import folder_paths
+class SaveImage:
+    def __init__(self):
+        self.output_dir = folder_paths.get_output_directory()
+        self.type = "output"
+        self.prefix_append = ""
+        self.compress_level = 4
+''',
+    "comfy/__init__.py": "",
+    "comfy/samplers.py": '''
+class KSampler:
+    SAMPLERS = ["euler", "euler_ancestral", "heun", "dpm_2", "dpmpp_2m", "dpmpp_sde", "lcm", "uni_pc"]
+    SCHEDULERS = ["normal", "karras", "exponential", "sgm_uniform", "simple", "ddim_uniform", "beta"]
+''',
+    "comfy/cli_args.py": '''
+class _Args:
+    disable_metadata = False
+args = _Args()
+''',
+    "comfy/comfy_types/__init__.py": "",
+    "comfy/comfy_types/node_typing.py": '''
+class IO:
+    ANY = "*"
+    PRIMITIVE = "STRING,FLOAT,INT,BOOLEAN"
+''',
+}
+
+COMFY_FOLDERS = ("models/checkpoints", "models/loras", "models/vae", "models/clip", "models/unet",
+                 "output", "input", "temp", "user")
+
+
+def write_stubs(root):
+    """Writes the stub modules and an empty ComfyUI directory tree under ``root``.
+
+    Returns ``(stub_dir, comfy_root)``.
+    """
+    stub_dir = os.path.join(root, "stubs")
+    for relative_path, source in COMFY_STUBS.items():
+        path = os.path.join(stub_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(source.lstrip())
+    comfy_root = os.path.join(root, "comfy_root")
+    for folder in COMFY_FOLDERS:
+        os.makedirs(os.path.join(comfy_root, folder), exist_ok=True)
+    return stub_dir, comfy_root
+
+
+def bench_environ(comfy_root):
+    """Environment variables that point the package at ``comfy_root``."""
+    return {
+        "COZYGEN_BENCH_ROOT": comfy_root,
+        "COZYGEN_CACHE_DIR": os.path.join(comfy_root, "user", "cozygen_cache"),
+    }
+
+
+def import_package(stub_dir, comfy_root):
+    """Imports the repository as PACKAGE_NAME in this process, against the stubs."""
+    os.environ.update(bench_environ(comfy_root))
+    os.environ.pop("COZYGEN_GALLERY_SNAPSHOT", None)
+    sys.path.insert(0, stub_dir)
+    spec = importlib.util.spec_from_file_location(PACKAGE_NAME, os.path.join(REPO_DIR, "__init__.py"),
+                                                  submodule_search_locations=[REPO_DIR])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE_NAME] = module
+    spec.loader.exec_module(module)
+    return module
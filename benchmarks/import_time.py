@@ -0,0 +1,124 @@
+"""Measures how long importing the CozyGen package takes.
+
+The package is imported in a fresh interpreter against stub versions of the
+ComfyUI modules it uses, with ``python -X importtime``, so the numbers cover
+CozyGen's own startup cost and not ComfyUI's. Run it from anywhere:
+
+    python benchmarks/import_time.py [--runs 5] [--budget-ms 150] [--json]
+
+With ``--budget-ms`` the script exits with status 1 when the median import
+time is over budget, so it can guard startup time in CI.
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+from comfy_stubs import REPO_DIR, PACKAGE_NAME, write_stubs, bench_environ
+
+# Modules ComfyUI has always loaded before custom nodes; they are imported
+# before the timer starts so they don't count against the package.
+HOST_MODULES = ("aiohttp.web", "json", "asyncio", "concurrent.futures", "uuid", "hashlib",
+                "folder_paths", "server", "nodes", "comfy.samplers", "comfy.cli_args", "comfy.comfy_types.node_typing")
+
+# Loads the repository as the package PACKAGE_NAME, wherever it is checked out
+IMPORT_SNIPPET = f'''
+import sys, time, importlib, importlib.util
+for name in {HOST_MODULES!r}:
+    importlib.import_module(name)
+sys.stderr.write("cozygen-bench: start\\n")
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location({PACKAGE_NAME!r}, {os.path.join(REPO_DIR, "__init__.py")!r},
+                                              submodule_search_locations=[{REPO_DIR!r}])
+module = importlib.util.module_from_spec(spec)
+sys.modules[{PACKAGE_NAME!r}] = module
+spec.loader.exec_module(module)
+sys.stderr.write("cozygen-bench: total_us=%d\\n" % ((time.perf_counter() - start) * 1e6))
+'''
+
+
+def parse_importtime(stderr):
+    """Returns ``(total_us, modules)`` from ``-X importtime`` output.
+
+    ``modules`` maps each module imported by the package to its
+    ``(self_us, cumulative_us)``; host modules loaded first are skipped.
+    """
+    total_us = None
+    modules = {}
+    started = False
+    for line in stderr.splitlines():
+        if line == "cozygen-bench: start":
+            started = True
+        elif line.startswith("cozygen-bench: total_us="):
+            total_us = int(line.split("=", 1)[1])
+        elif started and line.startswith("import time:") and "|" in line:
+            self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+            if self_us.isdigit():
+                modules[name] = (int(self_us), int(cumulative_us))
+    return total_us, modules
+
+
+def run_once(stub_dir, comfy_root):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([stub_dir, env.get("PYTHONPATH", "")]).rstrip(os.pathsep)
+    env.update(bench_environ(comfy_root))
+    env.pop("COZYGEN_GALLERY_SNAPSHOT", None)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", IMPORT_SNIPPET],
+                          env=env, capture_output=True, text=True, cwd=comfy_root)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing the package failed:\n{proc.stderr}")
+    return parse_importtime(proc.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="number of fresh interpreters to time")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest modules to list")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail when the median import time is above this")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="cozygen_bench_") as root:
+        stub_dir, comfy_root = write_stubs(root)
+        runs = [run_once(stub_dir, comfy_root) for _ in range(args.runs)]
+
+    totals_ms = [total_us / 1000 for total_us, _ in runs]
+    median_ms = statistics.median(totals_ms)
+    # Per-module self time from the median run, heaviest first
+    _, modules = sorted(runs, key=lambda run: run[0])[len(runs) // 2]
+    heaviest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+    heavy_deps = [name for name in ("torch", "numpy", "PIL", "imageio") if name in modules]
+
+    result = {
+        "runs": args.runs,
+        "median_ms": round(median_ms, 2),
+        "min_ms": round(min(totals_ms), 2),
+        "max_ms": round(max(totals_ms), 2),
+        "modules_imported": len(modules),
+        "heavy_dependencies_imported": heavy_deps,
+        "slowest_modules": [{"module": name, "self_ms": self_us / 1000, "cumulative_ms": cumulative_us / 1000}
+                            for name, (self_us, cumulative_us) in heaviest],
+        "budget_ms": args.budget_ms,
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"CozyGen import: median {result['median_ms']} ms "
+              f"(min {result['min_ms']}, max {result['max_ms']}, {args.runs} runs, {len(modules)} modules)")
+        print(f"Heavy dependencies imported: {', '.join(heavy_deps) or 'none'}")
+        print("Slowest modules (self time):")
+        for entry in result["slowest_modules"]:
+            print(f"  {entry['self_ms']:8.2f} ms  {entry['module']}")
+
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        print(f"Import time {median_ms:.2f} ms is over the {args.budget_ms} ms budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,598 @@
+"""Benchmarks CozyGen's hot paths on a plain CPU machine and writes the results as JSON.
+
+The package is imported against stub versions of the ComfyUI modules (see
+``comfy_stubs.py``) and exercised on synthetic data in a temporary ComfyUI
+directory:
+
+- ``gallery``: /cozygen/gallery over folders of 1k, 10k and 100k files
+- ``load_image``: CozyGenImageInput.load_image at several resolutions
+- ``save_video``: CozyGenVideoOutput.save_video, with and without pingpong
+- ``load_video``: CozyGenVideoInput.load_video, whole clip and sampled
+- ``upload``: /cozygen/upload_image and resumable upload throughput, and
+  downscaling an uploaded photo
+- ``endpoints``: the workflow and choice endpoints
+- ``search``: indexing outputs' metadata and /cozygen/gallery/search queries
+
+HTTP benchmarks go through a real aiohttp server on localhost. The image
+and video benchmarks need torch (the CPU build is enough) and are skipped
+without it. Typical use:
+
+    python benchmarks/suite.py --output before.json
+    python benchmarks/suite.py --output after.json --compare before.json
+
+Synthetic data comes from fixed seeds, so runs on the same machine are
+comparable. ``--quick`` uses small sizes for a smoke test.
+"""
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import random
+import asyncio
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+import importlib.metadata
+
+from comfy_stubs import REPO_DIR, PACKAGE_NAME, write_stubs, import_package
+
+SEED = 1234
+GROUPS = ("gallery", "load_image", "save_video", "load_video", "upload", "endpoints", "search")
+
+# Words the synthetic prompts of the search benchmark are made of
+PROMPT_WORDS = ("portrait", "landscape", "castle", "forest", "river", "mountain", "city", "night", "sunset",
+                "fox", "dragon", "robot", "knight", "ocean", "desert", "snow", "neon", "cinematic", "watercolor",
+                "oil", "painting", "photo", "detailed", "soft", "light", "fog", "rain", "autumn", "spring", "gold")
+
+# Changes below this fraction are reported as noise by --compare
+COMPARE_THRESHOLD = 0.05
+
+
+def _int_list(value):
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def summarize(name, samples, **extra):
+    """Summarizes a list of durations in seconds as one result entry."""
+    ms = sorted(s * 1000 for s in samples)
+    result = {
+        "name": name,
+        "runs": len(ms),
+        "median_ms": round(statistics.median(ms), 3),
+        "min_ms": round(ms[0], 3),
+        "max_ms": round(ms[-1], 3),
+        "stdev_ms": round(statistics.stdev(ms), 3) if len(ms) > 1 else 0.0,
+    }
+    result.update(extra)
+    return result
+
+
+def measure(fn, repeat, setup=None):
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def measure_async(fn, repeat, setup=None):
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _have_torch():
+    try:
+        import torch  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class Context:
+    """The imported package, the synthetic ComfyUI tree and an HTTP client for its routes."""
+
+    def __init__(self, package, comfy_root, args):
+        self.package = package
+        self.comfy_root = comfy_root
+        self.args = args
+        self.api = sys.modules[PACKAGE_NAME + ".api"]
+        self.nodes = sys.modules[PACKAGE_NAME + ".nodes"]
+        self.client = None
+
+    async def start_client(self):
+        from aiohttp import web
+        from aiohttp.test_utils import TestClient, TestServer
+        app = web.Application(client_max_size=1024 ** 3)
+        app.add_routes(self.api.routes)
+        self.client = TestClient(TestServer(app))
+        await self.client.start_server()
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.close()
+
+    async def get(self, path, expect=200, **kwargs):
+        async with self.client.get(path, **kwargs) as response:
+            body = await response.read()
+            if response.status != expect:
+                raise RuntimeError(f"GET {path}: HTTP {response.status}: {body[:200]!r}")
+            return response, body
+
+
+async def bench_gallery(ctx):
+    gallery_index = sys.modules[PACKAGE_NAME + ".gallery_index"].gallery_index
+    output_dir = os.path.join(ctx.comfy_root, "output")
+    per_page = 50
+    rng = random.Random(SEED)
+    now = time.time()
+    results = []
+    for size in ctx.args.gallery_sizes:
+        subfolder = f"bench_gallery_{size}"
+        folder = os.path.join(output_dir, subfolder)
+        os.makedirs(folder, exist_ok=True)
+        # Empty files are enough: listing only reads names and mtimes
+        for i in range(size):
+            path = os.path.join(folder, f"CozyGen_{i:06}_.png")
+            open(path, "wb").close()
+            mtime = now - rng.uniform(0, 365 * 86400)
+            os.utime(path, (mtime, mtime))
+        for i in range(max(1, size // 1000)):
+            os.makedirs(os.path.join(folder, f"batch_{i:03}"), exist_ok=True)
+        gallery_index.invalidate()
+
+        last_page = (size + max(1, size // 1000) + per_page - 1) // per_page
+        query = f"/cozygen/gallery?subfolder={subfolder}&per_page={per_page}"
+        first_page = lambda: ctx.get(query + "&page=1")
+        samples = await measure_async(first_page, ctx.args.repeat, setup=lambda: gallery_index.invalidate(folder))
+        results.append(summarize(f"gallery/{size}/first_page_cold", samples, files=size))
+        samples = await measure_async(first_page, ctx.args.repeat * 4)
+        results.append(summarize(f"gallery/{size}/first_page_warm", samples, files=size))
+        samples = await measure_async(lambda: ctx.get(query + f"&page={last_page}"), ctx.args.repeat * 4)
+        results.append(summarize(f"gallery/{size}/last_page_warm", samples, files=size))
+
+        # Walk ten pages by cursor, the way infinite scrolling does
+        async def cursor_walk():
+            cursor = None
+            for _ in range(10):
+                _, body = await ctx.get(query + (f"&cursor={cursor}" if cursor else ""))
+                cursor = json.loads(body)["next_cursor"]
+                if not cursor:
+                    break
+        samples = await measure_async(cursor_walk, ctx.args.repeat)
+        results.append(summarize(f"gallery/{size}/cursor_10_pages", samples, files=size))
+        # Later groups (e.g. the search index) walk the whole output directory
+        shutil.rmtree(folder)
+        gallery_index.invalidate()
+
+    # The timeline merges every folder of a tree; spread the largest size over 50
+    size = max(ctx.args.gallery_sizes)
+    tree = os.path.join(output_dir, "bench_timeline")
+    for i in range(size):
+        folder = os.path.join(tree, f"run_{i % 10:02}", f"batch_{i % 50 // 10:02}")
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"CozyGen_{i:06}_.png")
+        open(path, "wb").close()
+        mtime = now - rng.uniform(0, 365 * 86400)
+        os.utime(path, (mtime, mtime))
+    gallery_index.invalidate()
+    query = f"/cozygen/gallery/timeline?subfolder=bench_timeline&per_page={per_page}"
+    first_page = lambda: ctx.get(query)
+    samples = await measure_async(first_page, ctx.args.repeat, setup=lambda: gallery_index.invalidate())
+    results.append(summarize(f"gallery/timeline_{size}/first_page_cold", samples, files=size, folders=50))
+    samples = await measure_async(first_page, ctx.args.repeat * 4)
+    results.append(summarize(f"gallery/timeline_{size}/first_page_warm", samples, files=size, folders=50))
+
+    async def timeline_walk():
+        cursor = None
+        for _ in range(10):
+            _, body = await ctx.get(query + (f"&cursor={cursor}" if cursor else ""))
+            cursor = json.loads(body)["next_cursor"]
+            if not cursor:
+                break
+    samples = await measure_async(timeline_walk, ctx.args.repeat)
+    results.append(summarize(f"gallery/timeline_{size}/cursor_10_pages", samples, files=size, folders=50))
+    shutil.rmtree(tree)
+    gallery_index.invalidate()
+    return results
+
+
+def bench_load_image(ctx):
+    import numpy as np
+    from PIL import Image
+    tensor_cache = sys.modules[PACKAGE_NAME + ".tensor_cache"].tensor_cache
+    input_dir = os.path.join(ctx.comfy_root, "input")
+    node = ctx.nodes.CozyGenImageInput()
+    rng = np.random.default_rng(SEED)
+    results = []
+    for size in ctx.args.image_sizes:
+        for mode in ("RGB", "RGBA"):
+            filename = f"bench_{size}_{mode.lower()}.png"
+            # Smooth gradients plus noise compress roughly like real renders
+            gradient = np.linspace(0, 255, size, dtype=np.float32)
+            pixels = np.stack([np.add.outer(gradient, gradient) / 2] * len(mode), axis=-1)
+            pixels += rng.normal(0, 12, pixels.shape)
+            Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8), mode).save(os.path.join(input_dir, filename), compress_level=4)
+
+            load = lambda: node.load_image("image", filename)
+            samples = measure(load, ctx.args.repeat, setup=tensor_cache.clear)
+            results.append(summarize(f"load_image/{size}x{size}/{mode.lower()}/decode", samples,
+                                     megapixels=round(size * size / 1e6, 2)))
+            samples = measure(load, ctx.args.repeat * 4)
+            results.append(summarize(f"load_image/{size}x{size}/{mode.lower()}/cached", samples,
+                                     megapixels=round(size * size / 1e6, 2)))
+    tensor_cache.clear()
+    return results
+
+
+def _video_format():
+    try:
+        import imageio_ffmpeg  # noqa: F401
+        return "video/mp4", "mp4"
+    except ImportError:
+        return "image/gif", "gif"
+
+
+def bench_save_video(ctx):
+    import torch
+    fmt, ext = _video_format()
+    frames, width, height = ctx.args.video_frames, ctx.args.video_width, ctx.args.video_height
+    generator = torch.Generator().manual_seed(SEED)
+    # A slowly brightening gradient with grain; pure noise would measure the encoder's worst case
+    y = torch.linspace(0, 1, height)[:, None, None]
+    x = torch.linspace(0, 1, width)[None, :, None]
+    t = torch.linspace(0, 1, frames)[:, None, None, None]
+    images = ((x + y) / 2 * 0.75 + t * 0.25 + 0.05 * torch.rand((frames, height, width, 3), generator=generator)).clamp(0, 1)
+    node = ctx.nodes.CozyGenVideoOutput()
+    results = []
+    for pingpong in (False, True):
+        encoded = frames + (max(frames - 2, 0) if pingpong else 0)
+        save = lambda: node.save_video(images, 8, 0, filename_prefix="bench/video", format=fmt, pingpong=pingpong)
+        samples = measure(save, ctx.args.repeat)
+        results.append(summarize(f"save_video/{ext}/{frames}x{width}x{height}/{'pingpong' if pingpong else 'forward'}", samples,
+                                 frames_encoded=encoded,
+                                 frames_per_second=round(encoded / statistics.median(samples), 2)))
+    return results
+
+
+def bench_load_video(ctx):
+    import imageio
+    import numpy as np
+    tensor_cache = sys.modules[PACKAGE_NAME + ".tensor_cache"].tensor_cache
+    frames, width, height = ctx.args.video_frames, ctx.args.video_width, ctx.args.video_height
+    filename = f"bench_{frames}x{width}x{height}.mp4"
+    rng = np.random.default_rng(SEED)
+    gradient = np.add.outer(np.linspace(0, 191, height), np.linspace(0, 191, width)) / 2
+    with imageio.get_writer(os.path.join(ctx.comfy_root, "input", filename), fps=24) as writer:
+        for i in range(frames):
+            frame = gradient[:, :, None] + i * 64 / frames + rng.normal(0, 8, (height, width, 3))
+            writer.append_data(np.clip(frame, 0, 255).astype(np.uint8))
+
+    node = ctx.nodes.CozyGenVideoInput()
+    results = []
+    # (name, force_rate, start_frame, frame_cap, select_every_nth, width, height)
+    variants = [
+        ("all", 0.0, 0, 0, 1, 0, 0),
+        ("every_2nd_half_size", 0.0, 0, 0, 2, width // 2, 0),
+        ("12fps_first_8", 12.0, 0, 8, 1, 0, 0),
+    ]
+    for name, *sampling in variants:
+        load = lambda: node.load_video("video", filename, *sampling)
+        samples = measure(load, ctx.args.repeat, setup=tensor_cache.clear)
+        loaded = len(load()[0])
+        results.append(summarize(f"load_video/{frames}x{width}x{height}/{name}/decode", samples, frames_loaded=loaded))
+        samples = measure(load, ctx.args.repeat * 4)
+        results.append(summarize(f"load_video/{frames}x{width}x{height}/{name}/cached", samples, frames_loaded=loaded))
+    tensor_cache.clear()
+    return results
+
+
+async def bench_upload(ctx):
+    from aiohttp import FormData
+    rng = random.Random(SEED)
+    results = []
+
+    async def upload(payload, expect_deduplicated):
+        form = FormData()
+        form.add_field("image", payload, filename="upload.png", content_type="image/png")
+        async with ctx.client.post("/cozygen/upload_image", data=form) as response:
+            body = await response.json()
+            if response.status != 200 or body["deduplicated"] != expect_deduplicated:
+                raise RuntimeError(f"Upload failed: HTTP {response.status}: {body}")
+
+    async def upload_resumable(payload, filename, finalize=None):
+        async with ctx.client.post("/cozygen/upload", json={"filename": filename, "size": len(payload)}) as response:
+            body = await response.json()
+        upload_id, chunk_size = body["upload_id"], body["chunk_size"]
+        for offset in range(0, len(payload), chunk_size):
+            async with ctx.client.put(f"/cozygen/upload/{upload_id}?offset={offset}",
+                                      data=payload[offset:offset + chunk_size]) as response:
+                if response.status != 200:
+                    raise RuntimeError(f"Chunk failed: HTTP {response.status}: {await response.text()}")
+        async with ctx.client.post(f"/cozygen/upload/{upload_id}/finalize", json=finalize or {}) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Finalize failed: HTTP {response.status}: {await response.text()}")
+
+    for size_mb in ctx.args.upload_sizes_mb:
+        size = size_mb * 1024 * 1024
+        payloads = [rng.randbytes(size) for _ in range(ctx.args.repeat)]
+        pending = iter(payloads)
+        samples = await measure_async(lambda: upload(next(pending), False), len(payloads))
+        results.append(summarize(f"upload/{size_mb}mb/new", samples, bytes=size,
+                                 mb_per_second=round(size_mb / statistics.median(samples), 2)))
+        # The same content again takes the deduplication path
+        pending = iter(payloads)
+        samples = await measure_async(lambda: upload(next(pending), True), len(payloads))
+        results.append(summarize(f"upload/{size_mb}mb/deduplicated", samples, bytes=size,
+                                 mb_per_second=round(size_mb / statistics.median(samples), 2)))
+
+        # The same sizes through the resumable protocol, in its suggested chunks
+        payloads = [rng.randbytes(size) for _ in range(ctx.args.repeat)]
+        pending = iter(payloads)
+        samples = await measure_async(lambda: upload_resumable(next(pending), "upload.png"), len(payloads))
+        results.append(summarize(f"upload/{size_mb}mb/resumable", samples, bytes=size,
+                                 mb_per_second=round(size_mb / statistics.median(samples), 2)))
+
+    # A rotated 24 MP phone photo, stored fitted within 1024 px
+    import numpy as np
+    from PIL import Image
+    pixels = np.random.default_rng(SEED).integers(0, 256, (4000, 6000, 3), dtype=np.uint8)
+    exif = Image.Exif()
+    exif[0x0112] = 6
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="JPEG", quality=90, exif=exif.tobytes())
+    photo = buffer.getvalue()
+    counter = iter(range(1, 1 << 30))
+    # A different max_side each run, so the result isn't deduplicated
+    samples = await measure_async(lambda: upload_resumable(photo, "photo.jpg", {"max_side": 1024 + next(counter)}),
+                                  ctx.args.repeat)
+    results.append(summarize("upload/photo_24mp/normalize_1024", samples, bytes=len(photo)))
+    return results
+
+
+async def bench_endpoints(ctx):
+    choice_registry = sys.modules[PACKAGE_NAME + ".choice_registry"].choice_registry
+    repeat = ctx.args.repeat * 4
+    results = []
+
+    async def cached_get(name, path):
+        response, _ = await ctx.get(path)
+        etag = response.headers["ETag"]
+        samples = await measure_async(lambda: ctx.get(path), repeat)
+        results.append(summarize(f"{name}/full", samples))
+        samples = await measure_async(lambda: ctx.get(path, expect=304, headers={"If-None-Match": etag}), repeat)
+        results.append(summarize(f"{name}/not_modified", samples))
+
+    await cached_get("workflows/list", "/cozygen/workflows")
+    # The largest example workflow, so the numbers are driven by its size
+    workflows_dir = os.path.join(REPO_DIR, "workflows")
+    workflow = max((f for f in os.listdir(workflows_dir) if f.endswith(".json")),
+                   key=lambda f: os.path.getsize(os.path.join(workflows_dir, f)))
+    await cached_get("workflows/file", f"/cozygen/workflows/{workflow}")
+    await cached_get("workflows/bundle", f"/cozygen/workflows/{workflow}/bundle")
+
+    # A video-sized output: the whole file, and the 1 MB range a seek asks for
+    media_path = os.path.join(ctx.comfy_root, "output", "bench_media.mp4")
+    with open(media_path, "wb") as f:
+        f.write(os.urandom(32 * 1024 * 1024))
+    await cached_get("media/32mb", "/cozygen/media?filename=bench_media.mp4")
+    samples = await measure_async(lambda: ctx.get("/cozygen/media?filename=bench_media.mp4", expect=206,
+                                                  headers={"Range": "bytes=16777216-17825791"}), repeat)
+    results.append(summarize("media/32mb/range_1mb", samples))
+    os.remove(media_path)
+
+    # Model folders with a few levels of sub-directories, like a real library
+    for folder_name in ("checkpoints", "loras"):
+        for i in range(ctx.args.choice_files):
+            path = os.path.join(ctx.comfy_root, "models", folder_name, f"family_{i % 20:02}", f"model_{i:05}.safetensors")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "wb").close()
+    choice_registry.invalidate()
+
+    files = ctx.args.choice_files
+    path = "/cozygen/get_choices?type=checkpoints"
+    samples = await measure_async(lambda: ctx.get(path), ctx.args.repeat, setup=lambda: choice_registry.invalidate("checkpoints"))
+    results.append(summarize(f"choices/{files}/single/cold", samples))
+    samples = await measure_async(lambda: ctx.get(path), repeat)
+    results.append(summarize(f"choices/{files}/single/warm", samples))
+    samples = await measure_async(lambda: ctx.get("/cozygen/get_choices?types=checkpoints,loras,sampler,scheduler"), repeat)
+    results.append(summarize(f"choices/{files}/batch/warm", samples))
+    samples = measure(ctx.nodes.CozyGenChoiceInput.INPUT_TYPES, repeat)
+    results.append(summarize(f"choices/{files}/choice_input_types/warm", samples))
+    return results
+
+
+async def bench_search(ctx):
+    from PIL import Image
+    metadata_index = sys.modules[PACKAGE_NAME + ".metadata_index"].metadata_index
+    image_metadata_options = sys.modules[PACKAGE_NAME + ".output_writer"].image_metadata_options
+    count = ctx.args.search_files
+    folder = os.path.join(ctx.comfy_root, "output", "bench_search")
+    os.makedirs(folder, exist_ok=True)
+    rng = random.Random(SEED)
+    image = Image.new("RGB", (1, 1))
+    for i in range(count):
+        prompt = {
+            "3": {"class_type": "KSampler", "inputs": {"seed": i, "steps": 20, "cfg": 7.0, "model": ["4", 0]}},
+            "4": {"class_type": "CheckpointLoaderSimple", "inputs": {"ckpt_name": f"checkpoint_{i % 5}.safetensors"}},
+            "6": {"class_type": "CLIPTextEncode", "inputs": {"text": " ".join(rng.choices(PROMPT_WORDS, k=12))}},
+            "10": {"class_type": "CozyGenChoiceInput", "inputs": {"param_name": "Lora", "value": f"lora_{i % 50}.safetensors"}},
+            "11": {"class_type": "CozyGenFloatInput", "inputs": {"param_name": "CFG", "default_value": 3.5 + i % 8 / 2}},
+        }
+        image.save(os.path.join(folder, f"CozyGen_{i:06}_.png"), **image_metadata_options("image/png", prompt))
+
+    async def indexed():
+        stats = metadata_index.stats()
+        while stats["pending"] or stats["reconciling"] or stats["indexed"] < count:
+            await asyncio.sleep(0.01)
+            stats = metadata_index.stats()
+    start = time.perf_counter()
+    metadata_index.request_reconcile(force=True)
+    await indexed()
+    elapsed = time.perf_counter() - start
+    results = [summarize(f"search/{count}/initial_index", [elapsed], files_per_second=round(count / elapsed, 1))]
+
+    queries = {
+        "newest_page": "",
+        "text": "q=castle+fog",
+        "text_prefix": "q=water*",
+        "text_deep_page": "q=castle&page=20",
+        "seed": f"seed={count // 2}",
+        "model": "model=checkpoint_3",
+        "param": "param.Lora=lora_7.safetensors",
+        "combined": "q=dragon&model=checkpoint_1&param.CFG=4",
+    }
+    for name, query in queries.items():
+        path = f"/cozygen/gallery/search?per_page=50&{query}"
+        samples = await measure_async(lambda: ctx.get(path), ctx.args.repeat * 4)
+        results.append(summarize(f"search/{count}/{name}", samples))
+    return results
+
+
+BENCHMARKS = {
+    "gallery": (bench_gallery, False),
+    "load_image": (bench_load_image, True),
+    "save_video": (bench_save_video, True),
+    "load_video": (bench_load_video, True),
+    "upload": (bench_upload, False),
+    "endpoints": (bench_endpoints, False),
+    "search": (bench_search, False),
+}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _versions():
+    versions = {}
+    for name in ("aiohttp", "numpy", "pillow", "imageio", "imageio-ffmpeg", "torch"):
+        try:
+            versions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+async def run(ctx, groups):
+    results = []
+    skipped = {}
+    await ctx.start_client()
+    try:
+        for group in groups:
+            fn, needs_torch = BENCHMARKS[group]
+            if needs_torch and not _have_torch():
+                skipped[group] = "torch is not installed"
+                continue
+            print(f"Running {group}...", file=sys.stderr)
+            if asyncio.iscoroutinefunction(fn):
+                results.extend(await fn(ctx))
+            else:
+                results.extend(fn(ctx))
+    finally:
+        await ctx.close()
+    return results, skipped
+
+
+def compare(results, baseline):
+    """Prints the change in median time of every benchmark also found in ``baseline``."""
+    previous = {entry["name"]: entry for entry in baseline["results"]}
+    print(f"\nCompared with {baseline['meta'].get('git_commit') or 'baseline'}:")
+    if baseline["meta"].get("platform") != platform.platform() or baseline["meta"].get("cpu_count") != os.cpu_count():
+        print("  (the baseline was recorded on a different machine)")
+    for entry in results:
+        old = previous.get(entry["name"])
+        if old is None or old["runs"] < 1 or not old["median_ms"]:
+            continue
+        change = entry["median_ms"] / old["median_ms"] - 1
+        verdict = "" if abs(change) < COMPARE_THRESHOLD else ("  slower" if change > 0 else "  faster")
+        print(f"  {entry['name']:<45} {old['median_ms']:10.3f} -> {entry['median_ms']:10.3f} ms {change:+7.1%}{verdict}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", default=",".join(GROUPS), help=f"comma-separated groups to run ({', '.join(GROUPS)})")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark (cheap ones run 4x as many)")
+    parser.add_argument("--gallery-sizes", type=_int_list, default=[1000, 10000, 100000])
+    parser.add_argument("--image-sizes", type=_int_list, default=[512, 1024, 2048])
+    parser.add_argument("--video-frames", type=int, default=49)
+    parser.add_argument("--video-width", type=int, default=512)
+    parser.add_argument("--video-height", type=int, default=512)
+    parser.add_argument("--upload-sizes-mb", type=_int_list, default=[1, 16])
+    parser.add_argument("--choice-files", type=int, default=2000, help="files per synthetic model folder")
+    parser.add_argument("--search-files", type=int, default=10000, help="outputs in the search index")
+    parser.add_argument("--quick", action="store_true", help="small sizes and fewer runs, for a smoke test")
+    parser.add_argument("--output", default="cozygen-benchmark.json", help="where to write the JSON results")
+    parser.add_argument("--compare", metavar="JSON", help="results of an earlier run to compare against")
+    args = parser.parse_args()
+    if args.quick:
+        args.repeat = min(args.repeat, 2)
+        args.gallery_sizes = [1000]
+        args.image_sizes = [256]
+        args.video_frames = 9
+        args.video_width = args.video_height = 128
+        args.upload_sizes_mb = [1]
+        args.choice_files = 200
+        args.search_files = 500
+
+    groups = [g.strip() for g in args.only.split(",") if g.strip()]
+    unknown = [g for g in groups if g not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark groups: {', '.join(unknown)}")
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    with tempfile.TemporaryDirectory(prefix="cozygen_bench_") as root:
+        stub_dir, comfy_root = write_stubs(root)
+        package = import_package(stub_dir, comfy_root)
+        ctx = Context(package, comfy_root, args)
+        results, skipped = asyncio.run(run(ctx, groups))
+        # Let background work (video previews, coalesced events) finish before the tree is removed
+        sys.modules[PACKAGE_NAME + ".media_cache"].media_cache._get_executor().shutdown(wait=True)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "versions": _versions(),
+            "settings": {k: v for k, v in vars(args).items() if k not in ("output", "compare")},
+            "skipped": skipped,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    for entry in results:
+        print(f"{entry['name']:<45} median {entry['median_ms']:10.3f} ms  (min {entry['min_ms']:.3f}, {entry['runs']} runs)")
+    for group, reason in skipped.items():
+        print(f"{group}: skipped, {reason}")
+    print(f"Results written to {args.output}")
+    if baseline is not None:
+        compare(results, baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+import os
+import time
+import bisect
+import threading
+import collections
+
+import folder_paths
+
+# Choice types that come from the sampler registry rather than a model folder
+STATIC_CHOICE_TYPES = ("sampler", "scheduler")
+
+
+def _static_choices(choice_type):
+    import comfy.samplers
+    if choice_type == "sampler":
+        return comfy.samplers.KSampler.SAMPLERS
+    return comfy.samplers.KSampler.SCHEDULERS
+
+
+def _stat_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class _FolderChoices:
+    __slots__ = ("choices", "signature", "checked_at")
+
+    def __init__(self, choices, signature, checked_at):
+        self.choices = choices
+        self.signature = signature
+        self.checked_at = checked_at
+
+
+class ChoiceRegistry:
+    """Caches the file list of each model folder offered as a choice type.
+
+    A folder's list is reused until the mtime of one of the directories under
+    its base paths changes (checked at most every ``revalidate_interval``
+    seconds) or :meth:`invalidate` is called. The combined list used by
+    CozyGenChoiceInput is kept sorted and updated from the folders that
+    changed, instead of being rebuilt from every folder each time.
+    """
+
+    def __init__(self, revalidate_interval=5.0):
+        self.revalidate_interval = revalidate_interval
+        self._folders = {}
+        self._model_folders = None  # (models_dir mtime, sorted folder names)
+        # The combined list covers the types last returned by choice_types()
+        self._combined_types = set()
+        self._counts = collections.Counter()  # choice -> number of combined types offering it
+        self._all_choices = []  # sorted keys of _counts
+        self._lock = threading.RLock()
+
+    def choice_types(self):
+        """Sub-folders of the models directory, followed by the static choice types."""
+        models_dir = folder_paths.models_dir
+        mtime = _stat_mtime(models_dir)
+        with self._lock:
+            if self._model_folders is None or self._model_folders[0] != mtime:
+                try:
+                    names = sorted(d.name for d in os.scandir(models_dir) if d.is_dir())
+                except OSError:
+                    names = []
+                self._model_folders = (mtime, names)
+            return self._model_folders[1] + list(STATIC_CHOICE_TYPES)
+
+    def get(self, choice_type):
+        """Returns the choices for ``choice_type``; raises KeyError if it is not a known type."""
+        if choice_type in STATIC_CHOICE_TYPES:
+            choices = _static_choices(choice_type)
+            with self._lock:
+                folder = self._folders.get(choice_type)
+                if folder is None or folder.choices is not choices:
+                    self._store(choice_type, choices, None, 0.0)
+            return choices
+        if choice_type not in folder_paths.folder_names_and_paths:
+            raise KeyError(choice_type)
+        with self._lock:
+            folder = self._folders.get(choice_type)
+            now = time.monotonic()
+            if folder is not None:
+                if now - folder.checked_at < self.revalidate_interval:
+                    return folder.choices
+                if self._signature(choice_type) == folder.signature:
+                    folder.checked_at = now
+                    return folder.choices
+            choices = folder_paths.get_filename_list(choice_type)
+            self._store(choice_type, choices, self._signature(choice_type), now)
+            return choices
+
+    def all_choices(self):
+        """The sorted union of the choices of every choice type."""
+        choice_types = self.choice_types()
+        with self._lock:
+            combined_types = set(choice_types)
+            for choice_type in self._combined_types ^ combined_types:
+                folder = self._folders.get(choice_type)
+                if folder is None:
+                    continue
+                if choice_type in combined_types:
+                    self._update_all_choices([], folder.choices)
+                else:
+                    self._update_all_choices(folder.choices, [])
+            self._combined_types = combined_types
+        for choice_type in choice_types:
+            try:
+                self.get(choice_type)
+            except KeyError:
+                pass  # Ignore choice types that don't have a corresponding folder
+        with self._lock:
+            return list(self._all_choices)
+
+    def invalidate(self, choice_type=None):
+        """Forgets the cached list of ``choice_type``, or of every type if it is None."""
+        with self._lock:
+            if choice_type is None:
+                self._folders.clear()
+                self._model_folders = None
+                self._combined_types = set()
+                self._counts.clear()
+                self._all_choices = []
+                return
+            folder = self._folders.pop(choice_type, None)
+            if folder is not None and choice_type in self._combined_types:
+                self._update_all_choices(folder.choices, [])
+
+    def _store(self, choice_type, choices, signature, checked_at):
+        folder = self._folders.get(choice_type)
+        old_choices = folder.choices if folder is not None else []
+        if choice_type in self._combined_types and choices != old_choices:
+            self._update_all_choices(old_choices, choices)
+        self._folders[choice_type] = _FolderChoices(choices, signature, checked_at)
+
+    def _update_all_choices(self, old_choices, new_choices):
+        old_set = set(old_choices)
+        new_set = set(new_choices)
+        for choice in old_set - new_set:
+            self._counts[choice] -= 1
+            if self._counts[choice] <= 0:
+                del self._counts[choice]
+                i = bisect.bisect_left(self._all_choices, choice)
+                if i < len(self._all_choices) and self._all_choices[i] == choice:
+                    del self._all_choices[i]
+        for choice in new_set - old_set:
+            self._counts[choice] += 1
+            if self._counts[choice] == 1:
+                bisect.insort(self._all_choices, choice)
+
+    @staticmethod
+    def _signature(choice_type):
+        # Mtimes of the folder's base paths and of every directory below them,
+        # including ones that hold no model yet: adding, removing or renaming a
+        # file anywhere in the tree changes one. Links are followed, as
+        # folder_paths does when it lists the files.
+        signature = []
+        for base_path in folder_paths.folder_names_and_paths[choice_type][0]:
+            signature.append((base_path, _stat_mtime(base_path)))
+            for dirpath, dirnames, _ in os.walk(base_path, followlinks=True):
+                dirnames.sort()
+                for dirname in dirnames:
+                    path = os.path.join(dirpath, dirname)
+                    signature.append((path, _stat_mtime(path)))
+        return tuple(signature)
+
+
+choice_registry = ChoiceRegistry(
+    revalidate_interval=float(os.environ.get("COZYGEN_CHOICES_REVALIDATE_SECONDS", "5.0")),
+)
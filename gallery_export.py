@@ -0,0 +1,126 @@
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from .gallery_index import GALLERY_EXTENSIONS
+
+# Formats that are compressed already; deflating them again only costs CPU
+STORED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.mp4', '.webm', '.mp3', '.flac')
+
+CHUNK_SIZE = 1024 * 1024
+# Chunks written but not yet sent; with CHUNK_SIZE this bounds an export's memory
+QUEUE_CHUNKS = 8
+
+# Each running export holds one of these threads while it reads and compresses
+_export_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cozygen_export")
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+def folder_entries(folder, recursive=False):
+    """Yields ``(path, arcname)`` for the gallery files in ``folder``, walking it lazily.
+
+    Names are sorted so an export is reproducible; ``arcname`` is relative to
+    ``folder`` and uses forward slashes.
+    """
+    for root, dirs, files in os.walk(folder):
+        dirs.sort()
+        relative_root = os.path.relpath(root, folder)
+        for name in sorted(files):
+            if name.lower().endswith(GALLERY_EXTENSIONS):
+                arcname = name if relative_root == "." else os.path.join(relative_root, name)
+                yield os.path.join(root, name), arcname.replace(os.sep, "/")
+        if not recursive:
+            break
+
+
+class _ChunkSink:
+    # Write-only file object that hands ZipFile's output to the event loop in
+    # CHUNK_SIZE pieces, blocking the writer thread while the queue is full.
+    def __init__(self, loop, queue):
+        self._loop = loop
+        self._queue = queue
+        self._buffer = bytearray()
+        self.cancelled = False
+        self.bytes_written = 0
+
+    def write(self, data):
+        if not self._buffer and len(data) >= CHUNK_SIZE:
+            self._push(bytes(data))
+        else:
+            self._buffer += data
+            if len(self._buffer) >= CHUNK_SIZE:
+                self.flush()
+        return len(data)
+
+    def flush(self):
+        if self._buffer:
+            chunk = bytes(self._buffer)
+            self._buffer.clear()
+            self._push(chunk)
+
+    def _push(self, chunk):
+        if self.cancelled:
+            raise ExportCancelled()
+        self.bytes_written += len(chunk)
+        asyncio.run_coroutine_threadsafe(self._queue.put(chunk), self._loop).result()
+
+
+def _write_zip(entries, sink):
+    # ZipFile writes sequentially to a stream it cannot seek, so each member's
+    # sizes and CRC go in a data descriptor after its data.
+    import zipfile
+    with zipfile.ZipFile(sink, "w", allowZip64=True) as zf:
+        for path, arcname in entries:
+            try:
+                src = open(path, "rb")
+            except FileNotFoundError:
+                continue  # Deleted since it was listed
+            with src:
+                # The size from the stat decides whether the member needs ZIP64 fields
+                zinfo = zipfile.ZipInfo.from_file(path, arcname, strict_timestamps=False)
+                if arcname.lower().endswith(STORED_EXTENSIONS):
+                    zinfo.compress_type = zipfile.ZIP_STORED
+                else:
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                with zf.open(zinfo, "w") as dst:
+                    while chunk := src.read(CHUNK_SIZE):
+                        dst.write(chunk)
+    sink.flush()
+
+
+async def write_zip(response, entries):
+    """Writes a ZIP of ``entries`` to the prepared ``response`` as it is built.
+
+    ``entries`` is an iterable of ``(path, arcname)``; it is consumed in a
+    worker thread, so it can be a lazy directory walk. Nothing is staged on
+    disk and at most QUEUE_CHUNKS chunks are held in memory. Returns the
+    number of bytes written.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(QUEUE_CHUNKS)
+    sink = _ChunkSink(loop, queue)
+
+    def produce():
+        try:
+            _write_zip(entries, sink)
+        finally:
+            if not sink.cancelled:
+                asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+
+    future = loop.run_in_executor(_export_pool, produce)
+    try:
+        while (chunk := await queue.get()) is not None:
+            await response.write(chunk)
+        await future  # Re-raises an error from the writer thread
+    finally:
+        if not future.done():
+            # The client went away: stop the writer, and make room for a put
+            # it may be blocked on so it can notice.
+            sink.cancelled = True
+            while not queue.empty():
+                queue.get_nowait()
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    return sink.bytes_written
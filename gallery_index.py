@@ -0,0 +1,464 @@
+import os
+import json
+import time
+import heapq
+import base64
+import bisect
+import atexit
+import logging
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from . import metrics
+
+logger = logging.getLogger("CozyGen")
+
+# File types the gallery lists next to sub-directories
+GALLERY_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.mp4', '.webm', '.mp3', '.wav', '.flac')
+
+# Directories sort before files, so they get the lower rank
+DIRECTORY_RANK = 0
+FILE_RANK = 1
+
+SNAPSHOT_VERSION = 1
+
+
+def _sort_key(name, is_dir, mtime_ns):
+    # Ascending order of this key is "directories first, newest first"
+    return (DIRECTORY_RANK if is_dir else FILE_RANK, -mtime_ns, name)
+
+
+def encode_cursor(key):
+    rank, neg_mtime, name = key
+    raw = json.dumps([rank, -neg_mtime, name], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, mtime_ns, name = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return (int(rank), -int(mtime_ns), str(name))
+    except (ValueError, TypeError):
+        raise ValueError(f"Invalid gallery cursor: {cursor!r}")
+
+
+def encode_timeline_cursor(key):
+    neg_mtime, subfolder, name = key
+    raw = json.dumps([-neg_mtime, subfolder, name], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_timeline_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        mtime_ns, subfolder, name = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return (-int(mtime_ns), str(subfolder), str(name))
+    except (ValueError, TypeError):
+        raise ValueError(f"Invalid timeline cursor: {cursor!r}")
+
+
+def scan_directory(path, known=None, dir_stat=None):
+    """Lists a directory's sub-directories and gallery files.
+
+    Returns ``(dir_stat, entries)`` with ``entries`` as ``(name, is_dir,
+    mtime_ns)`` tuples. The directory is stat'ed before it is listed, so a
+    write racing with the scan shows up as a change on the next revalidation.
+    Files already in ``known`` (name -> sort key) keep their mtime; outputs
+    are written once, so only new names need a stat call.
+    """
+    started = time.perf_counter()
+    if dir_stat is None:
+        dir_stat = os.stat(path)
+    entries = []
+    scanned = 0
+    with os.scandir(path) as it:
+        for entry in it:
+            scanned += 1
+            name = entry.name
+            try:
+                if entry.is_dir():
+                    entries.append((name, True, entry.stat().st_mtime_ns))
+                elif name.lower().endswith(GALLERY_EXTENSIONS):
+                    key = known.get(name) if known else None
+                    if key is not None and key[0] == FILE_RANK:
+                        entries.append((name, False, -key[1]))
+                    else:
+                        entries.append((name, False, entry.stat().st_mtime_ns))
+            except FileNotFoundError:
+                pass
+    metrics.gallery_entries_scanned.inc(scanned)
+    metrics.gallery_scan_seconds.observe(time.perf_counter() - started)
+    return dir_stat, entries
+
+
+def _refresh_directory(path, dir_mtime, known):
+    # Runs in the scan pool. Returns (dir_stat, entries), with entries None when
+    # the directory is unchanged, or (None, None) when it is gone or unreadable.
+    try:
+        dir_stat = os.stat(path)
+        if dir_stat.st_mtime_ns == dir_mtime:
+            return dir_stat, None
+        return scan_directory(path, known, dir_stat)
+    except OSError:
+        return None, None
+
+
+class _FolderIndex:
+    """Entries of a single directory, kept sorted by (type, mtime)."""
+
+    __slots__ = ("path", "dir_mtime", "dir_id", "checked_at", "entries", "order", "subdirs")
+
+    def __init__(self, path):
+        self.path = path
+        self.dir_mtime = None
+        self.dir_id = None     # (st_dev, st_ino), to notice directory loops
+        self.checked_at = 0.0
+        self.entries = {}      # name -> sort key
+        self.order = []        # sort keys, ascending
+        self.subdirs = set()   # names of entries that are directories
+
+    def put(self, name, is_dir, mtime_ns):
+        key = _sort_key(name, is_dir, mtime_ns)
+        old_key = self.entries.get(name)
+        if old_key == key:
+            return
+        if old_key is not None:
+            self._discard_key(old_key)
+        self.entries[name] = key
+        bisect.insort(self.order, key)
+        if is_dir:
+            self.subdirs.add(name)
+        else:
+            self.subdirs.discard(name)
+
+    def remove(self, name):
+        key = self.entries.pop(name, None)
+        if key is not None:
+            self._discard_key(key)
+            self.subdirs.discard(name)
+
+    def _discard_key(self, key):
+        i = bisect.bisect_left(self.order, key)
+        if i < len(self.order) and self.order[i] == key:
+            del self.order[i]
+
+    def rescan(self):
+        dir_stat, entries = scan_directory(self.path, self.entries)
+        self.apply_scan(dir_stat, entries)
+
+    def apply_scan(self, dir_stat, entries):
+        """Replaces the folder's entries with the result of :func:`scan_directory`."""
+        self.dir_mtime = dir_stat.st_mtime_ns
+        self.dir_id = (dir_stat.st_dev, dir_stat.st_ino)
+        if not self.entries:
+            # A first scan sorts once instead of inserting entry by entry
+            for name, is_dir, mtime_ns in entries:
+                self.entries[name] = _sort_key(name, is_dir, mtime_ns)
+                if is_dir:
+                    self.subdirs.add(name)
+            self.order = sorted(self.entries.values())
+            return
+        seen = set()
+        for name, is_dir, mtime_ns in entries:
+            seen.add(name)
+            self.put(name, is_dir, mtime_ns)
+        for name in [n for n in self.entries if n not in seen]:
+            self.remove(name)
+
+    def revalidate(self):
+        dir_stat = os.stat(self.path)
+        self.dir_id = (dir_stat.st_dev, dir_stat.st_ino)
+        if dir_stat.st_mtime_ns != self.dir_mtime:
+            self.rescan()
+            return True
+        # Writes inside a sub-directory do not touch this directory's mtime,
+        # but they do change that sub-directory's position in the listing.
+        for name in list(self.subdirs):
+            try:
+                self.put(name, True, os.stat(os.path.join(self.path, name)).st_mtime_ns)
+            except FileNotFoundError:
+                self.remove(name)
+        return False
+
+
+class GalleryIndex:
+    """In-memory index of gallery folders, pre-sorted for O(page size) listing.
+
+    Folders are scanned once on first access. Afterwards they are revalidated
+    from the directory mtime (at most every ``revalidate_interval`` seconds),
+    rescanning only when it changed, and files written by the CozyGen output
+    nodes are recorded directly. When ``snapshot_path`` is set the index is
+    persisted there so restarts don't pay a full scan of unchanged folders;
+    it is read on first use rather than when the package is imported.
+
+    :meth:`timeline` lists the files of a whole tree, newest first; its
+    folders are scanned by up to ``scan_workers`` threads.
+    """
+
+    def __init__(self, snapshot_path=None, revalidate_interval=1.0, snapshot_interval=30.0, scan_workers=8):
+        self.snapshot_path = snapshot_path
+        self.revalidate_interval = revalidate_interval
+        self.snapshot_interval = snapshot_interval
+        self._scan_pool = ThreadPoolExecutor(max_workers=scan_workers, thread_name_prefix="cozygen_gallery_scan")
+        self._folders = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._last_snapshot = time.monotonic()
+        self._snapshot_loaded = not snapshot_path
+        if snapshot_path:
+            atexit.register(self.save_snapshot)
+
+    def _load_snapshot_once(self):
+        # Called with the lock held
+        if not self._snapshot_loaded:
+            self._snapshot_loaded = True
+            self.load_snapshot()
+
+    def _fresh_folder(self, path):
+        self._load_snapshot_once()
+        path = os.path.normpath(path)
+        folder = self._folders.get(path)
+        now = time.monotonic()
+        if folder is None:
+            folder = _FolderIndex(path)
+            folder.rescan()
+            self._folders[path] = folder
+            self._dirty = True
+        elif now - folder.checked_at >= self.revalidate_interval:
+            if folder.revalidate():
+                self._dirty = True
+        folder.checked_at = now
+        return folder
+
+    def page(self, path, offset, limit):
+        """Returns ``(entries, total, next_cursor)`` for ``limit`` items from ``offset``.
+
+        ``entries`` is a list of ``(name, is_dir, mtime_ns)`` tuples.
+        """
+        with self._lock:
+            folder = self._fresh_folder(path)
+            keys = folder.order[offset:offset + limit]
+            total = len(folder.order)
+            result = self._page_result(keys, offset + len(keys) < total, total)
+        self._maybe_save_snapshot()
+        return result
+
+    def page_after(self, path, cursor, limit):
+        """Keyset variant of :meth:`page`: items strictly after ``cursor``."""
+        key = decode_cursor(cursor)
+        with self._lock:
+            folder = self._fresh_folder(path)
+            start = bisect.bisect_right(folder.order, key)
+            keys = folder.order[start:start + limit]
+            total = len(folder.order)
+            result = self._page_result(keys, start + len(keys) < total, total)
+        self._maybe_save_snapshot()
+        return result
+
+    @staticmethod
+    def _page_result(keys, has_more, total):
+        entries = [(name, rank == DIRECTORY_RANK, -neg_mtime) for rank, neg_mtime, name in keys]
+        next_cursor = encode_cursor(keys[-1]) if keys and has_more else None
+        return entries, total, next_cursor
+
+    def timeline(self, root, limit, cursor=None):
+        """Returns ``(entries, total, next_cursor)`` for the newest files anywhere under ``root``.
+
+        ``entries`` is a list of ``(subfolder, name, mtime_ns)`` tuples with
+        ``subfolder`` relative to ``root``; ``cursor`` continues after the
+        last entry of a previous page. Every folder's files are already
+        sorted, so they are merged lazily and a page costs
+        O(folders + limit * log(folders)), not a sort of the whole tree.
+        """
+        after = decode_timeline_cursor(cursor) if cursor else None
+        folders = self._refresh_tree(os.path.normpath(root))
+        with self._lock:
+            streams = []
+            total = 0
+            for subfolder, path in folders:
+                folder = self._folders.get(path)
+                if folder is None:
+                    continue
+                order = folder.order
+                start = first_file = bisect.bisect_left(order, (FILE_RANK,))
+                total += len(order) - first_file
+                if after is not None:
+                    start = max(first_file, self._timeline_start(order, subfolder, after))
+                streams.append(self._timeline_stream(order, start, subfolder))
+            keys = list(itertools.islice(heapq.merge(*streams), limit + 1))
+        has_more = len(keys) > limit
+        keys = keys[:limit]
+        entries = [(subfolder, name, -neg_mtime) for neg_mtime, subfolder, name in keys]
+        next_cursor = encode_timeline_cursor(keys[-1]) if keys and has_more else None
+        self._maybe_save_snapshot()
+        return entries, total, next_cursor
+
+    @staticmethod
+    def _timeline_stream(order, start, subfolder):
+        # Timeline keys sort newest first, then by folder and name, across folders
+        for i in range(start, len(order)):
+            _, neg_mtime, name = order[i]
+            yield (neg_mtime, subfolder, name)
+
+    @staticmethod
+    def _timeline_start(order, subfolder, after):
+        # First position in a folder's order whose timeline key is after ``after``
+        neg_mtime, after_subfolder, after_name = after
+        if subfolder < after_subfolder:
+            return bisect.bisect_left(order, (FILE_RANK, neg_mtime + 1))
+        if subfolder == after_subfolder:
+            return bisect.bisect_right(order, (FILE_RANK, neg_mtime, after_name))
+        return bisect.bisect_left(order, (FILE_RANK, neg_mtime))
+
+    def _refresh_tree(self, root):
+        """Brings every folder under ``root`` up to date, one level at a time.
+
+        Stale folders of a level are stat'ed, and rescanned if they changed,
+        in the scan pool without holding the index lock. Returns the folders
+        as ``(subfolder relative to root, path)``.
+        """
+        folders = []
+        visited = set()
+        level = [("", root, None)]  # (subfolder, path, (parent path, name))
+        while level:
+            now = time.monotonic()
+            with self._lock:
+                self._load_snapshot_once()
+                stale = []
+                for subfolder, path, parent in level:
+                    folder = self._folders.get(path)
+                    if folder is None or now - folder.checked_at >= self.revalidate_interval:
+                        dir_mtime = folder.dir_mtime if folder is not None else None
+                        known = folder.entries if folder is not None else None
+                        stale.append((path, dir_mtime, known))
+            # Workers only look names up in ``known``, which is safe while it is updated
+            results = list(self._scan_pool.map(_refresh_directory, *zip(*stale))) if stale else []
+
+            refreshed = set()
+            with self._lock:
+                for (path, _, _), (dir_stat, entries) in zip(stale, results):
+                    if dir_stat is None:
+                        if self._folders.pop(path, None) is not None:
+                            self._dirty = True
+                        continue
+                    folder = self._folders.get(path)
+                    if folder is None:
+                        if entries is None:
+                            continue  # Invalidated meanwhile; the next request scans it
+                        folder = self._folders[path] = _FolderIndex(path)
+                    if entries is not None:
+                        folder.apply_scan(dir_stat, entries)
+                        self._dirty = True
+                    folder.dir_id = (dir_stat.st_dev, dir_stat.st_ino)
+                    folder.checked_at = now
+                    refreshed.add(path)
+
+                next_level = []
+                for subfolder, path, parent in level:
+                    folder = self._folders.get(path)
+                    if folder is None or folder.dir_id in visited:
+                        continue
+                    if folder.dir_id is not None:
+                        visited.add(folder.dir_id)
+                    if parent is not None and path in refreshed:
+                        # Keep the parent's listing order in step, as revalidate() would
+                        parent_folder = self._folders.get(parent[0])
+                        if parent_folder is not None and parent[1] in parent_folder.subdirs:
+                            parent_folder.put(parent[1], True, folder.dir_mtime)
+                    folders.append((subfolder, path))
+                    for name in sorted(folder.subdirs):
+                        next_level.append((os.path.join(subfolder, name), os.path.join(path, name), (path, name)))
+            level = next_level
+        return folders
+
+    def record_file(self, file_path):
+        """Adds a freshly written file to its folder's index, if that folder is indexed.
+
+        The folder's recorded mtime is left alone, so files written by anything
+        else at the same time are still picked up by the next revalidation.
+        """
+        file_path = os.path.normpath(file_path)
+        folder_path, name = os.path.split(file_path)
+        if not name.lower().endswith(GALLERY_EXTENSIONS):
+            return
+        with self._lock:
+            self._load_snapshot_once()
+            folder = self._folders.get(folder_path)
+            if folder is not None:
+                try:
+                    folder.put(name, False, os.stat(file_path).st_mtime_ns)
+                except FileNotFoundError:
+                    return
+                self._dirty = True
+            parent_path, folder_name = os.path.split(folder_path)
+            parent = self._folders.get(parent_path)
+            if parent is not None and folder_name in parent.subdirs:
+                try:
+                    parent.put(folder_name, True, os.stat(folder_path).st_mtime_ns)
+                except FileNotFoundError:
+                    pass
+
+    def invalidate(self, path=None):
+        with self._lock:
+            self._load_snapshot_once()
+            if path is None:
+                self._folders.clear()
+            else:
+                self._folders.pop(os.path.normpath(path), None)
+            self._dirty = True
+
+    def _maybe_save_snapshot(self):
+        if self.snapshot_path and self._dirty and time.monotonic() - self._last_snapshot >= self.snapshot_interval:
+            self.save_snapshot()
+
+    def save_snapshot(self):
+        if not self.snapshot_path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            folders = {
+                path: {
+                    "dir_mtime": folder.dir_mtime,
+                    "entries": [[name, rank == DIRECTORY_RANK, -neg_mtime] for rank, neg_mtime, name in folder.order],
+                }
+                for path, folder in self._folders.items()
+            }
+            self._dirty = False
+            self._last_snapshot = time.monotonic()
+        tmp_path = f"{self.snapshot_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": SNAPSHOT_VERSION, "folders": folders}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            logger.warning("Could not write gallery index snapshot: %s", e)
+
+    def load_snapshot(self):
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable gallery index snapshot: %s", e)
+            return
+        if data.get("version") != SNAPSHOT_VERSION:
+            return
+        with self._lock:
+            for path, stored in data.get("folders", {}).items():
+                folder = _FolderIndex(path)
+                folder.dir_mtime = stored["dir_mtime"]
+                for name, is_dir, mtime_ns in stored["entries"]:
+                    folder.put(name, is_dir, mtime_ns)
+                # checked_at stays 0, so the first access revalidates the folder
+                self._folders[path] = folder
+
+
+gallery_index = GalleryIndex(
+    snapshot_path=os.environ.get("COZYGEN_GALLERY_SNAPSHOT") or None,
+    revalidate_interval=float(os.environ.get("COZYGEN_GALLERY_REVALIDATE_SECONDS", "1.0")),
+    scan_workers=int(os.environ.get("COZYGEN_GALLERY_SCAN_WORKERS", "8")),
+)
@@ -1,120 +0,0 @@
-function tp(e,t){for(var n=0;n<t.length;n++){const r=t[n];if(typeof r!="string"&&!Array.isArray(r)){for(const o in r)if(o!=="default"&&!(o in e)){const l=Object.getOwnPropertyDescriptor(r,o);l&&Object.defineProperty(e,o,l.get?l:{enumerable:!0,get:()=>r[o]})}}}return Object.freeze(Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}))}(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const o of document.querySelectorAll('link[rel="modulepreload"]'))r(o);new MutationObserver(o=>{for(const l of o)if(l.type==="childList")for(const i of l.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(o){const l={};return o.integrity&&(l.integrity=o.integrity),o.referrerPolicy&&(l.referrerPolicy=o.referrerPolicy),o.crossOrigin==="use-credentials"?l.credentials="include":o.crossOrigin==="anonymous"?l.credentials="omit":l.credentials="same-origin",l}function r(o){if(o.ep)return;o.ep=!0;const l=n(o);fetch(o.href,l)}})();function Zu(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}function np(e){if(e.__esModule)return e;var t=e.default;if(typeof t=="function"){var n=function r(){return this instanceof r?Reflect.construct(t,arguments,this.constructor):t.apply(this,arguments)};n.prototype=t.prototype}else n={};return Object.defineProperty(n,"__esModule",{value:!0}),Object.keys(e).forEach(function(r){var o=Object.getOwnPropertyDescriptor(e,r);Object.defineProperty(n,r,o.get?o:{enumerable:!0,get:function(){return e[r]}})}),n}var qu={exports:{}},fl={},Ju={exports:{}},b={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Yr=Symbol.for("react.element"),rp=Symbol.for("react.portal"),op=Symbol.for("react.fragment"),lp=Symbol.for("react.strict_mode"),ip=Symbol.for("react.profiler"),ap=Symbol.for("react.provider"),sp=Symbol.for("react.context"),up=Symbol.for("react.forward_ref"),cp=Symbol.for("react.suspense"),fp=Symbol.for("react.memo"),dp=Symbol.for("react.lazy"),gs=Symbol.iterator;function pp(e){return e===null||typeof e!="object"?null:(e=gs&&e[gs]||e["@@iterator"],typeof e=="function"?e:null)}var ec={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},tc=Object.assign,nc={};function Qn(e,t,n){this.props=e,this.context=t,this.refs=nc,this.updater=n||ec}Qn.prototype.isReactComponent={};Qn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};Qn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function rc(){}rc.prototype=Qn.prototype;function va(e,t,n){this.props=e,this.context=t,this.refs=nc,this.updater=n||ec}var ga=va.prototype=new rc;ga.constructor=va;tc(ga,Qn.prototype);ga.isPureReactComponent=!0;var ys=Array.isArray,oc=Object.prototype.hasOwnProperty,ya={current:null},lc={key:!0,ref:!0,__self:!0,__source:!0};function ic(e,t,n){var r,o={},l=null,i=null;if(t!=null)for(r in t.ref!==void 0&&(i=t.ref),t.key!==void 0&&(l=""+t.key),t)oc.call(t,r)&&!lc.hasOwnProperty(r)&&(o[r]=t[r]);var a=arguments.length-2;if(a===1)o.children=n;else if(1<a){for(var s=Array(a),u=0;u<a;u++)s[u]=arguments[u+2];o.children=s}if(e&&e.defaultProps)for(r in a=e.defaultProps,a)o[r]===void 0&&(o[r]=a[r]);return{$$typeof:Yr,type:e,key:l,ref:i,props:o,_owner:ya.current}}function mp(e,t){return{$$typeof:Yr,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function wa(e){return typeof e=="object"&&e!==null&&e.$$typeof===Yr}function hp(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var ws=/\/+/g;function Dl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?hp(""+e.key):t.toString(36)}function ko(e,t,n,r,o){var l=typeof e;(l==="undefined"||l==="boolean")&&(e=null);var i=!1;if(e===null)i=!0;else switch(l){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case Yr:case rp:i=!0}}if(i)return i=e,o=o(i),e=r===""?"."+Dl(i,0):r,ys(o)?(n="",e!=null&&(n=e.replace(ws,"$&/")+"/"),ko(o,t,n,"",function(u){return u})):o!=null&&(wa(o)&&(o=mp(o,n+(!o.key||i&&i.key===o.key?"":(""+o.key).replace(ws,"$&/")+"/")+e)),t.push(o)),1;if(i=0,r=r===""?".":r+":",ys(e))for(var a=0;a<e.length;a++){l=e[a];var s=r+Dl(l,a);i+=ko(l,t,n,s,o)}else if(s=pp(e),typeof s=="function")for(e=s.call(e),a=0;!(l=e.next()).done;)l=l.value,s=r+Dl(l,a++),i+=ko(l,t,n,s,o);else if(l==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return i}function no(e,t,n){if(e==null)return e;var r=[],o=0;return ko(e,r,"","",function(l){return t.call(n,l,o++)}),r}function vp(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var Te={current:null},Eo={transition:null},gp={ReactCurrentDispatcher:Te,ReactCurrentBatchConfig:Eo,ReactCurrentOwner:ya};function ac(){throw Error("act(...) is not supported in production builds of React.")}b.Children={map:no,forEach:function(e,t,n){no(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return no(e,function(){t++}),t},toArray:function(e){return no(e,function(t){return t})||[]},only:function(e){if(!wa(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};b.Component=Qn;b.Fragment=op;b.Profiler=ip;b.PureComponent=va;b.StrictMode=lp;b.Suspense=cp;b.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=gp;b.act=ac;b.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=tc({},e.props),o=e.key,l=e.ref,i=e._owner;if(t!=null){if(t.ref!==void 0&&(l=t.ref,i=ya.current),t.key!==void 0&&(o=""+t.key),e.type&&e.type.defaultProps)var a=e.type.defaultProps;for(s in t)oc.call(t,s)&&!lc.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&a!==void 0?a[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){a=Array(s);for(var u=0;u<s;u++)a[u]=arguments[u+2];r.children=a}return{$$typeof:Yr,type:e.type,key:o,ref:l,props:r,_owner:i}};b.createContext=function(e){return e={$$typeof:sp,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:ap,_context:e},e.Consumer=e};b.createElement=ic;b.createFactory=function(e){var t=ic.bind(null,e);return t.type=e,t};b.createRef=function(){return{current:null}};b.forwardRef=function(e){return{$$typeof:up,render:e}};b.isValidElement=wa;b.lazy=function(e){return{$$typeof:dp,_payload:{_status:-1,_result:e},_init:vp}};b.memo=function(e,t){return{$$typeof:fp,type:e,compare:t===void 0?null:t}};b.startTransition=function(e){var t=Eo.transition;Eo.transition={};try{e()}finally{Eo.transition=t}};b.unstable_act=ac;b.useCallback=function(e,t){return Te.current.useCallback(e,t)};b.useContext=function(e){return Te.current.useContext(e)};b.useDebugValue=function(){};b.useDeferredValue=function(e){return Te.current.useDeferredValue(e)};b.useEffect=function(e,t){return Te.current.useEffect(e,t)};b.useId=function(){return Te.current.useId()};b.useImperativeHandle=function(e,t,n){return Te.current.useImperativeHandle(e,t,n)};b.useInsertionEffect=function(e,t){return Te.current.useInsertionEffect(e,t)};b.useLayoutEffect=function(e,t){return Te.current.useLayoutEffect(e,t)};b.useMemo=function(e,t){return Te.current.useMemo(e,t)};b.useReducer=function(e,t,n){return Te.current.useReducer(e,t,n)};b.useRef=function(e){return Te.current.useRef(e)};b.useState=function(e){return Te.current.useState(e)};b.useSyncExternalStore=function(e,t,n){return Te.current.useSyncExternalStore(e,t,n)};b.useTransition=function(){return Te.current.useTransition()};b.version="18.3.1";Ju.exports=b;var E=Ju.exports;const pt=Zu(E),yp=tp({__proto__:null,default:pt},[E]);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var wp=E,Sp=Symbol.for("react.element"),Cp=Symbol.for("react.fragment"),xp=Object.prototype.hasOwnProperty,kp=wp.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,Ep={key:!0,ref:!0,__self:!0,__source:!0};function sc(e,t,n){var r,o={},l=null,i=null;n!==void 0&&(l=""+n),t.key!==void 0&&(l=""+t.key),t.ref!==void 0&&(i=t.ref);for(r in t)xp.call(t,r)&&!Ep.hasOwnProperty(r)&&(o[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)o[r]===void 0&&(o[r]=t[r]);return{$$typeof:Sp,type:e,key:l,ref:i,props:o,_owner:kp.current}}fl.Fragment=Cp;fl.jsx=sc;fl.jsxs=sc;qu.exports=fl;var S=qu.exports,ci={},uc={exports:{}},$e={},cc={exports:{}},fc={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(y,T){var z=y.length;y.push(T);e:for(;0<z;){var F=z-1>>>1,D=y[F];if(0<o(D,T))y[F]=T,y[z]=D,z=F;else break e}}function n(y){return y.length===0?null:y[0]}function r(y){if(y.length===0)return null;var T=y[0],z=y.pop();if(z!==T){y[0]=z;e:for(var F=0,D=y.length,U=D>>>1;F<U;){var $=2*(F+1)-1,ee=y[$],K=$+1,te=y[K];if(0>o(ee,z))K<D&&0>o(te,ee)?(y[F]=te,y[K]=z,F=K):(y[F]=ee,y[$]=z,F=$);else if(K<D&&0>o(te,z))y[F]=te,y[K]=z,F=K;else break e}}return T}function o(y,T){var z=y.sortIndex-T.sortIndex;return z!==0?z:y.id-T.id}if(typeof performance=="object"&&typeof performance.now=="function"){var l=performance;e.unstable_now=function(){return l.now()}}else{var i=Date,a=i.now();e.unstable_now=function(){return i.now()-a}}var s=[],u=[],c=1,f=null,p=3,v=!1,g=!1,w=!1,k=typeof setTimeout=="function"?setTimeout:null,h=typeof clearTimeout=="function"?clearTimeout:null,d=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function m(y){for(var T=n(u);T!==null;){if(T.callback===null)r(u);else if(T.startTime<=y)r(u),T.sortIndex=T.expirationTime,t(s,T);else break;T=n(u)}}function C(y){if(w=!1,m(y),!g)if(n(s)!==null)g=!0,V(_);else{var T=n(u);T!==null&&x(C,T.startTime-y)}}function _(y,T){g=!1,w&&(w=!1,h(P),P=-1),v=!0;var z=p;try{for(m(T),f=n(s);f!==null&&(!(f.expirationTime>T)||y&&!Q());){var F=f.callback;if(typeof F=="function"){f.callback=null,p=f.priorityLevel;var D=F(f.expirationTime<=T);T=e.unstable_now(),typeof D=="function"?f.callback=D:f===n(s)&&r(s),m(T)}else r(s);f=n(s)}if(f!==null)var U=!0;else{var $=n(u);$!==null&&x(C,$.startTime-T),U=!1}return U}finally{f=null,p=z,v=!1}}var R=!1,N=null,P=-1,M=5,j=-1;function Q(){return!(e.unstable_now()-j<M)}function Z(){if(N!==null){var y=e.unstable_now();j=y;var T=!0;try{T=N(!0,y)}finally{T?ie():(R=!1,N=null)}}else R=!1}var ie;if(typeof d=="function")ie=function(){d(Z)};else if(typeof MessageChannel<"u"){var W=new MessageChannel,A=W.port2;W.port1.onmessage=Z,ie=function(){A.postMessage(null)}}else ie=function(){k(Z,0)};function V(y){N=y,R||(R=!0,ie())}function x(y,T){P=k(function(){y(e.unstable_now())},T)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(y){y.callback=null},e.unstable_continueExecution=function(){g||v||(g=!0,V(_))},e.unstable_forceFrameRate=function(y){0>y||125<y?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):M=0<y?Math.floor(1e3/y):5},e.unstable_getCurrentPriorityLevel=function(){return p},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(y){switch(p){case 1:case 2:case 3:var T=3;break;default:T=p}var z=p;p=T;try{return y()}finally{p=z}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(y,T){switch(y){case 1:case 2:case 3:case 4:case 5:break;default:y=3}var z=p;p=y;try{return T()}finally{p=z}},e.unstable_scheduleCallback=function(y,T,z){var F=e.unstable_now();switch(typeof z=="object"&&z!==null?(z=z.delay,z=typeof z=="number"&&0<z?F+z:F):z=F,y){case 1:var D=-1;break;case 2:D=250;break;case 5:D=1073741823;break;case 4:D=1e4;break;default:D=5e3}return D=z+D,y={id:c++,callback:T,priorityLevel:y,startTime:z,expirationTime:D,sortIndex:-1},z>F?(y.sortIndex=z,t(u,y),n(s)===null&&y===n(u)&&(w?(h(P),P=-1):w=!0,x(C,z-F))):(y.sortIndex=D,t(s,y),g||v||(g=!0,V(_))),y},e.unstable_shouldYield=Q,e.unstable_wrapCallback=function(y){var T=p;return function(){var z=p;p=T;try{return y.apply(this,arguments)}finally{p=z}}}})(fc);cc.exports=fc;var _p=cc.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Pp=E,Ue=_p;function O(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var dc=new Set,kr={};function hn(e,t){Un(e,t),Un(e+"Capture",t)}function Un(e,t){for(kr[e]=t,e=0;e<t.length;e++)dc.add(t[e])}var wt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),fi=Object.prototype.hasOwnProperty,Np=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Ss={},Cs={};function Op(e){return fi.call(Cs,e)?!0:fi.call(Ss,e)?!1:Np.test(e)?Cs[e]=!0:(Ss[e]=!0,!1)}function Tp(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function Rp(e,t,n,r){if(t===null||typeof t>"u"||Tp(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function Re(e,t,n,r,o,l,i){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=o,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=l,this.removeEmptyString=i}var Ce={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){Ce[e]=new Re(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];Ce[t]=new Re(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){Ce[e]=new Re(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){Ce[e]=new Re(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){Ce[e]=new Re(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){Ce[e]=new Re(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){Ce[e]=new Re(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){Ce[e]=new Re(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){Ce[e]=new Re(e,5,!1,e.toLowerCase(),null,!1,!1)});var Sa=/[\-:]([a-z])/g;function Ca(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(Sa,Ca);Ce[t]=new Re(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(Sa,Ca);Ce[t]=new Re(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(Sa,Ca);Ce[t]=new Re(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){Ce[e]=new Re(e,1,!1,e.toLowerCase(),null,!1,!1)});Ce.xlinkHref=new Re("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){Ce[e]=new Re(e,1,!1,e.toLowerCase(),null,!0,!0)});function xa(e,t,n,r){var o=Ce.hasOwnProperty(t)?Ce[t]:null;(o!==null?o.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(Rp(t,n,o,r)&&(n=null),r||o===null?Op(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):o.mustUseProperty?e[o.propertyName]=n===null?o.type===3?!1:"":n:(t=o.attributeName,r=o.attributeNamespace,n===null?e.removeAttribute(t):(o=o.type,n=o===3||o===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var kt=Pp.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,ro=Symbol.for("react.element"),Sn=Symbol.for("react.portal"),Cn=Symbol.for("react.fragment"),ka=Symbol.for("react.strict_mode"),di=Symbol.for("react.profiler"),pc=Symbol.for("react.provider"),mc=Symbol.for("react.context"),Ea=Symbol.for("react.forward_ref"),pi=Symbol.for("react.suspense"),mi=Symbol.for("react.suspense_list"),_a=Symbol.for("react.memo"),_t=Symbol.for("react.lazy"),hc=Symbol.for("react.offscreen"),xs=Symbol.iterator;function Jn(e){return e===null||typeof e!="object"?null:(e=xs&&e[xs]||e["@@iterator"],typeof e=="function"?e:null)}var ce=Object.assign,Ml;function sr(e){if(Ml===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Ml=t&&t[1]||""}return`
-`+Ml+e}var Al=!1;function Fl(e,t){if(!e||Al)return"";Al=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(u){var r=u}Reflect.construct(e,[],t)}else{try{t.call()}catch(u){r=u}e.call(t.prototype)}else{try{throw Error()}catch(u){r=u}e()}}catch(u){if(u&&r&&typeof u.stack=="string"){for(var o=u.stack.split(`
-`),l=r.stack.split(`
-`),i=o.length-1,a=l.length-1;1<=i&&0<=a&&o[i]!==l[a];)a--;for(;1<=i&&0<=a;i--,a--)if(o[i]!==l[a]){if(i!==1||a!==1)do if(i--,a--,0>a||o[i]!==l[a]){var s=`
-`+o[i].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=i&&0<=a);break}}}finally{Al=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?sr(e):""}function zp(e){switch(e.tag){case 5:return sr(e.type);case 16:return sr("Lazy");case 13:return sr("Suspense");case 19:return sr("SuspenseList");case 0:case 2:case 15:return e=Fl(e.type,!1),e;case 11:return e=Fl(e.type.render,!1),e;case 1:return e=Fl(e.type,!0),e;default:return""}}function hi(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case Cn:return"Fragment";case Sn:return"Portal";case di:return"Profiler";case ka:return"StrictMode";case pi:return"Suspense";case mi:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case mc:return(e.displayName||"Context")+".Consumer";case pc:return(e._context.displayName||"Context")+".Provider";case Ea:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case _a:return t=e.displayName||null,t!==null?t:hi(e.type)||"Memo";case _t:t=e._payload,e=e._init;try{return hi(e(t))}catch{}}return null}function Lp(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return hi(t);case 8:return t===ka?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function bt(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function vc(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function jp(e){var t=vc(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var o=n.get,l=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return o.call(this)},set:function(i){r=""+i,l.call(this,i)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(i){r=""+i},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function oo(e){e._valueTracker||(e._valueTracker=jp(e))}function gc(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=vc(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Ao(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function vi(e,t){var n=t.checked;return ce({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function ks(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=bt(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function yc(e,t){t=t.checked,t!=null&&xa(e,"checked",t,!1)}function gi(e,t){yc(e,t);var n=bt(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?yi(e,t.type,n):t.hasOwnProperty("defaultValue")&&yi(e,t.type,bt(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function Es(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function yi(e,t,n){(t!=="number"||Ao(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var ur=Array.isArray;function jn(e,t,n,r){if(e=e.options,t){t={};for(var o=0;o<n.length;o++)t["$"+n[o]]=!0;for(n=0;n<e.length;n++)o=t.hasOwnProperty("$"+e[n].value),e[n].selected!==o&&(e[n].selected=o),o&&r&&(e[n].defaultSelected=!0)}else{for(n=""+bt(n),t=null,o=0;o<e.length;o++){if(e[o].value===n){e[o].selected=!0,r&&(e[o].defaultSelected=!0);return}t!==null||e[o].disabled||(t=e[o])}t!==null&&(t.selected=!0)}}function wi(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(O(91));return ce({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function _s(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(O(92));if(ur(n)){if(1<n.length)throw Error(O(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:bt(n)}}function wc(e,t){var n=bt(t.value),r=bt(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function Ps(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function Sc(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function Si(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?Sc(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var lo,Cc=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,o){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,o)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(lo=lo||document.createElement("div"),lo.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=lo.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Er(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var dr={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},Dp=["Webkit","ms","Moz","O"];Object.keys(dr).forEach(function(e){Dp.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),dr[t]=dr[e]})});function xc(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||dr.hasOwnProperty(e)&&dr[e]?(""+t).trim():t+"px"}function kc(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,o=xc(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,o):e[n]=o}}var Mp=ce({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function Ci(e,t){if(t){if(Mp[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(O(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(O(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(O(61))}if(t.style!=null&&typeof t.style!="object")throw Error(O(62))}}function xi(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var ki=null;function Pa(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var Ei=null,Dn=null,Mn=null;function Ns(e){if(e=Vr(e)){if(typeof Ei!="function")throw Error(O(280));var t=e.stateNode;t&&(t=vl(t),Ei(e.stateNode,e.type,t))}}function Ec(e){Dn?Mn?Mn.push(e):Mn=[e]:Dn=e}function _c(){if(Dn){var e=Dn,t=Mn;if(Mn=Dn=null,Ns(e),t)for(e=0;e<t.length;e++)Ns(t[e])}}function Pc(e,t){return e(t)}function Nc(){}var Wl=!1;function Oc(e,t,n){if(Wl)return e(t,n);Wl=!0;try{return Pc(e,t,n)}finally{Wl=!1,(Dn!==null||Mn!==null)&&(Nc(),_c())}}function _r(e,t){var n=e.stateNode;if(n===null)return null;var r=vl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(O(231,t,typeof n));return n}var _i=!1;if(wt)try{var er={};Object.defineProperty(er,"passive",{get:function(){_i=!0}}),window.addEventListener("test",er,er),window.removeEventListener("test",er,er)}catch{_i=!1}function Ap(e,t,n,r,o,l,i,a,s){var u=Array.prototype.slice.call(arguments,3);try{t.apply(n,u)}catch(c){this.onError(c)}}var pr=!1,Fo=null,Wo=!1,Pi=null,Fp={onError:function(e){pr=!0,Fo=e}};function Wp(e,t,n,r,o,l,i,a,s){pr=!1,Fo=null,Ap.apply(Fp,arguments)}function Up(e,t,n,r,o,l,i,a,s){if(Wp.apply(this,arguments),pr){if(pr){var u=Fo;pr=!1,Fo=null}else throw Error(O(198));Wo||(Wo=!0,Pi=u)}}function vn(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function Tc(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function Os(e){if(vn(e)!==e)throw Error(O(188))}function $p(e){var t=e.alternate;if(!t){if(t=vn(e),t===null)throw Error(O(188));return t!==e?null:e}for(var n=e,r=t;;){var o=n.return;if(o===null)break;var l=o.alternate;if(l===null){if(r=o.return,r!==null){n=r;continue}break}if(o.child===l.child){for(l=o.child;l;){if(l===n)return Os(o),e;if(l===r)return Os(o),t;l=l.sibling}throw Error(O(188))}if(n.return!==r.return)n=o,r=l;else{for(var i=!1,a=o.child;a;){if(a===n){i=!0,n=o,r=l;break}if(a===r){i=!0,r=o,n=l;break}a=a.sibling}if(!i){for(a=l.child;a;){if(a===n){i=!0,n=l,r=o;break}if(a===r){i=!0,r=l,n=o;break}a=a.sibling}if(!i)throw Error(O(189))}}if(n.alternate!==r)throw Error(O(190))}if(n.tag!==3)throw Error(O(188));return n.stateNode.current===n?e:t}function Rc(e){return e=$p(e),e!==null?zc(e):null}function zc(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=zc(e);if(t!==null)return t;e=e.sibling}return null}var Lc=Ue.unstable_scheduleCallback,Ts=Ue.unstable_cancelCallback,Ip=Ue.unstable_shouldYield,Bp=Ue.unstable_requestPaint,pe=Ue.unstable_now,bp=Ue.unstable_getCurrentPriorityLevel,Na=Ue.unstable_ImmediatePriority,jc=Ue.unstable_UserBlockingPriority,Uo=Ue.unstable_NormalPriority,Yp=Ue.unstable_LowPriority,Dc=Ue.unstable_IdlePriority,dl=null,ft=null;function Hp(e){if(ft&&typeof ft.onCommitFiberRoot=="function")try{ft.onCommitFiberRoot(dl,e,void 0,(e.current.flags&128)===128)}catch{}}var nt=Math.clz32?Math.clz32:Qp,Xp=Math.log,Vp=Math.LN2;function Qp(e){return e>>>=0,e===0?32:31-(Xp(e)/Vp|0)|0}var io=64,ao=4194304;function cr(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function $o(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,o=e.suspendedLanes,l=e.pingedLanes,i=n&268435455;if(i!==0){var a=i&~o;a!==0?r=cr(a):(l&=i,l!==0&&(r=cr(l)))}else i=n&~o,i!==0?r=cr(i):l!==0&&(r=cr(l));if(r===0)return 0;if(t!==0&&t!==r&&!(t&o)&&(o=r&-r,l=t&-t,o>=l||o===16&&(l&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-nt(t),o=1<<n,r|=e[n],t&=~o;return r}function Kp(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Gp(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,o=e.expirationTimes,l=e.pendingLanes;0<l;){var i=31-nt(l),a=1<<i,s=o[i];s===-1?(!(a&n)||a&r)&&(o[i]=Kp(a,t)):s<=t&&(e.expiredLanes|=a),l&=~a}}function Ni(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Mc(){var e=io;return io<<=1,!(io&4194240)&&(io=64),e}function Ul(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Hr(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-nt(t),e[t]=n}function Zp(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var o=31-nt(n),l=1<<o;t[o]=0,r[o]=-1,e[o]=-1,n&=~l}}function Oa(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-nt(n),o=1<<r;o&t|e[r]&t&&(e[r]|=t),n&=~o}}var G=0;function Ac(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Fc,Ta,Wc,Uc,$c,Oi=!1,so=[],jt=null,Dt=null,Mt=null,Pr=new Map,Nr=new Map,Nt=[],qp="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Rs(e,t){switch(e){case"focusin":case"focusout":jt=null;break;case"dragenter":case"dragleave":Dt=null;break;case"mouseover":case"mouseout":Mt=null;break;case"pointerover":case"pointerout":Pr.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Nr.delete(t.pointerId)}}function tr(e,t,n,r,o,l){return e===null||e.nativeEvent!==l?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:l,targetContainers:[o]},t!==null&&(t=Vr(t),t!==null&&Ta(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,o!==null&&t.indexOf(o)===-1&&t.push(o),e)}function Jp(e,t,n,r,o){switch(t){case"focusin":return jt=tr(jt,e,t,n,r,o),!0;case"dragenter":return Dt=tr(Dt,e,t,n,r,o),!0;case"mouseover":return Mt=tr(Mt,e,t,n,r,o),!0;case"pointerover":var l=o.pointerId;return Pr.set(l,tr(Pr.get(l)||null,e,t,n,r,o)),!0;case"gotpointercapture":return l=o.pointerId,Nr.set(l,tr(Nr.get(l)||null,e,t,n,r,o)),!0}return!1}function Ic(e){var t=tn(e.target);if(t!==null){var n=vn(t);if(n!==null){if(t=n.tag,t===13){if(t=Tc(n),t!==null){e.blockedOn=t,$c(e.priority,function(){Wc(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function _o(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=Ti(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);ki=r,n.target.dispatchEvent(r),ki=null}else return t=Vr(n),t!==null&&Ta(t),e.blockedOn=n,!1;t.shift()}return!0}function zs(e,t,n){_o(e)&&n.delete(t)}function em(){Oi=!1,jt!==null&&_o(jt)&&(jt=null),Dt!==null&&_o(Dt)&&(Dt=null),Mt!==null&&_o(Mt)&&(Mt=null),Pr.forEach(zs),Nr.forEach(zs)}function nr(e,t){e.blockedOn===t&&(e.blockedOn=null,Oi||(Oi=!0,Ue.unstable_scheduleCallback(Ue.unstable_NormalPriority,em)))}function Or(e){function t(o){return nr(o,e)}if(0<so.length){nr(so[0],e);for(var n=1;n<so.length;n++){var r=so[n];r.blockedOn===e&&(r.blockedOn=null)}}for(jt!==null&&nr(jt,e),Dt!==null&&nr(Dt,e),Mt!==null&&nr(Mt,e),Pr.forEach(t),Nr.forEach(t),n=0;n<Nt.length;n++)r=Nt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<Nt.length&&(n=Nt[0],n.blockedOn===null);)Ic(n),n.blockedOn===null&&Nt.shift()}var An=kt.ReactCurrentBatchConfig,Io=!0;function tm(e,t,n,r){var o=G,l=An.transition;An.transition=null;try{G=1,Ra(e,t,n,r)}finally{G=o,An.transition=l}}function nm(e,t,n,r){var o=G,l=An.transition;An.transition=null;try{G=4,Ra(e,t,n,r)}finally{G=o,An.transition=l}}function Ra(e,t,n,r){if(Io){var o=Ti(e,t,n,r);if(o===null)Kl(e,t,r,Bo,n),Rs(e,r);else if(Jp(o,e,t,n,r))r.stopPropagation();else if(Rs(e,r),t&4&&-1<qp.indexOf(e)){for(;o!==null;){var l=Vr(o);if(l!==null&&Fc(l),l=Ti(e,t,n,r),l===null&&Kl(e,t,r,Bo,n),l===o)break;o=l}o!==null&&r.stopPropagation()}else Kl(e,t,r,null,n)}}var Bo=null;function Ti(e,t,n,r){if(Bo=null,e=Pa(r),e=tn(e),e!==null)if(t=vn(e),t===null)e=null;else if(n=t.tag,n===13){if(e=Tc(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Bo=e,null}function Bc(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(bp()){case Na:return 1;case jc:return 4;case Uo:case Yp:return 16;case Dc:return 536870912;default:return 16}default:return 16}}var Tt=null,za=null,Po=null;function bc(){if(Po)return Po;var e,t=za,n=t.length,r,o="value"in Tt?Tt.value:Tt.textContent,l=o.length;for(e=0;e<n&&t[e]===o[e];e++);var i=n-e;for(r=1;r<=i&&t[n-r]===o[l-r];r++);return Po=o.slice(e,1<r?1-r:void 0)}function No(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function uo(){return!0}function Ls(){return!1}function Ie(e){function t(n,r,o,l,i){this._reactName=n,this._targetInst=o,this.type=r,this.nativeEvent=l,this.target=i,this.currentTarget=null;for(var a in e)e.hasOwnProperty(a)&&(n=e[a],this[a]=n?n(l):l[a]);return this.isDefaultPrevented=(l.defaultPrevented!=null?l.defaultPrevented:l.returnValue===!1)?uo:Ls,this.isPropagationStopped=Ls,this}return ce(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=uo)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=uo)},persist:function(){},isPersistent:uo}),t}var Kn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},La=Ie(Kn),Xr=ce({},Kn,{view:0,detail:0}),rm=Ie(Xr),$l,Il,rr,pl=ce({},Xr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:ja,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==rr&&(rr&&e.type==="mousemove"?($l=e.screenX-rr.screenX,Il=e.screenY-rr.screenY):Il=$l=0,rr=e),$l)},movementY:function(e){return"movementY"in e?e.movementY:Il}}),js=Ie(pl),om=ce({},pl,{dataTransfer:0}),lm=Ie(om),im=ce({},Xr,{relatedTarget:0}),Bl=Ie(im),am=ce({},Kn,{animationName:0,elapsedTime:0,pseudoElement:0}),sm=Ie(am),um=ce({},Kn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),cm=Ie(um),fm=ce({},Kn,{data:0}),Ds=Ie(fm),dm={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},pm={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},mm={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function hm(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=mm[e])?!!t[e]:!1}function ja(){return hm}var vm=ce({},Xr,{key:function(e){if(e.key){var t=dm[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=No(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?pm[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:ja,charCode:function(e){return e.type==="keypress"?No(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?No(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),gm=Ie(vm),ym=ce({},pl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Ms=Ie(ym),wm=ce({},Xr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:ja}),Sm=Ie(wm),Cm=ce({},Kn,{propertyName:0,elapsedTime:0,pseudoElement:0}),xm=Ie(Cm),km=ce({},pl,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Em=Ie(km),_m=[9,13,27,32],Da=wt&&"CompositionEvent"in window,mr=null;wt&&"documentMode"in document&&(mr=document.documentMode);var Pm=wt&&"TextEvent"in window&&!mr,Yc=wt&&(!Da||mr&&8<mr&&11>=mr),As=" ",Fs=!1;function Hc(e,t){switch(e){case"keyup":return _m.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Xc(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var xn=!1;function Nm(e,t){switch(e){case"compositionend":return Xc(t);case"keypress":return t.which!==32?null:(Fs=!0,As);case"textInput":return e=t.data,e===As&&Fs?null:e;default:return null}}function Om(e,t){if(xn)return e==="compositionend"||!Da&&Hc(e,t)?(e=bc(),Po=za=Tt=null,xn=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Yc&&t.locale!=="ko"?null:t.data;default:return null}}var Tm={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Ws(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Tm[e.type]:t==="textarea"}function Vc(e,t,n,r){Ec(r),t=bo(t,"onChange"),0<t.length&&(n=new La("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var hr=null,Tr=null;function Rm(e){of(e,0)}function ml(e){var t=_n(e);if(gc(t))return e}function zm(e,t){if(e==="change")return t}var Qc=!1;if(wt){var bl;if(wt){var Yl="oninput"in document;if(!Yl){var Us=document.createElement("div");Us.setAttribute("oninput","return;"),Yl=typeof Us.oninput=="function"}bl=Yl}else bl=!1;Qc=bl&&(!document.documentMode||9<document.documentMode)}function $s(){hr&&(hr.detachEvent("onpropertychange",Kc),Tr=hr=null)}function Kc(e){if(e.propertyName==="value"&&ml(Tr)){var t=[];Vc(t,Tr,e,Pa(e)),Oc(Rm,t)}}function Lm(e,t,n){e==="focusin"?($s(),hr=t,Tr=n,hr.attachEvent("onpropertychange",Kc)):e==="focusout"&&$s()}function jm(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return ml(Tr)}function Dm(e,t){if(e==="click")return ml(t)}function Mm(e,t){if(e==="input"||e==="change")return ml(t)}function Am(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var lt=typeof Object.is=="function"?Object.is:Am;function Rr(e,t){if(lt(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var o=n[r];if(!fi.call(t,o)||!lt(e[o],t[o]))return!1}return!0}function Is(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Bs(e,t){var n=Is(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=Is(n)}}function Gc(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Gc(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Zc(){for(var e=window,t=Ao();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Ao(e.document)}return t}function Ma(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function Fm(e){var t=Zc(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&Gc(n.ownerDocument.documentElement,n)){if(r!==null&&Ma(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var o=n.textContent.length,l=Math.min(r.start,o);r=r.end===void 0?l:Math.min(r.end,o),!e.extend&&l>r&&(o=r,r=l,l=o),o=Bs(n,l);var i=Bs(n,r);o&&i&&(e.rangeCount!==1||e.anchorNode!==o.node||e.anchorOffset!==o.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&(t=t.createRange(),t.setStart(o.node,o.offset),e.removeAllRanges(),l>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var Wm=wt&&"documentMode"in document&&11>=document.documentMode,kn=null,Ri=null,vr=null,zi=!1;function bs(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;zi||kn==null||kn!==Ao(r)||(r=kn,"selectionStart"in r&&Ma(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),vr&&Rr(vr,r)||(vr=r,r=bo(Ri,"onSelect"),0<r.length&&(t=new La("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=kn)))}function co(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var En={animationend:co("Animation","AnimationEnd"),animationiteration:co("Animation","AnimationIteration"),animationstart:co("Animation","AnimationStart"),transitionend:co("Transition","TransitionEnd")},Hl={},qc={};wt&&(qc=document.createElement("div").style,"AnimationEvent"in window||(delete En.animationend.animation,delete En.animationiteration.animation,delete En.animationstart.animation),"TransitionEvent"in window||delete En.transitionend.transition);function hl(e){if(Hl[e])return Hl[e];if(!En[e])return e;var t=En[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in qc)return Hl[e]=t[n];return e}var Jc=hl("animationend"),ef=hl("animationiteration"),tf=hl("animationstart"),nf=hl("transitionend"),rf=new Map,Ys="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Xt(e,t){rf.set(e,t),hn(t,[e])}for(var Xl=0;Xl<Ys.length;Xl++){var Vl=Ys[Xl],Um=Vl.toLowerCase(),$m=Vl[0].toUpperCase()+Vl.slice(1);Xt(Um,"on"+$m)}Xt(Jc,"onAnimationEnd");Xt(ef,"onAnimationIteration");Xt(tf,"onAnimationStart");Xt("dblclick","onDoubleClick");Xt("focusin","onFocus");Xt("focusout","onBlur");Xt(nf,"onTransitionEnd");Un("onMouseEnter",["mouseout","mouseover"]);Un("onMouseLeave",["mouseout","mouseover"]);Un("onPointerEnter",["pointerout","pointerover"]);Un("onPointerLeave",["pointerout","pointerover"]);hn("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));hn("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));hn("onBeforeInput",["compositionend","keypress","textInput","paste"]);hn("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));hn("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));hn("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var fr="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Im=new Set("cancel close invalid load scroll toggle".split(" ").concat(fr));function Hs(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,Up(r,t,void 0,e),e.currentTarget=null}function of(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],o=r.event;r=r.listeners;e:{var l=void 0;if(t)for(var i=r.length-1;0<=i;i--){var a=r[i],s=a.instance,u=a.currentTarget;if(a=a.listener,s!==l&&o.isPropagationStopped())break e;Hs(o,a,u),l=s}else for(i=0;i<r.length;i++){if(a=r[i],s=a.instance,u=a.currentTarget,a=a.listener,s!==l&&o.isPropagationStopped())break e;Hs(o,a,u),l=s}}}if(Wo)throw e=Pi,Wo=!1,Pi=null,e}function ne(e,t){var n=t[Ai];n===void 0&&(n=t[Ai]=new Set);var r=e+"__bubble";n.has(r)||(lf(t,e,2,!1),n.add(r))}function Ql(e,t,n){var r=0;t&&(r|=4),lf(n,e,r,t)}var fo="_reactListening"+Math.random().toString(36).slice(2);function zr(e){if(!e[fo]){e[fo]=!0,dc.forEach(function(n){n!=="selectionchange"&&(Im.has(n)||Ql(n,!1,e),Ql(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[fo]||(t[fo]=!0,Ql("selectionchange",!1,t))}}function lf(e,t,n,r){switch(Bc(t)){case 1:var o=tm;break;case 4:o=nm;break;default:o=Ra}n=o.bind(null,t,n,e),o=void 0,!_i||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(o=!0),r?o!==void 0?e.addEventListener(t,n,{capture:!0,passive:o}):e.addEventListener(t,n,!0):o!==void 0?e.addEventListener(t,n,{passive:o}):e.addEventListener(t,n,!1)}function Kl(e,t,n,r,o){var l=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var i=r.tag;if(i===3||i===4){var a=r.stateNode.containerInfo;if(a===o||a.nodeType===8&&a.parentNode===o)break;if(i===4)for(i=r.return;i!==null;){var s=i.tag;if((s===3||s===4)&&(s=i.stateNode.containerInfo,s===o||s.nodeType===8&&s.parentNode===o))return;i=i.return}for(;a!==null;){if(i=tn(a),i===null)return;if(s=i.tag,s===5||s===6){r=l=i;continue e}a=a.parentNode}}r=r.return}Oc(function(){var u=l,c=Pa(n),f=[];e:{var p=rf.get(e);if(p!==void 0){var v=La,g=e;switch(e){case"keypress":if(No(n)===0)break e;case"keydown":case"keyup":v=gm;break;case"focusin":g="focus",v=Bl;break;case"focusout":g="blur",v=Bl;break;case"beforeblur":case"afterblur":v=Bl;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":v=js;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":v=lm;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":v=Sm;break;case Jc:case ef:case tf:v=sm;break;case nf:v=xm;break;case"scroll":v=rm;break;case"wheel":v=Em;break;case"copy":case"cut":case"paste":v=cm;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":v=Ms}var w=(t&4)!==0,k=!w&&e==="scroll",h=w?p!==null?p+"Capture":null:p;w=[];for(var d=u,m;d!==null;){m=d;var C=m.stateNode;if(m.tag===5&&C!==null&&(m=C,h!==null&&(C=_r(d,h),C!=null&&w.push(Lr(d,C,m)))),k)break;d=d.return}0<w.length&&(p=new v(p,g,null,n,c),f.push({event:p,listeners:w}))}}if(!(t&7)){e:{if(p=e==="mouseover"||e==="pointerover",v=e==="mouseout"||e==="pointerout",p&&n!==ki&&(g=n.relatedTarget||n.fromElement)&&(tn(g)||g[St]))break e;if((v||p)&&(p=c.window===c?c:(p=c.ownerDocument)?p.defaultView||p.parentWindow:window,v?(g=n.relatedTarget||n.toElement,v=u,g=g?tn(g):null,g!==null&&(k=vn(g),g!==k||g.tag!==5&&g.tag!==6)&&(g=null)):(v=null,g=u),v!==g)){if(w=js,C="onMouseLeave",h="onMouseEnter",d="mouse",(e==="pointerout"||e==="pointerover")&&(w=Ms,C="onPointerLeave",h="onPointerEnter",d="pointer"),k=v==null?p:_n(v),m=g==null?p:_n(g),p=new w(C,d+"leave",v,n,c),p.target=k,p.relatedTarget=m,C=null,tn(c)===u&&(w=new w(h,d+"enter",g,n,c),w.target=m,w.relatedTarget=k,C=w),k=C,v&&g)t:{for(w=v,h=g,d=0,m=w;m;m=wn(m))d++;for(m=0,C=h;C;C=wn(C))m++;for(;0<d-m;)w=wn(w),d--;for(;0<m-d;)h=wn(h),m--;for(;d--;){if(w===h||h!==null&&w===h.alternate)break t;w=wn(w),h=wn(h)}w=null}else w=null;v!==null&&Xs(f,p,v,w,!1),g!==null&&k!==null&&Xs(f,k,g,w,!0)}}e:{if(p=u?_n(u):window,v=p.nodeName&&p.nodeName.toLowerCase(),v==="select"||v==="input"&&p.type==="file")var _=zm;else if(Ws(p))if(Qc)_=Mm;else{_=jm;var R=Lm}else(v=p.nodeName)&&v.toLowerCase()==="input"&&(p.type==="checkbox"||p.type==="radio")&&(_=Dm);if(_&&(_=_(e,u))){Vc(f,_,n,c);break e}R&&R(e,p,u),e==="focusout"&&(R=p._wrapperState)&&R.controlled&&p.type==="number"&&yi(p,"number",p.value)}switch(R=u?_n(u):window,e){case"focusin":(Ws(R)||R.contentEditable==="true")&&(kn=R,Ri=u,vr=null);break;case"focusout":vr=Ri=kn=null;break;case"mousedown":zi=!0;break;case"contextmenu":case"mouseup":case"dragend":zi=!1,bs(f,n,c);break;case"selectionchange":if(Wm)break;case"keydown":case"keyup":bs(f,n,c)}var N;if(Da)e:{switch(e){case"compositionstart":var P="onCompositionStart";break e;case"compositionend":P="onCompositionEnd";break e;case"compositionupdate":P="onCompositionUpdate";break e}P=void 0}else xn?Hc(e,n)&&(P="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(P="onCompositionStart");P&&(Yc&&n.locale!=="ko"&&(xn||P!=="onCompositionStart"?P==="onCompositionEnd"&&xn&&(N=bc()):(Tt=c,za="value"in Tt?Tt.value:Tt.textContent,xn=!0)),R=bo(u,P),0<R.length&&(P=new Ds(P,e,null,n,c),f.push({event:P,listeners:R}),N?P.data=N:(N=Xc(n),N!==null&&(P.data=N)))),(N=Pm?Nm(e,n):Om(e,n))&&(u=bo(u,"onBeforeInput"),0<u.length&&(c=new Ds("onBeforeInput","beforeinput",null,n,c),f.push({event:c,listeners:u}),c.data=N))}of(f,t)})}function Lr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function bo(e,t){for(var n=t+"Capture",r=[];e!==null;){var o=e,l=o.stateNode;o.tag===5&&l!==null&&(o=l,l=_r(e,n),l!=null&&r.unshift(Lr(e,l,o)),l=_r(e,t),l!=null&&r.push(Lr(e,l,o))),e=e.return}return r}function wn(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Xs(e,t,n,r,o){for(var l=t._reactName,i=[];n!==null&&n!==r;){var a=n,s=a.alternate,u=a.stateNode;if(s!==null&&s===r)break;a.tag===5&&u!==null&&(a=u,o?(s=_r(n,l),s!=null&&i.unshift(Lr(n,s,a))):o||(s=_r(n,l),s!=null&&i.push(Lr(n,s,a)))),n=n.return}i.length!==0&&e.push({event:t,listeners:i})}var Bm=/\r\n?/g,bm=/\u0000|\uFFFD/g;function Vs(e){return(typeof e=="string"?e:""+e).replace(Bm,`
-`).replace(bm,"")}function po(e,t,n){if(t=Vs(t),Vs(e)!==t&&n)throw Error(O(425))}function Yo(){}var Li=null,ji=null;function Di(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Mi=typeof setTimeout=="function"?setTimeout:void 0,Ym=typeof clearTimeout=="function"?clearTimeout:void 0,Qs=typeof Promise=="function"?Promise:void 0,Hm=typeof queueMicrotask=="function"?queueMicrotask:typeof Qs<"u"?function(e){return Qs.resolve(null).then(e).catch(Xm)}:Mi;function Xm(e){setTimeout(function(){throw e})}function Gl(e,t){var n=t,r=0;do{var o=n.nextSibling;if(e.removeChild(n),o&&o.nodeType===8)if(n=o.data,n==="/$"){if(r===0){e.removeChild(o),Or(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=o}while(n);Or(t)}function At(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function Ks(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var Gn=Math.random().toString(36).slice(2),ct="__reactFiber$"+Gn,jr="__reactProps$"+Gn,St="__reactContainer$"+Gn,Ai="__reactEvents$"+Gn,Vm="__reactListeners$"+Gn,Qm="__reactHandles$"+Gn;function tn(e){var t=e[ct];if(t)return t;for(var n=e.parentNode;n;){if(t=n[St]||n[ct]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=Ks(e);e!==null;){if(n=e[ct])return n;e=Ks(e)}return t}e=n,n=e.parentNode}return null}function Vr(e){return e=e[ct]||e[St],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function _n(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(O(33))}function vl(e){return e[jr]||null}var Fi=[],Pn=-1;function Vt(e){return{current:e}}function re(e){0>Pn||(e.current=Fi[Pn],Fi[Pn]=null,Pn--)}function J(e,t){Pn++,Fi[Pn]=e.current,e.current=t}var Yt={},Pe=Vt(Yt),je=Vt(!1),un=Yt;function $n(e,t){var n=e.type.contextTypes;if(!n)return Yt;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var o={},l;for(l in n)o[l]=t[l];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=o),o}function De(e){return e=e.childContextTypes,e!=null}function Ho(){re(je),re(Pe)}function Gs(e,t,n){if(Pe.current!==Yt)throw Error(O(168));J(Pe,t),J(je,n)}function af(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var o in r)if(!(o in t))throw Error(O(108,Lp(e)||"Unknown",o));return ce({},n,r)}function Xo(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Yt,un=Pe.current,J(Pe,e),J(je,je.current),!0}function Zs(e,t,n){var r=e.stateNode;if(!r)throw Error(O(169));n?(e=af(e,t,un),r.__reactInternalMemoizedMergedChildContext=e,re(je),re(Pe),J(Pe,e)):re(je),J(je,n)}var ht=null,gl=!1,Zl=!1;function sf(e){ht===null?ht=[e]:ht.push(e)}function Km(e){gl=!0,sf(e)}function Qt(){if(!Zl&&ht!==null){Zl=!0;var e=0,t=G;try{var n=ht;for(G=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}ht=null,gl=!1}catch(o){throw ht!==null&&(ht=ht.slice(e+1)),Lc(Na,Qt),o}finally{G=t,Zl=!1}}return null}var Nn=[],On=0,Vo=null,Qo=0,be=[],Ye=0,cn=null,vt=1,gt="";function qt(e,t){Nn[On++]=Qo,Nn[On++]=Vo,Vo=e,Qo=t}function uf(e,t,n){be[Ye++]=vt,be[Ye++]=gt,be[Ye++]=cn,cn=e;var r=vt;e=gt;var o=32-nt(r)-1;r&=~(1<<o),n+=1;var l=32-nt(t)+o;if(30<l){var i=o-o%5;l=(r&(1<<i)-1).toString(32),r>>=i,o-=i,vt=1<<32-nt(t)+o|n<<o|r,gt=l+e}else vt=1<<l|n<<o|r,gt=e}function Aa(e){e.return!==null&&(qt(e,1),uf(e,1,0))}function Fa(e){for(;e===Vo;)Vo=Nn[--On],Nn[On]=null,Qo=Nn[--On],Nn[On]=null;for(;e===cn;)cn=be[--Ye],be[Ye]=null,gt=be[--Ye],be[Ye]=null,vt=be[--Ye],be[Ye]=null}var We=null,Fe=null,le=!1,et=null;function cf(e,t){var n=He(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function qs(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,We=e,Fe=At(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,We=e,Fe=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=cn!==null?{id:vt,overflow:gt}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=He(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,We=e,Fe=null,!0):!1;default:return!1}}function Wi(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Ui(e){if(le){var t=Fe;if(t){var n=t;if(!qs(e,t)){if(Wi(e))throw Error(O(418));t=At(n.nextSibling);var r=We;t&&qs(e,t)?cf(r,n):(e.flags=e.flags&-4097|2,le=!1,We=e)}}else{if(Wi(e))throw Error(O(418));e.flags=e.flags&-4097|2,le=!1,We=e}}}function Js(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;We=e}function mo(e){if(e!==We)return!1;if(!le)return Js(e),le=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!Di(e.type,e.memoizedProps)),t&&(t=Fe)){if(Wi(e))throw ff(),Error(O(418));for(;t;)cf(e,t),t=At(t.nextSibling)}if(Js(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(O(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){Fe=At(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}Fe=null}}else Fe=We?At(e.stateNode.nextSibling):null;return!0}function ff(){for(var e=Fe;e;)e=At(e.nextSibling)}function In(){Fe=We=null,le=!1}function Wa(e){et===null?et=[e]:et.push(e)}var Gm=kt.ReactCurrentBatchConfig;function or(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(O(309));var r=n.stateNode}if(!r)throw Error(O(147,e));var o=r,l=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===l?t.ref:(t=function(i){var a=o.refs;i===null?delete a[l]:a[l]=i},t._stringRef=l,t)}if(typeof e!="string")throw Error(O(284));if(!n._owner)throw Error(O(290,e))}return e}function ho(e,t){throw e=Object.prototype.toString.call(t),Error(O(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function eu(e){var t=e._init;return t(e._payload)}function df(e){function t(h,d){if(e){var m=h.deletions;m===null?(h.deletions=[d],h.flags|=16):m.push(d)}}function n(h,d){if(!e)return null;for(;d!==null;)t(h,d),d=d.sibling;return null}function r(h,d){for(h=new Map;d!==null;)d.key!==null?h.set(d.key,d):h.set(d.index,d),d=d.sibling;return h}function o(h,d){return h=$t(h,d),h.index=0,h.sibling=null,h}function l(h,d,m){return h.index=m,e?(m=h.alternate,m!==null?(m=m.index,m<d?(h.flags|=2,d):m):(h.flags|=2,d)):(h.flags|=1048576,d)}function i(h){return e&&h.alternate===null&&(h.flags|=2),h}function a(h,d,m,C){return d===null||d.tag!==6?(d=oi(m,h.mode,C),d.return=h,d):(d=o(d,m),d.return=h,d)}function s(h,d,m,C){var _=m.type;return _===Cn?c(h,d,m.props.children,C,m.key):d!==null&&(d.elementType===_||typeof _=="object"&&_!==null&&_.$$typeof===_t&&eu(_)===d.type)?(C=o(d,m.props),C.ref=or(h,d,m),C.return=h,C):(C=Do(m.type,m.key,m.props,null,h.mode,C),C.ref=or(h,d,m),C.return=h,C)}function u(h,d,m,C){return d===null||d.tag!==4||d.stateNode.containerInfo!==m.containerInfo||d.stateNode.implementation!==m.implementation?(d=li(m,h.mode,C),d.return=h,d):(d=o(d,m.children||[]),d.return=h,d)}function c(h,d,m,C,_){return d===null||d.tag!==7?(d=ln(m,h.mode,C,_),d.return=h,d):(d=o(d,m),d.return=h,d)}function f(h,d,m){if(typeof d=="string"&&d!==""||typeof d=="number")return d=oi(""+d,h.mode,m),d.return=h,d;if(typeof d=="object"&&d!==null){switch(d.$$typeof){case ro:return m=Do(d.type,d.key,d.props,null,h.mode,m),m.ref=or(h,null,d),m.return=h,m;case Sn:return d=li(d,h.mode,m),d.return=h,d;case _t:var C=d._init;return f(h,C(d._payload),m)}if(ur(d)||Jn(d))return d=ln(d,h.mode,m,null),d.return=h,d;ho(h,d)}return null}function p(h,d,m,C){var _=d!==null?d.key:null;if(typeof m=="string"&&m!==""||typeof m=="number")return _!==null?null:a(h,d,""+m,C);if(typeof m=="object"&&m!==null){switch(m.$$typeof){case ro:return m.key===_?s(h,d,m,C):null;case Sn:return m.key===_?u(h,d,m,C):null;case _t:return _=m._init,p(h,d,_(m._payload),C)}if(ur(m)||Jn(m))return _!==null?null:c(h,d,m,C,null);ho(h,m)}return null}function v(h,d,m,C,_){if(typeof C=="string"&&C!==""||typeof C=="number")return h=h.get(m)||null,a(d,h,""+C,_);if(typeof C=="object"&&C!==null){switch(C.$$typeof){case ro:return h=h.get(C.key===null?m:C.key)||null,s(d,h,C,_);case Sn:return h=h.get(C.key===null?m:C.key)||null,u(d,h,C,_);case _t:var R=C._init;return v(h,d,m,R(C._payload),_)}if(ur(C)||Jn(C))return h=h.get(m)||null,c(d,h,C,_,null);ho(d,C)}return null}function g(h,d,m,C){for(var _=null,R=null,N=d,P=d=0,M=null;N!==null&&P<m.length;P++){N.index>P?(M=N,N=null):M=N.sibling;var j=p(h,N,m[P],C);if(j===null){N===null&&(N=M);break}e&&N&&j.alternate===null&&t(h,N),d=l(j,d,P),R===null?_=j:R.sibling=j,R=j,N=M}if(P===m.length)return n(h,N),le&&qt(h,P),_;if(N===null){for(;P<m.length;P++)N=f(h,m[P],C),N!==null&&(d=l(N,d,P),R===null?_=N:R.sibling=N,R=N);return le&&qt(h,P),_}for(N=r(h,N);P<m.length;P++)M=v(N,h,P,m[P],C),M!==null&&(e&&M.alternate!==null&&N.delete(M.key===null?P:M.key),d=l(M,d,P),R===null?_=M:R.sibling=M,R=M);return e&&N.forEach(function(Q){return t(h,Q)}),le&&qt(h,P),_}function w(h,d,m,C){var _=Jn(m);if(typeof _!="function")throw Error(O(150));if(m=_.call(m),m==null)throw Error(O(151));for(var R=_=null,N=d,P=d=0,M=null,j=m.next();N!==null&&!j.done;P++,j=m.next()){N.index>P?(M=N,N=null):M=N.sibling;var Q=p(h,N,j.value,C);if(Q===null){N===null&&(N=M);break}e&&N&&Q.alternate===null&&t(h,N),d=l(Q,d,P),R===null?_=Q:R.sibling=Q,R=Q,N=M}if(j.done)return n(h,N),le&&qt(h,P),_;if(N===null){for(;!j.done;P++,j=m.next())j=f(h,j.value,C),j!==null&&(d=l(j,d,P),R===null?_=j:R.sibling=j,R=j);return le&&qt(h,P),_}for(N=r(h,N);!j.done;P++,j=m.next())j=v(N,h,P,j.value,C),j!==null&&(e&&j.alternate!==null&&N.delete(j.key===null?P:j.key),d=l(j,d,P),R===null?_=j:R.sibling=j,R=j);return e&&N.forEach(function(Z){return t(h,Z)}),le&&qt(h,P),_}function k(h,d,m,C){if(typeof m=="object"&&m!==null&&m.type===Cn&&m.key===null&&(m=m.props.children),typeof m=="object"&&m!==null){switch(m.$$typeof){case ro:e:{for(var _=m.key,R=d;R!==null;){if(R.key===_){if(_=m.type,_===Cn){if(R.tag===7){n(h,R.sibling),d=o(R,m.props.children),d.return=h,h=d;break e}}else if(R.elementType===_||typeof _=="object"&&_!==null&&_.$$typeof===_t&&eu(_)===R.type){n(h,R.sibling),d=o(R,m.props),d.ref=or(h,R,m),d.return=h,h=d;break e}n(h,R);break}else t(h,R);R=R.sibling}m.type===Cn?(d=ln(m.props.children,h.mode,C,m.key),d.return=h,h=d):(C=Do(m.type,m.key,m.props,null,h.mode,C),C.ref=or(h,d,m),C.return=h,h=C)}return i(h);case Sn:e:{for(R=m.key;d!==null;){if(d.key===R)if(d.tag===4&&d.stateNode.containerInfo===m.containerInfo&&d.stateNode.implementation===m.implementation){n(h,d.sibling),d=o(d,m.children||[]),d.return=h,h=d;break e}else{n(h,d);break}else t(h,d);d=d.sibling}d=li(m,h.mode,C),d.return=h,h=d}return i(h);case _t:return R=m._init,k(h,d,R(m._payload),C)}if(ur(m))return g(h,d,m,C);if(Jn(m))return w(h,d,m,C);ho(h,m)}return typeof m=="string"&&m!==""||typeof m=="number"?(m=""+m,d!==null&&d.tag===6?(n(h,d.sibling),d=o(d,m),d.return=h,h=d):(n(h,d),d=oi(m,h.mode,C),d.return=h,h=d),i(h)):n(h,d)}return k}var Bn=df(!0),pf=df(!1),Ko=Vt(null),Go=null,Tn=null,Ua=null;function $a(){Ua=Tn=Go=null}function Ia(e){var t=Ko.current;re(Ko),e._currentValue=t}function $i(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Fn(e,t){Go=e,Ua=Tn=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(Le=!0),e.firstContext=null)}function Qe(e){var t=e._currentValue;if(Ua!==e)if(e={context:e,memoizedValue:t,next:null},Tn===null){if(Go===null)throw Error(O(308));Tn=e,Go.dependencies={lanes:0,firstContext:e}}else Tn=Tn.next=e;return t}var nn=null;function Ba(e){nn===null?nn=[e]:nn.push(e)}function mf(e,t,n,r){var o=t.interleaved;return o===null?(n.next=n,Ba(t)):(n.next=o.next,o.next=n),t.interleaved=n,Ct(e,r)}function Ct(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var Pt=!1;function ba(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function hf(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function yt(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Ft(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,X&2){var o=r.pending;return o===null?t.next=t:(t.next=o.next,o.next=t),r.pending=t,Ct(e,n)}return o=r.interleaved,o===null?(t.next=t,Ba(r)):(t.next=o.next,o.next=t),r.interleaved=t,Ct(e,n)}function Oo(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,Oa(e,n)}}function tu(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var o=null,l=null;if(n=n.firstBaseUpdate,n!==null){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};l===null?o=l=i:l=l.next=i,n=n.next}while(n!==null);l===null?o=l=t:l=l.next=t}else o=l=t;n={baseState:r.baseState,firstBaseUpdate:o,lastBaseUpdate:l,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Zo(e,t,n,r){var o=e.updateQueue;Pt=!1;var l=o.firstBaseUpdate,i=o.lastBaseUpdate,a=o.shared.pending;if(a!==null){o.shared.pending=null;var s=a,u=s.next;s.next=null,i===null?l=u:i.next=u,i=s;var c=e.alternate;c!==null&&(c=c.updateQueue,a=c.lastBaseUpdate,a!==i&&(a===null?c.firstBaseUpdate=u:a.next=u,c.lastBaseUpdate=s))}if(l!==null){var f=o.baseState;i=0,c=u=s=null,a=l;do{var p=a.lane,v=a.eventTime;if((r&p)===p){c!==null&&(c=c.next={eventTime:v,lane:0,tag:a.tag,payload:a.payload,callback:a.callback,next:null});e:{var g=e,w=a;switch(p=t,v=n,w.tag){case 1:if(g=w.payload,typeof g=="function"){f=g.call(v,f,p);break e}f=g;break e;case 3:g.flags=g.flags&-65537|128;case 0:if(g=w.payload,p=typeof g=="function"?g.call(v,f,p):g,p==null)break e;f=ce({},f,p);break e;case 2:Pt=!0}}a.callback!==null&&a.lane!==0&&(e.flags|=64,p=o.effects,p===null?o.effects=[a]:p.push(a))}else v={eventTime:v,lane:p,tag:a.tag,payload:a.payload,callback:a.callback,next:null},c===null?(u=c=v,s=f):c=c.next=v,i|=p;if(a=a.next,a===null){if(a=o.shared.pending,a===null)break;p=a,a=p.next,p.next=null,o.lastBaseUpdate=p,o.shared.pending=null}}while(!0);if(c===null&&(s=f),o.baseState=s,o.firstBaseUpdate=u,o.lastBaseUpdate=c,t=o.shared.interleaved,t!==null){o=t;do i|=o.lane,o=o.next;while(o!==t)}else l===null&&(o.shared.lanes=0);dn|=i,e.lanes=i,e.memoizedState=f}}function nu(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],o=r.callback;if(o!==null){if(r.callback=null,r=n,typeof o!="function")throw Error(O(191,o));o.call(r)}}}var Qr={},dt=Vt(Qr),Dr=Vt(Qr),Mr=Vt(Qr);function rn(e){if(e===Qr)throw Error(O(174));return e}function Ya(e,t){switch(J(Mr,t),J(Dr,e),J(dt,Qr),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:Si(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=Si(t,e)}re(dt),J(dt,t)}function bn(){re(dt),re(Dr),re(Mr)}function vf(e){rn(Mr.current);var t=rn(dt.current),n=Si(t,e.type);t!==n&&(J(Dr,e),J(dt,n))}function Ha(e){Dr.current===e&&(re(dt),re(Dr))}var se=Vt(0);function qo(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var ql=[];function Xa(){for(var e=0;e<ql.length;e++)ql[e]._workInProgressVersionPrimary=null;ql.length=0}var To=kt.ReactCurrentDispatcher,Jl=kt.ReactCurrentBatchConfig,fn=0,ue=null,he=null,ge=null,Jo=!1,gr=!1,Ar=0,Zm=0;function xe(){throw Error(O(321))}function Va(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!lt(e[n],t[n]))return!1;return!0}function Qa(e,t,n,r,o,l){if(fn=l,ue=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,To.current=e===null||e.memoizedState===null?th:nh,e=n(r,o),gr){l=0;do{if(gr=!1,Ar=0,25<=l)throw Error(O(301));l+=1,ge=he=null,t.updateQueue=null,To.current=rh,e=n(r,o)}while(gr)}if(To.current=el,t=he!==null&&he.next!==null,fn=0,ge=he=ue=null,Jo=!1,t)throw Error(O(300));return e}function Ka(){var e=Ar!==0;return Ar=0,e}function ut(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return ge===null?ue.memoizedState=ge=e:ge=ge.next=e,ge}function Ke(){if(he===null){var e=ue.alternate;e=e!==null?e.memoizedState:null}else e=he.next;var t=ge===null?ue.memoizedState:ge.next;if(t!==null)ge=t,he=e;else{if(e===null)throw Error(O(310));he=e,e={memoizedState:he.memoizedState,baseState:he.baseState,baseQueue:he.baseQueue,queue:he.queue,next:null},ge===null?ue.memoizedState=ge=e:ge=ge.next=e}return ge}function Fr(e,t){return typeof t=="function"?t(e):t}function ei(e){var t=Ke(),n=t.queue;if(n===null)throw Error(O(311));n.lastRenderedReducer=e;var r=he,o=r.baseQueue,l=n.pending;if(l!==null){if(o!==null){var i=o.next;o.next=l.next,l.next=i}r.baseQueue=o=l,n.pending=null}if(o!==null){l=o.next,r=r.baseState;var a=i=null,s=null,u=l;do{var c=u.lane;if((fn&c)===c)s!==null&&(s=s.next={lane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),r=u.hasEagerState?u.eagerState:e(r,u.action);else{var f={lane:c,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null};s===null?(a=s=f,i=r):s=s.next=f,ue.lanes|=c,dn|=c}u=u.next}while(u!==null&&u!==l);s===null?i=r:s.next=a,lt(r,t.memoizedState)||(Le=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){o=e;do l=o.lane,ue.lanes|=l,dn|=l,o=o.next;while(o!==e)}else o===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function ti(e){var t=Ke(),n=t.queue;if(n===null)throw Error(O(311));n.lastRenderedReducer=e;var r=n.dispatch,o=n.pending,l=t.memoizedState;if(o!==null){n.pending=null;var i=o=o.next;do l=e(l,i.action),i=i.next;while(i!==o);lt(l,t.memoizedState)||(Le=!0),t.memoizedState=l,t.baseQueue===null&&(t.baseState=l),n.lastRenderedState=l}return[l,r]}function gf(){}function yf(e,t){var n=ue,r=Ke(),o=t(),l=!lt(r.memoizedState,o);if(l&&(r.memoizedState=o,Le=!0),r=r.queue,Ga(Cf.bind(null,n,r,e),[e]),r.getSnapshot!==t||l||ge!==null&&ge.memoizedState.tag&1){if(n.flags|=2048,Wr(9,Sf.bind(null,n,r,o,t),void 0,null),ye===null)throw Error(O(349));fn&30||wf(n,t,o)}return o}function wf(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=ue.updateQueue,t===null?(t={lastEffect:null,stores:null},ue.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function Sf(e,t,n,r){t.value=n,t.getSnapshot=r,xf(t)&&kf(e)}function Cf(e,t,n){return n(function(){xf(t)&&kf(e)})}function xf(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!lt(e,n)}catch{return!0}}function kf(e){var t=Ct(e,1);t!==null&&rt(t,e,1,-1)}function ru(e){var t=ut();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Fr,lastRenderedState:e},t.queue=e,e=e.dispatch=eh.bind(null,ue,e),[t.memoizedState,e]}function Wr(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=ue.updateQueue,t===null?(t={lastEffect:null,stores:null},ue.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function Ef(){return Ke().memoizedState}function Ro(e,t,n,r){var o=ut();ue.flags|=e,o.memoizedState=Wr(1|t,n,void 0,r===void 0?null:r)}function yl(e,t,n,r){var o=Ke();r=r===void 0?null:r;var l=void 0;if(he!==null){var i=he.memoizedState;if(l=i.destroy,r!==null&&Va(r,i.deps)){o.memoizedState=Wr(t,n,l,r);return}}ue.flags|=e,o.memoizedState=Wr(1|t,n,l,r)}function ou(e,t){return Ro(8390656,8,e,t)}function Ga(e,t){return yl(2048,8,e,t)}function _f(e,t){return yl(4,2,e,t)}function Pf(e,t){return yl(4,4,e,t)}function Nf(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function Of(e,t,n){return n=n!=null?n.concat([e]):null,yl(4,4,Nf.bind(null,t,e),n)}function Za(){}function Tf(e,t){var n=Ke();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Va(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Rf(e,t){var n=Ke();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Va(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function zf(e,t,n){return fn&21?(lt(n,t)||(n=Mc(),ue.lanes|=n,dn|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,Le=!0),e.memoizedState=n)}function qm(e,t){var n=G;G=n!==0&&4>n?n:4,e(!0);var r=Jl.transition;Jl.transition={};try{e(!1),t()}finally{G=n,Jl.transition=r}}function Lf(){return Ke().memoizedState}function Jm(e,t,n){var r=Ut(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},jf(e))Df(t,n);else if(n=mf(e,t,n,r),n!==null){var o=Oe();rt(n,e,r,o),Mf(n,t,r)}}function eh(e,t,n){var r=Ut(e),o={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(jf(e))Df(t,o);else{var l=e.alternate;if(e.lanes===0&&(l===null||l.lanes===0)&&(l=t.lastRenderedReducer,l!==null))try{var i=t.lastRenderedState,a=l(i,n);if(o.hasEagerState=!0,o.eagerState=a,lt(a,i)){var s=t.interleaved;s===null?(o.next=o,Ba(t)):(o.next=s.next,s.next=o),t.interleaved=o;return}}catch{}finally{}n=mf(e,t,o,r),n!==null&&(o=Oe(),rt(n,e,r,o),Mf(n,t,r))}}function jf(e){var t=e.alternate;return e===ue||t!==null&&t===ue}function Df(e,t){gr=Jo=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Mf(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,Oa(e,n)}}var el={readContext:Qe,useCallback:xe,useContext:xe,useEffect:xe,useImperativeHandle:xe,useInsertionEffect:xe,useLayoutEffect:xe,useMemo:xe,useReducer:xe,useRef:xe,useState:xe,useDebugValue:xe,useDeferredValue:xe,useTransition:xe,useMutableSource:xe,useSyncExternalStore:xe,useId:xe,unstable_isNewReconciler:!1},th={readContext:Qe,useCallback:function(e,t){return ut().memoizedState=[e,t===void 0?null:t],e},useContext:Qe,useEffect:ou,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Ro(4194308,4,Nf.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Ro(4194308,4,e,t)},useInsertionEffect:function(e,t){return Ro(4,2,e,t)},useMemo:function(e,t){var n=ut();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=ut();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=Jm.bind(null,ue,e),[r.memoizedState,e]},useRef:function(e){var t=ut();return e={current:e},t.memoizedState=e},useState:ru,useDebugValue:Za,useDeferredValue:function(e){return ut().memoizedState=e},useTransition:function(){var e=ru(!1),t=e[0];return e=qm.bind(null,e[1]),ut().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=ue,o=ut();if(le){if(n===void 0)throw Error(O(407));n=n()}else{if(n=t(),ye===null)throw Error(O(349));fn&30||wf(r,t,n)}o.memoizedState=n;var l={value:n,getSnapshot:t};return o.queue=l,ou(Cf.bind(null,r,l,e),[e]),r.flags|=2048,Wr(9,Sf.bind(null,r,l,n,t),void 0,null),n},useId:function(){var e=ut(),t=ye.identifierPrefix;if(le){var n=gt,r=vt;n=(r&~(1<<32-nt(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=Ar++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=Zm++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},nh={readContext:Qe,useCallback:Tf,useContext:Qe,useEffect:Ga,useImperativeHandle:Of,useInsertionEffect:_f,useLayoutEffect:Pf,useMemo:Rf,useReducer:ei,useRef:Ef,useState:function(){return ei(Fr)},useDebugValue:Za,useDeferredValue:function(e){var t=Ke();return zf(t,he.memoizedState,e)},useTransition:function(){var e=ei(Fr)[0],t=Ke().memoizedState;return[e,t]},useMutableSource:gf,useSyncExternalStore:yf,useId:Lf,unstable_isNewReconciler:!1},rh={readContext:Qe,useCallback:Tf,useContext:Qe,useEffect:Ga,useImperativeHandle:Of,useInsertionEffect:_f,useLayoutEffect:Pf,useMemo:Rf,useReducer:ti,useRef:Ef,useState:function(){return ti(Fr)},useDebugValue:Za,useDeferredValue:function(e){var t=Ke();return he===null?t.memoizedState=e:zf(t,he.memoizedState,e)},useTransition:function(){var e=ti(Fr)[0],t=Ke().memoizedState;return[e,t]},useMutableSource:gf,useSyncExternalStore:yf,useId:Lf,unstable_isNewReconciler:!1};function Ze(e,t){if(e&&e.defaultProps){t=ce({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Ii(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:ce({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var wl={isMounted:function(e){return(e=e._reactInternals)?vn(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=Oe(),o=Ut(e),l=yt(r,o);l.payload=t,n!=null&&(l.callback=n),t=Ft(e,l,o),t!==null&&(rt(t,e,o,r),Oo(t,e,o))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=Oe(),o=Ut(e),l=yt(r,o);l.tag=1,l.payload=t,n!=null&&(l.callback=n),t=Ft(e,l,o),t!==null&&(rt(t,e,o,r),Oo(t,e,o))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=Oe(),r=Ut(e),o=yt(n,r);o.tag=2,t!=null&&(o.callback=t),t=Ft(e,o,r),t!==null&&(rt(t,e,r,n),Oo(t,e,r))}};function lu(e,t,n,r,o,l,i){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,l,i):t.prototype&&t.prototype.isPureReactComponent?!Rr(n,r)||!Rr(o,l):!0}function Af(e,t,n){var r=!1,o=Yt,l=t.contextType;return typeof l=="object"&&l!==null?l=Qe(l):(o=De(t)?un:Pe.current,r=t.contextTypes,l=(r=r!=null)?$n(e,o):Yt),t=new t(n,l),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=wl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=o,e.__reactInternalMemoizedMaskedChildContext=l),t}function iu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&wl.enqueueReplaceState(t,t.state,null)}function Bi(e,t,n,r){var o=e.stateNode;o.props=n,o.state=e.memoizedState,o.refs={},ba(e);var l=t.contextType;typeof l=="object"&&l!==null?o.context=Qe(l):(l=De(t)?un:Pe.current,o.context=$n(e,l)),o.state=e.memoizedState,l=t.getDerivedStateFromProps,typeof l=="function"&&(Ii(e,t,l,n),o.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof o.getSnapshotBeforeUpdate=="function"||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(t=o.state,typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount(),t!==o.state&&wl.enqueueReplaceState(o,o.state,null),Zo(e,n,o,r),o.state=e.memoizedState),typeof o.componentDidMount=="function"&&(e.flags|=4194308)}function Yn(e,t){try{var n="",r=t;do n+=zp(r),r=r.return;while(r);var o=n}catch(l){o=`
-Error generating stack: `+l.message+`
-`+l.stack}return{value:e,source:t,stack:o,digest:null}}function ni(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function bi(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var oh=typeof WeakMap=="function"?WeakMap:Map;function Ff(e,t,n){n=yt(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){nl||(nl=!0,Ji=r),bi(e,t)},n}function Wf(e,t,n){n=yt(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var o=t.value;n.payload=function(){return r(o)},n.callback=function(){bi(e,t)}}var l=e.stateNode;return l!==null&&typeof l.componentDidCatch=="function"&&(n.callback=function(){bi(e,t),typeof r!="function"&&(Wt===null?Wt=new Set([this]):Wt.add(this));var i=t.stack;this.componentDidCatch(t.value,{componentStack:i!==null?i:""})}),n}function au(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new oh;var o=new Set;r.set(t,o)}else o=r.get(t),o===void 0&&(o=new Set,r.set(t,o));o.has(n)||(o.add(n),e=yh.bind(null,e,t,n),t.then(e,e))}function su(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function uu(e,t,n,r,o){return e.mode&1?(e.flags|=65536,e.lanes=o,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=yt(-1,1),t.tag=2,Ft(n,t,1))),n.lanes|=1),e)}var lh=kt.ReactCurrentOwner,Le=!1;function Ne(e,t,n,r){t.child=e===null?pf(t,null,n,r):Bn(t,e.child,n,r)}function cu(e,t,n,r,o){n=n.render;var l=t.ref;return Fn(t,o),r=Qa(e,t,n,r,l,o),n=Ka(),e!==null&&!Le?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~o,xt(e,t,o)):(le&&n&&Aa(t),t.flags|=1,Ne(e,t,r,o),t.child)}function fu(e,t,n,r,o){if(e===null){var l=n.type;return typeof l=="function"&&!ls(l)&&l.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=l,Uf(e,t,l,r,o)):(e=Do(n.type,null,r,t,t.mode,o),e.ref=t.ref,e.return=t,t.child=e)}if(l=e.child,!(e.lanes&o)){var i=l.memoizedProps;if(n=n.compare,n=n!==null?n:Rr,n(i,r)&&e.ref===t.ref)return xt(e,t,o)}return t.flags|=1,e=$t(l,r),e.ref=t.ref,e.return=t,t.child=e}function Uf(e,t,n,r,o){if(e!==null){var l=e.memoizedProps;if(Rr(l,r)&&e.ref===t.ref)if(Le=!1,t.pendingProps=r=l,(e.lanes&o)!==0)e.flags&131072&&(Le=!0);else return t.lanes=e.lanes,xt(e,t,o)}return Yi(e,t,n,r,o)}function $f(e,t,n){var r=t.pendingProps,o=r.children,l=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},J(zn,Ae),Ae|=n;else{if(!(n&1073741824))return e=l!==null?l.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,J(zn,Ae),Ae|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=l!==null?l.baseLanes:n,J(zn,Ae),Ae|=r}else l!==null?(r=l.baseLanes|n,t.memoizedState=null):r=n,J(zn,Ae),Ae|=r;return Ne(e,t,o,n),t.child}function If(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Yi(e,t,n,r,o){var l=De(n)?un:Pe.current;return l=$n(t,l),Fn(t,o),n=Qa(e,t,n,r,l,o),r=Ka(),e!==null&&!Le?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~o,xt(e,t,o)):(le&&r&&Aa(t),t.flags|=1,Ne(e,t,n,o),t.child)}function du(e,t,n,r,o){if(De(n)){var l=!0;Xo(t)}else l=!1;if(Fn(t,o),t.stateNode===null)zo(e,t),Af(t,n,r),Bi(t,n,r,o),r=!0;else if(e===null){var i=t.stateNode,a=t.memoizedProps;i.props=a;var s=i.context,u=n.contextType;typeof u=="object"&&u!==null?u=Qe(u):(u=De(n)?un:Pe.current,u=$n(t,u));var c=n.getDerivedStateFromProps,f=typeof c=="function"||typeof i.getSnapshotBeforeUpdate=="function";f||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(a!==r||s!==u)&&iu(t,i,r,u),Pt=!1;var p=t.memoizedState;i.state=p,Zo(t,r,i,o),s=t.memoizedState,a!==r||p!==s||je.current||Pt?(typeof c=="function"&&(Ii(t,n,c,r),s=t.memoizedState),(a=Pt||lu(t,n,a,r,p,s,u))?(f||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount()),typeof i.componentDidMount=="function"&&(t.flags|=4194308)):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),i.props=r,i.state=s,i.context=u,r=a):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,hf(e,t),a=t.memoizedProps,u=t.type===t.elementType?a:Ze(t.type,a),i.props=u,f=t.pendingProps,p=i.context,s=n.contextType,typeof s=="object"&&s!==null?s=Qe(s):(s=De(n)?un:Pe.current,s=$n(t,s));var v=n.getDerivedStateFromProps;(c=typeof v=="function"||typeof i.getSnapshotBeforeUpdate=="function")||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(a!==f||p!==s)&&iu(t,i,r,s),Pt=!1,p=t.memoizedState,i.state=p,Zo(t,r,i,o);var g=t.memoizedState;a!==f||p!==g||je.current||Pt?(typeof v=="function"&&(Ii(t,n,v,r),g=t.memoizedState),(u=Pt||lu(t,n,u,r,p,g,s)||!1)?(c||typeof i.UNSAFE_componentWillUpdate!="function"&&typeof i.componentWillUpdate!="function"||(typeof i.componentWillUpdate=="function"&&i.componentWillUpdate(r,g,s),typeof i.UNSAFE_componentWillUpdate=="function"&&i.UNSAFE_componentWillUpdate(r,g,s)),typeof i.componentDidUpdate=="function"&&(t.flags|=4),typeof i.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof i.componentDidUpdate!="function"||a===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||a===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=g),i.props=r,i.state=g,i.context=s,r=u):(typeof i.componentDidUpdate!="function"||a===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||a===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),r=!1)}return Hi(e,t,n,r,l,o)}function Hi(e,t,n,r,o,l){If(e,t);var i=(t.flags&128)!==0;if(!r&&!i)return o&&Zs(t,n,!1),xt(e,t,l);r=t.stateNode,lh.current=t;var a=i&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&i?(t.child=Bn(t,e.child,null,l),t.child=Bn(t,null,a,l)):Ne(e,t,a,l),t.memoizedState=r.state,o&&Zs(t,n,!0),t.child}function Bf(e){var t=e.stateNode;t.pendingContext?Gs(e,t.pendingContext,t.pendingContext!==t.context):t.context&&Gs(e,t.context,!1),Ya(e,t.containerInfo)}function pu(e,t,n,r,o){return In(),Wa(o),t.flags|=256,Ne(e,t,n,r),t.child}var Xi={dehydrated:null,treeContext:null,retryLane:0};function Vi(e){return{baseLanes:e,cachePool:null,transitions:null}}function bf(e,t,n){var r=t.pendingProps,o=se.current,l=!1,i=(t.flags&128)!==0,a;if((a=i)||(a=e!==null&&e.memoizedState===null?!1:(o&2)!==0),a?(l=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(o|=1),J(se,o&1),e===null)return Ui(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(i=r.children,e=r.fallback,l?(r=t.mode,l=t.child,i={mode:"hidden",children:i},!(r&1)&&l!==null?(l.childLanes=0,l.pendingProps=i):l=xl(i,r,0,null),e=ln(e,r,n,null),l.return=t,e.return=t,l.sibling=e,t.child=l,t.child.memoizedState=Vi(n),t.memoizedState=Xi,e):qa(t,i));if(o=e.memoizedState,o!==null&&(a=o.dehydrated,a!==null))return ih(e,t,i,r,a,o,n);if(l){l=r.fallback,i=t.mode,o=e.child,a=o.sibling;var s={mode:"hidden",children:r.children};return!(i&1)&&t.child!==o?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=$t(o,s),r.subtreeFlags=o.subtreeFlags&14680064),a!==null?l=$t(a,l):(l=ln(l,i,n,null),l.flags|=2),l.return=t,r.return=t,r.sibling=l,t.child=r,r=l,l=t.child,i=e.child.memoizedState,i=i===null?Vi(n):{baseLanes:i.baseLanes|n,cachePool:null,transitions:i.transitions},l.memoizedState=i,l.childLanes=e.childLanes&~n,t.memoizedState=Xi,r}return l=e.child,e=l.sibling,r=$t(l,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function qa(e,t){return t=xl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function vo(e,t,n,r){return r!==null&&Wa(r),Bn(t,e.child,null,n),e=qa(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function ih(e,t,n,r,o,l,i){if(n)return t.flags&256?(t.flags&=-257,r=ni(Error(O(422))),vo(e,t,i,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(l=r.fallback,o=t.mode,r=xl({mode:"visible",children:r.children},o,0,null),l=ln(l,o,i,null),l.flags|=2,r.return=t,l.return=t,r.sibling=l,t.child=r,t.mode&1&&Bn(t,e.child,null,i),t.child.memoizedState=Vi(i),t.memoizedState=Xi,l);if(!(t.mode&1))return vo(e,t,i,null);if(o.data==="$!"){if(r=o.nextSibling&&o.nextSibling.dataset,r)var a=r.dgst;return r=a,l=Error(O(419)),r=ni(l,r,void 0),vo(e,t,i,r)}if(a=(i&e.childLanes)!==0,Le||a){if(r=ye,r!==null){switch(i&-i){case 4:o=2;break;case 16:o=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:o=32;break;case 536870912:o=268435456;break;default:o=0}o=o&(r.suspendedLanes|i)?0:o,o!==0&&o!==l.retryLane&&(l.retryLane=o,Ct(e,o),rt(r,e,o,-1))}return os(),r=ni(Error(O(421))),vo(e,t,i,r)}return o.data==="$?"?(t.flags|=128,t.child=e.child,t=wh.bind(null,e),o._reactRetry=t,null):(e=l.treeContext,Fe=At(o.nextSibling),We=t,le=!0,et=null,e!==null&&(be[Ye++]=vt,be[Ye++]=gt,be[Ye++]=cn,vt=e.id,gt=e.overflow,cn=t),t=qa(t,r.children),t.flags|=4096,t)}function mu(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),$i(e.return,t,n)}function ri(e,t,n,r,o){var l=e.memoizedState;l===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:o}:(l.isBackwards=t,l.rendering=null,l.renderingStartTime=0,l.last=r,l.tail=n,l.tailMode=o)}function Yf(e,t,n){var r=t.pendingProps,o=r.revealOrder,l=r.tail;if(Ne(e,t,r.children,n),r=se.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&mu(e,n,t);else if(e.tag===19)mu(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(J(se,r),!(t.mode&1))t.memoizedState=null;else switch(o){case"forwards":for(n=t.child,o=null;n!==null;)e=n.alternate,e!==null&&qo(e)===null&&(o=n),n=n.sibling;n=o,n===null?(o=t.child,t.child=null):(o=n.sibling,n.sibling=null),ri(t,!1,o,n,l);break;case"backwards":for(n=null,o=t.child,t.child=null;o!==null;){if(e=o.alternate,e!==null&&qo(e)===null){t.child=o;break}e=o.sibling,o.sibling=n,n=o,o=e}ri(t,!0,n,null,l);break;case"together":ri(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function zo(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function xt(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),dn|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(O(153));if(t.child!==null){for(e=t.child,n=$t(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=$t(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function ah(e,t,n){switch(t.tag){case 3:Bf(t),In();break;case 5:vf(t);break;case 1:De(t.type)&&Xo(t);break;case 4:Ya(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,o=t.memoizedProps.value;J(Ko,r._currentValue),r._currentValue=o;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(J(se,se.current&1),t.flags|=128,null):n&t.child.childLanes?bf(e,t,n):(J(se,se.current&1),e=xt(e,t,n),e!==null?e.sibling:null);J(se,se.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Yf(e,t,n);t.flags|=128}if(o=t.memoizedState,o!==null&&(o.rendering=null,o.tail=null,o.lastEffect=null),J(se,se.current),r)break;return null;case 22:case 23:return t.lanes=0,$f(e,t,n)}return xt(e,t,n)}var Hf,Qi,Xf,Vf;Hf=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Qi=function(){};Xf=function(e,t,n,r){var o=e.memoizedProps;if(o!==r){e=t.stateNode,rn(dt.current);var l=null;switch(n){case"input":o=vi(e,o),r=vi(e,r),l=[];break;case"select":o=ce({},o,{value:void 0}),r=ce({},r,{value:void 0}),l=[];break;case"textarea":o=wi(e,o),r=wi(e,r),l=[];break;default:typeof o.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=Yo)}Ci(n,r);var i;n=null;for(u in o)if(!r.hasOwnProperty(u)&&o.hasOwnProperty(u)&&o[u]!=null)if(u==="style"){var a=o[u];for(i in a)a.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else u!=="dangerouslySetInnerHTML"&&u!=="children"&&u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&u!=="autoFocus"&&(kr.hasOwnProperty(u)?l||(l=[]):(l=l||[]).push(u,null));for(u in r){var s=r[u];if(a=o!=null?o[u]:void 0,r.hasOwnProperty(u)&&s!==a&&(s!=null||a!=null))if(u==="style")if(a){for(i in a)!a.hasOwnProperty(i)||s&&s.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in s)s.hasOwnProperty(i)&&a[i]!==s[i]&&(n||(n={}),n[i]=s[i])}else n||(l||(l=[]),l.push(u,n)),n=s;else u==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,a=a?a.__html:void 0,s!=null&&a!==s&&(l=l||[]).push(u,s)):u==="children"?typeof s!="string"&&typeof s!="number"||(l=l||[]).push(u,""+s):u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&(kr.hasOwnProperty(u)?(s!=null&&u==="onScroll"&&ne("scroll",e),l||a===s||(l=[])):(l=l||[]).push(u,s))}n&&(l=l||[]).push("style",n);var u=l;(t.updateQueue=u)&&(t.flags|=4)}};Vf=function(e,t,n,r){n!==r&&(t.flags|=4)};function lr(e,t){if(!le)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function ke(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var o=e.child;o!==null;)n|=o.lanes|o.childLanes,r|=o.subtreeFlags&14680064,r|=o.flags&14680064,o.return=e,o=o.sibling;else for(o=e.child;o!==null;)n|=o.lanes|o.childLanes,r|=o.subtreeFlags,r|=o.flags,o.return=e,o=o.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function sh(e,t,n){var r=t.pendingProps;switch(Fa(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return ke(t),null;case 1:return De(t.type)&&Ho(),ke(t),null;case 3:return r=t.stateNode,bn(),re(je),re(Pe),Xa(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(mo(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,et!==null&&(na(et),et=null))),Qi(e,t),ke(t),null;case 5:Ha(t);var o=rn(Mr.current);if(n=t.type,e!==null&&t.stateNode!=null)Xf(e,t,n,r,o),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(O(166));return ke(t),null}if(e=rn(dt.current),mo(t)){r=t.stateNode,n=t.type;var l=t.memoizedProps;switch(r[ct]=t,r[jr]=l,e=(t.mode&1)!==0,n){case"dialog":ne("cancel",r),ne("close",r);break;case"iframe":case"object":case"embed":ne("load",r);break;case"video":case"audio":for(o=0;o<fr.length;o++)ne(fr[o],r);break;case"source":ne("error",r);break;case"img":case"image":case"link":ne("error",r),ne("load",r);break;case"details":ne("toggle",r);break;case"input":ks(r,l),ne("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!l.multiple},ne("invalid",r);break;case"textarea":_s(r,l),ne("invalid",r)}Ci(n,l),o=null;for(var i in l)if(l.hasOwnProperty(i)){var a=l[i];i==="children"?typeof a=="string"?r.textContent!==a&&(l.suppressHydrationWarning!==!0&&po(r.textContent,a,e),o=["children",a]):typeof a=="number"&&r.textContent!==""+a&&(l.suppressHydrationWarning!==!0&&po(r.textContent,a,e),o=["children",""+a]):kr.hasOwnProperty(i)&&a!=null&&i==="onScroll"&&ne("scroll",r)}switch(n){case"input":oo(r),Es(r,l,!0);break;case"textarea":oo(r),Ps(r);break;case"select":case"option":break;default:typeof l.onClick=="function"&&(r.onclick=Yo)}r=o,t.updateQueue=r,r!==null&&(t.flags|=4)}else{i=o.nodeType===9?o:o.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=Sc(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=i.createElement(n,{is:r.is}):(e=i.createElement(n),n==="select"&&(i=e,r.multiple?i.multiple=!0:r.size&&(i.size=r.size))):e=i.createElementNS(e,n),e[ct]=t,e[jr]=r,Hf(e,t,!1,!1),t.stateNode=e;e:{switch(i=xi(n,r),n){case"dialog":ne("cancel",e),ne("close",e),o=r;break;case"iframe":case"object":case"embed":ne("load",e),o=r;break;case"video":case"audio":for(o=0;o<fr.length;o++)ne(fr[o],e);o=r;break;case"source":ne("error",e),o=r;break;case"img":case"image":case"link":ne("error",e),ne("load",e),o=r;break;case"details":ne("toggle",e),o=r;break;case"input":ks(e,r),o=vi(e,r),ne("invalid",e);break;case"option":o=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},o=ce({},r,{value:void 0}),ne("invalid",e);break;case"textarea":_s(e,r),o=wi(e,r),ne("invalid",e);break;default:o=r}Ci(n,o),a=o;for(l in a)if(a.hasOwnProperty(l)){var s=a[l];l==="style"?kc(e,s):l==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&Cc(e,s)):l==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&Er(e,s):typeof s=="number"&&Er(e,""+s):l!=="suppressContentEditableWarning"&&l!=="suppressHydrationWarning"&&l!=="autoFocus"&&(kr.hasOwnProperty(l)?s!=null&&l==="onScroll"&&ne("scroll",e):s!=null&&xa(e,l,s,i))}switch(n){case"input":oo(e),Es(e,r,!1);break;case"textarea":oo(e),Ps(e);break;case"option":r.value!=null&&e.setAttribute("value",""+bt(r.value));break;case"select":e.multiple=!!r.multiple,l=r.value,l!=null?jn(e,!!r.multiple,l,!1):r.defaultValue!=null&&jn(e,!!r.multiple,r.defaultValue,!0);break;default:typeof o.onClick=="function"&&(e.onclick=Yo)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return ke(t),null;case 6:if(e&&t.stateNode!=null)Vf(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(O(166));if(n=rn(Mr.current),rn(dt.current),mo(t)){if(r=t.stateNode,n=t.memoizedProps,r[ct]=t,(l=r.nodeValue!==n)&&(e=We,e!==null))switch(e.tag){case 3:po(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&po(r.nodeValue,n,(e.mode&1)!==0)}l&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[ct]=t,t.stateNode=r}return ke(t),null;case 13:if(re(se),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(le&&Fe!==null&&t.mode&1&&!(t.flags&128))ff(),In(),t.flags|=98560,l=!1;else if(l=mo(t),r!==null&&r.dehydrated!==null){if(e===null){if(!l)throw Error(O(318));if(l=t.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(O(317));l[ct]=t}else In(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;ke(t),l=!1}else et!==null&&(na(et),et=null),l=!0;if(!l)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||se.current&1?ve===0&&(ve=3):os())),t.updateQueue!==null&&(t.flags|=4),ke(t),null);case 4:return bn(),Qi(e,t),e===null&&zr(t.stateNode.containerInfo),ke(t),null;case 10:return Ia(t.type._context),ke(t),null;case 17:return De(t.type)&&Ho(),ke(t),null;case 19:if(re(se),l=t.memoizedState,l===null)return ke(t),null;if(r=(t.flags&128)!==0,i=l.rendering,i===null)if(r)lr(l,!1);else{if(ve!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(i=qo(e),i!==null){for(t.flags|=128,lr(l,!1),r=i.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)l=n,e=r,l.flags&=14680066,i=l.alternate,i===null?(l.childLanes=0,l.lanes=e,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=i.childLanes,l.lanes=i.lanes,l.child=i.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=i.memoizedProps,l.memoizedState=i.memoizedState,l.updateQueue=i.updateQueue,l.type=i.type,e=i.dependencies,l.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return J(se,se.current&1|2),t.child}e=e.sibling}l.tail!==null&&pe()>Hn&&(t.flags|=128,r=!0,lr(l,!1),t.lanes=4194304)}else{if(!r)if(e=qo(i),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),lr(l,!0),l.tail===null&&l.tailMode==="hidden"&&!i.alternate&&!le)return ke(t),null}else 2*pe()-l.renderingStartTime>Hn&&n!==1073741824&&(t.flags|=128,r=!0,lr(l,!1),t.lanes=4194304);l.isBackwards?(i.sibling=t.child,t.child=i):(n=l.last,n!==null?n.sibling=i:t.child=i,l.last=i)}return l.tail!==null?(t=l.tail,l.rendering=t,l.tail=t.sibling,l.renderingStartTime=pe(),t.sibling=null,n=se.current,J(se,r?n&1|2:n&1),t):(ke(t),null);case 22:case 23:return rs(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?Ae&1073741824&&(ke(t),t.subtreeFlags&6&&(t.flags|=8192)):ke(t),null;case 24:return null;case 25:return null}throw Error(O(156,t.tag))}function uh(e,t){switch(Fa(t),t.tag){case 1:return De(t.type)&&Ho(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return bn(),re(je),re(Pe),Xa(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Ha(t),null;case 13:if(re(se),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(O(340));In()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return re(se),null;case 4:return bn(),null;case 10:return Ia(t.type._context),null;case 22:case 23:return rs(),null;case 24:return null;default:return null}}var go=!1,_e=!1,ch=typeof WeakSet=="function"?WeakSet:Set,L=null;function Rn(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){fe(e,t,r)}else n.current=null}function Ki(e,t,n){try{n()}catch(r){fe(e,t,r)}}var hu=!1;function fh(e,t){if(Li=Io,e=Zc(),Ma(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var o=r.anchorOffset,l=r.focusNode;r=r.focusOffset;try{n.nodeType,l.nodeType}catch{n=null;break e}var i=0,a=-1,s=-1,u=0,c=0,f=e,p=null;t:for(;;){for(var v;f!==n||o!==0&&f.nodeType!==3||(a=i+o),f!==l||r!==0&&f.nodeType!==3||(s=i+r),f.nodeType===3&&(i+=f.nodeValue.length),(v=f.firstChild)!==null;)p=f,f=v;for(;;){if(f===e)break t;if(p===n&&++u===o&&(a=i),p===l&&++c===r&&(s=i),(v=f.nextSibling)!==null)break;f=p,p=f.parentNode}f=v}n=a===-1||s===-1?null:{start:a,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(ji={focusedElem:e,selectionRange:n},Io=!1,L=t;L!==null;)if(t=L,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,L=e;else for(;L!==null;){t=L;try{var g=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(g!==null){var w=g.memoizedProps,k=g.memoizedState,h=t.stateNode,d=h.getSnapshotBeforeUpdate(t.elementType===t.type?w:Ze(t.type,w),k);h.__reactInternalSnapshotBeforeUpdate=d}break;case 3:var m=t.stateNode.containerInfo;m.nodeType===1?m.textContent="":m.nodeType===9&&m.documentElement&&m.removeChild(m.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(O(163))}}catch(C){fe(t,t.return,C)}if(e=t.sibling,e!==null){e.return=t.return,L=e;break}L=t.return}return g=hu,hu=!1,g}function yr(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var o=r=r.next;do{if((o.tag&e)===e){var l=o.destroy;o.destroy=void 0,l!==void 0&&Ki(t,n,l)}o=o.next}while(o!==r)}}function Sl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Gi(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function Qf(e){var t=e.alternate;t!==null&&(e.alternate=null,Qf(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[ct],delete t[jr],delete t[Ai],delete t[Vm],delete t[Qm])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function Kf(e){return e.tag===5||e.tag===3||e.tag===4}function vu(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Kf(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Zi(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=Yo));else if(r!==4&&(e=e.child,e!==null))for(Zi(e,t,n),e=e.sibling;e!==null;)Zi(e,t,n),e=e.sibling}function qi(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(qi(e,t,n),e=e.sibling;e!==null;)qi(e,t,n),e=e.sibling}var we=null,Je=!1;function Et(e,t,n){for(n=n.child;n!==null;)Gf(e,t,n),n=n.sibling}function Gf(e,t,n){if(ft&&typeof ft.onCommitFiberUnmount=="function")try{ft.onCommitFiberUnmount(dl,n)}catch{}switch(n.tag){case 5:_e||Rn(n,t);case 6:var r=we,o=Je;we=null,Et(e,t,n),we=r,Je=o,we!==null&&(Je?(e=we,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):we.removeChild(n.stateNode));break;case 18:we!==null&&(Je?(e=we,n=n.stateNode,e.nodeType===8?Gl(e.parentNode,n):e.nodeType===1&&Gl(e,n),Or(e)):Gl(we,n.stateNode));break;case 4:r=we,o=Je,we=n.stateNode.containerInfo,Je=!0,Et(e,t,n),we=r,Je=o;break;case 0:case 11:case 14:case 15:if(!_e&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){o=r=r.next;do{var l=o,i=l.destroy;l=l.tag,i!==void 0&&(l&2||l&4)&&Ki(n,t,i),o=o.next}while(o!==r)}Et(e,t,n);break;case 1:if(!_e&&(Rn(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(a){fe(n,t,a)}Et(e,t,n);break;case 21:Et(e,t,n);break;case 22:n.mode&1?(_e=(r=_e)||n.memoizedState!==null,Et(e,t,n),_e=r):Et(e,t,n);break;default:Et(e,t,n)}}function gu(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new ch),t.forEach(function(r){var o=Sh.bind(null,e,r);n.has(r)||(n.add(r),r.then(o,o))})}}function Ge(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var o=n[r];try{var l=e,i=t,a=i;e:for(;a!==null;){switch(a.tag){case 5:we=a.stateNode,Je=!1;break e;case 3:we=a.stateNode.containerInfo,Je=!0;break e;case 4:we=a.stateNode.containerInfo,Je=!0;break e}a=a.return}if(we===null)throw Error(O(160));Gf(l,i,o),we=null,Je=!1;var s=o.alternate;s!==null&&(s.return=null),o.return=null}catch(u){fe(o,t,u)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Zf(t,e),t=t.sibling}function Zf(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Ge(t,e),st(e),r&4){try{yr(3,e,e.return),Sl(3,e)}catch(w){fe(e,e.return,w)}try{yr(5,e,e.return)}catch(w){fe(e,e.return,w)}}break;case 1:Ge(t,e),st(e),r&512&&n!==null&&Rn(n,n.return);break;case 5:if(Ge(t,e),st(e),r&512&&n!==null&&Rn(n,n.return),e.flags&32){var o=e.stateNode;try{Er(o,"")}catch(w){fe(e,e.return,w)}}if(r&4&&(o=e.stateNode,o!=null)){var l=e.memoizedProps,i=n!==null?n.memoizedProps:l,a=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{a==="input"&&l.type==="radio"&&l.name!=null&&yc(o,l),xi(a,i);var u=xi(a,l);for(i=0;i<s.length;i+=2){var c=s[i],f=s[i+1];c==="style"?kc(o,f):c==="dangerouslySetInnerHTML"?Cc(o,f):c==="children"?Er(o,f):xa(o,c,f,u)}switch(a){case"input":gi(o,l);break;case"textarea":wc(o,l);break;case"select":var p=o._wrapperState.wasMultiple;o._wrapperState.wasMultiple=!!l.multiple;var v=l.value;v!=null?jn(o,!!l.multiple,v,!1):p!==!!l.multiple&&(l.defaultValue!=null?jn(o,!!l.multiple,l.defaultValue,!0):jn(o,!!l.multiple,l.multiple?[]:"",!1))}o[jr]=l}catch(w){fe(e,e.return,w)}}break;case 6:if(Ge(t,e),st(e),r&4){if(e.stateNode===null)throw Error(O(162));o=e.stateNode,l=e.memoizedProps;try{o.nodeValue=l}catch(w){fe(e,e.return,w)}}break;case 3:if(Ge(t,e),st(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{Or(t.containerInfo)}catch(w){fe(e,e.return,w)}break;case 4:Ge(t,e),st(e);break;case 13:Ge(t,e),st(e),o=e.child,o.flags&8192&&(l=o.memoizedState!==null,o.stateNode.isHidden=l,!l||o.alternate!==null&&o.alternate.memoizedState!==null||(ts=pe())),r&4&&gu(e);break;case 22:if(c=n!==null&&n.memoizedState!==null,e.mode&1?(_e=(u=_e)||c,Ge(t,e),_e=u):Ge(t,e),st(e),r&8192){if(u=e.memoizedState!==null,(e.stateNode.isHidden=u)&&!c&&e.mode&1)for(L=e,c=e.child;c!==null;){for(f=L=c;L!==null;){switch(p=L,v=p.child,p.tag){case 0:case 11:case 14:case 15:yr(4,p,p.return);break;case 1:Rn(p,p.return);var g=p.stateNode;if(typeof g.componentWillUnmount=="function"){r=p,n=p.return;try{t=r,g.props=t.memoizedProps,g.state=t.memoizedState,g.componentWillUnmount()}catch(w){fe(r,n,w)}}break;case 5:Rn(p,p.return);break;case 22:if(p.memoizedState!==null){wu(f);continue}}v!==null?(v.return=p,L=v):wu(f)}c=c.sibling}e:for(c=null,f=e;;){if(f.tag===5){if(c===null){c=f;try{o=f.stateNode,u?(l=o.style,typeof l.setProperty=="function"?l.setProperty("display","none","important"):l.display="none"):(a=f.stateNode,s=f.memoizedProps.style,i=s!=null&&s.hasOwnProperty("display")?s.display:null,a.style.display=xc("display",i))}catch(w){fe(e,e.return,w)}}}else if(f.tag===6){if(c===null)try{f.stateNode.nodeValue=u?"":f.memoizedProps}catch(w){fe(e,e.return,w)}}else if((f.tag!==22&&f.tag!==23||f.memoizedState===null||f===e)&&f.child!==null){f.child.return=f,f=f.child;continue}if(f===e)break e;for(;f.sibling===null;){if(f.return===null||f.return===e)break e;c===f&&(c=null),f=f.return}c===f&&(c=null),f.sibling.return=f.return,f=f.sibling}}break;case 19:Ge(t,e),st(e),r&4&&gu(e);break;case 21:break;default:Ge(t,e),st(e)}}function st(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(Kf(n)){var r=n;break e}n=n.return}throw Error(O(160))}switch(r.tag){case 5:var o=r.stateNode;r.flags&32&&(Er(o,""),r.flags&=-33);var l=vu(e);qi(e,l,o);break;case 3:case 4:var i=r.stateNode.containerInfo,a=vu(e);Zi(e,a,i);break;default:throw Error(O(161))}}catch(s){fe(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function dh(e,t,n){L=e,qf(e)}function qf(e,t,n){for(var r=(e.mode&1)!==0;L!==null;){var o=L,l=o.child;if(o.tag===22&&r){var i=o.memoizedState!==null||go;if(!i){var a=o.alternate,s=a!==null&&a.memoizedState!==null||_e;a=go;var u=_e;if(go=i,(_e=s)&&!u)for(L=o;L!==null;)i=L,s=i.child,i.tag===22&&i.memoizedState!==null?Su(o):s!==null?(s.return=i,L=s):Su(o);for(;l!==null;)L=l,qf(l),l=l.sibling;L=o,go=a,_e=u}yu(e)}else o.subtreeFlags&8772&&l!==null?(l.return=o,L=l):yu(e)}}function yu(e){for(;L!==null;){var t=L;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:_e||Sl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!_e)if(n===null)r.componentDidMount();else{var o=t.elementType===t.type?n.memoizedProps:Ze(t.type,n.memoizedProps);r.componentDidUpdate(o,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var l=t.updateQueue;l!==null&&nu(t,l,r);break;case 3:var i=t.updateQueue;if(i!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}nu(t,i,n)}break;case 5:var a=t.stateNode;if(n===null&&t.flags&4){n=a;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var u=t.alternate;if(u!==null){var c=u.memoizedState;if(c!==null){var f=c.dehydrated;f!==null&&Or(f)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(O(163))}_e||t.flags&512&&Gi(t)}catch(p){fe(t,t.return,p)}}if(t===e){L=null;break}if(n=t.sibling,n!==null){n.return=t.return,L=n;break}L=t.return}}function wu(e){for(;L!==null;){var t=L;if(t===e){L=null;break}var n=t.sibling;if(n!==null){n.return=t.return,L=n;break}L=t.return}}function Su(e){for(;L!==null;){var t=L;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{Sl(4,t)}catch(s){fe(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var o=t.return;try{r.componentDidMount()}catch(s){fe(t,o,s)}}var l=t.return;try{Gi(t)}catch(s){fe(t,l,s)}break;case 5:var i=t.return;try{Gi(t)}catch(s){fe(t,i,s)}}}catch(s){fe(t,t.return,s)}if(t===e){L=null;break}var a=t.sibling;if(a!==null){a.return=t.return,L=a;break}L=t.return}}var ph=Math.ceil,tl=kt.ReactCurrentDispatcher,Ja=kt.ReactCurrentOwner,Ve=kt.ReactCurrentBatchConfig,X=0,ye=null,me=null,Se=0,Ae=0,zn=Vt(0),ve=0,Ur=null,dn=0,Cl=0,es=0,wr=null,ze=null,ts=0,Hn=1/0,mt=null,nl=!1,Ji=null,Wt=null,yo=!1,Rt=null,rl=0,Sr=0,ea=null,Lo=-1,jo=0;function Oe(){return X&6?pe():Lo!==-1?Lo:Lo=pe()}function Ut(e){return e.mode&1?X&2&&Se!==0?Se&-Se:Gm.transition!==null?(jo===0&&(jo=Mc()),jo):(e=G,e!==0||(e=window.event,e=e===void 0?16:Bc(e.type)),e):1}function rt(e,t,n,r){if(50<Sr)throw Sr=0,ea=null,Error(O(185));Hr(e,n,r),(!(X&2)||e!==ye)&&(e===ye&&(!(X&2)&&(Cl|=n),ve===4&&Ot(e,Se)),Me(e,r),n===1&&X===0&&!(t.mode&1)&&(Hn=pe()+500,gl&&Qt()))}function Me(e,t){var n=e.callbackNode;Gp(e,t);var r=$o(e,e===ye?Se:0);if(r===0)n!==null&&Ts(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&Ts(n),t===1)e.tag===0?Km(Cu.bind(null,e)):sf(Cu.bind(null,e)),Hm(function(){!(X&6)&&Qt()}),n=null;else{switch(Ac(r)){case 1:n=Na;break;case 4:n=jc;break;case 16:n=Uo;break;case 536870912:n=Dc;break;default:n=Uo}n=id(n,Jf.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function Jf(e,t){if(Lo=-1,jo=0,X&6)throw Error(O(327));var n=e.callbackNode;if(Wn()&&e.callbackNode!==n)return null;var r=$o(e,e===ye?Se:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=ol(e,r);else{t=r;var o=X;X|=2;var l=td();(ye!==e||Se!==t)&&(mt=null,Hn=pe()+500,on(e,t));do try{vh();break}catch(a){ed(e,a)}while(!0);$a(),tl.current=l,X=o,me!==null?t=0:(ye=null,Se=0,t=ve)}if(t!==0){if(t===2&&(o=Ni(e),o!==0&&(r=o,t=ta(e,o))),t===1)throw n=Ur,on(e,0),Ot(e,r),Me(e,pe()),n;if(t===6)Ot(e,r);else{if(o=e.current.alternate,!(r&30)&&!mh(o)&&(t=ol(e,r),t===2&&(l=Ni(e),l!==0&&(r=l,t=ta(e,l))),t===1))throw n=Ur,on(e,0),Ot(e,r),Me(e,pe()),n;switch(e.finishedWork=o,e.finishedLanes=r,t){case 0:case 1:throw Error(O(345));case 2:Jt(e,ze,mt);break;case 3:if(Ot(e,r),(r&130023424)===r&&(t=ts+500-pe(),10<t)){if($o(e,0)!==0)break;if(o=e.suspendedLanes,(o&r)!==r){Oe(),e.pingedLanes|=e.suspendedLanes&o;break}e.timeoutHandle=Mi(Jt.bind(null,e,ze,mt),t);break}Jt(e,ze,mt);break;case 4:if(Ot(e,r),(r&4194240)===r)break;for(t=e.eventTimes,o=-1;0<r;){var i=31-nt(r);l=1<<i,i=t[i],i>o&&(o=i),r&=~l}if(r=o,r=pe()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*ph(r/1960))-r,10<r){e.timeoutHandle=Mi(Jt.bind(null,e,ze,mt),r);break}Jt(e,ze,mt);break;case 5:Jt(e,ze,mt);break;default:throw Error(O(329))}}}return Me(e,pe()),e.callbackNode===n?Jf.bind(null,e):null}function ta(e,t){var n=wr;return e.current.memoizedState.isDehydrated&&(on(e,t).flags|=256),e=ol(e,t),e!==2&&(t=ze,ze=n,t!==null&&na(t)),e}function na(e){ze===null?ze=e:ze.push.apply(ze,e)}function mh(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var o=n[r],l=o.getSnapshot;o=o.value;try{if(!lt(l(),o))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Ot(e,t){for(t&=~es,t&=~Cl,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-nt(t),r=1<<n;e[n]=-1,t&=~r}}function Cu(e){if(X&6)throw Error(O(327));Wn();var t=$o(e,0);if(!(t&1))return Me(e,pe()),null;var n=ol(e,t);if(e.tag!==0&&n===2){var r=Ni(e);r!==0&&(t=r,n=ta(e,r))}if(n===1)throw n=Ur,on(e,0),Ot(e,t),Me(e,pe()),n;if(n===6)throw Error(O(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Jt(e,ze,mt),Me(e,pe()),null}function ns(e,t){var n=X;X|=1;try{return e(t)}finally{X=n,X===0&&(Hn=pe()+500,gl&&Qt())}}function pn(e){Rt!==null&&Rt.tag===0&&!(X&6)&&Wn();var t=X;X|=1;var n=Ve.transition,r=G;try{if(Ve.transition=null,G=1,e)return e()}finally{G=r,Ve.transition=n,X=t,!(X&6)&&Qt()}}function rs(){Ae=zn.current,re(zn)}function on(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Ym(n)),me!==null)for(n=me.return;n!==null;){var r=n;switch(Fa(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Ho();break;case 3:bn(),re(je),re(Pe),Xa();break;case 5:Ha(r);break;case 4:bn();break;case 13:re(se);break;case 19:re(se);break;case 10:Ia(r.type._context);break;case 22:case 23:rs()}n=n.return}if(ye=e,me=e=$t(e.current,null),Se=Ae=t,ve=0,Ur=null,es=Cl=dn=0,ze=wr=null,nn!==null){for(t=0;t<nn.length;t++)if(n=nn[t],r=n.interleaved,r!==null){n.interleaved=null;var o=r.next,l=n.pending;if(l!==null){var i=l.next;l.next=o,r.next=i}n.pending=r}nn=null}return e}function ed(e,t){do{var n=me;try{if($a(),To.current=el,Jo){for(var r=ue.memoizedState;r!==null;){var o=r.queue;o!==null&&(o.pending=null),r=r.next}Jo=!1}if(fn=0,ge=he=ue=null,gr=!1,Ar=0,Ja.current=null,n===null||n.return===null){ve=1,Ur=t,me=null;break}e:{var l=e,i=n.return,a=n,s=t;if(t=Se,a.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var u=s,c=a,f=c.tag;if(!(c.mode&1)&&(f===0||f===11||f===15)){var p=c.alternate;p?(c.updateQueue=p.updateQueue,c.memoizedState=p.memoizedState,c.lanes=p.lanes):(c.updateQueue=null,c.memoizedState=null)}var v=su(i);if(v!==null){v.flags&=-257,uu(v,i,a,l,t),v.mode&1&&au(l,u,t),t=v,s=u;var g=t.updateQueue;if(g===null){var w=new Set;w.add(s),t.updateQueue=w}else g.add(s);break e}else{if(!(t&1)){au(l,u,t),os();break e}s=Error(O(426))}}else if(le&&a.mode&1){var k=su(i);if(k!==null){!(k.flags&65536)&&(k.flags|=256),uu(k,i,a,l,t),Wa(Yn(s,a));break e}}l=s=Yn(s,a),ve!==4&&(ve=2),wr===null?wr=[l]:wr.push(l),l=i;do{switch(l.tag){case 3:l.flags|=65536,t&=-t,l.lanes|=t;var h=Ff(l,s,t);tu(l,h);break e;case 1:a=s;var d=l.type,m=l.stateNode;if(!(l.flags&128)&&(typeof d.getDerivedStateFromError=="function"||m!==null&&typeof m.componentDidCatch=="function"&&(Wt===null||!Wt.has(m)))){l.flags|=65536,t&=-t,l.lanes|=t;var C=Wf(l,a,t);tu(l,C);break e}}l=l.return}while(l!==null)}rd(n)}catch(_){t=_,me===n&&n!==null&&(me=n=n.return);continue}break}while(!0)}function td(){var e=tl.current;return tl.current=el,e===null?el:e}function os(){(ve===0||ve===3||ve===2)&&(ve=4),ye===null||!(dn&268435455)&&!(Cl&268435455)||Ot(ye,Se)}function ol(e,t){var n=X;X|=2;var r=td();(ye!==e||Se!==t)&&(mt=null,on(e,t));do try{hh();break}catch(o){ed(e,o)}while(!0);if($a(),X=n,tl.current=r,me!==null)throw Error(O(261));return ye=null,Se=0,ve}function hh(){for(;me!==null;)nd(me)}function vh(){for(;me!==null&&!Ip();)nd(me)}function nd(e){var t=ld(e.alternate,e,Ae);e.memoizedProps=e.pendingProps,t===null?rd(e):me=t,Ja.current=null}function rd(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=uh(n,t),n!==null){n.flags&=32767,me=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{ve=6,me=null;return}}else if(n=sh(n,t,Ae),n!==null){me=n;return}if(t=t.sibling,t!==null){me=t;return}me=t=e}while(t!==null);ve===0&&(ve=5)}function Jt(e,t,n){var r=G,o=Ve.transition;try{Ve.transition=null,G=1,gh(e,t,n,r)}finally{Ve.transition=o,G=r}return null}function gh(e,t,n,r){do Wn();while(Rt!==null);if(X&6)throw Error(O(327));n=e.finishedWork;var o=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(O(177));e.callbackNode=null,e.callbackPriority=0;var l=n.lanes|n.childLanes;if(Zp(e,l),e===ye&&(me=ye=null,Se=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||yo||(yo=!0,id(Uo,function(){return Wn(),null})),l=(n.flags&15990)!==0,n.subtreeFlags&15990||l){l=Ve.transition,Ve.transition=null;var i=G;G=1;var a=X;X|=4,Ja.current=null,fh(e,n),Zf(n,e),Fm(ji),Io=!!Li,ji=Li=null,e.current=n,dh(n),Bp(),X=a,G=i,Ve.transition=l}else e.current=n;if(yo&&(yo=!1,Rt=e,rl=o),l=e.pendingLanes,l===0&&(Wt=null),Hp(n.stateNode),Me(e,pe()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)o=t[n],r(o.value,{componentStack:o.stack,digest:o.digest});if(nl)throw nl=!1,e=Ji,Ji=null,e;return rl&1&&e.tag!==0&&Wn(),l=e.pendingLanes,l&1?e===ea?Sr++:(Sr=0,ea=e):Sr=0,Qt(),null}function Wn(){if(Rt!==null){var e=Ac(rl),t=Ve.transition,n=G;try{if(Ve.transition=null,G=16>e?16:e,Rt===null)var r=!1;else{if(e=Rt,Rt=null,rl=0,X&6)throw Error(O(331));var o=X;for(X|=4,L=e.current;L!==null;){var l=L,i=l.child;if(L.flags&16){var a=l.deletions;if(a!==null){for(var s=0;s<a.length;s++){var u=a[s];for(L=u;L!==null;){var c=L;switch(c.tag){case 0:case 11:case 15:yr(8,c,l)}var f=c.child;if(f!==null)f.return=c,L=f;else for(;L!==null;){c=L;var p=c.sibling,v=c.return;if(Qf(c),c===u){L=null;break}if(p!==null){p.return=v,L=p;break}L=v}}}var g=l.alternate;if(g!==null){var w=g.child;if(w!==null){g.child=null;do{var k=w.sibling;w.sibling=null,w=k}while(w!==null)}}L=l}}if(l.subtreeFlags&2064&&i!==null)i.return=l,L=i;else e:for(;L!==null;){if(l=L,l.flags&2048)switch(l.tag){case 0:case 11:case 15:yr(9,l,l.return)}var h=l.sibling;if(h!==null){h.return=l.return,L=h;break e}L=l.return}}var d=e.current;for(L=d;L!==null;){i=L;var m=i.child;if(i.subtreeFlags&2064&&m!==null)m.return=i,L=m;else e:for(i=d;L!==null;){if(a=L,a.flags&2048)try{switch(a.tag){case 0:case 11:case 15:Sl(9,a)}}catch(_){fe(a,a.return,_)}if(a===i){L=null;break e}var C=a.sibling;if(C!==null){C.return=a.return,L=C;break e}L=a.return}}if(X=o,Qt(),ft&&typeof ft.onPostCommitFiberRoot=="function")try{ft.onPostCommitFiberRoot(dl,e)}catch{}r=!0}return r}finally{G=n,Ve.transition=t}}return!1}function xu(e,t,n){t=Yn(n,t),t=Ff(e,t,1),e=Ft(e,t,1),t=Oe(),e!==null&&(Hr(e,1,t),Me(e,t))}function fe(e,t,n){if(e.tag===3)xu(e,e,n);else for(;t!==null;){if(t.tag===3){xu(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(Wt===null||!Wt.has(r))){e=Yn(n,e),e=Wf(t,e,1),t=Ft(t,e,1),e=Oe(),t!==null&&(Hr(t,1,e),Me(t,e));break}}t=t.return}}function yh(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=Oe(),e.pingedLanes|=e.suspendedLanes&n,ye===e&&(Se&n)===n&&(ve===4||ve===3&&(Se&130023424)===Se&&500>pe()-ts?on(e,0):es|=n),Me(e,t)}function od(e,t){t===0&&(e.mode&1?(t=ao,ao<<=1,!(ao&130023424)&&(ao=4194304)):t=1);var n=Oe();e=Ct(e,t),e!==null&&(Hr(e,t,n),Me(e,n))}function wh(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),od(e,n)}function Sh(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,o=e.memoizedState;o!==null&&(n=o.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(O(314))}r!==null&&r.delete(t),od(e,n)}var ld;ld=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||je.current)Le=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return Le=!1,ah(e,t,n);Le=!!(e.flags&131072)}else Le=!1,le&&t.flags&1048576&&uf(t,Qo,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;zo(e,t),e=t.pendingProps;var o=$n(t,Pe.current);Fn(t,n),o=Qa(null,t,r,e,o,n);var l=Ka();return t.flags|=1,typeof o=="object"&&o!==null&&typeof o.render=="function"&&o.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,De(r)?(l=!0,Xo(t)):l=!1,t.memoizedState=o.state!==null&&o.state!==void 0?o.state:null,ba(t),o.updater=wl,t.stateNode=o,o._reactInternals=t,Bi(t,r,e,n),t=Hi(null,t,r,!0,l,n)):(t.tag=0,le&&l&&Aa(t),Ne(null,t,o,n),t=t.child),t;case 16:r=t.elementType;e:{switch(zo(e,t),e=t.pendingProps,o=r._init,r=o(r._payload),t.type=r,o=t.tag=xh(r),e=Ze(r,e),o){case 0:t=Yi(null,t,r,e,n);break e;case 1:t=du(null,t,r,e,n);break e;case 11:t=cu(null,t,r,e,n);break e;case 14:t=fu(null,t,r,Ze(r.type,e),n);break e}throw Error(O(306,r,""))}return t;case 0:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:Ze(r,o),Yi(e,t,r,o,n);case 1:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:Ze(r,o),du(e,t,r,o,n);case 3:e:{if(Bf(t),e===null)throw Error(O(387));r=t.pendingProps,l=t.memoizedState,o=l.element,hf(e,t),Zo(t,r,null,n);var i=t.memoizedState;if(r=i.element,l.isDehydrated)if(l={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=l,t.memoizedState=l,t.flags&256){o=Yn(Error(O(423)),t),t=pu(e,t,r,n,o);break e}else if(r!==o){o=Yn(Error(O(424)),t),t=pu(e,t,r,n,o);break e}else for(Fe=At(t.stateNode.containerInfo.firstChild),We=t,le=!0,et=null,n=pf(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(In(),r===o){t=xt(e,t,n);break e}Ne(e,t,r,n)}t=t.child}return t;case 5:return vf(t),e===null&&Ui(t),r=t.type,o=t.pendingProps,l=e!==null?e.memoizedProps:null,i=o.children,Di(r,o)?i=null:l!==null&&Di(r,l)&&(t.flags|=32),If(e,t),Ne(e,t,i,n),t.child;case 6:return e===null&&Ui(t),null;case 13:return bf(e,t,n);case 4:return Ya(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=Bn(t,null,r,n):Ne(e,t,r,n),t.child;case 11:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:Ze(r,o),cu(e,t,r,o,n);case 7:return Ne(e,t,t.pendingProps,n),t.child;case 8:return Ne(e,t,t.pendingProps.children,n),t.child;case 12:return Ne(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,o=t.pendingProps,l=t.memoizedProps,i=o.value,J(Ko,r._currentValue),r._currentValue=i,l!==null)if(lt(l.value,i)){if(l.children===o.children&&!je.current){t=xt(e,t,n);break e}}else for(l=t.child,l!==null&&(l.return=t);l!==null;){var a=l.dependencies;if(a!==null){i=l.child;for(var s=a.firstContext;s!==null;){if(s.context===r){if(l.tag===1){s=yt(-1,n&-n),s.tag=2;var u=l.updateQueue;if(u!==null){u=u.shared;var c=u.pending;c===null?s.next=s:(s.next=c.next,c.next=s),u.pending=s}}l.lanes|=n,s=l.alternate,s!==null&&(s.lanes|=n),$i(l.return,n,t),a.lanes|=n;break}s=s.next}}else if(l.tag===10)i=l.type===t.type?null:l.child;else if(l.tag===18){if(i=l.return,i===null)throw Error(O(341));i.lanes|=n,a=i.alternate,a!==null&&(a.lanes|=n),$i(i,n,t),i=l.sibling}else i=l.child;if(i!==null)i.return=l;else for(i=l;i!==null;){if(i===t){i=null;break}if(l=i.sibling,l!==null){l.return=i.return,i=l;break}i=i.return}l=i}Ne(e,t,o.children,n),t=t.child}return t;case 9:return o=t.type,r=t.pendingProps.children,Fn(t,n),o=Qe(o),r=r(o),t.flags|=1,Ne(e,t,r,n),t.child;case 14:return r=t.type,o=Ze(r,t.pendingProps),o=Ze(r.type,o),fu(e,t,r,o,n);case 15:return Uf(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:Ze(r,o),zo(e,t),t.tag=1,De(r)?(e=!0,Xo(t)):e=!1,Fn(t,n),Af(t,r,o),Bi(t,r,o,n),Hi(null,t,r,!0,e,n);case 19:return Yf(e,t,n);case 22:return $f(e,t,n)}throw Error(O(156,t.tag))};function id(e,t){return Lc(e,t)}function Ch(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function He(e,t,n,r){return new Ch(e,t,n,r)}function ls(e){return e=e.prototype,!(!e||!e.isReactComponent)}function xh(e){if(typeof e=="function")return ls(e)?1:0;if(e!=null){if(e=e.$$typeof,e===Ea)return 11;if(e===_a)return 14}return 2}function $t(e,t){var n=e.alternate;return n===null?(n=He(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Do(e,t,n,r,o,l){var i=2;if(r=e,typeof e=="function")ls(e)&&(i=1);else if(typeof e=="string")i=5;else e:switch(e){case Cn:return ln(n.children,o,l,t);case ka:i=8,o|=8;break;case di:return e=He(12,n,t,o|2),e.elementType=di,e.lanes=l,e;case pi:return e=He(13,n,t,o),e.elementType=pi,e.lanes=l,e;case mi:return e=He(19,n,t,o),e.elementType=mi,e.lanes=l,e;case hc:return xl(n,o,l,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case pc:i=10;break e;case mc:i=9;break e;case Ea:i=11;break e;case _a:i=14;break e;case _t:i=16,r=null;break e}throw Error(O(130,e==null?e:typeof e,""))}return t=He(i,n,t,o),t.elementType=e,t.type=r,t.lanes=l,t}function ln(e,t,n,r){return e=He(7,e,r,t),e.lanes=n,e}function xl(e,t,n,r){return e=He(22,e,r,t),e.elementType=hc,e.lanes=n,e.stateNode={isHidden:!1},e}function oi(e,t,n){return e=He(6,e,null,t),e.lanes=n,e}function li(e,t,n){return t=He(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function kh(e,t,n,r,o){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Ul(0),this.expirationTimes=Ul(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ul(0),this.identifierPrefix=r,this.onRecoverableError=o,this.mutableSourceEagerHydrationData=null}function is(e,t,n,r,o,l,i,a,s){return e=new kh(e,t,n,a,s),t===1?(t=1,l===!0&&(t|=8)):t=0,l=He(3,null,null,t),e.current=l,l.stateNode=e,l.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},ba(l),e}function Eh(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Sn,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function ad(e){if(!e)return Yt;e=e._reactInternals;e:{if(vn(e)!==e||e.tag!==1)throw Error(O(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(De(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(O(171))}if(e.tag===1){var n=e.type;if(De(n))return af(e,n,t)}return t}function sd(e,t,n,r,o,l,i,a,s){return e=is(n,r,!0,e,o,l,i,a,s),e.context=ad(null),n=e.current,r=Oe(),o=Ut(n),l=yt(r,o),l.callback=t??null,Ft(n,l,o),e.current.lanes=o,Hr(e,o,r),Me(e,r),e}function kl(e,t,n,r){var o=t.current,l=Oe(),i=Ut(o);return n=ad(n),t.context===null?t.context=n:t.pendingContext=n,t=yt(l,i),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=Ft(o,t,i),e!==null&&(rt(e,o,i,l),Oo(e,o,i)),i}function ll(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function ku(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function as(e,t){ku(e,t),(e=e.alternate)&&ku(e,t)}function _h(){return null}var ud=typeof reportError=="function"?reportError:function(e){console.error(e)};function ss(e){this._internalRoot=e}El.prototype.render=ss.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(O(409));kl(e,t,null,null)};El.prototype.unmount=ss.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;pn(function(){kl(null,e,null,null)}),t[St]=null}};function El(e){this._internalRoot=e}El.prototype.unstable_scheduleHydration=function(e){if(e){var t=Uc();e={blockedOn:null,target:e,priority:t};for(var n=0;n<Nt.length&&t!==0&&t<Nt[n].priority;n++);Nt.splice(n,0,e),n===0&&Ic(e)}};function us(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function _l(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function Eu(){}function Ph(e,t,n,r,o){if(o){if(typeof r=="function"){var l=r;r=function(){var u=ll(i);l.call(u)}}var i=sd(t,r,e,0,null,!1,!1,"",Eu);return e._reactRootContainer=i,e[St]=i.current,zr(e.nodeType===8?e.parentNode:e),pn(),i}for(;o=e.lastChild;)e.removeChild(o);if(typeof r=="function"){var a=r;r=function(){var u=ll(s);a.call(u)}}var s=is(e,0,!1,null,null,!1,!1,"",Eu);return e._reactRootContainer=s,e[St]=s.current,zr(e.nodeType===8?e.parentNode:e),pn(function(){kl(t,s,n,r)}),s}function Pl(e,t,n,r,o){var l=n._reactRootContainer;if(l){var i=l;if(typeof o=="function"){var a=o;o=function(){var s=ll(i);a.call(s)}}kl(t,i,e,o)}else i=Ph(n,t,e,o,r);return ll(i)}Fc=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=cr(t.pendingLanes);n!==0&&(Oa(t,n|1),Me(t,pe()),!(X&6)&&(Hn=pe()+500,Qt()))}break;case 13:pn(function(){var r=Ct(e,1);if(r!==null){var o=Oe();rt(r,e,1,o)}}),as(e,1)}};Ta=function(e){if(e.tag===13){var t=Ct(e,134217728);if(t!==null){var n=Oe();rt(t,e,134217728,n)}as(e,134217728)}};Wc=function(e){if(e.tag===13){var t=Ut(e),n=Ct(e,t);if(n!==null){var r=Oe();rt(n,e,t,r)}as(e,t)}};Uc=function(){return G};$c=function(e,t){var n=G;try{return G=e,t()}finally{G=n}};Ei=function(e,t,n){switch(t){case"input":if(gi(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var o=vl(r);if(!o)throw Error(O(90));gc(r),gi(r,o)}}}break;case"textarea":wc(e,n);break;case"select":t=n.value,t!=null&&jn(e,!!n.multiple,t,!1)}};Pc=ns;Nc=pn;var Nh={usingClientEntryPoint:!1,Events:[Vr,_n,vl,Ec,_c,ns]},ir={findFiberByHostInstance:tn,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},Oh={bundleType:ir.bundleType,version:ir.version,rendererPackageName:ir.rendererPackageName,rendererConfig:ir.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:kt.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Rc(e),e===null?null:e.stateNode},findFiberByHostInstance:ir.findFiberByHostInstance||_h,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var wo=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!wo.isDisabled&&wo.supportsFiber)try{dl=wo.inject(Oh),ft=wo}catch{}}$e.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Nh;$e.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!us(t))throw Error(O(200));return Eh(e,t,null,n)};$e.createRoot=function(e,t){if(!us(e))throw Error(O(299));var n=!1,r="",o=ud;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(o=t.onRecoverableError)),t=is(e,1,!1,null,null,n,!1,r,o),e[St]=t.current,zr(e.nodeType===8?e.parentNode:e),new ss(t)};$e.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(O(188)):(e=Object.keys(e).join(","),Error(O(268,e)));return e=Rc(t),e=e===null?null:e.stateNode,e};$e.flushSync=function(e){return pn(e)};$e.hydrate=function(e,t,n){if(!_l(t))throw Error(O(200));return Pl(null,e,t,!0,n)};$e.hydrateRoot=function(e,t,n){if(!us(e))throw Error(O(405));var r=n!=null&&n.hydratedSources||null,o=!1,l="",i=ud;if(n!=null&&(n.unstable_strictMode===!0&&(o=!0),n.identifierPrefix!==void 0&&(l=n.identifierPrefix),n.onRecoverableError!==void 0&&(i=n.onRecoverableError)),t=sd(t,null,e,1,n??null,o,!1,l,i),e[St]=t.current,zr(e),r)for(e=0;e<r.length;e++)n=r[e],o=n._getVersion,o=o(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,o]:t.mutableSourceEagerHydrationData.push(n,o);return new El(t)};$e.render=function(e,t,n){if(!_l(t))throw Error(O(200));return Pl(null,e,t,!1,n)};$e.unmountComponentAtNode=function(e){if(!_l(e))throw Error(O(40));return e._reactRootContainer?(pn(function(){Pl(null,null,e,!1,function(){e._reactRootContainer=null,e[St]=null})}),!0):!1};$e.unstable_batchedUpdates=ns;$e.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!_l(n))throw Error(O(200));if(e==null||e._reactInternals===void 0)throw Error(O(38));return Pl(e,t,n,!1,r)};$e.version="18.3.1-next-f1338f8080-20240426";function cd(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(cd)}catch(e){console.error(e)}}cd(),uc.exports=$e;var fd=uc.exports,_u=fd;ci.createRoot=_u.createRoot,ci.hydrateRoot=_u.hydrateRoot;/**
- * @remix-run/router v1.23.0
- *
- * Copyright (c) Remix Software Inc.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE.md file in the root directory of this source tree.
- *
- * @license MIT
- */function $r(){return $r=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},$r.apply(this,arguments)}var zt;(function(e){e.Pop="POP",e.Push="PUSH",e.Replace="REPLACE"})(zt||(zt={}));const Pu="popstate";function Th(e){e===void 0&&(e={});function t(o,l){let{pathname:i="/",search:a="",hash:s=""}=gn(o.location.hash.substr(1));return!i.startsWith("/")&&!i.startsWith(".")&&(i="/"+i),ra("",{pathname:i,search:a,hash:s},l.state&&l.state.usr||null,l.state&&l.state.key||"default")}function n(o,l){let i=o.document.querySelector("base"),a="";if(i&&i.getAttribute("href")){let s=o.location.href,u=s.indexOf("#");a=u===-1?s:s.slice(0,u)}return a+"#"+(typeof l=="string"?l:il(l))}function r(o,l){cs(o.pathname.charAt(0)==="/","relative pathnames are not supported in hash history.push("+JSON.stringify(l)+")")}return zh(t,n,r,e)}function de(e,t){if(e===!1||e===null||typeof e>"u")throw new Error(t)}function cs(e,t){if(!e){typeof console<"u"&&console.warn(t);try{throw new Error(t)}catch{}}}function Rh(){return Math.random().toString(36).substr(2,8)}function Nu(e,t){return{usr:e.state,key:e.key,idx:t}}function ra(e,t,n,r){return n===void 0&&(n=null),$r({pathname:typeof e=="string"?e:e.pathname,search:"",hash:""},typeof t=="string"?gn(t):t,{state:n,key:t&&t.key||r||Rh()})}function il(e){let{pathname:t="/",search:n="",hash:r=""}=e;return n&&n!=="?"&&(t+=n.charAt(0)==="?"?n:"?"+n),r&&r!=="#"&&(t+=r.charAt(0)==="#"?r:"#"+r),t}function gn(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substr(n),e=e.substr(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substr(r),e=e.substr(0,r)),e&&(t.pathname=e)}return t}function zh(e,t,n,r){r===void 0&&(r={});let{window:o=document.defaultView,v5Compat:l=!1}=r,i=o.history,a=zt.Pop,s=null,u=c();u==null&&(u=0,i.replaceState($r({},i.state,{idx:u}),""));function c(){return(i.state||{idx:null}).idx}function f(){a=zt.Pop;let k=c(),h=k==null?null:k-u;u=k,s&&s({action:a,location:w.location,delta:h})}function p(k,h){a=zt.Push;let d=ra(w.location,k,h);n&&n(d,k),u=c()+1;let m=Nu(d,u),C=w.createHref(d);try{i.pushState(m,"",C)}catch(_){if(_ instanceof DOMException&&_.name==="DataCloneError")throw _;o.location.assign(C)}l&&s&&s({action:a,location:w.location,delta:1})}function v(k,h){a=zt.Replace;let d=ra(w.location,k,h);n&&n(d,k),u=c();let m=Nu(d,u),C=w.createHref(d);i.replaceState(m,"",C),l&&s&&s({action:a,location:w.location,delta:0})}function g(k){let h=o.location.origin!=="null"?o.location.origin:o.location.href,d=typeof k=="string"?k:il(k);return d=d.replace(/ $/,"%20"),de(h,"No window.location.(origin|href) available to create URL for href: "+d),new URL(d,h)}let w={get action(){return a},get location(){return e(o,i)},listen(k){if(s)throw new Error("A history only accepts one active listener");return o.addEventListener(Pu,f),s=k,()=>{o.removeEventListener(Pu,f),s=null}},createHref(k){return t(o,k)},createURL:g,encodeLocation(k){let h=g(k);return{pathname:h.pathname,search:h.search,hash:h.hash}},push:p,replace:v,go(k){return i.go(k)}};return w}var Ou;(function(e){e.data="data",e.deferred="deferred",e.redirect="redirect",e.error="error"})(Ou||(Ou={}));function Lh(e,t,n){return n===void 0&&(n="/"),jh(e,t,n)}function jh(e,t,n,r){let o=typeof t=="string"?gn(t):t,l=Xn(o.pathname||"/",n);if(l==null)return null;let i=dd(e);Dh(i);let a=null;for(let s=0;a==null&&s<i.length;++s){let u=Hh(l);a=bh(i[s],u)}return a}function dd(e,t,n,r){t===void 0&&(t=[]),n===void 0&&(n=[]),r===void 0&&(r="");let o=(l,i,a)=>{let s={relativePath:a===void 0?l.path||"":a,caseSensitive:l.caseSensitive===!0,childrenIndex:i,route:l};s.relativePath.startsWith("/")&&(de(s.relativePath.startsWith(r),'Absolute route path "'+s.relativePath+'" nested under path '+('"'+r+'" is not valid. An absolute child route path ')+"must start with the combined path of all its parent routes."),s.relativePath=s.relativePath.slice(r.length));let u=It([r,s.relativePath]),c=n.concat(s);l.children&&l.children.length>0&&(de(l.index!==!0,"Index routes must not have child routes. Please remove "+('all child routes from route path "'+u+'".')),dd(l.children,t,c,u)),!(l.path==null&&!l.index)&&t.push({path:u,score:Ih(u,l.index),routesMeta:c})};return e.forEach((l,i)=>{var a;if(l.path===""||!((a=l.path)!=null&&a.includes("?")))o(l,i);else for(let s of pd(l.path))o(l,i,s)}),t}function pd(e){let t=e.split("/");if(t.length===0)return[];let[n,...r]=t,o=n.endsWith("?"),l=n.replace(/\?$/,"");if(r.length===0)return o?[l,""]:[l];let i=pd(r.join("/")),a=[];return a.push(...i.map(s=>s===""?l:[l,s].join("/"))),o&&a.push(...i),a.map(s=>e.startsWith("/")&&s===""?"/":s)}function Dh(e){e.sort((t,n)=>t.score!==n.score?n.score-t.score:Bh(t.routesMeta.map(r=>r.childrenIndex),n.routesMeta.map(r=>r.childrenIndex)))}const Mh=/^:[\w-]+$/,Ah=3,Fh=2,Wh=1,Uh=10,$h=-2,Tu=e=>e==="*";function Ih(e,t){let n=e.split("/"),r=n.length;return n.some(Tu)&&(r+=$h),t&&(r+=Fh),n.filter(o=>!Tu(o)).reduce((o,l)=>o+(Mh.test(l)?Ah:l===""?Wh:Uh),r)}function Bh(e,t){return e.length===t.length&&e.slice(0,-1).every((r,o)=>r===t[o])?e[e.length-1]-t[t.length-1]:0}function bh(e,t,n){let{routesMeta:r}=e,o={},l="/",i=[];for(let a=0;a<r.length;++a){let s=r[a],u=a===r.length-1,c=l==="/"?t:t.slice(l.length)||"/",f=oa({path:s.relativePath,caseSensitive:s.caseSensitive,end:u},c),p=s.route;if(!f)return null;Object.assign(o,f.params),i.push({params:o,pathname:It([l,f.pathname]),pathnameBase:Kh(It([l,f.pathnameBase])),route:p}),f.pathnameBase!=="/"&&(l=It([l,f.pathnameBase]))}return i}function oa(e,t){typeof e=="string"&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=Yh(e.path,e.caseSensitive,e.end),o=t.match(n);if(!o)return null;let l=o[0],i=l.replace(/(.)\/+$/,"$1"),a=o.slice(1);return{params:r.reduce((u,c,f)=>{let{paramName:p,isOptional:v}=c;if(p==="*"){let w=a[f]||"";i=l.slice(0,l.length-w.length).replace(/(.)\/+$/,"$1")}const g=a[f];return v&&!g?u[p]=void 0:u[p]=(g||"").replace(/%2F/g,"/"),u},{}),pathname:l,pathnameBase:i,pattern:e}}function Yh(e,t,n){t===void 0&&(t=!1),n===void 0&&(n=!0),cs(e==="*"||!e.endsWith("*")||e.endsWith("/*"),'Route path "'+e+'" will be treated as if it were '+('"'+e.replace(/\*$/,"/*")+'" because the `*` character must ')+"always follow a `/` in the pattern. To get rid of this warning, "+('please change the route path to "'+e.replace(/\*$/,"/*")+'".'));let r=[],o="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(i,a,s)=>(r.push({paramName:a,isOptional:s!=null}),s?"/?([^\\/]+)?":"/([^\\/]+)"));return e.endsWith("*")?(r.push({paramName:"*"}),o+=e==="*"||e==="/*"?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?o+="\\/*$":e!==""&&e!=="/"&&(o+="(?:(?=\\/|$))"),[new RegExp(o,t?void 0:"i"),r]}function Hh(e){try{return e.split("/").map(t=>decodeURIComponent(t).replace(/\//g,"%2F")).join("/")}catch(t){return cs(!1,'The URL path "'+e+'" could not be decoded because it is is a malformed URL segment. This is probably due to a bad percent '+("encoding ("+t+").")),e}}function Xn(e,t){if(t==="/")return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&r!=="/"?null:e.slice(n)||"/"}function Xh(e,t){t===void 0&&(t="/");let{pathname:n,search:r="",hash:o=""}=typeof e=="string"?gn(e):e;return{pathname:n?n.startsWith("/")?n:Vh(n,t):t,search:Gh(r),hash:Zh(o)}}function Vh(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach(o=>{o===".."?n.length>1&&n.pop():o!=="."&&n.push(o)}),n.length>1?n.join("/"):"/"}function ii(e,t,n,r){return"Cannot include a '"+e+"' character in a manually specified "+("`to."+t+"` field ["+JSON.stringify(r)+"].  Please separate it out to the ")+("`to."+n+"` field. Alternatively you may provide the full path as ")+'a string in <Link to="..."> and the router will parse it for you.'}function Qh(e){return e.filter((t,n)=>n===0||t.route.path&&t.route.path.length>0)}function md(e,t){let n=Qh(e);return t?n.map((r,o)=>o===n.length-1?r.pathname:r.pathnameBase):n.map(r=>r.pathnameBase)}function hd(e,t,n,r){r===void 0&&(r=!1);let o;typeof e=="string"?o=gn(e):(o=$r({},e),de(!o.pathname||!o.pathname.includes("?"),ii("?","pathname","search",o)),de(!o.pathname||!o.pathname.includes("#"),ii("#","pathname","hash",o)),de(!o.search||!o.search.includes("#"),ii("#","search","hash",o)));let l=e===""||o.pathname==="",i=l?"/":o.pathname,a;if(i==null)a=n;else{let f=t.length-1;if(!r&&i.startsWith("..")){let p=i.split("/");for(;p[0]==="..";)p.shift(),f-=1;o.pathname=p.join("/")}a=f>=0?t[f]:"/"}let s=Xh(o,a),u=i&&i!=="/"&&i.endsWith("/"),c=(l||i===".")&&n.endsWith("/");return!s.pathname.endsWith("/")&&(u||c)&&(s.pathname+="/"),s}const It=e=>e.join("/").replace(/\/\/+/g,"/"),Kh=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),Gh=e=>!e||e==="?"?"":e.startsWith("?")?e:"?"+e,Zh=e=>!e||e==="#"?"":e.startsWith("#")?e:"#"+e;function qh(e){return e!=null&&typeof e.status=="number"&&typeof e.statusText=="string"&&typeof e.internal=="boolean"&&"data"in e}const vd=["post","put","patch","delete"];new Set(vd);const Jh=["get",...vd];new Set(Jh);/**
- * React Router v6.30.1
- *
- * Copyright (c) Remix Software Inc.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE.md file in the root directory of this source tree.
- *
- * @license MIT
- */function Ir(){return Ir=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Ir.apply(this,arguments)}const Nl=E.createContext(null),gd=E.createContext(null),Kt=E.createContext(null),Ol=E.createContext(null),Gt=E.createContext({outlet:null,matches:[],isDataRoute:!1}),yd=E.createContext(null);function ev(e,t){let{relative:n}=t===void 0?{}:t;Kr()||de(!1);let{basename:r,navigator:o}=E.useContext(Kt),{hash:l,pathname:i,search:a}=Tl(e,{relative:n}),s=i;return r!=="/"&&(s=i==="/"?r:It([r,i])),o.createHref({pathname:s,search:a,hash:l})}function Kr(){return E.useContext(Ol)!=null}function Gr(){return Kr()||de(!1),E.useContext(Ol).location}function wd(e){E.useContext(Kt).static||E.useLayoutEffect(e)}function tv(){let{isDataRoute:e}=E.useContext(Gt);return e?vv():nv()}function nv(){Kr()||de(!1);let e=E.useContext(Nl),{basename:t,future:n,navigator:r}=E.useContext(Kt),{matches:o}=E.useContext(Gt),{pathname:l}=Gr(),i=JSON.stringify(md(o,n.v7_relativeSplatPath)),a=E.useRef(!1);return wd(()=>{a.current=!0}),E.useCallback(function(u,c){if(c===void 0&&(c={}),!a.current)return;if(typeof u=="number"){r.go(u);return}let f=hd(u,JSON.parse(i),l,c.relative==="path");e==null&&t!=="/"&&(f.pathname=f.pathname==="/"?t:It([t,f.pathname])),(c.replace?r.replace:r.push)(f,c.state,c)},[t,r,i,l,e])}const rv=E.createContext(null);function ov(e){let t=E.useContext(Gt).outlet;return t&&E.createElement(rv.Provider,{value:e},t)}function Tl(e,t){let{relative:n}=t===void 0?{}:t,{future:r}=E.useContext(Kt),{matches:o}=E.useContext(Gt),{pathname:l}=Gr(),i=JSON.stringify(md(o,r.v7_relativeSplatPath));return E.useMemo(()=>hd(e,JSON.parse(i),l,n==="path"),[e,i,l,n])}function lv(e,t){return iv(e,t)}function iv(e,t,n,r){Kr()||de(!1);let{navigator:o}=E.useContext(Kt),{matches:l}=E.useContext(Gt),i=l[l.length-1],a=i?i.params:{};i&&i.pathname;let s=i?i.pathnameBase:"/";i&&i.route;let u=Gr(),c;if(t){var f;let k=typeof t=="string"?gn(t):t;s==="/"||(f=k.pathname)!=null&&f.startsWith(s)||de(!1),c=k}else c=u;let p=c.pathname||"/",v=p;if(s!=="/"){let k=s.replace(/^\//,"").split("/");v="/"+p.replace(/^\//,"").split("/").slice(k.length).join("/")}let g=Lh(e,{pathname:v}),w=fv(g&&g.map(k=>Object.assign({},k,{params:Object.assign({},a,k.params),pathname:It([s,o.encodeLocation?o.encodeLocation(k.pathname).pathname:k.pathname]),pathnameBase:k.pathnameBase==="/"?s:It([s,o.encodeLocation?o.encodeLocation(k.pathnameBase).pathname:k.pathnameBase])})),l,n,r);return t&&w?E.createElement(Ol.Provider,{value:{location:Ir({pathname:"/",search:"",hash:"",state:null,key:"default"},c),navigationType:zt.Pop}},w):w}function av(){let e=hv(),t=qh(e)?e.status+" "+e.statusText:e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,o={padding:"0.5rem",backgroundColor:"rgba(200,200,200, 0.5)"};return E.createElement(E.Fragment,null,E.createElement("h2",null,"Unexpected Application Error!"),E.createElement("h3",{style:{fontStyle:"italic"}},t),n?E.createElement("pre",{style:o},n):null,null)}const sv=E.createElement(av,null);class uv extends E.Component{constructor(t){super(t),this.state={location:t.location,revalidation:t.revalidation,error:t.error}}static getDerivedStateFromError(t){return{error:t}}static getDerivedStateFromProps(t,n){return n.location!==t.location||n.revalidation!=="idle"&&t.revalidation==="idle"?{error:t.error,location:t.location,revalidation:t.revalidation}:{error:t.error!==void 0?t.error:n.error,location:n.location,revalidation:t.revalidation||n.revalidation}}componentDidCatch(t,n){console.error("React Router caught the following error during render",t,n)}render(){return this.state.error!==void 0?E.createElement(Gt.Provider,{value:this.props.routeContext},E.createElement(yd.Provider,{value:this.state.error,children:this.props.component})):this.props.children}}function cv(e){let{routeContext:t,match:n,children:r}=e,o=E.useContext(Nl);return o&&o.static&&o.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(o.staticContext._deepestRenderedBoundaryId=n.route.id),E.createElement(Gt.Provider,{value:t},r)}function fv(e,t,n,r){var o;if(t===void 0&&(t=[]),n===void 0&&(n=null),r===void 0&&(r=null),e==null){var l;if(!n)return null;if(n.errors)e=n.matches;else if((l=r)!=null&&l.v7_partialHydration&&t.length===0&&!n.initialized&&n.matches.length>0)e=n.matches;else return null}let i=e,a=(o=n)==null?void 0:o.errors;if(a!=null){let c=i.findIndex(f=>f.route.id&&(a==null?void 0:a[f.route.id])!==void 0);c>=0||de(!1),i=i.slice(0,Math.min(i.length,c+1))}let s=!1,u=-1;if(n&&r&&r.v7_partialHydration)for(let c=0;c<i.length;c++){let f=i[c];if((f.route.HydrateFallback||f.route.hydrateFallbackElement)&&(u=c),f.route.id){let{loaderData:p,errors:v}=n,g=f.route.loader&&p[f.route.id]===void 0&&(!v||v[f.route.id]===void 0);if(f.route.lazy||g){s=!0,u>=0?i=i.slice(0,u+1):i=[i[0]];break}}}return i.reduceRight((c,f,p)=>{let v,g=!1,w=null,k=null;n&&(v=a&&f.route.id?a[f.route.id]:void 0,w=f.route.errorElement||sv,s&&(u<0&&p===0?(gv("route-fallback"),g=!0,k=null):u===p&&(g=!0,k=f.route.hydrateFallbackElement||null)));let h=t.concat(i.slice(0,p+1)),d=()=>{let m;return v?m=w:g?m=k:f.route.Component?m=E.createElement(f.route.Component,null):f.route.element?m=f.route.element:m=c,E.createElement(cv,{match:f,routeContext:{outlet:c,matches:h,isDataRoute:n!=null},children:m})};return n&&(f.route.ErrorBoundary||f.route.errorElement||p===0)?E.createElement(uv,{location:n.location,revalidation:n.revalidation,component:w,error:v,children:d(),routeContext:{outlet:null,matches:h,isDataRoute:!0}}):d()},null)}var Sd=function(e){return e.UseBlocker="useBlocker",e.UseRevalidator="useRevalidator",e.UseNavigateStable="useNavigate",e}(Sd||{}),Cd=function(e){return e.UseBlocker="useBlocker",e.UseLoaderData="useLoaderData",e.UseActionData="useActionData",e.UseRouteError="useRouteError",e.UseNavigation="useNavigation",e.UseRouteLoaderData="useRouteLoaderData",e.UseMatches="useMatches",e.UseRevalidator="useRevalidator",e.UseNavigateStable="useNavigate",e.UseRouteId="useRouteId",e}(Cd||{});function dv(e){let t=E.useContext(Nl);return t||de(!1),t}function pv(e){let t=E.useContext(gd);return t||de(!1),t}function mv(e){let t=E.useContext(Gt);return t||de(!1),t}function xd(e){let t=mv(),n=t.matches[t.matches.length-1];return n.route.id||de(!1),n.route.id}function hv(){var e;let t=E.useContext(yd),n=pv(),r=xd();return t!==void 0?t:(e=n.errors)==null?void 0:e[r]}function vv(){let{router:e}=dv(Sd.UseNavigateStable),t=xd(Cd.UseNavigateStable),n=E.useRef(!1);return wd(()=>{n.current=!0}),E.useCallback(function(o,l){l===void 0&&(l={}),n.current&&(typeof o=="number"?e.navigate(o):e.navigate(o,Ir({fromRouteId:t},l)))},[e,t])}const Ru={};function gv(e,t,n){Ru[e]||(Ru[e]=!0)}function yv(e,t){e==null||e.v7_startTransition,e==null||e.v7_relativeSplatPath}function wv(e){return ov(e.context)}function Mo(e){de(!1)}function Sv(e){let{basename:t="/",children:n=null,location:r,navigationType:o=zt.Pop,navigator:l,static:i=!1,future:a}=e;Kr()&&de(!1);let s=t.replace(/^\/*/,"/"),u=E.useMemo(()=>({basename:s,navigator:l,static:i,future:Ir({v7_relativeSplatPath:!1},a)}),[s,a,l,i]);typeof r=="string"&&(r=gn(r));let{pathname:c="/",search:f="",hash:p="",state:v=null,key:g="default"}=r,w=E.useMemo(()=>{let k=Xn(c,s);return k==null?null:{location:{pathname:k,search:f,hash:p,state:v,key:g},navigationType:o}},[s,c,f,p,v,g,o]);return w==null?null:E.createElement(Kt.Provider,{value:u},E.createElement(Ol.Provider,{children:n,value:w}))}function Cv(e){let{children:t,location:n}=e;return lv(la(t),n)}new Promise(()=>{});function la(e,t){t===void 0&&(t=[]);let n=[];return E.Children.forEach(e,(r,o)=>{if(!E.isValidElement(r))return;let l=[...t,o];if(r.type===E.Fragment){n.push.apply(n,la(r.props.children,l));return}r.type!==Mo&&de(!1),!r.props.index||!r.props.children||de(!1);let i={id:r.props.id||l.join("-"),caseSensitive:r.props.caseSensitive,element:r.props.element,Component:r.props.Component,index:r.props.index,path:r.props.path,loader:r.props.loader,action:r.props.action,errorElement:r.props.errorElement,ErrorBoundary:r.props.ErrorBoundary,hasErrorBoundary:r.props.ErrorBoundary!=null||r.props.errorElement!=null,shouldRevalidate:r.props.shouldRevalidate,handle:r.props.handle,lazy:r.props.lazy};r.props.children&&(i.children=la(r.props.children,l)),n.push(i)}),n}/**
- * React Router DOM v6.30.1
- *
- * Copyright (c) Remix Software Inc.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE.md file in the root directory of this source tree.
- *
- * @license MIT
- */function al(){return al=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},al.apply(this,arguments)}function kd(e,t){if(e==null)return{};var n={},r=Object.keys(e),o,l;for(l=0;l<r.length;l++)o=r[l],!(t.indexOf(o)>=0)&&(n[o]=e[o]);return n}function xv(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}function kv(e,t){return e.button===0&&(!t||t==="_self")&&!xv(e)}const Ev=["onClick","relative","reloadDocument","replace","state","target","to","preventScrollReset","viewTransition"],_v=["aria-current","caseSensitive","className","end","style","to","viewTransition","children"],Pv="6";try{window.__reactRouterVersion=Pv}catch{}const Nv=E.createContext({isTransitioning:!1}),Ov="startTransition",zu=yp[Ov];function Tv(e){let{basename:t,children:n,future:r,window:o}=e,l=E.useRef();l.current==null&&(l.current=Th({window:o,v5Compat:!0}));let i=l.current,[a,s]=E.useState({action:i.action,location:i.location}),{v7_startTransition:u}=r||{},c=E.useCallback(f=>{u&&zu?zu(()=>s(f)):s(f)},[s,u]);return E.useLayoutEffect(()=>i.listen(c),[i,c]),E.useEffect(()=>yv(r),[r]),E.createElement(Sv,{basename:t,children:n,location:a.location,navigationType:a.action,navigator:i,future:r})}const Rv=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u",zv=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,Ed=E.forwardRef(function(t,n){let{onClick:r,relative:o,reloadDocument:l,replace:i,state:a,target:s,to:u,preventScrollReset:c,viewTransition:f}=t,p=kd(t,Ev),{basename:v}=E.useContext(Kt),g,w=!1;if(typeof u=="string"&&zv.test(u)&&(g=u,Rv))try{let m=new URL(window.location.href),C=u.startsWith("//")?new URL(m.protocol+u):new URL(u),_=Xn(C.pathname,v);C.origin===m.origin&&_!=null?u=_+C.search+C.hash:w=!0}catch{}let k=ev(u,{relative:o}),h=jv(u,{replace:i,state:a,target:s,preventScrollReset:c,relative:o,viewTransition:f});function d(m){r&&r(m),m.defaultPrevented||h(m)}return E.createElement("a",al({},p,{href:g||k,onClick:w||l?r:d,ref:n,target:s}))}),Lu=E.forwardRef(function(t,n){let{"aria-current":r="page",caseSensitive:o=!1,className:l="",end:i=!1,style:a,to:s,viewTransition:u,children:c}=t,f=kd(t,_v),p=Tl(s,{relative:f.relative}),v=Gr(),g=E.useContext(gd),{navigator:w,basename:k}=E.useContext(Kt),h=g!=null&&Dv(p)&&u===!0,d=w.encodeLocation?w.encodeLocation(p).pathname:p.pathname,m=v.pathname,C=g&&g.navigation&&g.navigation.location?g.navigation.location.pathname:null;o||(m=m.toLowerCase(),C=C?C.toLowerCase():null,d=d.toLowerCase()),C&&k&&(C=Xn(C,k)||C);const _=d!=="/"&&d.endsWith("/")?d.length-1:d.length;let R=m===d||!i&&m.startsWith(d)&&m.charAt(_)==="/",N=C!=null&&(C===d||!i&&C.startsWith(d)&&C.charAt(d.length)==="/"),P={isActive:R,isPending:N,isTransitioning:h},M=R?r:void 0,j;typeof l=="function"?j=l(P):j=[l,R?"active":null,N?"pending":null,h?"transitioning":null].filter(Boolean).join(" ");let Q=typeof a=="function"?a(P):a;return E.createElement(Ed,al({},f,{"aria-current":M,className:j,ref:n,style:Q,to:s,viewTransition:u}),typeof c=="function"?c(P):c)});var ia;(function(e){e.UseScrollRestoration="useScrollRestoration",e.UseSubmit="useSubmit",e.UseSubmitFetcher="useSubmitFetcher",e.UseFetcher="useFetcher",e.useViewTransitionState="useViewTransitionState"})(ia||(ia={}));var ju;(function(e){e.UseFetcher="useFetcher",e.UseFetchers="useFetchers",e.UseScrollRestoration="useScrollRestoration"})(ju||(ju={}));function Lv(e){let t=E.useContext(Nl);return t||de(!1),t}function jv(e,t){let{target:n,replace:r,state:o,preventScrollReset:l,relative:i,viewTransition:a}=t===void 0?{}:t,s=tv(),u=Gr(),c=Tl(e,{relative:i});return E.useCallback(f=>{if(kv(f,n)){f.preventDefault();let p=r!==void 0?r:il(u)===il(c);s(e,{replace:p,state:o,preventScrollReset:l,relative:i,viewTransition:a})}},[u,s,c,r,o,n,e,l,i,a])}function Dv(e,t){t===void 0&&(t={});let n=E.useContext(Nv);n==null&&de(!1);let{basename:r}=Lv(ia.useViewTransitionState),o=Tl(e,{relative:t.relative});if(!n.isTransitioning)return!1;let l=Xn(n.currentLocation.pathname,r)||n.currentLocation.pathname,i=Xn(n.nextLocation.pathname,r)||n.nextLocation.pathname;return oa(o.pathname,i)!=null||oa(o.pathname,l)!=null}const Mv=()=>S.jsxs("div",{className:"bg-base-100 text-gray-300 min-h-screen font-sans",children:[S.jsx("header",{className:"bg-base-200/80 backdrop-blur-sm shadow-lg sticky top-0 z-50",children:S.jsxs("nav",{className:"container mx-auto px-4 py-3 flex justify-between items-center",children:[S.jsx(Ed,{to:"/",children:S.jsx("h1",{className:"text-2xl font-bold text-white tracking-wider",children:"CozyGen"})}),S.jsxs("div",{className:"flex items-center space-x-4",children:[S.jsx(Lu,{to:"/",className:({isActive:e})=>`px-3 py-2 rounded-md text-sm font-medium transition-colors ${e?"bg-accent text-white":"text-gray-300 hover:bg-base-300"}`,children:"Generate"}),S.jsx(Lu,{to:"/gallery",className:({isActive:e})=>`px-3 py-2 rounded-md text-sm font-medium transition-colors ${e?"bg-accent text-white":"text-gray-300 hover:bg-base-300"}`,children:"Gallery"})]})]})}),S.jsx("main",{className:"container mx-auto p-4",children:S.jsx(wv,{})})]}),Av=({workflows:e,selectedWorkflow:t,onSelect:n})=>S.jsxs("div",{className:"bg-base-200 shadow-lg rounded-lg p-4",children:[S.jsx("label",{htmlFor:"workflow-selector",className:"block text-lg font-semibold text-white mb-2",children:"Workflow"}),S.jsxs("select",{id:"workflow-selector",className:"block w-full p-3 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all",value:t||"",onChange:r=>n(r.target.value),children:[S.jsx("option",{value:"",disabled:!0,children:"-- Select a workflow --"}),e.map(r=>S.jsx("option",{value:r,children:r},r))]})]}),Fv=({value:e,onChange:t,multiline:n})=>{const r=n?"textarea":"input";return S.jsx("div",{className:"w-full",children:S.jsx(r,{type:"text",rows:n?6:void 0,className:"block w-full p-2.5 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all",value:e||"",onChange:o=>t(o.target.value)})})},Wv=({inputName:e,value:t,onChange:n,min:r,max:o,step:l,paramType:i})=>{const a=u=>{const c=u.target.value;n(c)};let s=l;return(s===0||s===void 0||s===null)&&(i==="INT"?s=1:i==="FLOAT"&&(s=.1)),S.jsx("div",{className:"w-full",children:S.jsx("div",{className:"flex items-center space-x-2",children:S.jsx("input",{type:"number",className:"block w-full p-2.5 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all disabled:bg-base-300/50",value:t||"",onChange:a,min:r,max:o,step:s})})})},Uv=({value:e,onChange:t})=>S.jsx("div",{className:"w-full",children:S.jsx("div",{onClick:()=>t(!e),className:`w-14 h-8 flex items-center rounded-full p-1 cursor-pointer transition-colors ${e?"bg-accent":"bg-base-100"}`,children:S.jsx("div",{className:`bg-white w-6 h-6 rounded-full shadow-md transform transition-transform ${e?"translate-x-6":""}`})})}),$v=({value:e,onChange:t,choices:n})=>S.jsx("div",{className:"w-full",children:S.jsx("select",{className:"block w-full p-2.5 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all",value:e||"",onChange:r=>t(r.target.value),children:Array.isArray(n)&&n.map(r=>S.jsx("option",{value:r,children:r},r))})}),Iv=(e,t,n,r,o,l,i)=>{const{id:a,inputs:s}=e,u=s.param_name,c=s.param_type,f=s.default_value,p=t[u]!==void 0?t[u]:f,v=s.display_bypass,g=l[u]||!1;let w;switch(c){case"STRING":w=S.jsx(Fv,{value:p,onChange:k=>n(u,k),multiline:s.Multiline});break;case"INT":case"FLOAT":w=S.jsx(Wv,{inputName:u,value:p,onChange:k=>n(u,k),onRandomizeToggle:s.add_randomize_toggle?k=>o(u,k):null,isRandomized:r[u]||!1,min:s.min_value,max:s.max_value,step:s.step,paramType:c});break;case"BOOLEAN":w=S.jsx(Uv,{value:p,onChange:k=>n(u,k)});break;case"DROPDOWN":w=S.jsx($v,{value:p,onChange:k=>n(u,k),choices:s.choices});break;default:w=S.jsxs("p",{children:["Unsupported input type: ",c]})}return S.jsxs("div",{className:"flex flex-col",children:[" ",S.jsxs("div",{className:"flex justify-between items-center mb-1",children:[" ",S.jsxs("label",{className:"block text-sm font-medium text-gray-300",children:[u,s.add_randomize_toggle&&S.jsxs("span",{className:"ml-2 text-xs text-gray-400",children:["(Randomize",S.jsx("input",{type:"checkbox",className:"toggle toggle-sm toggle-accent ml-1",checked:r[u]||!1,onChange:k=>o(u,k.target.checked)}),")"]}),v&&S.jsxs("span",{className:"ml-2 text-xs text-gray-400",children:["(Bypass",S.jsx("input",{type:"checkbox",className:"toggle toggle-sm toggle-accent ml-1",checked:g,onChange:k=>i(u,k.target.checked)}),")"]})]})]}),w]})},Bv=({inputs:e,formData:t,onFormChange:n,randomizeState:r,onRandomizeToggle:o,bypassedState:l,onBypassToggle:i})=>!e||e.length===0?S.jsx("div",{className:"bg-base-200 shadow-lg rounded-lg p-4 text-center",children:S.jsx("p",{className:"text-gray-400",children:"Select a workflow to see its controls."})}):S.jsxs("div",{className:"bg-base-200 shadow-lg rounded-lg p-4",children:[S.jsx("h2",{className:"text-lg font-semibold text-white mb-2",children:"Controls"}),S.jsx("div",{className:"grid grid-cols-1 sm:grid-cols-2 gap-x-4 gap-y-4",children:e.map(a=>S.jsx("div",{className:a.inputs.Multiline?"sm:col-span-2":"",children:Iv(a,t,n,r,o,l,i)},a.id))})]}),Zr="/cozygen",bv=async()=>{const e=await fetch(`${Zr}/workflows`);if(!e.ok)throw new Error("Failed to fetch workflows");return e.json()},Yv=async e=>{const t=await fetch(`${Zr}/workflows/${e}`);if(!t.ok)throw new Error(`Failed to fetch workflow: ${e}`);return t.json()},Hv=async e=>{const t=await fetch(window.location.protocol+"//"+window.location.host+"/prompt",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e)});if(!t.ok)throw new Error("Failed to queue prompt");return t.json()},_d=async(e="",t=1,n=20)=>{const r=await fetch(`${Zr}/gallery?subfolder=${encodeURIComponent(e)}&page=${t}&per_page=${n}`);if(!r.ok)throw new Error("Failed to fetch gallery items");return r.json()},Xv=async e=>{const t=await fetch(`${Zr}/get_choices?type=${encodeURIComponent(e)}`);if(!t.ok)throw new Error(`Failed to fetch choices for type: ${e}`);return t.json()},ai=async e=>{const t=new FormData;t.append("image",e);const n=await fetch(`${Zr}/upload_image`,{method:"POST",body:t});if(!n.ok)throw new Error("Failed to upload image");return n.json()},Vv=({input:e,value:t,onFormChange:n})=>{const[r,o]=E.useState((t==null?void 0:t.source)||"Upload"),[l,i]=E.useState((t==null?void 0:t.path)||""),[a,s]=E.useState(null),[u,c]=E.useState((t==null?void 0:t.url)||""),[f,p]=E.useState([]),[v,g]=E.useState(""),[w,k]=E.useState(!0);E.useEffect(()=>{const N=async()=>{try{const P=await _d(v);p(P)}catch(P){console.error("Error fetching gallery items:",P)}};e.class_type!=="CozyGenImageInput"&&N()},[v,e.class_type]),E.useEffect(()=>{e.class_type==="CozyGenImageInput"?c(t?`/view?filename=${t}&type=input`:""):t!=null&&t.url?c(t.url):t!=null&&t.path&&r==="Gallery"&&c(`/view?filename=${t.path}&subfolder=&type=output`)},[t,r,e.class_type]);const h=N=>{const P=N.target.value;o(P),i(""),s(null),c(""),n(e.inputs.param_name,{source:P,path:"",url:""})},d=async N=>{const P=N.target.files[0];if(P){s(P),c(URL.createObjectURL(P));try{const M=await ai(P);n(e.inputs.param_name,{source:"Upload",path:M.filename,url:`/view?filename=${M.filename}&type=input`})}catch(M){console.error("Error uploading image:",M),c("")}}},m=N=>{const P=N.target.value;i(P);const M=f.find(j=>j.filename===P);if(M){const j=`/view?filename=${M.filename}&subfolder=${M.subfolder}&type=${M.type}`;c(j),n(e.inputs.param_name,{source:"Gallery",path:M.filename,subfolder:M.subfolder,url:j})}},C=()=>{o("Upload"),i(""),s(null),c(""),n(e.inputs.param_name,{source:"Upload",path:"",url:""})},_=async N=>{const P=N.target.files[0];if(P)if(w){const M=new FileReader;M.onload=j=>{const Q=new Image;Q.onload=async()=>{let{width:Z,height:ie}=Q;if(Z+ie>2048){const x=Z/ie;Z=Math.floor(2048*x/(x+1)),ie=2048-Z}const A=document.createElement("canvas");A.width=Z,A.height=ie,A.getContext("2d").drawImage(Q,0,0,Z,ie),A.toBlob(async x=>{const y=new File([x],P.name,{type:P.type});c(URL.createObjectURL(y));try{const T=await ai(y),z=`/view?filename=${T.filename}&type=input`;c(z),n(e.inputs.param_name,T.filename)}catch(T){console.error("Error uploading image:",T),c("")}},P.type)},Q.src=j.target.result},M.readAsDataURL(P)}else{c(URL.createObjectURL(P));try{const M=await ai(P),j=`/view?filename=${M.filename}&subfolder=input&type=input`;c(j),n(e.inputs.param_name,M.filename)}catch(M){console.error("Error uploading image:",M),c("")}}},R=N=>{g(N),i("")};return S.jsxs("div",{className:"form-control mb-4 p-4 bg-base-200 rounded-box shadow-lg",children:[S.jsx("label",{className:"label",children:S.jsx("span",{className:"label-text text-lg font-semibold",children:e.inputs.param_name})}),e.class_type==="CozyGenImageInput"?S.jsxs("div",{className:"flex flex-col sm:flex-row items-center gap-4 mb-4",children:[S.jsxs("div",{className:"flex-grow w-full sm:w-auto",children:[S.jsx("input",{type:"file",id:`cozyGenImageUploader-${e.id}`,accept:"image/png, image/jpeg, image/webp",onChange:_,className:"file-input file-input-bordered w-full mb-2"}),S.jsx("div",{class:"form-control",children:S.jsxs("label",{class:"label cursor-pointer",children:[S.jsx("span",{class:"label-text",children:"Smart Resize"}),S.jsx("input",{type:"checkbox",class:"toggle",checked:w,onChange:()=>k(!w)})]})})]}),u&&S.jsx("div",{className:"flex-shrink-0 w-24 h-24 rounded-lg overflow-hidden shadow-md border border-base-300 flex items-center justify-center bg-base-300",children:S.jsx("img",{src:u,alt:"Image Preview",className:"w-full h-full object-cover"})})]}):S.jsxs(S.Fragment,{children:[S.jsxs("div",{className:"flex items-center space-x-2 mb-4",children:[S.jsxs("select",{className:"select select-bordered w-full max-w-xs",value:r,onChange:h,children:[S.jsx("option",{value:"Upload",children:"Upload Image"}),S.jsx("option",{value:"Gallery",children:"Select from Gallery"})]}),S.jsx("button",{onClick:C,className:"btn btn-sm btn-outline",children:"Clear"})]}),r==="Upload"&&S.jsx("div",{className:"mb-4",children:S.jsx("input",{type:"file",className:"file-input file-input-bordered w-full",onChange:d,accept:"image/*"})}),r==="Gallery"&&S.jsxs("div",{className:"mb-4",children:[S.jsxs("div",{className:"flex items-center space-x-2 mb-2",children:[S.jsxs("span",{className:"text-sm text-gray-400",children:["Current Path: ",v||"/"]}),v&&S.jsx("button",{onClick:()=>R(""),className:"btn btn-xs btn-ghost",children:"Back to Root"})]}),S.jsxs("select",{className:"select select-bordered w-full",value:l,onChange:m,children:[S.jsx("option",{value:"",children:"-- Select an image or directory --"}),f.map((N,P)=>S.jsx("option",{value:N.filename,children:N.type==="directory"?`[DIR] ${N.filename}`:N.filename},P))]}),l&&f.find(N=>N.filename===l&&N.type==="directory")&&S.jsx("button",{onClick:()=>R(l),className:"btn btn-sm btn-primary mt-2",children:"Open Directory"})]}),u&&S.jsx("div",{className:"mt-4 flex justify-center",children:S.jsx("img",{src:u,alt:"Image Preview",className:"max-w-full h-auto rounded-lg shadow-md",style:{maxHeight:"300px"}})})]})]})};var aa={exports:{}},mn={},Pd={exports:{}},Qv="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED",Kv=Qv,Gv=Kv;function Nd(){}function Od(){}Od.resetWarningCache=Nd;var Zv=function(){function e(r,o,l,i,a,s){if(s!==Gv){var u=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw u.name="Invariant Violation",u}}e.isRequired=e;function t(){return e}var n={array:e,bigint:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:t,element:e,elementType:e,instanceOf:t,node:e,objectOf:t,oneOf:t,oneOfType:t,shape:t,exact:t,checkPropTypes:Od,resetWarningCache:Nd};return n.PropTypes=n,n};Pd.exports=Zv();var Td=Pd.exports,sa={exports:{}},it={},ua={exports:{}};(function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.default=c;/*!
- * Adapted from jQuery UI core
- *
- * http://jqueryui.com
- *
- * Copyright 2014 jQuery Foundation and other contributors
- * Released under the MIT license.
- * http://jquery.org/license
- *
- * http://api.jqueryui.com/category/ui-core/
- */var n="none",r="contents",o=/^(input|select|textarea|button|object|iframe)$/;function l(f,p){return p.getPropertyValue("overflow")!=="visible"||f.scrollWidth<=0&&f.scrollHeight<=0}function i(f){var p=f.offsetWidth<=0&&f.offsetHeight<=0;if(p&&!f.innerHTML)return!0;try{var v=window.getComputedStyle(f),g=v.getPropertyValue("display");return p?g!==r&&l(f,v):g===n}catch{return console.warn("Failed to inspect element style"),!1}}function a(f){for(var p=f,v=f.getRootNode&&f.getRootNode();p&&p!==document.body;){if(v&&p===v&&(p=v.host.parentNode),i(p))return!1;p=p.parentNode}return!0}function s(f,p){var v=f.nodeName.toLowerCase(),g=o.test(v)&&!f.disabled||v==="a"&&f.href||p;return g&&a(f)}function u(f){var p=f.getAttribute("tabindex");p===null&&(p=void 0);var v=isNaN(p);return(v||p>=0)&&s(f,!v)}function c(f){var p=[].slice.call(f.querySelectorAll("*"),0).reduce(function(v,g){return v.concat(g.shadowRoot?c(g.shadowRoot):[g])},[]);return p.filter(u)}e.exports=t.default})(ua,ua.exports);var Rd=ua.exports;Object.defineProperty(it,"__esModule",{value:!0});it.resetState=tg;it.log=ng;it.handleBlur=Br;it.handleFocus=br;it.markForFocusLater=rg;it.returnFocus=og;it.popWithoutFocus=lg;it.setupScopedFocus=ig;it.teardownScopedFocus=ag;var qv=Rd,Jv=eg(qv);function eg(e){return e&&e.__esModule?e:{default:e}}var Vn=[],Ln=null,ca=!1;function tg(){Vn=[]}function ng(){}function Br(){ca=!0}function br(){if(ca){if(ca=!1,!Ln)return;setTimeout(function(){if(!Ln.contains(document.activeElement)){var e=(0,Jv.default)(Ln)[0]||Ln;e.focus()}},0)}}function rg(){Vn.push(document.activeElement)}function og(){var e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:!1,t=null;try{Vn.length!==0&&(t=Vn.pop(),t.focus({preventScroll:e}));return}catch{console.warn(["You tried to return focus to",t,"but it is not in the DOM anymore"].join(" "))}}function lg(){Vn.length>0&&Vn.pop()}function ig(e){Ln=e,window.addEventListener?(window.addEventListener("blur",Br,!1),document.addEventListener("focus",br,!0)):(window.attachEvent("onBlur",Br),document.attachEvent("onFocus",br))}function ag(){Ln=null,window.addEventListener?(window.removeEventListener("blur",Br),document.removeEventListener("focus",br)):(window.detachEvent("onBlur",Br),document.detachEvent("onFocus",br))}var fa={exports:{}};(function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.default=i;var n=Rd,r=o(n);function o(a){return a&&a.__esModule?a:{default:a}}function l(){var a=arguments.length>0&&arguments[0]!==void 0?arguments[0]:document;return a.activeElement.shadowRoot?l(a.activeElement.shadowRoot):a.activeElement}function i(a,s){var u=(0,r.default)(a);if(!u.length){s.preventDefault();return}var c=void 0,f=s.shiftKey,p=u[0],v=u[u.length-1],g=l();if(a===g){if(!f)return;c=v}if(v===g&&!f&&(c=p),p===g&&f&&(c=v),c){s.preventDefault(),c.focus();return}var w=/(\bChrome\b|\bSafari\b)\//.exec(navigator.userAgent),k=w!=null&&w[1]!="Chrome"&&/\biPod\b|\biPad\b/g.exec(navigator.userAgent)==null;if(k){var h=u.indexOf(g);if(h>-1&&(h+=f?-1:1),c=u[h],typeof c>"u"){s.preventDefault(),c=f?v:p,c.focus();return}s.preventDefault(),c.focus()}}e.exports=t.default})(fa,fa.exports);var sg=fa.exports,at={},ug=function(){},cg=ug,ot={},zd={exports:{}};/*!
-  Copyright (c) 2015 Jed Watson.
-  Based on code that is Copyright 2013-2015, Facebook, Inc.
-  All rights reserved.
-*/(function(e){(function(){var t=!!(typeof window<"u"&&window.document&&window.document.createElement),n={canUseDOM:t,canUseWorkers:typeof Worker<"u",canUseEventListeners:t&&!!(window.addEventListener||window.attachEvent),canUseViewport:t&&!!window.screen};e.exports?e.exports=n:window.ExecutionEnvironment=n})()})(zd);var fg=zd.exports;Object.defineProperty(ot,"__esModule",{value:!0});ot.canUseDOM=ot.SafeNodeList=ot.SafeHTMLCollection=void 0;var dg=fg,pg=mg(dg);function mg(e){return e&&e.__esModule?e:{default:e}}var Rl=pg.default,hg=Rl.canUseDOM?window.HTMLElement:{};ot.SafeHTMLCollection=Rl.canUseDOM?window.HTMLCollection:{};ot.SafeNodeList=Rl.canUseDOM?window.NodeList:{};ot.canUseDOM=Rl.canUseDOM;ot.default=hg;Object.defineProperty(at,"__esModule",{value:!0});at.resetState=Sg;at.log=Cg;at.assertNodeList=Ld;at.setElement=xg;at.validateElement=fs;at.hide=kg;at.show=Eg;at.documentNotReadyOrSSRTesting=_g;var vg=cg,gg=wg(vg),yg=ot;function wg(e){return e&&e.__esModule?e:{default:e}}var Be=null;function Sg(){Be&&(Be.removeAttribute?Be.removeAttribute("aria-hidden"):Be.length!=null?Be.forEach(function(e){return e.removeAttribute("aria-hidden")}):document.querySelectorAll(Be).forEach(function(e){return e.removeAttribute("aria-hidden")})),Be=null}function Cg(){}function Ld(e,t){if(!e||!e.length)throw new Error("react-modal: No elements were found for selector "+t+".")}function xg(e){var t=e;if(typeof t=="string"&&yg.canUseDOM){var n=document.querySelectorAll(t);Ld(n,t),t=n}return Be=t||Be,Be}function fs(e){var t=e||Be;return t?Array.isArray(t)||t instanceof HTMLCollection||t instanceof NodeList?t:[t]:((0,gg.default)(!1,["react-modal: App element is not defined.","Please use `Modal.setAppElement(el)` or set `appElement={el}`.","This is needed so screen readers don't see main content","when modal is opened. It is not recommended, but you can opt-out","by setting `ariaHideApp={false}`."].join(" ")),[])}function kg(e){var t=!0,n=!1,r=void 0;try{for(var o=fs(e)[Symbol.iterator](),l;!(t=(l=o.next()).done);t=!0){var i=l.value;i.setAttribute("aria-hidden","true")}}catch(a){n=!0,r=a}finally{try{!t&&o.return&&o.return()}finally{if(n)throw r}}}function Eg(e){var t=!0,n=!1,r=void 0;try{for(var o=fs(e)[Symbol.iterator](),l;!(t=(l=o.next()).done);t=!0){var i=l.value;i.removeAttribute("aria-hidden")}}catch(a){n=!0,r=a}finally{try{!t&&o.return&&o.return()}finally{if(n)throw r}}}function _g(){Be=null}var Zn={};Object.defineProperty(Zn,"__esModule",{value:!0});Zn.resetState=Pg;Zn.log=Ng;var Cr={},xr={};function Du(e,t){e.classList.remove(t)}function Pg(){var e=document.getElementsByTagName("html")[0];for(var t in Cr)Du(e,Cr[t]);var n=document.body;for(var r in xr)Du(n,xr[r]);Cr={},xr={}}function Ng(){}var Og=function(t,n){return t[n]||(t[n]=0),t[n]+=1,n},Tg=function(t,n){return t[n]&&(t[n]-=1),n},Rg=function(t,n,r){r.forEach(function(o){Og(n,o),t.add(o)})},zg=function(t,n,r){r.forEach(function(o){Tg(n,o),n[o]===0&&t.remove(o)})};Zn.add=function(t,n){return Rg(t.classList,t.nodeName.toLowerCase()=="html"?Cr:xr,n.split(" "))};Zn.remove=function(t,n){return zg(t.classList,t.nodeName.toLowerCase()=="html"?Cr:xr,n.split(" "))};var qn={};Object.defineProperty(qn,"__esModule",{value:!0});qn.log=jg;qn.resetState=Dg;function Lg(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}var jd=function e(){var t=this;Lg(this,e),this.register=function(n){t.openInstances.indexOf(n)===-1&&(t.openInstances.push(n),t.emit("register"))},this.deregister=function(n){var r=t.openInstances.indexOf(n);r!==-1&&(t.openInstances.splice(r,1),t.emit("deregister"))},this.subscribe=function(n){t.subscribers.push(n)},this.emit=function(n){t.subscribers.forEach(function(r){return r(n,t.openInstances.slice())})},this.openInstances=[],this.subscribers=[]},sl=new jd;function jg(){console.log("portalOpenInstances ----------"),console.log(sl.openInstances.length),sl.openInstances.forEach(function(e){return console.log(e)}),console.log("end portalOpenInstances ----------")}function Dg(){sl=new jd}qn.default=sl;var ds={};Object.defineProperty(ds,"__esModule",{value:!0});ds.resetState=Wg;ds.log=Ug;var Mg=qn,Ag=Fg(Mg);function Fg(e){return e&&e.__esModule?e:{default:e}}var Ee=void 0,qe=void 0,an=[];function Wg(){for(var e=[Ee,qe],t=0;t<e.length;t++){var n=e[t];n&&n.parentNode&&n.parentNode.removeChild(n)}Ee=qe=null,an=[]}function Ug(){console.log("bodyTrap ----------"),console.log(an.length);for(var e=[Ee,qe],t=0;t<e.length;t++){var n=e[t],r=n||{};console.log(r.nodeName,r.className,r.id)}console.log("edn bodyTrap ----------")}function Mu(){an.length!==0&&an[an.length-1].focusContent()}function $g(e,t){!Ee&&!qe&&(Ee=document.createElement("div"),Ee.setAttribute("data-react-modal-body-trap",""),Ee.style.position="absolute",Ee.style.opacity="0",Ee.setAttribute("tabindex","0"),Ee.addEventListener("focus",Mu),qe=Ee.cloneNode(),qe.addEventListener("focus",Mu)),an=t,an.length>0?(document.body.firstChild!==Ee&&document.body.insertBefore(Ee,document.body.firstChild),document.body.lastChild!==qe&&document.body.appendChild(qe)):(Ee.parentElement&&Ee.parentElement.removeChild(Ee),qe.parentElement&&qe.parentElement.removeChild(qe))}Ag.default.subscribe($g);(function(e,t){Object.defineProperty(t,"__esModule",{value:!0});var n=Object.assign||function(W){for(var A=1;A<arguments.length;A++){var V=arguments[A];for(var x in V)Object.prototype.hasOwnProperty.call(V,x)&&(W[x]=V[x])}return W},r=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(W){return typeof W}:function(W){return W&&typeof Symbol=="function"&&W.constructor===Symbol&&W!==Symbol.prototype?"symbol":typeof W},o=function(){function W(A,V){for(var x=0;x<V.length;x++){var y=V[x];y.enumerable=y.enumerable||!1,y.configurable=!0,"value"in y&&(y.writable=!0),Object.defineProperty(A,y.key,y)}}return function(A,V,x){return V&&W(A.prototype,V),x&&W(A,x),A}}(),l=E,i=Td,a=_(i),s=it,u=C(s),c=sg,f=_(c),p=at,v=C(p),g=Zn,w=C(g),k=ot,h=_(k),d=qn,m=_(d);function C(W){if(W&&W.__esModule)return W;var A={};if(W!=null)for(var V in W)Object.prototype.hasOwnProperty.call(W,V)&&(A[V]=W[V]);return A.default=W,A}function _(W){return W&&W.__esModule?W:{default:W}}function R(W,A){if(!(W instanceof A))throw new TypeError("Cannot call a class as a function")}function N(W,A){if(!W)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return A&&(typeof A=="object"||typeof A=="function")?A:W}function P(W,A){if(typeof A!="function"&&A!==null)throw new TypeError("Super expression must either be null or a function, not "+typeof A);W.prototype=Object.create(A&&A.prototype,{constructor:{value:W,enumerable:!1,writable:!0,configurable:!0}}),A&&(Object.setPrototypeOf?Object.setPrototypeOf(W,A):W.__proto__=A)}var M={overlay:"ReactModal__Overlay",content:"ReactModal__Content"},j=function(A){return A.code==="Tab"||A.keyCode===9},Q=function(A){return A.code==="Escape"||A.keyCode===27},Z=0,ie=function(W){P(A,W);function A(V){R(this,A);var x=N(this,(A.__proto__||Object.getPrototypeOf(A)).call(this,V));return x.setOverlayRef=function(y){x.overlay=y,x.props.overlayRef&&x.props.overlayRef(y)},x.setContentRef=function(y){x.content=y,x.props.contentRef&&x.props.contentRef(y)},x.afterClose=function(){var y=x.props,T=y.appElement,z=y.ariaHideApp,F=y.htmlOpenClassName,D=y.bodyOpenClassName,U=y.parentSelector,$=U&&U().ownerDocument||document;D&&w.remove($.body,D),F&&w.remove($.getElementsByTagName("html")[0],F),z&&Z>0&&(Z-=1,Z===0&&v.show(T)),x.props.shouldFocusAfterRender&&(x.props.shouldReturnFocusAfterClose?(u.returnFocus(x.props.preventScroll),u.teardownScopedFocus()):u.popWithoutFocus()),x.props.onAfterClose&&x.props.onAfterClose(),m.default.deregister(x)},x.open=function(){x.beforeOpen(),x.state.afterOpen&&x.state.beforeClose?(clearTimeout(x.closeTimer),x.setState({beforeClose:!1})):(x.props.shouldFocusAfterRender&&(u.setupScopedFocus(x.node),u.markForFocusLater()),x.setState({isOpen:!0},function(){x.openAnimationFrame=requestAnimationFrame(function(){x.setState({afterOpen:!0}),x.props.isOpen&&x.props.onAfterOpen&&x.props.onAfterOpen({overlayEl:x.overlay,contentEl:x.content})})}))},x.close=function(){x.props.closeTimeoutMS>0?x.closeWithTimeout():x.closeWithoutTimeout()},x.focusContent=function(){return x.content&&!x.contentHasFocus()&&x.content.focus({preventScroll:!0})},x.closeWithTimeout=function(){var y=Date.now()+x.props.closeTimeoutMS;x.setState({beforeClose:!0,closesAt:y},function(){x.closeTimer=setTimeout(x.closeWithoutTimeout,x.state.closesAt-Date.now())})},x.closeWithoutTimeout=function(){x.setState({beforeClose:!1,isOpen:!1,afterOpen:!1,closesAt:null},x.afterClose)},x.handleKeyDown=function(y){j(y)&&(0,f.default)(x.content,y),x.props.shouldCloseOnEsc&&Q(y)&&(y.stopPropagation(),x.requestClose(y))},x.handleOverlayOnClick=function(y){x.shouldClose===null&&(x.shouldClose=!0),x.shouldClose&&x.props.shouldCloseOnOverlayClick&&(x.ownerHandlesClose()?x.requestClose(y):x.focusContent()),x.shouldClose=null},x.handleContentOnMouseUp=function(){x.shouldClose=!1},x.handleOverlayOnMouseDown=function(y){!x.props.shouldCloseOnOverlayClick&&y.target==x.overlay&&y.preventDefault()},x.handleContentOnClick=function(){x.shouldClose=!1},x.handleContentOnMouseDown=function(){x.shouldClose=!1},x.requestClose=function(y){return x.ownerHandlesClose()&&x.props.onRequestClose(y)},x.ownerHandlesClose=function(){return x.props.onRequestClose},x.shouldBeClosed=function(){return!x.state.isOpen&&!x.state.beforeClose},x.contentHasFocus=function(){return document.activeElement===x.content||x.content.contains(document.activeElement)},x.buildClassName=function(y,T){var z=(typeof T>"u"?"undefined":r(T))==="object"?T:{base:M[y],afterOpen:M[y]+"--after-open",beforeClose:M[y]+"--before-close"},F=z.base;return x.state.afterOpen&&(F=F+" "+z.afterOpen),x.state.beforeClose&&(F=F+" "+z.beforeClose),typeof T=="string"&&T?F+" "+T:F},x.attributesFromObject=function(y,T){return Object.keys(T).reduce(function(z,F){return z[y+"-"+F]=T[F],z},{})},x.state={afterOpen:!1,beforeClose:!1},x.shouldClose=null,x.moveFromContentToOverlay=null,x}return o(A,[{key:"componentDidMount",value:function(){this.props.isOpen&&this.open()}},{key:"componentDidUpdate",value:function(x,y){this.props.isOpen&&!x.isOpen?this.open():!this.props.isOpen&&x.isOpen&&this.close(),this.props.shouldFocusAfterRender&&this.state.isOpen&&!y.isOpen&&this.focusContent()}},{key:"componentWillUnmount",value:function(){this.state.isOpen&&this.afterClose(),clearTimeout(this.closeTimer),cancelAnimationFrame(this.openAnimationFrame)}},{key:"beforeOpen",value:function(){var x=this.props,y=x.appElement,T=x.ariaHideApp,z=x.htmlOpenClassName,F=x.bodyOpenClassName,D=x.parentSelector,U=D&&D().ownerDocument||document;F&&w.add(U.body,F),z&&w.add(U.getElementsByTagName("html")[0],z),T&&(Z+=1,v.hide(y)),m.default.register(this)}},{key:"render",value:function(){var x=this.props,y=x.id,T=x.className,z=x.overlayClassName,F=x.defaultStyles,D=x.children,U=T?{}:F.content,$=z?{}:F.overlay;if(this.shouldBeClosed())return null;var ee={ref:this.setOverlayRef,className:this.buildClassName("overlay",z),style:n({},$,this.props.style.overlay),onClick:this.handleOverlayOnClick,onMouseDown:this.handleOverlayOnMouseDown},K=n({id:y,ref:this.setContentRef,style:n({},U,this.props.style.content),className:this.buildClassName("content",T),tabIndex:"-1",onKeyDown:this.handleKeyDown,onMouseDown:this.handleContentOnMouseDown,onMouseUp:this.handleContentOnMouseUp,onClick:this.handleContentOnClick,role:this.props.role,"aria-label":this.props.contentLabel},this.attributesFromObject("aria",n({modal:!0},this.props.aria)),this.attributesFromObject("data",this.props.data||{}),{"data-testid":this.props.testId}),te=this.props.contentElement(K,D);return this.props.overlayElement(ee,te)}}]),A}(l.Component);ie.defaultProps={style:{overlay:{},content:{}},defaultStyles:{}},ie.propTypes={isOpen:a.default.bool.isRequired,defaultStyles:a.default.shape({content:a.default.object,overlay:a.default.object}),style:a.default.shape({content:a.default.object,overlay:a.default.object}),className:a.default.oneOfType([a.default.string,a.default.object]),overlayClassName:a.default.oneOfType([a.default.string,a.default.object]),parentSelector:a.default.func,bodyOpenClassName:a.default.string,htmlOpenClassName:a.default.string,ariaHideApp:a.default.bool,appElement:a.default.oneOfType([a.default.instanceOf(h.default),a.default.instanceOf(k.SafeHTMLCollection),a.default.instanceOf(k.SafeNodeList),a.default.arrayOf(a.default.instanceOf(h.default))]),onAfterOpen:a.default.func,onAfterClose:a.default.func,onRequestClose:a.default.func,closeTimeoutMS:a.default.number,shouldFocusAfterRender:a.default.bool,shouldCloseOnOverlayClick:a.default.bool,shouldReturnFocusAfterClose:a.default.bool,preventScroll:a.default.bool,role:a.default.string,contentLabel:a.default.string,aria:a.default.object,data:a.default.object,children:a.default.node,shouldCloseOnEsc:a.default.bool,overlayRef:a.default.func,contentRef:a.default.func,id:a.default.string,overlayElement:a.default.func,contentElement:a.default.func,testId:a.default.string},t.default=ie,e.exports=t.default})(sa,sa.exports);var Ig=sa.exports;function Dd(){var e=this.constructor.getDerivedStateFromProps(this.props,this.state);e!=null&&this.setState(e)}function Md(e){function t(n){var r=this.constructor.getDerivedStateFromProps(e,n);return r??null}this.setState(t.bind(this))}function Ad(e,t){try{var n=this.props,r=this.state;this.props=e,this.state=t,this.__reactInternalSnapshotFlag=!0,this.__reactInternalSnapshot=this.getSnapshotBeforeUpdate(n,r)}finally{this.props=n,this.state=r}}Dd.__suppressDeprecationWarning=!0;Md.__suppressDeprecationWarning=!0;Ad.__suppressDeprecationWarning=!0;function Bg(e){var t=e.prototype;if(!t||!t.isReactComponent)throw new Error("Can only polyfill class components");if(typeof e.getDerivedStateFromProps!="function"&&typeof t.getSnapshotBeforeUpdate!="function")return e;var n=null,r=null,o=null;if(typeof t.componentWillMount=="function"?n="componentWillMount":typeof t.UNSAFE_componentWillMount=="function"&&(n="UNSAFE_componentWillMount"),typeof t.componentWillReceiveProps=="function"?r="componentWillReceiveProps":typeof t.UNSAFE_componentWillReceiveProps=="function"&&(r="UNSAFE_componentWillReceiveProps"),typeof t.componentWillUpdate=="function"?o="componentWillUpdate":typeof t.UNSAFE_componentWillUpdate=="function"&&(o="UNSAFE_componentWillUpdate"),n!==null||r!==null||o!==null){var l=e.displayName||e.name,i=typeof e.getDerivedStateFromProps=="function"?"getDerivedStateFromProps()":"getSnapshotBeforeUpdate()";throw Error(`Unsafe legacy lifecycles will not be called for components using new component APIs.
-
-`+l+" uses "+i+" but also contains the following legacy lifecycles:"+(n!==null?`
-  `+n:"")+(r!==null?`
-  `+r:"")+(o!==null?`
-  `+o:"")+`
-
-The above lifecycles should be removed. Learn more about this warning here:
-https://fb.me/react-async-component-lifecycle-hooks`)}if(typeof e.getDerivedStateFromProps=="function"&&(t.componentWillMount=Dd,t.componentWillReceiveProps=Md),typeof t.getSnapshotBeforeUpdate=="function"){if(typeof t.componentDidUpdate!="function")throw new Error("Cannot polyfill getSnapshotBeforeUpdate() for components that do not define componentDidUpdate() on the prototype");t.componentWillUpdate=Ad;var a=t.componentDidUpdate;t.componentDidUpdate=function(u,c,f){var p=this.__reactInternalSnapshotFlag?this.__reactInternalSnapshot:f;a.call(this,u,c,p)}}return e}const bg=Object.freeze(Object.defineProperty({__proto__:null,polyfill:Bg},Symbol.toStringTag,{value:"Module"})),Yg=np(bg);Object.defineProperty(mn,"__esModule",{value:!0});mn.bodyOpenClassName=mn.portalClassName=void 0;var Au=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Hg=function(){function e(t,n){for(var r=0;r<n.length;r++){var o=n[r];o.enumerable=o.enumerable||!1,o.configurable=!0,"value"in o&&(o.writable=!0),Object.defineProperty(t,o.key,o)}}return function(t,n,r){return n&&e(t.prototype,n),r&&e(t,r),t}}(),Fd=E,ul=qr(Fd),Xg=fd,cl=qr(Xg),Vg=Td,I=qr(Vg),Qg=Ig,Fu=qr(Qg),Kg=at,Gg=qg(Kg),Lt=ot,Wu=qr(Lt),Zg=Yg;function qg(e){if(e&&e.__esModule)return e;var t={};if(e!=null)for(var n in e)Object.prototype.hasOwnProperty.call(e,n)&&(t[n]=e[n]);return t.default=e,t}function qr(e){return e&&e.__esModule?e:{default:e}}function Jg(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function Uu(e,t){if(!e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t&&(typeof t=="object"||typeof t=="function")?t:e}function ey(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function, not "+typeof t);e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,enumerable:!1,writable:!0,configurable:!0}}),t&&(Object.setPrototypeOf?Object.setPrototypeOf(e,t):e.__proto__=t)}var ty=mn.portalClassName="ReactModalPortal",ny=mn.bodyOpenClassName="ReactModal__Body--open",en=Lt.canUseDOM&&cl.default.createPortal!==void 0,$u=function(t){return document.createElement(t)},Iu=function(){return en?cl.default.createPortal:cl.default.unstable_renderSubtreeIntoContainer};function So(e){return e()}var Jr=function(e){ey(t,e);function t(){var n,r,o,l;Jg(this,t);for(var i=arguments.length,a=Array(i),s=0;s<i;s++)a[s]=arguments[s];return l=(r=(o=Uu(this,(n=t.__proto__||Object.getPrototypeOf(t)).call.apply(n,[this].concat(a))),o),o.removePortal=function(){!en&&cl.default.unmountComponentAtNode(o.node);var u=So(o.props.parentSelector);u&&u.contains(o.node)?u.removeChild(o.node):console.warn('React-Modal: "parentSelector" prop did not returned any DOM element. Make sure that the parent element is unmounted to avoid any memory leaks.')},o.portalRef=function(u){o.portal=u},o.renderPortal=function(u){var c=Iu(),f=c(o,ul.default.createElement(Fu.default,Au({defaultStyles:t.defaultStyles},u)),o.node);o.portalRef(f)},r),Uu(o,l)}return Hg(t,[{key:"componentDidMount",value:function(){if(Lt.canUseDOM){en||(this.node=$u("div")),this.node.className=this.props.portalClassName;var r=So(this.props.parentSelector);r.appendChild(this.node),!en&&this.renderPortal(this.props)}}},{key:"getSnapshotBeforeUpdate",value:function(r){var o=So(r.parentSelector),l=So(this.props.parentSelector);return{prevParent:o,nextParent:l}}},{key:"componentDidUpdate",value:function(r,o,l){if(Lt.canUseDOM){var i=this.props,a=i.isOpen,s=i.portalClassName;r.portalClassName!==s&&(this.node.className=s);var u=l.prevParent,c=l.nextParent;c!==u&&(u.removeChild(this.node),c.appendChild(this.node)),!(!r.isOpen&&!a)&&!en&&this.renderPortal(this.props)}}},{key:"componentWillUnmount",value:function(){if(!(!Lt.canUseDOM||!this.node||!this.portal)){var r=this.portal.state,o=Date.now(),l=r.isOpen&&this.props.closeTimeoutMS&&(r.closesAt||o+this.props.closeTimeoutMS);l?(r.beforeClose||this.portal.closeWithTimeout(),setTimeout(this.removePortal,l-o)):this.removePortal()}}},{key:"render",value:function(){if(!Lt.canUseDOM||!en)return null;!this.node&&en&&(this.node=$u("div"));var r=Iu();return r(ul.default.createElement(Fu.default,Au({ref:this.portalRef,defaultStyles:t.defaultStyles},this.props)),this.node)}}],[{key:"setAppElement",value:function(r){Gg.setElement(r)}}]),t}(Fd.Component);Jr.propTypes={isOpen:I.default.bool.isRequired,style:I.default.shape({content:I.default.object,overlay:I.default.object}),portalClassName:I.default.string,bodyOpenClassName:I.default.string,htmlOpenClassName:I.default.string,className:I.default.oneOfType([I.default.string,I.default.shape({base:I.default.string.isRequired,afterOpen:I.default.string.isRequired,beforeClose:I.default.string.isRequired})]),overlayClassName:I.default.oneOfType([I.default.string,I.default.shape({base:I.default.string.isRequired,afterOpen:I.default.string.isRequired,beforeClose:I.default.string.isRequired})]),appElement:I.default.oneOfType([I.default.instanceOf(Wu.default),I.default.instanceOf(Lt.SafeHTMLCollection),I.default.instanceOf(Lt.SafeNodeList),I.default.arrayOf(I.default.instanceOf(Wu.default))]),onAfterOpen:I.default.func,onRequestClose:I.default.func,closeTimeoutMS:I.default.number,ariaHideApp:I.default.bool,shouldFocusAfterRender:I.default.bool,shouldCloseOnOverlayClick:I.default.bool,shouldReturnFocusAfterClose:I.default.bool,preventScroll:I.default.bool,parentSelector:I.default.func,aria:I.default.object,data:I.default.object,role:I.default.string,contentLabel:I.default.string,shouldCloseOnEsc:I.default.bool,overlayRef:I.default.func,contentRef:I.default.func,id:I.default.string,overlayElement:I.default.func,contentElement:I.default.func};Jr.defaultProps={isOpen:!1,portalClassName:ty,bodyOpenClassName:ny,role:"dialog",ariaHideApp:!0,closeTimeoutMS:0,shouldFocusAfterRender:!0,shouldCloseOnEsc:!0,shouldCloseOnOverlayClick:!0,shouldReturnFocusAfterClose:!0,preventScroll:!1,parentSelector:function(){return document.body},overlayElement:function(t,n){return ul.default.createElement("div",t,n)},contentElement:function(t,n){return ul.default.createElement("div",t,n)}};Jr.defaultStyles={overlay:{position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"rgba(255, 255, 255, 0.75)"},content:{position:"absolute",top:"40px",left:"40px",right:"40px",bottom:"40px",border:"1px solid #ccc",background:"#fff",overflow:"auto",WebkitOverflowScrolling:"touch",borderRadius:"4px",outline:"none",padding:"20px"}};(0,Zg.polyfill)(Jr);mn.default=Jr;(function(e,t){Object.defineProperty(t,"__esModule",{value:!0});var n=mn,r=o(n);function o(l){return l&&l.__esModule?l:{default:l}}t.default=r.default,e.exports=t.default})(aa,aa.exports);var ry=aa.exports;const zl=Zu(ry);var Xe=function(e,t){return Number(e.toFixed(t))},oy=function(e,t){return t},oe=function(e,t,n){n&&typeof n=="function"&&n(e,t)},ly=function(e){return-Math.cos(e*Math.PI)/2+.5},iy=function(e){return e},ay=function(e){return e*e},sy=function(e){return e*(2-e)},uy=function(e){return e<.5?2*e*e:-1+(4-2*e)*e},cy=function(e){return e*e*e},fy=function(e){return--e*e*e+1},dy=function(e){return e<.5?4*e*e*e:(e-1)*(2*e-2)*(2*e-2)+1},py=function(e){return e*e*e*e},my=function(e){return 1- --e*e*e*e},hy=function(e){return e<.5?8*e*e*e*e:1-8*--e*e*e*e},vy=function(e){return e*e*e*e*e},gy=function(e){return 1+--e*e*e*e*e},yy=function(e){return e<.5?16*e*e*e*e*e:1+16*--e*e*e*e*e},Wd={easeOut:ly,linear:iy,easeInQuad:ay,easeOutQuad:sy,easeInOutQuad:uy,easeInCubic:cy,easeOutCubic:fy,easeInOutCubic:dy,easeInQuart:py,easeOutQuart:my,easeInOutQuart:hy,easeInQuint:vy,easeOutQuint:gy,easeInOutQuint:yy},Ud=function(e){typeof e=="number"&&cancelAnimationFrame(e)},tt=function(e){e.mounted&&(Ud(e.animation),e.animate=!1,e.animation=null,e.velocity=null)};function $d(e,t,n,r){if(e.mounted){var o=new Date().getTime(),l=1;tt(e),e.animation=function(){if(!e.mounted)return Ud(e.animation);var i=new Date().getTime()-o,a=i/n,s=Wd[t],u=s(a);i>=n?(r(l),e.animation=null):e.animation&&(r(u),requestAnimationFrame(e.animation))},requestAnimationFrame(e.animation)}}function wy(e){var t=e.scale,n=e.positionX,r=e.positionY;return!(Number.isNaN(t)||Number.isNaN(n)||Number.isNaN(r))}function Zt(e,t,n,r){var o=wy(t);if(!(!e.mounted||!o)){var l=e.setTransformState,i=e.transformState,a=i.scale,s=i.positionX,u=i.positionY,c=t.scale-a,f=t.positionX-s,p=t.positionY-u;n===0?l(t.scale,t.positionX,t.positionY):$d(e,r,n,function(v){var g=a+c*v,w=s+f*v,k=u+p*v;l(g,w,k)})}}function Sy(e,t,n){var r=e.offsetWidth,o=e.offsetHeight,l=t.offsetWidth,i=t.offsetHeight,a=l*n,s=i*n,u=r-a,c=o-s;return{wrapperWidth:r,wrapperHeight:o,newContentWidth:a,newDiffWidth:u,newContentHeight:s,newDiffHeight:c}}var Cy=function(e,t,n,r,o,l,i){var a=e>t?n*(i?1:.5):0,s=r>o?l*(i?1:.5):0,u=e-t-a,c=a,f=r-o-s,p=s;return{minPositionX:u,maxPositionX:c,minPositionY:f,maxPositionY:p}},ps=function(e,t){var n=e.wrapperComponent,r=e.contentComponent,o=e.setup.centerZoomedOut;if(!n||!r)throw new Error("Components are not mounted");var l=Sy(n,r,t),i=l.wrapperWidth,a=l.wrapperHeight,s=l.newContentWidth,u=l.newDiffWidth,c=l.newContentHeight,f=l.newDiffHeight,p=Cy(i,s,u,a,c,f,!!o);return p},da=function(e,t,n,r){return r?e<t?Xe(t,2):e>n?Xe(n,2):Xe(e,2):Xe(e,2)},sn=function(e,t){var n=ps(e,t);return e.bounds=n,n};function eo(e,t,n,r,o,l,i){var a=n.minPositionX,s=n.minPositionY,u=n.maxPositionX,c=n.maxPositionY,f=0,p=0;i&&(f=o,p=l);var v=da(e,a-f,u+f,r),g=da(t,s-p,c+p,r);return{x:v,y:g}}function Ll(e,t,n,r,o,l){var i=e.transformState,a=i.scale,s=i.positionX,u=i.positionY,c=r-a;if(typeof t!="number"||typeof n!="number")return console.error("Mouse X and Y position were not provided!"),{x:s,y:u};var f=s-t*c,p=u-n*c,v=eo(f,p,o,l,0,0,null);return v}function to(e,t,n,r,o){var l=o?r:0,i=t-l;return!Number.isNaN(n)&&e>=n?n:!Number.isNaN(t)&&e<=i?i:e}var Bu=function(e,t){var n=e.setup.panning.excluded,r=e.isInitialized,o=e.wrapperComponent,l=t.target,i="shadowRoot"in l&&"composedPath"in t,a=i?t.composedPath().some(function(c){return c instanceof Element?o==null?void 0:o.contains(c):!1}):o==null?void 0:o.contains(l),s=r&&l&&a;if(!s)return!1;var u=jl(l,n);return!u},bu=function(e){var t=e.isInitialized,n=e.isPanning,r=e.setup,o=r.panning.disabled,l=t&&n&&!o;return!!l},xy=function(e,t){var n=e.transformState,r=n.positionX,o=n.positionY;e.isPanning=!0;var l=t.clientX,i=t.clientY;e.startCoords={x:l-r,y:i-o}},ky=function(e,t){var n=t.touches,r=e.transformState,o=r.positionX,l=r.positionY;e.isPanning=!0;var i=n.length===1;if(i){var a=n[0].clientX,s=n[0].clientY;e.startCoords={x:a-o,y:s-l}}};function Ey(e){var t=e.transformState,n=t.positionX,r=t.positionY,o=t.scale,l=e.setup,i=l.disabled,a=l.limitToBounds,s=l.centerZoomedOut,u=e.wrapperComponent;if(!(i||!u||!e.bounds)){var c=e.bounds,f=c.maxPositionX,p=c.minPositionX,v=c.maxPositionY,g=c.minPositionY,w=n>f||n<p,k=r>v||r<g,h=n>f?u.offsetWidth:e.setup.minPositionX||0,d=r>v?u.offsetHeight:e.setup.minPositionY||0,m=Ll(e,h,d,o,e.bounds,a||s),C=m.x,_=m.y;return{scale:o,positionX:w?C:n,positionY:k?_:r}}}function Id(e,t,n,r,o){var l=e.setup.limitToBounds,i=e.wrapperComponent,a=e.bounds,s=e.transformState,u=s.scale,c=s.positionX,f=s.positionY;if(!(i===null||a===null||t===c&&n===f)){var p=eo(t,n,a,l,r,o,i),v=p.x,g=p.y;e.setTransformState(u,v,g)}}var _y=function(e,t,n){var r=e.startCoords,o=e.transformState,l=e.setup.panning,i=l.lockAxisX,a=l.lockAxisY,s=o.positionX,u=o.positionY;if(!r)return{x:s,y:u};var c=t-r.x,f=n-r.y,p=i?s:c,v=a?u:f;return{x:p,y:v}},Ht=function(e,t){var n=e.setup,r=e.transformState,o=r.scale,l=n.minScale,i=n.disablePadding;return t>0&&o>=l&&!i?t:0},Py=function(e){var t=e.mounted,n=e.setup,r=n.disabled,o=n.velocityAnimation,l=e.transformState.scale,i=o.disabled,a=!i||l>1||!r||t;return!!a},Ny=function(e){var t=e.mounted,n=e.velocity,r=e.bounds,o=e.setup,l=o.disabled,i=o.velocityAnimation,a=e.transformState.scale,s=i.disabled,u=!s||a>1||!l||t;return!(!u||!n||!r)};function Oy(e,t){var n=e.setup.velocityAnimation,r=n.equalToMove,o=n.animationTime,l=n.sensitivity;return r?o*t*l:o}function Yu(e,t,n,r,o,l,i,a,s,u){if(o){if(t>i&&n>i){var c=i+(e-i)*u;return c>s?s:c<i?i:c}if(t<l&&n<l){var c=l+(e-l)*u;return c<a?a:c>l?l:c}}return r?t:da(e,l,i,o)}function Ty(e,t){var n=1;return t?Math.min(n,e.offsetWidth/window.innerWidth):n}function Ry(e,t){var n=Py(e);if(n){var r=e.lastMousePosition,o=e.velocityTime,l=e.setup,i=e.wrapperComponent,a=l.velocityAnimation.equalToMove,s=Date.now();if(r&&o&&i){var u=Ty(i,a),c=t.x-r.x,f=t.y-r.y,p=c/u,v=f/u,g=s-o,w=c*c+f*f,k=Math.sqrt(w)/g;e.velocity={velocityX:p,velocityY:v,total:k}}e.lastMousePosition=t,e.velocityTime=s}}function zy(e){var t=e.velocity,n=e.bounds,r=e.setup,o=e.wrapperComponent,l=Ny(e);if(!(!l||!t||!n||!o)){var i=t.velocityX,a=t.velocityY,s=t.total,u=n.maxPositionX,c=n.minPositionX,f=n.maxPositionY,p=n.minPositionY,v=r.limitToBounds,g=r.alignmentAnimation,w=r.zoomAnimation,k=r.panning,h=k.lockAxisY,d=k.lockAxisX,m=w.animationType,C=g.sizeX,_=g.sizeY,R=g.velocityAlignmentTime,N=R,P=Oy(e,s),M=Math.max(P,N),j=Ht(e,C),Q=Ht(e,_),Z=j*o.offsetWidth/100,ie=Q*o.offsetHeight/100,W=u+Z,A=c-Z,V=f+ie,x=p-ie,y=e.transformState,T=new Date().getTime();$d(e,m,M,function(z){var F=e.transformState,D=F.scale,U=F.positionX,$=F.positionY,ee=new Date().getTime()-T,K=ee/N,te=Wd[g.animationType],Y=1-te(Math.min(1,K)),B=1-z,H=U+i*B,ae=$+a*B,yn=Yu(H,y.positionX,U,d,v,c,u,A,W,Y),ep=Yu(ae,y.positionY,$,h,v,p,f,x,V,Y);(U!==H||$!==ae)&&e.setTransformState(D,yn,ep)})}}function Hu(e,t){var n=e.transformState.scale;tt(e),sn(e,n),window.TouchEvent!==void 0&&t instanceof TouchEvent?ky(e,t):xy(e,t)}function ms(e,t){var n=e.transformState.scale,r=e.setup,o=r.minScale,l=r.alignmentAnimation,i=l.disabled,a=l.sizeX,s=l.sizeY,u=l.animationTime,c=l.animationType,f=i||n<o||!a&&!s;if(!f){var p=Ey(e);p&&Zt(e,p,t??u,c)}}function Xu(e,t,n){var r=e.startCoords,o=e.setup,l=o.alignmentAnimation,i=l.sizeX,a=l.sizeY;if(r){var s=_y(e,t,n),u=s.x,c=s.y,f=Ht(e,i),p=Ht(e,a);Ry(e,{x:u,y:c}),Id(e,u,c,f,p)}}function Ly(e){if(e.isPanning){var t=e.setup.panning.velocityDisabled,n=e.velocity,r=e.wrapperComponent,o=e.contentComponent;e.isPanning=!1,e.animate=!1,e.animation=null;var l=r==null?void 0:r.getBoundingClientRect(),i=o==null?void 0:o.getBoundingClientRect(),a=(l==null?void 0:l.width)||0,s=(l==null?void 0:l.height)||0,u=(i==null?void 0:i.width)||0,c=(i==null?void 0:i.height)||0,f=a<u||s<c,p=!t&&n&&(n==null?void 0:n.total)>.1&&f;p?zy(e):ms(e)}}function hs(e,t,n,r){var o=e.setup,l=o.minScale,i=o.maxScale,a=o.limitToBounds,s=to(Xe(t,2),l,i,0,!1),u=sn(e,s),c=Ll(e,n,r,s,u,a),f=c.x,p=c.y;return{scale:s,positionX:f,positionY:p}}function Bd(e,t,n){var r=e.transformState.scale,o=e.wrapperComponent,l=e.setup,i=l.minScale,a=l.limitToBounds,s=l.zoomAnimation,u=s.disabled,c=s.animationTime,f=s.animationType,p=u||r>=i;if((r>=1||a)&&ms(e),!(p||!o||!e.mounted)){var v=t||o.offsetWidth/2,g=n||o.offsetHeight/2,w=hs(e,i,v,g);w&&Zt(e,w,c,f)}}var Bt=function(){return Bt=Object.assign||function(t){for(var n,r=1,o=arguments.length;r<o;r++){n=arguments[r];for(var l in n)Object.prototype.hasOwnProperty.call(n,l)&&(t[l]=n[l])}return t},Bt.apply(this,arguments)};function Vu(e,t,n){for(var r=0,o=t.length,l;r<o;r++)(l||!(r in t))&&(l||(l=Array.prototype.slice.call(t,0,r)),l[r]=t[r]);return e.concat(l||Array.prototype.slice.call(t))}var Co={scale:1,positionX:0,positionY:0},ar={disabled:!1,minPositionX:null,maxPositionX:null,minPositionY:null,maxPositionY:null,minScale:1,maxScale:8,limitToBounds:!0,centerZoomedOut:!1,centerOnInit:!1,disablePadding:!1,smooth:!0,wheel:{step:.2,disabled:!1,smoothStep:.001,wheelDisabled:!1,touchPadDisabled:!1,activationKeys:[],excluded:[]},panning:{disabled:!1,velocityDisabled:!1,lockAxisX:!1,lockAxisY:!1,allowLeftClickPan:!0,allowMiddleClickPan:!0,allowRightClickPan:!0,wheelPanning:!1,activationKeys:[],excluded:[]},pinch:{step:5,disabled:!1,excluded:[]},doubleClick:{disabled:!1,step:.7,mode:"zoomIn",animationType:"easeOut",animationTime:200,excluded:[]},zoomAnimation:{disabled:!1,size:.4,animationTime:200,animationType:"easeOut"},alignmentAnimation:{disabled:!1,sizeX:100,sizeY:100,animationTime:200,velocityAlignmentTime:400,animationType:"easeOut"},velocityAnimation:{disabled:!1,sensitivity:1,animationTime:400,animationType:"easeOut",equalToMove:!0}},pa={wrapperClass:"react-transform-wrapper",contentClass:"react-transform-component"},bd=function(e){var t,n,r,o;return{previousScale:(t=e.initialScale)!==null&&t!==void 0?t:Co.scale,scale:(n=e.initialScale)!==null&&n!==void 0?n:Co.scale,positionX:(r=e.initialPositionX)!==null&&r!==void 0?r:Co.positionX,positionY:(o=e.initialPositionY)!==null&&o!==void 0?o:Co.positionY}},Qu=function(e){var t=Bt({},ar);return Object.keys(e).forEach(function(n){var r=typeof e[n]<"u",o=typeof ar[n]<"u";if(o&&r){var l=Object.prototype.toString.call(ar[n]),i=l==="[object Object]",a=l==="[object Array]";i?t[n]=Bt(Bt({},ar[n]),e[n]):a?t[n]=Vu(Vu([],ar[n],!0),e[n]):t[n]=e[n]}}),t},Yd=function(e,t,n){var r=e.transformState.scale,o=e.wrapperComponent,l=e.setup,i=l.maxScale,a=l.minScale,s=l.zoomAnimation,u=l.smooth,c=s.size;if(!o)throw new Error("Wrapper is not mounted");var f=u?r*Math.exp(t*n):r+t*n,p=to(Xe(f,3),a,i,c,!1);return p};function Hd(e,t,n,r,o){var l=e.wrapperComponent,i=e.transformState,a=i.scale,s=i.positionX,u=i.positionY;if(!l)return console.error("No WrapperComponent found");var c=l.offsetWidth,f=l.offsetHeight,p=(c/2-s)/a,v=(f/2-u)/a,g=Yd(e,t,n),w=hs(e,g,p,v);if(!w)return console.error("Error during zoom event. New transformation state was not calculated.");Zt(e,w,r,o)}function Xd(e,t,n,r){var o=e.setup,l=e.wrapperComponent,i=o.limitToBounds,a=bd(e.props),s=e.transformState,u=s.scale,c=s.positionX,f=s.positionY;if(l){var p=ps(e,a.scale),v=eo(a.positionX,a.positionY,p,i,0,0,l),g={scale:a.scale,positionX:v.x,positionY:v.y};u===a.scale&&c===a.positionX&&f===a.positionY||(r==null||r(),Zt(e,g,t,n))}}function jy(e,t,n,r){var o=e.getBoundingClientRect(),l=t.getBoundingClientRect(),i=n.getBoundingClientRect(),a=l.x*r.scale,s=l.y*r.scale;return{x:(o.x-i.x+a)/r.scale,y:(o.y-i.y+s)/r.scale}}function Dy(e,t,n){var r=e.wrapperComponent,o=e.contentComponent,l=e.transformState,i=e.setup,a=i.limitToBounds,s=i.minScale,u=i.maxScale;if(!r||!o)return l;var c=r.getBoundingClientRect(),f=t.getBoundingClientRect(),p=jy(t,r,o,l),v=p.x,g=p.y,w=f.width/l.scale,k=f.height/l.scale,h=r.offsetWidth/w,d=r.offsetHeight/k,m=to(n||Math.min(h,d),s,u,0,!1),C=(c.width-w*m)/2,_=(c.height-k*m)/2,R=(c.left-v)*m+C,N=(c.top-g)*m+_,P=ps(e,m),M=eo(R,N,P,a,0,0,r),j=M.x,Q=M.y;return{positionX:j,positionY:Q,scale:m}}var My=function(e){return function(t,n,r){t===void 0&&(t=.5),n===void 0&&(n=300),r===void 0&&(r="easeOut"),Hd(e,1,t,n,r)}},Ay=function(e){return function(t,n,r){t===void 0&&(t=.5),n===void 0&&(n=300),r===void 0&&(r="easeOut"),Hd(e,-1,t,n,r)}},Fy=function(e){return function(t,n,r,o,l){o===void 0&&(o=300),l===void 0&&(l="easeOut");var i=e.transformState,a=i.positionX,s=i.positionY,u=i.scale,c=e.wrapperComponent,f=e.contentComponent,p=e.setup.disabled;if(!(p||!c||!f)){var v={positionX:Number.isNaN(t)?a:t,positionY:Number.isNaN(n)?s:n,scale:Number.isNaN(r)?u:r};Zt(e,v,o,l)}}},Wy=function(e){return function(t,n){t===void 0&&(t=200),n===void 0&&(n="easeOut"),Xd(e,t,n)}},Uy=function(e){return function(t,n,r){n===void 0&&(n=200),r===void 0&&(r="easeOut");var o=e.transformState,l=e.wrapperComponent,i=e.contentComponent;if(l&&i){var a=Vd(t||o.scale,l,i);Zt(e,a,n,r)}}},$y=function(e){return function(t,n,r,o){r===void 0&&(r=600),o===void 0&&(o="easeOut"),tt(e);var l=e.wrapperComponent,i=typeof t=="string"?document.getElementById(t):t;if(l&&i&&l.contains(i)){var a=Dy(e,i,n);Zt(e,a,r,o)}}},ma=function(e){return{instance:e,zoomIn:My(e),zoomOut:Ay(e),setTransform:Fy(e),resetTransform:Wy(e),centerView:Uy(e),zoomToElement:$y(e)}},Iy=function(e){return{instance:e,state:e.transformState}},q=function(e){var t={};return Object.assign(t,Iy(e)),Object.assign(t,ma(e)),t},si=!1;function ui(){try{var e={get passive(){return si=!0,!1}};return e}catch{return si=!1,si}}var xo=".".concat(pa.wrapperClass),jl=function(e,t){return t.some(function(n){return e.matches("".concat(xo," ").concat(n,", ").concat(xo," .").concat(n,", ").concat(xo," ").concat(n," *, ").concat(xo," .").concat(n," *"))})},ha=function(e){e&&clearTimeout(e)},By=function(e,t,n){return"translate(".concat(e,"px, ").concat(t,"px) scale(").concat(n,")")},Vd=function(e,t,n){var r=n.offsetWidth*e,o=n.offsetHeight*e,l=(t.offsetWidth-r)/2,i=(t.offsetHeight-o)/2;return{scale:e,positionX:l,positionY:i}};function by(e){return function(t){e.forEach(function(n){typeof n=="function"?n(t):n!=null&&(n.current=t)})}}var Yy=function(e,t){var n=e.setup.wheel,r=n.disabled,o=n.wheelDisabled,l=n.touchPadDisabled,i=n.excluded,a=e.isInitialized,s=e.isPanning,u=t.target,c=a&&!s&&!r&&u;if(!c||o&&!t.ctrlKey||l&&t.ctrlKey)return!1;var f=jl(u,i);return!f},Hy=function(e){return e?e.deltaY<0?1:-1:0};function Xy(e,t){var n=Hy(e),r=oy(t,n);return r}function Qd(e,t,n){var r=t.getBoundingClientRect(),o=0,l=0;if("clientX"in e)o=(e.clientX-r.left)/n,l=(e.clientY-r.top)/n;else{var i=e.touches[0];o=(i.clientX-r.left)/n,l=(i.clientY-r.top)/n}return(Number.isNaN(o)||Number.isNaN(l))&&console.error("No mouse or touch offset found"),{x:o,y:l}}var Vy=function(e,t,n,r,o){var l=e.transformState.scale,i=e.wrapperComponent,a=e.setup,s=a.maxScale,u=a.minScale,c=a.zoomAnimation,f=a.disablePadding,p=c.size,v=c.disabled;if(!i)throw new Error("Wrapper is not mounted");var g=l+t*n,w=r?!1:!v,k=to(Xe(g,3),u,s,p,w&&!f);return k},Qy=function(e,t){var n=e.previousWheelEvent,r=e.transformState.scale,o=e.setup,l=o.maxScale,i=o.minScale;return n?r<l||r>i||Math.sign(n.deltaY)!==Math.sign(t.deltaY)||n.deltaY>0&&n.deltaY<t.deltaY||n.deltaY<0&&n.deltaY>t.deltaY||Math.sign(n.deltaY)!==Math.sign(t.deltaY):!1},Ky=function(e,t){var n=e.setup.pinch,r=n.disabled,o=n.excluded,l=e.isInitialized,i=t.target,a=l&&!r&&i;if(!a)return!1;var s=jl(i,o);return!s},Gy=function(e){var t=e.setup.pinch.disabled,n=e.isInitialized,r=e.pinchStartDistance,o=n&&!t&&r;return!!o},Zy=function(e,t,n){var r=n.getBoundingClientRect(),o=e.touches,l=Xe(o[0].clientX-r.left,5),i=Xe(o[0].clientY-r.top,5),a=Xe(o[1].clientX-r.left,5),s=Xe(o[1].clientY-r.top,5);return{x:(l+a)/2/t,y:(i+s)/2/t}},Kd=function(e){return Math.sqrt(Math.pow(e.touches[0].pageX-e.touches[1].pageX,2)+Math.pow(e.touches[0].pageY-e.touches[1].pageY,2))},qy=function(e,t){var n=e.pinchStartScale,r=e.pinchStartDistance,o=e.setup,l=o.maxScale,i=o.minScale,a=o.zoomAnimation,s=o.disablePadding,u=a.size,c=a.disabled;if(!n||r===null||!t)throw new Error("Pinch touches distance was not provided");if(t<0)return e.transformState.scale;var f=t/r,p=f*n;return to(Xe(p,2),i,l,u,!c&&!s)},Jy=160,e0=100,t0=function(e,t){var n=e.props,r=n.onWheelStart,o=n.onZoomStart;e.wheelStopEventTimer||(tt(e),oe(q(e),t,r),oe(q(e),t,o))},n0=function(e,t){var n=e.props,r=n.onWheel,o=n.onZoom,l=e.contentComponent,i=e.setup,a=e.transformState,s=a.scale,u=i.limitToBounds,c=i.centerZoomedOut,f=i.zoomAnimation,p=i.wheel,v=i.disablePadding,g=i.smooth,w=f.size,k=f.disabled,h=p.step,d=p.smoothStep;if(!l)throw new Error("Component not mounted");t.preventDefault(),t.stopPropagation();var m=Xy(t,null),C=g?d*Math.abs(t.deltaY):h,_=Vy(e,m,C,!t.ctrlKey);if(s!==_){var R=sn(e,_),N=Qd(t,l,s),P=k||w===0||c||v,M=u&&P,j=Ll(e,N.x,N.y,_,R,M),Q=j.x,Z=j.y;e.previousWheelEvent=t,e.setTransformState(_,Q,Z),oe(q(e),t,r),oe(q(e),t,o)}},r0=function(e,t){var n=e.props,r=n.onWheelStop,o=n.onZoomStop;ha(e.wheelAnimationTimer),e.wheelAnimationTimer=setTimeout(function(){e.mounted&&(Bd(e,t.x,t.y),e.wheelAnimationTimer=null)},e0);var l=Qy(e,t);l&&(ha(e.wheelStopEventTimer),e.wheelStopEventTimer=setTimeout(function(){e.mounted&&(e.wheelStopEventTimer=null,oe(q(e),t,r),oe(q(e),t,o))},Jy))},Gd=function(e){for(var t=0,n=0,r=0;r<2;r+=1)t+=e.touches[r].clientX,n+=e.touches[r].clientY;var o=t/2,l=n/2;return{x:o,y:l}},o0=function(e,t){var n=Kd(t);e.pinchStartDistance=n,e.lastDistance=n,e.pinchStartScale=e.transformState.scale,e.isPanning=!1;var r=Gd(t);e.pinchLastCenterX=r.x,e.pinchLastCenterY=r.y,tt(e)},l0=function(e,t){var n=e.contentComponent,r=e.pinchStartDistance,o=e.wrapperComponent,l=e.transformState.scale,i=e.setup,a=i.limitToBounds,s=i.centerZoomedOut,u=i.zoomAnimation,c=i.alignmentAnimation,f=u.disabled,p=u.size;if(!(r===null||!n)){var v=Zy(t,l,n);if(!(!Number.isFinite(v.x)||!Number.isFinite(v.y))){var g=Kd(t),w=qy(e,g),k=Gd(t),h=k.x-(e.pinchLastCenterX||0),d=k.y-(e.pinchLastCenterY||0);if(!(w===l&&h===0&&d===0)){e.pinchLastCenterX=k.x,e.pinchLastCenterY=k.y;var m=sn(e,w),C=f||p===0||s,_=a&&C,R=Ll(e,v.x,v.y,w,m,_),N=R.x,P=R.y;e.pinchMidpoint=v,e.lastDistance=g;var M=c.sizeX,j=c.sizeY,Q=Ht(e,M),Z=Ht(e,j),ie=N+h,W=P+d,A=eo(ie,W,m,a,Q,Z,o),V=A.x,x=A.y;e.setTransformState(w,V,x)}}}},i0=function(e){var t=e.pinchMidpoint;e.velocity=null,e.lastDistance=null,e.pinchMidpoint=null,e.pinchStartScale=null,e.pinchStartDistance=null,Bd(e,t==null?void 0:t.x,t==null?void 0:t.y)},Zd=function(e,t){var n=e.props.onZoomStop,r=e.setup.doubleClick.animationTime;ha(e.doubleClickStopEventTimer),e.doubleClickStopEventTimer=setTimeout(function(){e.doubleClickStopEventTimer=null,oe(q(e),t,n)},r)},a0=function(e,t){var n=e.props,r=n.onZoomStart,o=n.onZoom,l=e.setup.doubleClick,i=l.animationTime,a=l.animationType;oe(q(e),t,r),Xd(e,i,a,function(){return oe(q(e),t,o)}),Zd(e,t)};function s0(e,t){return e==="toggle"?t===1?1:-1:e==="zoomOut"?-1:1}function u0(e,t){var n=e.setup,r=e.doubleClickStopEventTimer,o=e.transformState,l=e.contentComponent,i=o.scale,a=e.props,s=a.onZoomStart,u=a.onZoom,c=n.doubleClick,f=c.disabled,p=c.mode,v=c.step,g=c.animationTime,w=c.animationType;if(!f&&!r){if(p==="reset")return a0(e,t);if(!l)return console.error("No ContentComponent found");var k=s0(p,e.transformState.scale),h=Yd(e,k,v);if(i!==h){oe(q(e),t,s);var d=Qd(t,l,i),m=hs(e,h,d.x,d.y);if(!m)return console.error("Error during zoom event. New transformation state was not calculated.");oe(q(e),t,u),Zt(e,m,g,w),Zd(e,t)}}}var c0=function(e,t){var n=e.isInitialized,r=e.setup,o=e.wrapperComponent,l=r.doubleClick,i=l.disabled,a=l.excluded,s=t.target,u=o==null?void 0:o.contains(s),c=n&&s&&u&&!i;if(!c)return!1;var f=jl(s,a);return!f},f0=function(){function e(t){var n=this;this.mounted=!0,this.pinchLastCenterX=null,this.pinchLastCenterY=null,this.onChangeCallbacks=new Set,this.onInitCallbacks=new Set,this.wrapperComponent=null,this.contentComponent=null,this.isInitialized=!1,this.bounds=null,this.previousWheelEvent=null,this.wheelStopEventTimer=null,this.wheelAnimationTimer=null,this.isPanning=!1,this.isWheelPanning=!1,this.startCoords=null,this.lastTouch=null,this.distance=null,this.lastDistance=null,this.pinchStartDistance=null,this.pinchStartScale=null,this.pinchMidpoint=null,this.doubleClickStopEventTimer=null,this.velocity=null,this.velocityTime=null,this.lastMousePosition=null,this.animate=!1,this.animation=null,this.maxBounds=null,this.pressedKeys={},this.mount=function(){n.initializeWindowEvents()},this.unmount=function(){n.cleanupWindowEvents()},this.update=function(r){n.props=r,sn(n,n.transformState.scale),n.setup=Qu(r)},this.initializeWindowEvents=function(){var r,o,l=ui(),i=(r=n.wrapperComponent)===null||r===void 0?void 0:r.ownerDocument,a=i==null?void 0:i.defaultView;(o=n.wrapperComponent)===null||o===void 0||o.addEventListener("wheel",n.onWheelPanning,l),a==null||a.addEventListener("mousedown",n.onPanningStart,l),a==null||a.addEventListener("mousemove",n.onPanning,l),a==null||a.addEventListener("mouseup",n.onPanningStop,l),i==null||i.addEventListener("mouseleave",n.clearPanning,l),a==null||a.addEventListener("keyup",n.setKeyUnPressed,l),a==null||a.addEventListener("keydown",n.setKeyPressed,l)},this.cleanupWindowEvents=function(){var r,o,l=ui(),i=(r=n.wrapperComponent)===null||r===void 0?void 0:r.ownerDocument,a=i==null?void 0:i.defaultView;a==null||a.removeEventListener("mousedown",n.onPanningStart,l),a==null||a.removeEventListener("mousemove",n.onPanning,l),a==null||a.removeEventListener("mouseup",n.onPanningStop,l),i==null||i.removeEventListener("mouseleave",n.clearPanning,l),a==null||a.removeEventListener("keyup",n.setKeyUnPressed,l),a==null||a.removeEventListener("keydown",n.setKeyPressed,l),document.removeEventListener("mouseleave",n.clearPanning,l),tt(n),(o=n.observer)===null||o===void 0||o.disconnect()},this.handleInitializeWrapperEvents=function(r){var o=ui();r.addEventListener("wheel",n.onWheelZoom,o),r.addEventListener("dblclick",n.onDoubleClick,o),r.addEventListener("touchstart",n.onTouchPanningStart,o),r.addEventListener("touchmove",n.onTouchPanning,o),r.addEventListener("touchend",n.onTouchPanningStop,o)},this.handleInitialize=function(r,o){var l=!1,i=n.setup.centerOnInit,a=function(s,u){for(var c=0,f=s;c<f.length;c++){var p=f[c];if(p.target===u)return!0}return!1};n.applyTransformation(),n.onInitCallbacks.forEach(function(s){s(q(n))}),n.observer=new ResizeObserver(function(s){if(a(s,r)||a(s,o))if(i&&!l){var u=o.offsetWidth,c=o.offsetHeight;(u>0||c>0)&&(l=!0,n.setCenter())}else tt(n),sn(n,n.transformState.scale),ms(n,0)}),n.observer.observe(r),n.observer.observe(o)},this.onWheelZoom=function(r){var o=n.setup.disabled;if(!o){var l=Yy(n,r);if(l){var i=n.isPressingKeys(n.setup.wheel.activationKeys);i&&(t0(n,r),n0(n,r),r0(n,r))}}},this.onWheelPanning=function(r){var o=n.setup,l=o.disabled,i=o.wheel,a=o.panning;if(!(!n.wrapperComponent||!n.contentComponent||l||!i.wheelDisabled||a.disabled||!a.wheelPanning||r.ctrlKey)){r.preventDefault(),r.stopPropagation();var s=n.transformState,u=s.positionX,c=s.positionY,f=u-r.deltaX,p=c-r.deltaY,v=a.lockAxisX?u:f,g=a.lockAxisY?c:p,w=n.setup.alignmentAnimation,k=w.sizeX,h=w.sizeY,d=Ht(n,k),m=Ht(n,h);v===u&&g===c||Id(n,v,g,d,m)}},this.onPanningStart=function(r){var o=n.setup.disabled,l=n.props.onPanningStart;if(!o){var i=Bu(n,r);if(i){var a=n.isPressingKeys(n.setup.panning.activationKeys);a&&(r.button===0&&!n.setup.panning.allowLeftClickPan||r.button===1&&!n.setup.panning.allowMiddleClickPan||r.button===2&&!n.setup.panning.allowRightClickPan||(r.preventDefault(),r.stopPropagation(),tt(n),Hu(n,r),oe(q(n),r,l)))}}},this.onPanning=function(r){var o=n.setup.disabled,l=n.props.onPanning;if(!o){var i=bu(n);if(i){var a=n.isPressingKeys(n.setup.panning.activationKeys);a&&(r.preventDefault(),r.stopPropagation(),Xu(n,r.clientX,r.clientY),oe(q(n),r,l))}}},this.onPanningStop=function(r){var o=n.props.onPanningStop;n.isPanning&&(Ly(n),oe(q(n),r,o))},this.onPinchStart=function(r){var o=n.setup.disabled,l=n.props,i=l.onPinchingStart,a=l.onZoomStart;if(!o){var s=Ky(n,r);s&&(o0(n,r),tt(n),oe(q(n),r,i),oe(q(n),r,a))}},this.onPinch=function(r){var o=n.setup.disabled,l=n.props,i=l.onPinching,a=l.onZoom;if(!o){var s=Gy(n);s&&(r.preventDefault(),r.stopPropagation(),l0(n,r),oe(q(n),r,i),oe(q(n),r,a))}},this.onPinchStop=function(r){var o=n.props,l=o.onPinchingStop,i=o.onZoomStop;n.pinchStartScale&&(i0(n),oe(q(n),r,l),oe(q(n),r,i))},this.onTouchPanningStart=function(r){var o=n.setup.disabled,l=n.props.onPanningStart;if(!o){var i=Bu(n,r);if(i){var a=n.lastTouch&&+new Date-n.lastTouch<200&&r.touches.length===1;if(!a){n.lastTouch=+new Date,tt(n);var s=r.touches,u=s.length===1,c=s.length===2;u&&(tt(n),Hu(n,r),oe(q(n),r,l)),c&&n.onPinchStart(r)}}}},this.onTouchPanning=function(r){var o=n.setup.disabled,l=n.props.onPanning;if(n.isPanning&&r.touches.length===1){if(o)return;var i=bu(n);if(!i)return;r.preventDefault(),r.stopPropagation();var a=r.touches[0];Xu(n,a.clientX,a.clientY),oe(q(n),r,l)}else r.touches.length>1&&n.onPinch(r)},this.onTouchPanningStop=function(r){n.onPanningStop(r),n.onPinchStop(r)},this.onDoubleClick=function(r){var o=n.setup.disabled;if(!o){var l=c0(n,r);l&&u0(n,r)}},this.clearPanning=function(r){n.isPanning&&n.onPanningStop(r)},this.setKeyPressed=function(r){n.pressedKeys[r.key]=!0},this.setKeyUnPressed=function(r){n.pressedKeys[r.key]=!1},this.isPressingKeys=function(r){return r.length?!!r.find(function(o){return n.pressedKeys[o]}):!0},this.setTransformState=function(r,o,l){var i=n.props.onTransformed;if(!Number.isNaN(r)&&!Number.isNaN(o)&&!Number.isNaN(l)){r!==n.transformState.scale&&(n.transformState.previousScale=n.transformState.scale,n.transformState.scale=r),n.transformState.positionX=o,n.transformState.positionY=l,n.applyTransformation();var a=q(n);n.onChangeCallbacks.forEach(function(s){return s(a)}),oe(a,{scale:r,positionX:o,positionY:l},i)}else console.error("Detected NaN set state values")},this.setCenter=function(){if(n.wrapperComponent&&n.contentComponent){var r=Vd(n.transformState.scale,n.wrapperComponent,n.contentComponent);n.setTransformState(r.scale,r.positionX,r.positionY)}},this.handleTransformStyles=function(r,o,l){return n.props.customTransform?n.props.customTransform(r,o,l):By(r,o,l)},this.applyTransformation=function(){if(!(!n.mounted||!n.contentComponent)){var r=n.transformState,o=r.scale,l=r.positionX,i=r.positionY,a=n.handleTransformStyles(l,i,o);n.contentComponent.style.transform=a}},this.getContext=function(){return q(n)},this.onChange=function(r){return n.onChangeCallbacks.has(r)||n.onChangeCallbacks.add(r),function(){n.onChangeCallbacks.delete(r)}},this.onInit=function(r){return n.onInitCallbacks.has(r)||n.onInitCallbacks.add(r),function(){n.onInitCallbacks.delete(r)}},this.init=function(r,o){n.cleanupWindowEvents(),n.wrapperComponent=r,n.contentComponent=o,sn(n,n.transformState.scale),n.handleInitializeWrapperEvents(r),n.handleInitialize(r,o),n.initializeWindowEvents(),n.isInitialized=!0;var l=q(n);oe(l,void 0,n.props.onInit)},this.props=t,this.setup=Qu(this.props),this.transformState=bd(this.props)}return e}(),vs=pt.createContext(null),d0=function(e,t){return typeof e=="function"?e(t):e},qd=pt.forwardRef(function(e,t){var n=E.useRef(new f0(e)).current,r=d0(e.children,ma(n));return E.useImperativeHandle(t,function(){return ma(n)},[n]),E.useEffect(function(){n.update(e)},[n,e]),pt.createElement(vs.Provider,{value:n},r)});pt.forwardRef(function(e,t){var n=E.useRef(null),r=E.useContext(vs);return E.useEffect(function(){return r.onChange(function(o){if(n.current){var l=0,i=0;n.current.style.transform=r.handleTransformStyles(l,i,1/o.instance.transformState.scale)}})},[r]),pt.createElement("div",Bt({},e,{ref:by([n,t])}))});function p0(e,t){t===void 0&&(t={});var n=t.insertAt;if(!(typeof document>"u")){var r=document.head||document.getElementsByTagName("head")[0],o=document.createElement("style");o.type="text/css",n==="top"&&r.firstChild?r.insertBefore(o,r.firstChild):r.appendChild(o),o.styleSheet?o.styleSheet.cssText=e:o.appendChild(document.createTextNode(e))}}var m0=`.transform-component-module_wrapper__SPB86 {
-  position: relative;
-  width: -moz-fit-content;
-  width: fit-content;
-  height: -moz-fit-content;
-  height: fit-content;
-  overflow: hidden;
-  -webkit-touch-callout: none; /* iOS Safari */
-  -webkit-user-select: none; /* Safari */
-  -khtml-user-select: none; /* Konqueror HTML */
-  -moz-user-select: none; /* Firefox */
-  -ms-user-select: none; /* Internet Explorer/Edge */
-  user-select: none;
-  margin: 0;
-  padding: 0;
-  transform: translate3d(0, 0, 0);
-}
-.transform-component-module_content__FBWxo {
-  display: flex;
-  flex-wrap: wrap;
-  width: -moz-fit-content;
-  width: fit-content;
-  height: -moz-fit-content;
-  height: fit-content;
-  margin: 0;
-  padding: 0;
-  transform-origin: 0% 0%;
-}
-.transform-component-module_content__FBWxo img {
-  pointer-events: none;
-}
-`,Ku={wrapper:"transform-component-module_wrapper__SPB86",content:"transform-component-module_content__FBWxo"};p0(m0);var Jd=function(e){var t=e.children,n=e.wrapperClass,r=n===void 0?"":n,o=e.contentClass,l=o===void 0?"":o,i=e.wrapperStyle,a=e.contentStyle,s=e.wrapperProps,u=s===void 0?{}:s,c=e.contentProps,f=c===void 0?{}:c,p=E.useContext(vs),v=p.init,g=p.cleanupWindowEvents,w=E.useRef(null),k=E.useRef(null);return E.useEffect(function(){var h=w.current,d=k.current;return h!==null&&d!==null&&v&&(v==null||v(h,d)),function(){g==null||g()}},[]),pt.createElement("div",Bt({},u,{ref:w,className:"".concat(pa.wrapperClass," ").concat(Ku.wrapper," ").concat(r),style:i}),pt.createElement("div",Bt({},f,{ref:k,className:"".concat(pa.contentClass," ").concat(Ku.content," ").concat(l),style:a}),t))};const h0={content:{position:"relative",top:"auto",left:"auto",right:"auto",bottom:"auto",transform:"none",marginRight:"0",backgroundColor:"#2D3748",border:"none",borderRadius:"8px",padding:"0rem",maxHeight:"90vh",width:"90vw",maxWidth:"864px",overflow:"auto",flexShrink:0},overlay:{backgroundColor:"rgba(0, 0, 0, 0.75)",display:"flex",alignItems:"center",justifyContent:"center",zIndex:1e3}};zl.setAppElement("#root");const Gu=(e,t)=>e?Object.entries(e).map(([r,o])=>({...o,id:r})).filter(r=>r.class_type===t):[],v0={clip_name1:"clip",clip_name2:"clip",unet_name:"unet",vae_name:"vae",sampler_name:"sampler",scheduler:"scheduler"};function g0(){const[e,t]=E.useState([]),[n,r]=E.useState(localStorage.getItem("selectedWorkflow")||null),[o,l]=E.useState(null),[i,a]=E.useState([]),[s,u]=E.useState({}),[c,f]=E.useState({}),[p,v]=E.useState({}),[g,w]=E.useState(localStorage.getItem("lastPreviewImage")||null),[k,h]=E.useState(null),[d,m]=E.useState(!1),C=E.useRef(null),[_,R]=E.useState(0),[N,P]=E.useState(0),[M,j]=E.useState(!1),Q=y=>{h(y),j(!0)};E.useEffect(()=>{const y=()=>{const T=window.location.protocol==="https:"?"wss":"ws",z=window.location.host,F=`${T}://${z}/ws`;C.current=new WebSocket(F),C.current.onmessage=D=>{const U=JSON.parse(D.data);U.type==="cozygen_image_ready"?(U.data.status==="image_generated"?(w(U.data.image_url),localStorage.setItem("lastPreviewImage",U.data.image_url)):U.data.status,m(!1),R(0),P(0)):U.type==="progress"?(R(U.data.value),P(U.data.max)):U.type==="cozygen_prompt_completed"&&(m(!1),R(0),P(0))},C.current.onclose=()=>{setTimeout(y,1e3)},C.current.onerror=D=>{console.error("CozyGen: WebSocket error: ",D),C.current.close()}};return y(),()=>{C.current&&C.current.close()}},[]),E.useEffect(()=>{(async()=>{try{const T=await bv();t(T.workflows||[])}catch(T){console.error(T)}})()},[]),E.useEffect(()=>{if(!n)return;(async()=>{try{const T=await Yv(n);l(T);for(const Y in T){const B=T[Y];B.class_type==="CozyGenImageInput"&&(B.inputs.param_name||(B.inputs.param_name="Image Input"))}const z=Gu(T,"CozyGenDynamicInput"),F=Gu(T,"CozyGenImageInput"),D=[...z,...F];D.sort((Y,B)=>(Y.inputs.priority||0)-(B.inputs.priority||0));const U=await Promise.all(D.map(async Y=>{if(Y.class_type==="CozyGenDynamicInput"&&Y.inputs.param_type==="DROPDOWN"){const B=Y.inputs.param_name;let H=Y.inputs.choice_type||Y.properties&&Y.properties.choice_type;if(H||(H=v0[B]),H)try{const ae=await Xv(H);Y.inputs.choices=ae.choices||[]}catch(ae){console.error(`Error fetching choices for ${B} (choiceType: ${H}):`,ae),Y.inputs.choices=[]}}return Y}));a(U);const $=JSON.parse(localStorage.getItem(`${n}_formData`))||{},ee={};U.forEach(Y=>{const B=Y.inputs.param_name;if($[B]===void 0){let H;Y.class_type==="CozyGenDynamicInput"?(H=Y.inputs.default_value,Y.inputs.param_type==="INT"?H=parseInt(H):Y.inputs.param_type==="FLOAT"?H=parseFloat(H):Y.inputs.param_type==="BOOLEAN"&&(H=String(H).toLowerCase()==="true")):Y.class_type==="CozyGenImageInput"&&(H=""),ee[B]=H}else ee[B]=$[B]}),u(ee);const K=JSON.parse(localStorage.getItem(`${n}_randomizeState`))||{};f(K);const te=JSON.parse(localStorage.getItem(`${n}_bypassedState`))||{};v(te)}catch(T){console.error(T)}})()},[n]);const Z=y=>{r(y),localStorage.setItem("selectedWorkflow",y),l(null),a([]),u({}),f({}),w(null)},ie=(y,T)=>{const z={...s,[y]:T};u(z),localStorage.setItem(`${n}_formData`,JSON.stringify(z))},W=(y,T)=>{const z={...c,[y]:T};f(z),localStorage.setItem(`${n}_randomizeState`,JSON.stringify(z))},A=(y,T)=>{const z={...p,[y]:T};v(z),localStorage.setItem(`${n}_bypassedState`,JSON.stringify(z))},V=async()=>{if(!o)return;m(!0),w(null);let y=JSON.parse(JSON.stringify(o));for(const D in y){const U=y[D];if(U.class_type==="CozyGenImageInput"){const $=i.find(ee=>ee.id===D);$&&(U.inputs.param_name=$.inputs.param_name)}}for(const D of i){const U=D.inputs.param_name;if(p[U]&&D.class_type==="CozyGenDynamicInput"){let ee=null;for(const K in y){const te=y[K];for(const Y in te.inputs){const B=te.inputs[Y];if(Array.isArray(B)&&B[0]==D.id){ee=K;break}}if(ee)break}if(ee){const K=y[ee];console.log(`CozyGen: Bypassing node ${ee} (type: ${K.class_type}) connected to dynamic input ${U}`);const te=[];for(const B in K.inputs){const H=K.inputs[B];Array.isArray(H)&&H.length===2&&te.push({sourceNodeId:H[0],sourceOutputIndex:H[1],targetInputKey:B})}const Y=[];for(const B in y){if(B===ee)continue;const H=y[B];for(const ae in H.inputs){const yn=H.inputs[ae];Array.isArray(yn)&&yn.length===2&&yn[0]==ee&&Y.push({targetNodeId:B,targetInputKey:ae,sourceOutputIndex:yn[1]})}}if(K.class_type==="LoraLoader"){let B=null,H=null;for(const ae of te)ae.targetInputKey==="model"?B=ae:ae.targetInputKey==="clip"&&(H=ae);for(const ae of Y)ae.sourceOutputIndex===0&&B?(y[ae.targetNodeId].inputs[ae.targetInputKey]=[B.sourceNodeId,B.sourceOutputIndex],console.log(`CozyGen: Rewired model from ${B.sourceNodeId} to ${ae.targetNodeId}`)):ae.sourceOutputIndex===1&&H&&(y[ae.targetNodeId].inputs[ae.targetInputKey]=[H.sourceNodeId,H.sourceOutputIndex],console.log(`CozyGen: Rewired clip from ${H.sourceNodeId} to ${ae.targetNodeId}`))}else if(te.length===1&&Y.length===1){const B=te[0],H=Y[0];y[H.targetNodeId].inputs[H.targetInputKey]=[B.sourceNodeId,B.sourceOutputIndex],console.log(`CozyGen: Generic rewiring from ${B.sourceNodeId} to ${H.targetNodeId}`)}else console.warn(`CozyGen: Skipping generic rewiring for node ${ee} due to complex connections.`);delete y[ee],console.log(`CozyGen: Removed bypassed node ${ee}`)}}}const T=Date.now();for(const D in y){const U=y[D];if(U.class_type==="CozyGenOutput"){U.inputs.extra_pnginfo||(U.inputs.extra_pnginfo={}),U.inputs.extra_pnginfo.cozygen_unique_id=T;break}}const z=Object.values(y).filter(D=>D.class_type==="CozyGenImageInput");if(z.length>0)for(const D of z){const U=D.inputs.param_name,$=s[U];if(!$){alert(`Please upload an image for "${U}" before generating.`),m(!1);return}D.inputs.image_filename=$}let F={...s};i.forEach(D=>{console.log("Processing dynamicNode:",D);const U=D.inputs.param_name;let $;if(D.class_type==="CozyGenImageInput")return;if(c[U]){const K=D.inputs.min_value||0,te=D.inputs.max_value||1e6;D.inputs.param_type==="FLOAT"?$=Math.random()*(te-K)+K:$=Math.floor(Math.random()*(te-K+1))+K,F[U]=$}else $=s[U];switch(D.inputs.param_type){case"INT":$=parseInt(String($||"0"),10),isNaN($)&&($=0);break;case"FLOAT":$=parseFloat(String($||"0")),isNaN($)&&($=0);break;case"BOOLEAN":$=String($).toLowerCase()==="true"||$===!0;break;case"STRING":default:$=String($||"");break}for(const K in y){const te=y[K];for(const Y in te.inputs){const B=te.inputs[Y];Array.isArray(B)&&String(B[0])===String(D.id)&&(console.log(`Replacing link in node ${K}, input ${Y} with value:`,$),te.inputs[Y]=$)}}}),u(F),localStorage.setItem(`${n}_formData`,JSON.stringify(F)),console.log(JSON.stringify(y,null,2));try{await Hv({prompt:y})}catch(D){console.error(D),m(!1)}},x=()=>{w(null),localStorage.removeItem("lastPreviewImage")};return i.some(y=>y.class_type==="CozyGenImageInput"),S.jsxs("div",{className:"max-w-7xl mx-auto",children:[S.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-2 gap-4",children:[S.jsxs("div",{className:"flex flex-col space-y-4",children:[S.jsxs("div",{className:"bg-base-200 shadow-lg rounded-lg p-4 min-h-[400px] lg:min-h-[500px] flex flex-col",children:[S.jsxs("div",{className:"flex justify-between items-center mb-4",children:[S.jsx("h2",{className:"text-xl font-semibold text-white",children:"Preview"}),S.jsx("button",{onClick:x,className:"px-3 py-1 bg-base-300 text-gray-300 rounded-md text-sm hover:bg-base-300/70 transition-colors",children:"Clear"})]}),S.jsxs("div",{className:"flex-grow flex items-center justify-center border-2 border-dashed border-base-300 rounded-lg p-4 overflow-y-auto",children:[d&&S.jsx("div",{className:"text-center w-full",children:S.jsx("p",{className:"text-lg",children:"Generating..."})}),!d&&!g&&S.jsx("p",{className:"text-gray-400",children:"Your generated image will appear here."}),!d&&g&&S.jsx("img",{src:g,alt:"Generated preview",className:"max-w-full max-h-full object-contain rounded-lg cursor-pointer",onClick:()=>Q(g)})]})]}),S.jsx("button",{onClick:V,disabled:d||!o,className:"w-full bg-accent text-white font-bold text-lg py-4 px-4 rounded-lg hover:bg-accent-focus transition duration-300 disabled:bg-base-300 disabled:cursor-not-allowed shadow-lg",children:d?"Generating...":"Generate"}),d&&N>0&&S.jsx("div",{className:"w-full bg-base-300 rounded-full h-2.5 mt-2",children:S.jsx("div",{className:"bg-accent h-2.5 rounded-full transition-all duration-1000 ease-out",style:{width:`${_/N*100}%`}})})]}),S.jsxs("div",{className:"flex flex-col space-y-4",children:[S.jsx(Av,{workflows:e,selectedWorkflow:n,onSelect:Z}),S.jsx(Bv,{inputs:i.filter(y=>y.class_type==="CozyGenDynamicInput"),formData:s,onFormChange:ie,randomizeState:c,onRandomizeToggle:W,bypassedState:p,onBypassToggle:A}),i.filter(y=>y.class_type==="CozyGenImageInput").map(y=>S.jsx(Vv,{input:y,value:s[y.inputs.param_name],onFormChange:ie},y.id))]})]}),k&&S.jsx(zl,{isOpen:M,onRequestClose:()=>j(!1),style:h0,contentLabel:"Image Preview",children:S.jsxs("div",{className:"flex flex-col h-full w-full",children:[S.jsx("div",{className:"flex-grow flex items-center justify-center min-h-0",children:S.jsx(qd,{initialScale:1,minScale:.5,maxScale:5,limitToBounds:!1,doubleClick:{disabled:!0},wheel:!0,children:S.jsx(Jd,{children:S.jsx("img",{src:k,alt:"Generated preview",className:"max-w-full max-h-full object-contain rounded-lg"})})})}),S.jsx("div",{className:"flex-shrink-0 p-2 flex justify-center",children:S.jsx("button",{onClick:()=>j(!1),className:"px-4 py-2 bg-accent text-white rounded-md hover:bg-accent-focus transition-colors",children:"Close"})})]})})]})}const y0=({item:e,onSelect:t})=>{const n=e.type==="directory",r=n?"":`/view?filename=${e.filename}&subfolder=${e.subfolder}&type=output`;return S.jsxs("div",{className:"bg-base-200 rounded-lg shadow-lg overflow-hidden cursor-pointer group transform hover:-translate-y-1 transition-all duration-300",onClick:()=>t(e),children:[S.jsxs("div",{className:"relative w-full h-48",children:[n?S.jsx("div",{className:"flex flex-col items-center justify-center h-full bg-base-300/50",children:S.jsx("svg",{className:"w-16 h-16 text-gray-500 group-hover:text-accent transition-colors",fill:"currentColor",viewBox:"0 0 20 20",xmlns:"http://www.w3.org/2000/svg",children:S.jsx("path",{d:"M2 6a2 2 0 012-2h5l2 2h5a2 2 0 012 2v6a2 2 0 01-2 2H4a2 2 0 01-2-2V6z"})})}):S.jsx("img",{src:r,alt:e.filename,className:"w-full h-full object-cover"}),S.jsx("div",{className:"absolute inset-0 bg-black/40 opacity-0 group-hover:opacity-100 transition-opacity"})]}),S.jsx("p",{className:"p-2 text-sm text-white truncate",children:e.filename})]})},w0={content:{position:"relative",top:"auto",left:"auto",right:"auto",bottom:"auto",transform:"none",marginRight:"0",backgroundColor:"#2D3748",border:"none",borderRadius:"8px",padding:"0rem",maxHeight:"90vh",width:"90vw",maxWidth:"864px",overflow:"auto",flexShrink:0},overlay:{backgroundColor:"rgba(0, 0, 0, 0.75)",display:"flex",alignItems:"center",justifyContent:"center",zIndex:1e3}};zl.setAppElement("#root");const S0=()=>{const[e,t]=E.useState([]),[n,r]=E.useState(localStorage.getItem("galleryPath")||""),[o,l]=E.useState(!1),[i,a]=E.useState(null),[s,u]=E.useState(1),[c,f]=E.useState(1);E.useEffect(()=>{(async()=>{try{const m=await _d(n,s);m&&m.items?(t(m.items),f(m.total_pages)):(t([]),f(1))}catch(m){console.error(m),t([]),f(1)}})(),localStorage.setItem("galleryPath",n)},[n,s]);const p=d=>{d.type==="directory"?(r(d.subfolder),u(1)):(a(d),l(!0))},v=d=>{const _=n.replace(/\\/g,"/").split("/").filter(Boolean).slice(0,d).join("/");r(_),u(1)},g=()=>{const m=n.replace(/\\/g,"/").split("/").filter(Boolean);if(m.length>0){const C=m.slice(0,-1).join("/");r(C)}else r("");u(1)},w=()=>{const d=e.filter(_=>_.type!=="directory");if(d.length<=1)return;const C=(d.findIndex(_=>_.filename===i.filename&&_.subfolder===i.subfolder)+1)%d.length;a(d[C])},k=()=>{const d=e.filter(_=>_.type!=="directory");if(d.length<=1)return;const C=(d.findIndex(_=>_.filename===i.filename&&_.subfolder===i.subfolder)-1+d.length)%d.length;a(d[C])},h=n.split(/[\/]/).filter(Boolean);return S.jsxs("div",{className:"p-4",children:[S.jsxs("div",{className:"mb-4 bg-base-200 rounded-lg p-2 flex items-center text-lg",children:[S.jsx("span",{onClick:()=>{r(""),u(1)},className:"cursor-pointer hover:text-accent transition-colors",children:"Gallery"}),h.map((d,m)=>S.jsxs(pt.Fragment,{children:[S.jsx("span",{className:"mx-2 text-gray-500",children:"/"}),S.jsx("span",{onClick:()=>v(m+1),className:"cursor-pointer hover:text-accent transition-colors",children:d})]},m)),S.jsxs("button",{onClick:g,disabled:n==="",className:"ml-auto px-3 py-1 bg-base-300 text-gray-300 rounded-md text-sm hover:bg-base-300/70 transition-colors flex items-center",children:[S.jsx("svg",{xmlns:"http://www.w3.org/2000/svg",fill:"none",viewBox:"0 0 24 24",strokeWidth:1.5,stroke:"currentColor",className:"w-4 h-4 mr-1",children:S.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",d:"M4.5 10.5 12 3m0 0 7.5 7.5M12 3v18"})}),"Up"]})]}),S.jsx("div",{className:"grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-5 xl:grid-cols-6 gap-4",children:e.map(d=>S.jsx(y0,{item:d,onSelect:p},d.filename))}),S.jsxs("div",{className:"flex justify-center items-center space-x-4 mt-4",children:[S.jsx("button",{onClick:()=>u(s>1?s-1:1),disabled:s<=1,className:"px-4 py-2 bg-base-300 text-white rounded-md disabled:opacity-50",children:"Previous"}),S.jsxs("span",{children:["Page ",s," of ",c]}),S.jsx("button",{onClick:()=>u(s<c?s+1:c),disabled:s>=c,className:"px-4 py-2 bg-base-300 text-white rounded-md disabled:opacity-50",children:"Next"})]}),i&&S.jsx(zl,{isOpen:o,onRequestClose:()=>l(!1),style:w0,contentLabel:"Image Preview",children:S.jsxs("div",{className:"flex flex-col h-full w-full",children:[S.jsx("div",{className:"flex-grow flex items-center justify-center min-h-0",children:S.jsx(qd,{initialScale:1,minScale:.5,maxScale:5,limitToBounds:!1,doubleClick:{disabled:!0},wheel:!0,children:S.jsx(Jd,{children:S.jsx("img",{src:`/view?filename=${i.filename}&subfolder=${i.subfolder}&type=output`,alt:i.filename,className:"max-w-full max-h-full object-contain rounded-lg"})})})}),S.jsxs("div",{className:"flex-shrink-0 p-2 flex justify-center items-center space-x-4",children:[S.jsx("button",{onClick:k,className:"p-2 bg-base-300 text-gray-300 rounded-full hover:bg-base-300/70 transition-colors",children:S.jsx("svg",{xmlns:"http://www.w3.org/2000/svg",fill:"none",viewBox:"0 0 24 24",strokeWidth:1.5,stroke:"currentColor",className:"w-6 h-6",children:S.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",d:"M15.75 19.5L8.25 12l7.5-7.5"})})}),S.jsx("button",{onClick:()=>l(!1),className:"px-4 py-2 bg-accent text-white rounded-md hover:bg-accent-focus transition-colors",children:"Close"}),S.jsx("button",{onClick:w,className:"p-2 bg-base-300 text-gray-300 rounded-full hover:bg-base-300/70 transition-colors",children:S.jsx("svg",{xmlns:"http://www.w3.org/2000/svg",fill:"none",viewBox:"0 0 24 24",strokeWidth:1.5,stroke:"currentColor",className:"w-6 h-6",children:S.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",d:"M8.25 4.5l7.5 7.5-7.5 7.5"})})})]})]})})]})};function C0(){return S.jsx(Tv,{children:S.jsx(Cv,{children:S.jsxs(Mo,{path:"/",element:S.jsx(Mv,{}),children:[S.jsx(Mo,{index:!0,element:S.jsx(g0,{})}),S.jsx(Mo,{path:"gallery",element:S.jsx(S0,{})})]})})})}ci.createRoot(document.getElementById("root")).render(S.jsx(pt.StrictMode,{children:S.jsx(C0,{})}));
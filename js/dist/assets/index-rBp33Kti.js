@@ -64,7 +64,7 @@ Error generating stack: `+o.message+`
  * LICENSE.md file in the root directory of this source tree.
  *
  * @license MIT
- */function ao(){return ao=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},ao.apply(this,arguments)}function Pd(e,t){if(e==null)return{};var n={},r=Object.keys(e),l,o;for(o=0;o<r.length;o++)l=r[o],!(t.indexOf(l)>=0)&&(n[l]=e[l]);return n}function _v(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}function Pv(e,t){return e.button===0&&(!t||t==="_self")&&!_v(e)}const Nv=["onClick","relative","reloadDocument","replace","state","target","to","preventScrollReset","viewTransition"],Ov=["aria-current","caseSensitive","className","end","style","to","viewTransition","children"],Tv="6";try{window.__reactRouterVersion=Tv}catch{}const zv=k.createContext({isTransitioning:!1}),jv="startTransition",Du=Cp[jv];function Rv(e){let{basename:t,children:n,future:r,window:l}=e,o=k.useRef();o.current==null&&(o.current=Rh({window:l,v5Compat:!0}));let i=o.current,[a,s]=k.useState({action:i.action,location:i.location}),{v7_startTransition:u}=r||{},c=k.useCallback(f=>{u&&Du?Du(()=>s(f)):s(f)},[s,u]);return k.useLayoutEffect(()=>i.listen(c),[i,c]),k.useEffect(()=>Cv(r),[r]),k.createElement(kv,{basename:t,children:n,location:a.location,navigationType:a.action,navigator:i,future:r})}const Lv=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u",Dv=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,Nd=k.forwardRef(function(t,n){let{onClick:r,relative:l,reloadDocument:o,replace:i,state:a,target:s,to:u,preventScrollReset:c,viewTransition:f}=t,d=Pd(t,Nv),{basename:v}=k.useContext(Kt),g,w=!1;if(typeof u=="string"&&Dv.test(u)&&(g=u,Lv))try{let h=new URL(window.location.href),S=u.startsWith("//")?new URL(h.protocol+u):new URL(u),T=Vn(S.pathname,v);S.origin===h.origin&&T!=null?u=T+S.search+S.hash:w=!0}catch{}let x=rv(u,{relative:l}),m=Av(u,{replace:i,state:a,target:s,preventScrollReset:c,relative:l,viewTransition:f});function p(h){r&&r(h),h.defaultPrevented||m(h)}return k.createElement("a",ao({},d,{href:g||x,onClick:w||o?r:p,ref:n,target:s}))}),Mu=k.forwardRef(function(t,n){let{"aria-current":r="page",caseSensitive:l=!1,className:o="",end:i=!1,style:a,to:s,viewTransition:u,children:c}=t,f=Pd(t,Ov),d=zo(s,{relative:f.relative}),v=qr(),g=k.useContext(Sd),{navigator:w,basename:x}=k.useContext(Kt),m=g!=null&&Fv(d)&&u===!0,p=w.encodeLocation?w.encodeLocation(d).pathname:d.pathname,h=v.pathname,S=g&&g.navigation&&g.navigation.location?g.navigation.location.pathname:null;l||(h=h.toLowerCase(),S=S?S.toLowerCase():null,p=p.toLowerCase()),S&&x&&(S=Vn(S,x)||S);const T=p!=="/"&&p.endsWith("/")?p.length-1:p.length;let P=h===p||!i&&h.startsWith(p)&&h.charAt(T)==="/",_=S!=null&&(S===p||!i&&S.startsWith(p)&&S.charAt(p.length)==="/"),N={isActive:P,isPending:_,isTransitioning:m},j=P?r:void 0,D;typeof o=="function"?D=o(N):D=[o,P?"active":null,_?"pending":null,m?"transitioning":null].filter(Boolean).join(" ");let V=typeof a=="function"?a(N):a;return k.createElement(Nd,ao({},f,{"aria-current":j,className:D,ref:n,style:V,to:s,viewTransition:u}),typeof c=="function"?c(N):c)});var ua;(function(e){e.UseScrollRestoration="useScrollRestoration",e.UseSubmit="useSubmit",e.UseSubmitFetcher="useSubmitFetcher",e.UseFetcher="useFetcher",e.useViewTransitionState="useViewTransitionState"})(ua||(ua={}));var Au;(function(e){e.UseFetcher="useFetcher",e.UseFetchers="useFetchers",e.UseScrollRestoration="useScrollRestoration"})(Au||(Au={}));function Mv(e){let t=k.useContext(Oo);return t||ce(!1),t}function Av(e,t){let{target:n,replace:r,state:l,preventScrollReset:o,relative:i,viewTransition:a}=t===void 0?{}:t,s=lv(),u=qr(),c=zo(e,{relative:i});return k.useCallback(f=>{if(Pv(f,n)){f.preventDefault();let d=r!==void 0?r:io(u)===io(c);s(e,{replace:d,state:l,preventScrollReset:o,relative:i,viewTransition:a})}},[u,s,c,r,l,n,e,o,i,a])}function Fv(e,t){t===void 0&&(t={});let n=k.useContext(zv);n==null&&ce(!1);let{basename:r}=Mv(ua.useViewTransitionState),l=zo(e,{relative:t.relative});if(!n.isTransitioning)return!1;let o=Vn(n.currentLocation.pathname,r)||n.currentLocation.pathname,i=Vn(n.nextLocation.pathname,r)||n.nextLocation.pathname;return aa(l.pathname,i)!=null||aa(l.pathname,o)!=null}const Uv=()=>y.jsxs("div",{className:"bg-base-100 text-gray-300 min-h-screen font-sans",children:[y.jsx("header",{className:"bg-base-200/80 backdrop-blur-sm shadow-lg sticky top-0 z-50",children:y.jsxs("nav",{className:"container mx-auto px-4 py-3 flex justify-between items-center",children:[y.jsx(Nd,{to:"/",children:y.jsx("h1",{className:"text-2xl font-bold text-white tracking-wider",children:"CozyGen"})}),y.jsxs("div",{className:"flex items-center space-x-4",children:[y.jsx(Mu,{to:"/",className:({isActive:e})=>`px-3 py-2 rounded-md text-sm font-medium transition-colors ${e?"bg-accent text-white":"text-gray-300 hover:bg-base-300"}`,children:"Generate"}),y.jsx(Mu,{to:"/gallery",className:({isActive:e})=>`px-3 py-2 rounded-md text-sm font-medium transition-colors ${e?"bg-accent text-white":"text-gray-300 hover:bg-base-300"}`,children:"Gallery"})]})]})}),y.jsx("main",{className:"container mx-auto p-4",children:y.jsx(xv,{})})]}),Wv=({workflows:e,selectedWorkflow:t,onSelect:n})=>y.jsxs("div",{className:"bg-base-200 shadow-lg rounded-lg p-3",children:[y.jsx("label",{htmlFor:"workflow-selector",className:"block text-lg font-semibold text-white mb-2",children:"Workflow"}),y.jsxs("select",{id:"workflow-selector",className:"block w-full p-3 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all",value:t||"",onChange:r=>n(r.target.value),children:[y.jsx("option",{value:"",disabled:!0,children:"-- Select a workflow --"}),e.map(r=>y.jsx("option",{value:r,children:r},r))]})]}),bv=({value:e,onChange:t,multiline:n,disabled:r})=>{const l="disabled:bg-base-300/50 disabled:cursor-not-allowed disabled:text-gray-400";return n?y.jsx("textarea",{rows:6,className:`block w-full p-2.5 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all h-40 min-h-24 resize-y ${l}`,value:e||"",onChange:o=>t(o.target.value),disabled:r}):y.jsx("input",{type:"text",className:`block w-full p-2.5 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all ${l}`,value:e||"",onChange:o=>t(o.target.value),disabled:r})},$v=({inputName:e,value:t,onChange:n,min:r,max:l,step:o,paramType:i,disabled:a})=>{const s=c=>{const f=c.target.value;n(f)};let u=o;return(u===0||u===void 0||u===null)&&(i==="INT"?u=1:i==="FLOAT"&&(u=.1)),y.jsx("div",{className:"w-full",children:y.jsx("div",{className:"flex items-center space-x-2",children:y.jsx("input",{type:"number",className:"block w-full p-2.5 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all disabled:bg-base-300/50 disabled:cursor-not-allowed disabled:text-gray-400",value:t||"",onChange:s,min:r,max:l,step:u,disabled:a})})})},Iv=({value:e,onChange:t,disabled:n})=>y.jsx("div",{className:"w-full",children:y.jsx("div",{onClick:()=>!n&&t(!e),className:`w-14 h-8 flex items-center rounded-full p-1 cursor-pointer transition-colors ${e?"bg-accent":"bg-base-100"} ${n?"opacity-50 cursor-not-allowed":""}`,children:y.jsx("div",{className:`bg-white w-6 h-6 rounded-full shadow-md transform transition-transform ${e?"translate-x-6":""}`})})}),Bv=({value:e,onChange:t,choices:n,disabled:r})=>y.jsx("div",{className:"w-full",children:y.jsx("select",{className:"block w-full p-2.5 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all disabled:bg-base-300/50 disabled:cursor-not-allowed disabled:text-gray-400",value:e||"",onChange:l=>t(l.target.value),disabled:r,children:Array.isArray(n)&&n.map(l=>y.jsx("option",{value:l,children:l},l))})}),Yv=(e,t,n,r,l,o,i)=>{const{id:a,inputs:s}=e,u=s.param_name,c=s.param_type,f=s.default_value,d=t[u]!==void 0?t[u]:f,v=s.display_bypass,g=o[u]||!1;let w;switch(c){case"STRING":w=y.jsx(bv,{value:d,onChange:x=>n(u,x),multiline:s.Multiline,disabled:g});break;case"INT":case"FLOAT":w=y.jsx($v,{inputName:u,value:d,onChange:x=>n(u,x),onRandomizeToggle:s.add_randomize_toggle?x=>l(u,x):null,isRandomized:r[u]||!1,min:s.min_value,max:s.max_value,step:s.step,paramType:c,disabled:g});break;case"BOOLEAN":w=y.jsx(Iv,{value:d,onChange:x=>n(u,x),disabled:g});break;case"DROPDOWN":w=y.jsx(Bv,{value:d,onChange:x=>n(u,x),choices:s.choices,disabled:g});break;default:w=y.jsxs("p",{children:["Unsupported input type: ",c]})}return y.jsxs("div",{className:"flex flex-col",children:[" ",y.jsxs("div",{className:"flex justify-between items-center mb-1",children:[" ",y.jsxs("label",{className:"block text-sm font-medium text-gray-300",children:[u,s.add_randomize_toggle&&y.jsxs("span",{className:"ml-2 text-xs text-gray-400",children:["(Randomize",y.jsx("input",{type:"checkbox",className:"toggle toggle-sm toggle-accent ml-1",checked:r[u]||!1,onChange:x=>l(u,x.target.checked)}),")"]}),v&&y.jsxs("span",{className:"ml-2 text-xs text-gray-400",children:["(Bypass",y.jsx("input",{type:"checkbox",className:"toggle toggle-sm toggle-accent ml-1",checked:g,onChange:x=>i(u,x.target.checked)}),")"]})]})]}),w]})},Hv=({inputs:e,formData:t,onFormChange:n,randomizeState:r,onRandomizeToggle:l,bypassedState:o,onBypassToggle:i})=>!e||e.length===0?y.jsx("div",{className:"bg-base-200 shadow-lg rounded-lg p-3 text-center",children:y.jsx("p",{className:"text-gray-400",children:"Select a workflow to see its controls."})}):y.jsxs("div",{className:"bg-base-200 shadow-lg rounded-lg p-3",children:[y.jsx("h2",{className:"text-lg font-semibold text-white mb-2",children:"Controls"}),y.jsx("div",{className:"grid grid-cols-1 xs:grid-cols-2 gap-x-4 gap-y-4",children:e.map(a=>y.jsx("div",{className:a.inputs.Multiline?"xs:col-span-2":"",children:Yv(a,t,n,r,l,o,i)},a.id))})]}),jo="/cozygen",Xv=async()=>{const e=await fetch(`${jo}/workflows`);if(!e.ok)throw new Error("Failed to fetch workflows");return e.json()},Vv=async e=>{const t=await fetch(`${jo}/workflows/${e}`);if(!t.ok)throw new Error(`Failed to fetch workflow: ${e}`);return t.json()},Gv=async e=>{const t=await fetch(window.location.protocol+"//"+window.location.host+"/prompt",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e)});if(!t.ok)throw new Error("Failed to queue prompt");return t.json()},Od=async(e="",t=1,n=20)=>{const r=await fetch(`/cozygen/gallery?subfolder=${encodeURIComponent(e)}&page=${t}&per_page=${n}`);if(!r.ok)throw new Error("Failed to fetch gallery items");return r.json()},Qv=async e=>{const t=await fetch(`${jo}/get_choices?type=${encodeURIComponent(e)}`);if(!t.ok)throw new Error(`Failed to fetch choices for type: ${e}`);return t.json()},ci=async e=>{const t=new FormData;t.append("image",e);const n=await fetch(`${jo}/upload_image`,{method:"POST",body:t});if(!n.ok)throw new Error("Failed to upload image");return n.json()},Kv=({input:e,value:t,onFormChange:n})=>{const[r,l]=k.useState((t==null?void 0:t.source)||"Upload"),[o,i]=k.useState((t==null?void 0:t.path)||""),[a,s]=k.useState(null),[u,c]=k.useState((t==null?void 0:t.url)||""),[f,d]=k.useState([]),[v,g]=k.useState(""),[w,x]=k.useState(!0);k.useEffect(()=>{const _=async()=>{try{const N=await Od(v);d(N)}catch(N){console.error("Error fetching gallery items:",N)}};e.class_type!=="CozyGenImageInput"&&_()},[v,e.class_type]),k.useEffect(()=>{e.class_type==="CozyGenImageInput"?c(t?`/view?filename=${t}&type=input`:""):t!=null&&t.url?c(t.url):t!=null&&t.path&&r==="Gallery"&&c(`/view?filename=${t.path}&subfolder=&type=output`)},[t,r,e.class_type]);const m=_=>{const N=_.target.value;l(N),i(""),s(null),c(""),n(e.inputs.param_name,{source:N,path:"",url:""})},p=async _=>{const N=_.target.files[0];if(N){s(N),c(URL.createObjectURL(N));try{const j=await ci(N);n(e.inputs.param_name,{source:"Upload",path:j.filename,url:`/view?filename=${j.filename}&type=input`})}catch(j){console.error("Error uploading image:",j),c("")}}},h=_=>{const N=_.target.value;i(N);const j=f.find(D=>D.filename===N);if(j){const D=`/view?filename=${j.filename}&subfolder=${j.subfolder}&type=${j.type}`;c(D),n(e.inputs.param_name,{source:"Gallery",path:j.filename,subfolder:j.subfolder,url:D})}},S=()=>{l("Upload"),i(""),s(null),c(""),n(e.inputs.param_name,{source:"Upload",path:"",url:""})},T=async _=>{const N=_.target.files[0];if(N)if(w){const j=new FileReader;j.onload=D=>{const V=new Image;V.onload=async()=>{let{width:G,height:ee}=V;if(G+ee>2048){const C=G/ee;G=Math.floor(2048*C/(C+1)),ee=2048-G}const F=document.createElement("canvas");F.width=G,F.height=ee,F.getContext("2d").drawImage(V,0,0,G,ee),F.toBlob(async C=>{const E=new File([C],N.name,{type:N.type});c(URL.createObjectURL(E));try{const R=await ci(E),M=`/view?filename=${R.filename}&type=input`;c(M),n(e.inputs.param_name,R.filename)}catch(R){console.error("Error uploading image:",R),c("")}},N.type)},V.src=D.target.result},j.readAsDataURL(N)}else{c(URL.createObjectURL(N));try{const j=await ci(N),D=`/view?filename=${j.filename}&subfolder=input&type=input`;c(D),n(e.inputs.param_name,j.filename)}catch(j){console.error("Error uploading image:",j),c("")}}},P=_=>{g(_),i("")};return y.jsxs("div",{className:"form-control mb-4 p-3 bg-base-200 rounded-box shadow-lg",children:[y.jsx("label",{className:"label",children:y.jsx("span",{className:"label-text text-lg font-semibold",children:e.inputs.param_name})}),e.class_type==="CozyGenImageInput"?y.jsxs("div",{className:"flex flex-col sm:flex-row items-center gap-4 mb-4",children:[y.jsxs("div",{className:"flex-grow w-full sm:w-auto",children:[y.jsx("input",{type:"file",id:`cozyGenImageUploader-${e.id}`,accept:"image/png, image/jpeg, image/webp",onChange:T,className:"file-input file-input-bordered w-full mb-2"}),y.jsx("div",{class:"form-control",children:y.jsxs("label",{class:"label cursor-pointer",children:[y.jsx("span",{class:"label-text",children:"Smart Resize"}),y.jsx("input",{type:"checkbox",class:"toggle",checked:w,onChange:()=>x(!w)})]})})]}),u&&y.jsx("div",{className:"flex-shrink-0 w-24 h-24 rounded-lg overflow-hidden shadow-md border border-base-300 flex items-center justify-center bg-base-300",children:y.jsx("img",{src:u,alt:"Image Preview",className:"w-full h-full object-cover"})})]}):y.jsxs(y.Fragment,{children:[y.jsxs("div",{className:"flex items-center space-x-2 mb-4",children:[y.jsxs("select",{className:"select select-bordered w-full max-w-xs",value:r,onChange:m,children:[y.jsx("option",{value:"Upload",children:"Upload Image"}),y.jsx("option",{value:"Gallery",children:"Select from Gallery"})]}),y.jsx("button",{onClick:S,className:"btn btn-sm btn-outline",children:"Clear"})]}),r==="Upload"&&y.jsx("div",{className:"mb-4",children:y.jsx("input",{type:"file",className:"file-input file-input-bordered w-full",onChange:p,accept:"image/*"})}),r==="Gallery"&&y.jsxs("div",{className:"mb-4",children:[y.jsxs("div",{className:"flex items-center space-x-2 mb-2",children:[y.jsxs("span",{className:"text-sm text-gray-400",children:["Current Path: ",v||"/"]}),v&&y.jsx("button",{onClick:()=>P(""),className:"btn btn-xs btn-ghost",children:"Back to Root"})]}),y.jsxs("select",{className:"select select-bordered w-full",value:o,onChange:h,children:[y.jsx("option",{value:"",children:"-- Select an image or directory --"}),f.map((_,N)=>y.jsx("option",{value:_.filename,children:_.type==="directory"?`[DIR] ${_.filename}`:_.filename},N))]}),o&&f.find(_=>_.filename===o&&_.type==="directory")&&y.jsx("button",{onClick:()=>P(o),className:"btn btn-sm btn-primary mt-2",children:"Open Directory"})]}),u&&y.jsx("div",{className:"mt-4 flex justify-center",children:y.jsx("img",{src:u,alt:"Image Preview",className:"max-w-full h-auto rounded-lg shadow-md",style:{maxHeight:"300px"}})})]})]})};var ca={exports:{}},vn={},Td={exports:{}},Zv="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED",qv=Zv,Jv=qv;function zd(){}function jd(){}jd.resetWarningCache=zd;var eg=function(){function e(r,l,o,i,a,s){if(s!==Jv){var u=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw u.name="Invariant Violation",u}}e.isRequired=e;function t(){return e}var n={array:e,bigint:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:t,element:e,elementType:e,instanceOf:t,node:e,objectOf:t,oneOf:t,oneOfType:t,shape:t,exact:t,checkPropTypes:jd,resetWarningCache:zd};return n.PropTypes=n,n};Td.exports=eg();var Rd=Td.exports,fa={exports:{}},at={},da={exports:{}};(function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.default=c;/*!
+ */function ao(){return ao=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},ao.apply(this,arguments)}function Pd(e,t){if(e==null)return{};var n={},r=Object.keys(e),l,o;for(o=0;o<r.length;o++)l=r[o],!(t.indexOf(l)>=0)&&(n[l]=e[l]);return n}function _v(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}function Pv(e,t){return e.button===0&&(!t||t==="_self")&&!_v(e)}const Nv=["onClick","relative","reloadDocument","replace","state","target","to","preventScrollReset","viewTransition"],Ov=["aria-current","caseSensitive","className","end","style","to","viewTransition","children"],Tv="6";try{window.__reactRouterVersion=Tv}catch{}const zv=k.createContext({isTransitioning:!1}),jv="startTransition",Du=Cp[jv];function Rv(e){let{basename:t,children:n,future:r,window:l}=e,o=k.useRef();o.current==null&&(o.current=Rh({window:l,v5Compat:!0}));let i=o.current,[a,s]=k.useState({action:i.action,location:i.location}),{v7_startTransition:u}=r||{},c=k.useCallback(f=>{u&&Du?Du(()=>s(f)):s(f)},[s,u]);return k.useLayoutEffect(()=>i.listen(c),[i,c]),k.useEffect(()=>Cv(r),[r]),k.createElement(kv,{basename:t,children:n,location:a.location,navigationType:a.action,navigator:i,future:r})}const Lv=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u",Dv=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,Nd=k.forwardRef(function(t,n){let{onClick:r,relative:l,reloadDocument:o,replace:i,state:a,target:s,to:u,preventScrollReset:c,viewTransition:f}=t,d=Pd(t,Nv),{basename:v}=k.useContext(Kt),g,w=!1;if(typeof u=="string"&&Dv.test(u)&&(g=u,Lv))try{let h=new URL(window.location.href),S=u.startsWith("//")?new URL(h.protocol+u):new URL(u),T=Vn(S.pathname,v);S.origin===h.origin&&T!=null?u=T+S.search+S.hash:w=!0}catch{}let x=rv(u,{relative:l}),m=Av(u,{replace:i,state:a,target:s,preventScrollReset:c,relative:l,viewTransition:f});function p(h){r&&r(h),h.defaultPrevented||m(h)}return k.createElement("a",ao({},d,{href:g||x,onClick:w||o?r:p,ref:n,target:s}))}),Mu=k.forwardRef(function(t,n){let{"aria-current":r="page",caseSensitive:l=!1,className:o="",end:i=!1,style:a,to:s,viewTransition:u,children:c}=t,f=Pd(t,Ov),d=zo(s,{relative:f.relative}),v=qr(),g=k.useContext(Sd),{navigator:w,basename:x}=k.useContext(Kt),m=g!=null&&Fv(d)&&u===!0,p=w.encodeLocation?w.encodeLocation(d).pathname:d.pathname,h=v.pathname,S=g&&g.navigation&&g.navigation.location?g.navigation.location.pathname:null;l||(h=h.toLowerCase(),S=S?S.toLowerCase():null,p=p.toLowerCase()),S&&x&&(S=Vn(S,x)||S);const T=p!=="/"&&p.endsWith("/")?p.length-1:p.length;let P=h===p||!i&&h.startsWith(p)&&h.charAt(T)==="/",_=S!=null&&(S===p||!i&&S.startsWith(p)&&S.charAt(p.length)==="/"),N={isActive:P,isPending:_,isTransitioning:m},j=P?r:void 0,D;typeof o=="function"?D=o(N):D=[o,P?"active":null,_?"pending":null,m?"transitioning":null].filter(Boolean).join(" ");let V=typeof a=="function"?a(N):a;return k.createElement(Nd,ao({},f,{"aria-current":j,className:D,ref:n,style:V,to:s,viewTransition:u}),typeof c=="function"?c(N):c)});var ua;(function(e){e.UseScrollRestoration="useScrollRestoration",e.UseSubmit="useSubmit",e.UseSubmitFetcher="useSubmitFetcher",e.UseFetcher="useFetcher",e.useViewTransitionState="useViewTransitionState"})(ua||(ua={}));var Au;(function(e){e.UseFetcher="useFetcher",e.UseFetchers="useFetchers",e.UseScrollRestoration="useScrollRestoration"})(Au||(Au={}));function Mv(e){let t=k.useContext(Oo);return t||ce(!1),t}function Av(e,t){let{target:n,replace:r,state:l,preventScrollReset:o,relative:i,viewTransition:a}=t===void 0?{}:t,s=lv(),u=qr(),c=zo(e,{relative:i});return k.useCallback(f=>{if(Pv(f,n)){f.preventDefault();let d=r!==void 0?r:io(u)===io(c);s(e,{replace:d,state:l,preventScrollReset:o,relative:i,viewTransition:a})}},[u,s,c,r,l,n,e,o,i,a])}function Fv(e,t){t===void 0&&(t={});let n=k.useContext(zv);n==null&&ce(!1);let{basename:r}=Mv(ua.useViewTransitionState),l=zo(e,{relative:t.relative});if(!n.isTransitioning)return!1;let o=Vn(n.currentLocation.pathname,r)||n.currentLocation.pathname,i=Vn(n.nextLocation.pathname,r)||n.nextLocation.pathname;return aa(l.pathname,i)!=null||aa(l.pathname,o)!=null}var ca={exports:{}},vn={},Td={exports:{}},Zv="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED",qv=Zv,Jv=qv;function zd(){}function jd(){}jd.resetWarningCache=zd;var eg=function(){function e(r,l,o,i,a,s){if(s!==Jv){var u=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw u.name="Invariant Violation",u}}e.isRequired=e;function t(){return e}var n={array:e,bigint:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:t,element:e,elementType:e,instanceOf:t,node:e,objectOf:t,oneOf:t,oneOfType:t,shape:t,exact:t,checkPropTypes:jd,resetWarningCache:zd};return n.PropTypes=n,n};Td.exports=eg();var Rd=Td.exports,fa={exports:{}},at={},da={exports:{}};(function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.default=c;/*!
  * Adapted from jQuery UI core
  *
  * http://jqueryui.com
@@ -117,4 +117,1468 @@ https://fb.me/react-async-component-lifecycle-hooks`)}if(typeof e.getDerivedStat
 .transform-component-module_content__FBWxo img {
   pointer-events: none;
 }
-`,qu={wrapper:"transform-component-module_wrapper__SPB86",content:"transform-component-module_content__FBWxo"};v0(g0);var np=function(e){var t=e.children,n=e.wrapperClass,r=n===void 0?"":n,l=e.contentClass,o=l===void 0?"":l,i=e.wrapperStyle,a=e.contentStyle,s=e.wrapperProps,u=s===void 0?{}:s,c=e.contentProps,f=c===void 0?{}:c,d=k.useContext(ws),v=d.init,g=d.cleanupWindowEvents,w=k.useRef(null),x=k.useRef(null);return k.useEffect(function(){var m=w.current,p=x.current;return m!==null&&p!==null&&v&&(v==null||v(m,p)),function(){g==null||g()}},[]),mt.createElement("div",Bt({},u,{ref:w,className:"".concat(va.wrapperClass," ").concat(qu.wrapper," ").concat(r),style:i}),mt.createElement("div",Bt({},f,{ref:x,className:"".concat(va.contentClass," ").concat(qu.content," ").concat(o),style:a}),t))};const rp=e=>/\.(mp4|webm)/i.test(e),y0={content:{position:"relative",top:"auto",left:"auto",right:"auto",bottom:"auto",transform:"none",marginRight:"0",backgroundColor:"#2D3748",border:"none",borderRadius:"8px",padding:"0rem",maxHeight:"90vh",width:"90vw",maxWidth:"864px",overflow:"auto",flexShrink:0},overlay:{backgroundColor:"rgba(0, 0, 0, 0.75)",display:"flex",alignItems:"center",justifyContent:"center",zIndex:1e3}};Lo.setAppElement("#root");const Ju=e=>e?rp(e)?y.jsx("video",{src:e,controls:!0,autoPlay:!0,loop:!0,muted:!0,className:"max-w-full max-h-full object-contain rounded-lg"}):y.jsx("img",{src:e,alt:"Generated preview",className:"max-w-full max-h-full object-contain rounded-lg cursor-pointer"}):null,w0=e=>e?rp(e)?y.jsx("video",{src:e,controls:!0,autoPlay:!0,loop:!0,className:"max-w-full max-h-full object-contain rounded-lg"}):y.jsx(tp,{initialScale:1,minScale:.5,maxScale:5,limitToBounds:!1,doubleClick:{disabled:!0},wheel:!0,children:y.jsx(np,{children:y.jsx("img",{src:e,alt:"Generated preview",className:"max-w-full max-h-full object-contain rounded-lg"})})}):null,S0={clip_name1:"clip",clip_name2:"clip",unet_name:"unet",vae_name:"vae",sampler_name:"sampler",scheduler:"scheduler"};function C0(){const[e,t]=k.useState([]),[n,r]=k.useState(localStorage.getItem("selectedWorkflow")||null),[l,o]=k.useState(null),[i,a]=k.useState([]),[s,u]=k.useState({}),[c,f]=k.useState({}),[d,v]=k.useState({}),[g,w]=k.useState(JSON.parse(localStorage.getItem("lastPreviewImages"))||[]),[x,m]=k.useState(null),[p,h]=k.useState(!1),S=k.useRef(null),[T,P]=k.useState(0),[_,N]=k.useState(0),[j,D]=k.useState(!1),[V,G]=k.useState("Generating..."),ee=k.useRef(null);k.useEffect(()=>{ee.current=l},[l]);const U=O=>{m(O),D(!0)};k.useEffect(()=>{const O=()=>{const A=window.location.protocol==="https"?"wss":"ws",H=window.location.host,te=`${A}://${H}/ws`;S.current=new WebSocket(te),S.current.onmessage=ge=>{if(typeof ge.data!="string"){console.log("CozyGen: Received binary WebSocket message, ignoring.");return}const W=JSON.parse(ge.data);if(W.type==="cozygen_batch_ready"){const X=W.data.images.map(Ce=>Ce.url);X.length>0&&(w(X),localStorage.setItem("lastPreviewImages",JSON.stringify(X))),h(!1),P(0),N(0),G("Finished")}else if(W.type==="executing"){const X=W.data.node;if(X&&ee.current&&ee.current[X]){const Ce=ee.current[X],je=Ce.title||Ce.class_type;G(`Executing: ${je}`)}}else W.type==="progress"&&(P(W.data.value),N(W.data.max))},S.current.onclose=()=>{setTimeout(O,1e3)},S.current.onerror=ge=>{console.error("CozyGen: WebSocket error: ",ge),S.current.close()}};return O(),()=>{S.current&&S.current.close()}},[]),k.useEffect(()=>{(async()=>{try{const A=await Xv();t(A.workflows||[])}catch(A){console.error(A)}})()},[]),k.useEffect(()=>{if(!n)return;(async()=>{try{const A=await Vv(n);o(A);for(const $ in A){const Q=A[$];Q.class_type==="CozyGenImageInput"&&(Q.inputs.param_name||(Q.inputs.param_name="Image Input"))}const H=["CozyGenDynamicInput","CozyGenImageInput","CozyGenFloatInput","CozyGenIntInput","CozyGenStringInput","CozyGenChoiceInput"],te=Object.values(A).filter($=>H.includes($.class_type));for(const $ in A)H.includes(A[$].class_type)&&(A[$].id=$);te.sort(($,Q)=>($.inputs.priority||0)-(Q.inputs.priority||0));const ge=await Promise.all(te.map(async $=>{const Q=$.class_type==="CozyGenDynamicInput"&&$.inputs.param_type==="DROPDOWN",Z=$.class_type==="CozyGenChoiceInput";if(Q||Z){const Jt=$.inputs.param_name;let er=$.inputs.choice_type||$.properties&&$.properties.choice_type;if(!er&&Q&&(er=S0[Jt]),er)try{const Ao=await Qv(er);$.inputs.choices=Ao.choices||[]}catch(Ao){console.error(`Error fetching choices for ${Jt} (choiceType: ${er}):`,Ao),$.inputs.choices=[]}}return $}));a(ge);const W=JSON.parse(localStorage.getItem(`${n}_formData`))||{},X={};ge.forEach($=>{const Q=$.inputs.param_name;if(W[Q]===void 0){let Z;["CozyGenDynamicInput","CozyGenFloatInput","CozyGenIntInput","CozyGenStringInput"].includes($.class_type)?(Z=$.inputs.default_value,$.class_type==="CozyGenIntInput"?Z=parseInt(Z,10):$.class_type==="CozyGenFloatInput"&&(Z=parseFloat(Z))):$.class_type==="CozyGenChoiceInput"?Z=$.inputs.choices&&$.inputs.choices.length>0?$.inputs.choices[0]:"":$.class_type==="CozyGenImageInput"&&(Z=""),X[Q]=Z}else X[Q]=W[Q]}),u(X);const Ce=JSON.parse(localStorage.getItem(`${n}_randomizeState`))||{};f(Ce);const je=JSON.parse(localStorage.getItem(`${n}_bypassedState`))||{};v(je)}catch(A){console.error(A)}})()},[n]);const F=O=>{r(O),localStorage.setItem("selectedWorkflow",O),o(null),a([]),u({}),f({}),setPreviewImage(null)},Y=(O,A)=>{const H={...s,[O]:A};u(H),localStorage.setItem(`${n}_formData`,JSON.stringify(H))},C=(O,A)=>{const H={...c,[O]:A};f(H),localStorage.setItem(`${n}_randomizeState`,JSON.stringify(H))},E=(O,A)=>{const H={...d,[O]:A};v(H),localStorage.setItem(`${n}_bypassedState`,JSON.stringify(H))},R=async()=>{if(l){h(!0),w([]),G("Queuing prompt...");try{let O=JSON.parse(JSON.stringify(l));const A=["CozyGenDynamicInput","CozyGenChoiceInput"],H=i.filter(W=>d[W.inputs.param_name]&&A.includes(W.class_type));for(const W of H){let X=Object.keys(O).find(Q=>Object.values(O[Q].inputs).some(Z=>Array.isArray(Z)&&Z[0]===W.id));if(!X)continue;const Ce=O[X],je={};for(const Q in Ce.inputs){const Z=Ce.inputs[Q];Array.isArray(Z)&&O[Z[0]]&&!A.includes(O[Z[0]].class_type)&&(je[Q]=Z)}if(Object.keys(je).length===0)continue;const $=[];for(const Q in O)for(const Z in O[Q].inputs){const Jt=O[Q].inputs[Z];Array.isArray(Jt)&&Jt[0]===X&&$.push({nodeId:Q,inputName:Z})}for(const Q of $){const Z=je[Q.inputName];Z&&(O[Q.nodeId].inputs[Q.inputName]=Z)}delete O[X],delete O[W.id]}let te={...s};i.forEach(W=>{if(!O[W.id])return;const X=W.inputs.param_name;if(W.class_type==="CozyGenImageInput")return;let Ce=c[X]?W.inputs.param_type==="FLOAT"?Math.random()*((W.inputs.max_value||1e6)-(W.inputs.min_value||0))+(W.inputs.min_value||0):Math.floor(Math.random()*((W.inputs.max_value||1e6)-(W.inputs.min_value||0)+1))+(W.inputs.min_value||0):s[X];te[X]=Ce;const je=O[W.id];je&&(["CozyGenFloatInput","CozyGenIntInput","CozyGenStringInput","CozyGenDynamicInput"].includes(W.class_type)?je.inputs.default_value=Ce:W.class_type==="CozyGenChoiceInput"&&(je.inputs.value=Ce))}),u(te),localStorage.setItem(`${n}_formData`,JSON.stringify(te));const ge=i.filter(W=>W.class_type==="CozyGenImageInput");for(const W of ge){const X=s[W.inputs.param_name];if(!X){alert(`Please upload an image for "${W.inputs.param_name}" before generating.`),h(!1);return}O[W.id]&&(O[W.id].inputs.image_filename=X)}await Gv({prompt:O})}catch(O){console.error("Failed to queue prompt:",O),h(!1),G("Error queuing prompt")}}},M=()=>{w([]),localStorage.removeItem("lastPreviewImages")};return i.some(O=>O.class_type==="CozyGenImageInput"),y.jsxs("div",{className:"max-w-7xl mx-auto",children:[y.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-2 gap-4 pb-28",children:[y.jsx("div",{className:"flex flex-col space-y-2",children:y.jsxs("div",{className:"bg-base-200 shadow-lg rounded-lg p-3 min-h-[400px] lg:min-h-[500px] flex flex-col",children:[y.jsxs("div",{className:"flex justify-between items-center mb-4",children:[y.jsx("h2",{className:"text-xl font-semibold text-white",children:"Preview"}),y.jsx("button",{onClick:M,className:"px-3 py-1 bg-base-300 text-gray-300 rounded-md text-sm hover:bg-base-300/70 transition-colors",children:"Clear"})]}),y.jsxs("div",{className:"flex-grow flex items-center justify-center border-2 border-dashed border-base-300 rounded-lg p-2 overflow-y-auto",children:[p&&y.jsx("div",{className:"text-center w-full",children:y.jsx("p",{className:"text-lg",children:V})}),!p&&g.length===0&&y.jsx("p",{className:"text-gray-400",children:"Your generated image or video will appear here."}),!p&&g.length===1&&y.jsx("div",{className:"w-full h-full flex items-center justify-center cursor-pointer",onClick:()=>U(g[0]),children:Ju(g[0])}),!p&&g.length>1&&y.jsx("div",{className:"grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 gap-2 w-full h-full",children:g.map((O,A)=>y.jsx("div",{className:"aspect-square bg-base-300 rounded-lg overflow-hidden cursor-pointer",onClick:()=>U(O),children:Ju(O)},A))})]})]})}),y.jsxs("div",{className:"flex flex-col space-y-2",children:[y.jsx(Wv,{workflows:e,selectedWorkflow:n,onSelect:F}),y.jsx(Hv,{inputs:i.filter(O=>O.class_type!=="CozyGenImageInput").map(O=>{if(["CozyGenFloatInput","CozyGenIntInput","CozyGenStringInput","CozyGenChoiceInput"].includes(O.class_type)){let A=O.class_type.replace("CozyGen","").replace("Input","").toUpperCase();return A==="CHOICE"&&(A="DROPDOWN"),{...O,inputs:{...O.inputs,param_type:A,Multiline:O.inputs.display_multiline||!1}}}return O}),formData:s,onFormChange:Y,randomizeState:c,onRandomizeToggle:C,bypassedState:d,onBypassToggle:E}),i.filter(O=>O.class_type==="CozyGenImageInput").map(O=>y.jsx(Kv,{input:O,value:s[O.inputs.param_name],onFormChange:Y},O.id))]})]}),y.jsx("div",{className:"fixed bottom-0 left-0 right-0 bg-base-100/80 backdrop-blur-sm p-4 border-t border-base-300 z-10 shadow-lg",children:y.jsxs("div",{className:"max-w-2xl mx-auto",children:[" ",y.jsx("button",{onClick:R,disabled:p||!l,className:"w-full bg-accent text-white font-bold text-lg py-4 px-4 rounded-lg hover:bg-accent-focus transition duration-300 disabled:bg-base-300 disabled:cursor-not-allowed shadow-lg",children:p?"Generating...":"Generate"}),p&&_>0&&y.jsx("div",{className:"w-full bg-base-300 rounded-full h-2.5 mt-2",children:y.jsx("div",{className:"bg-accent h-2.5 rounded-full transition-all duration-1000 ease-out",style:{width:`${T/_*100}%`}})})]})}),x&&y.jsx(Lo,{isOpen:j,onRequestClose:()=>D(!1),style:y0,contentLabel:"Image Preview",children:y.jsxs("div",{className:"flex flex-col h-full w-full",children:[y.jsx("div",{className:"flex-grow flex items-center justify-center min-h-0",children:w0(x)}),y.jsx("div",{className:"flex-shrink-0 p-2 flex justify-center",children:y.jsx("button",{onClick:()=>D(!1),className:"px-4 py-2 bg-accent text-white rounded-md hover:bg-accent-focus transition-colors",children:"Close"})})]})})]})}const x0=e=>/\.(mp4|webm)$/i.test(e),k0=e=>/\.(mp3|wav|flac)$/i.test(e),E0=({item:e,onSelect:t})=>{const n=e.type==="directory",r=n?"":`/view?filename=${e.filename}&subfolder=${e.subfolder}&type=output`,l=()=>n?y.jsx("div",{className:"flex flex-col items-center justify-center h-full bg-base-300/50",children:y.jsx("svg",{className:"w-16 h-16 text-gray-500 group-hover:text-accent transition-colors",fill:"currentColor",viewBox:"0 0 20 20",xmlns:"http://www.w3.org/2000/svg",children:y.jsx("path",{d:"M2 6a2 2 0 012-2h5l2 2h5a2 2 0 012 2v6a2 2 0 01-2 2H4a2 2 0 01-2-2V6z"})})}):x0(e.filename)?y.jsx("video",{src:r,muted:!0,className:"w-full h-full object-cover"}):k0(e.filename)?y.jsx("div",{className:"flex flex-col items-center justify-center h-full bg-base-300/50",children:y.jsx("svg",{className:"w-16 h-16 text-gray-500 group-hover:text-accent transition-colors",xmlns:"http://www.w3.org/2000/svg",fill:"none",viewBox:"0 0 24 24",strokeWidth:1.5,stroke:"currentColor",children:y.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",d:"M9 9l10.5-3m0 6.553v3.75a2.25 2.25 0 01-1.632 2.163l-1.32.377a1.803 1.803 0 11-.99-3.467l2.31-.66a2.25 2.25 0 001.632-2.163zm0 0V2.25L9 5.25v10.303m0 0v3.75a2.25 2.25 0 01-1.632 2.163l-1.32.377a1.803 1.803 0 01-.99-3.467l2.31-.66A2.25 2.25 0 009 15.553z"})})}):y.jsx("img",{src:r,alt:e.filename,className:"w-full h-full object-cover"});return y.jsxs("div",{className:"bg-base-200 rounded-lg shadow-lg overflow-hidden cursor-pointer group transform hover:-translate-y-1 transition-all duration-300",onClick:()=>t(e),children:[y.jsxs("div",{className:"relative w-full h-48",children:[l(),y.jsx("div",{className:"absolute inset-0 bg-black/40 opacity-0 group-hover:opacity-100 transition-opacity"})]}),y.jsx("p",{className:"p-2 text-sm text-white truncate",children:e.filename})]})},_0={content:{position:"relative",top:"auto",left:"auto",right:"auto",bottom:"auto",transform:"none",marginRight:"0",backgroundColor:"#2D3748",border:"none",borderRadius:"8px",padding:"0rem",maxHeight:"90vh",width:"90vw",maxWidth:"864px",overflow:"auto",flexShrink:0},overlay:{backgroundColor:"rgba(0, 0, 0, 0.75)",display:"flex",alignItems:"center",justifyContent:"center",zIndex:1e3}};Lo.setAppElement("#root");const P0=e=>/\.(mp4|webm)$/i.test(e),N0=e=>/\.(mp3|wav|flac)$/i.test(e),O0=()=>{const[e,t]=k.useState([]),[n,r]=k.useState(localStorage.getItem("galleryPath")||""),[l,o]=k.useState(!1),[i,a]=k.useState(null),[s,u]=k.useState(1),[c,f]=k.useState(1),[d,v]=k.useState(parseInt(localStorage.getItem("galleryPageSize"),10)||20);k.useEffect(()=>{(async()=>{try{const _=await Od(n,s,d);_&&_.items?(t(_.items),f(_.total_pages)):(t([]),f(1))}catch(_){console.error(_),t([]),f(1)}})(),localStorage.setItem("galleryPath",n)},[n,s,d]);const g=P=>{P.type==="directory"?(r(P.subfolder),u(1)):(a(P),o(!0))},w=P=>{const _=parseInt(P.target.value,10);v(_),u(1),localStorage.setItem("galleryPageSize",_)},x=P=>{const j=n.replace(/\\/g,"/").split("/").filter(Boolean).slice(0,P).join("/");r(j),u(1)},m=()=>{const _=n.replace(/\\/g,"/").split("/").filter(Boolean);if(_.length>0){const N=_.slice(0,-1).join("/");r(N)}else r("");u(1)},p=()=>{const P=e.filter(j=>j.type!=="directory");if(P.length<=1)return;const N=(P.findIndex(j=>j.filename===i.filename&&j.subfolder===i.subfolder)+1)%P.length;a(P[N])},h=()=>{const P=e.filter(j=>j.type!=="directory");if(P.length<=1)return;const N=(P.findIndex(j=>j.filename===i.filename&&j.subfolder===i.subfolder)-1+P.length)%P.length;a(P[N])},S=()=>{if(!i)return null;const P=`/view?filename=${i.filename}&subfolder=${i.subfolder}&type=output`;return P0(i.filename)?y.jsx("video",{src:P,controls:!0,autoPlay:!0,loop:!0,className:"max-w-full max-h-full object-contain rounded-lg"}):N0(i.filename)?y.jsx("audio",{src:P,controls:!0,autoPlay:!0,loop:!0,className:"w-full"}):y.jsx(tp,{initialScale:1,minScale:.5,maxScale:5,limitToBounds:!1,doubleClick:{disabled:!0},wheel:!0,children:y.jsx(np,{children:y.jsx("img",{src:P,alt:i.filename,className:"max-w-full max-h-full object-contain rounded-lg"})})})},T=n.split(/[\/]/).filter(Boolean);return y.jsxs("div",{className:"p-4",children:[y.jsxs("div",{className:"mb-4 bg-base-200 rounded-lg p-2 flex items-center text-lg",children:[y.jsx("span",{onClick:()=>{r(""),u(1)},className:"cursor-pointer hover:text-accent transition-colors",children:"Gallery"}),T.map((P,_)=>y.jsxs(mt.Fragment,{children:[y.jsx("span",{className:"mx-2 text-gray-500",children:"/"}),y.jsx("span",{onClick:()=>x(_+1),className:"cursor-pointer hover:text-accent transition-colors",children:P})]},_)),y.jsxs("button",{onClick:m,disabled:n==="",className:"ml-auto px-3 py-1 bg-base-300 text-gray-300 rounded-md text-sm hover:bg-base-300/70 transition-colors flex items-center",children:[y.jsx("svg",{xmlns:"http://www.w3.org/2000/svg",fill:"none",viewBox:"0 0 24 24",strokeWidth:1.5,stroke:"currentColor",className:"w-4 h-4 mr-1",children:y.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",d:"M4.5 10.5 12 3m0 0 7.5 7.5M12 3v18"})}),"Up"]})]}),y.jsxs("div",{className:"flex justify-center items-center space-x-4 mb-4",children:[y.jsx("button",{onClick:()=>u(s>1?s-1:1),disabled:s<=1,className:"px-4 py-2 bg-base-300 text-white rounded-md disabled:opacity-50",children:"Previous"}),y.jsxs("span",{children:["Page ",s," of ",c]}),y.jsx("button",{onClick:()=>u(s<c?s+1:c),disabled:s>=c,className:"px-4 py-2 bg-base-300 text-white rounded-md disabled:opacity-50",children:"Next"}),y.jsxs("div",{className:"flex items-center space-x-2",children:[y.jsx("label",{htmlFor:"page-size-selector",className:"text-sm",children:"Per Page:"}),y.jsxs("select",{id:"page-size-selector",className:"select select-bordered select-sm bg-base-100",value:d,onChange:w,children:[y.jsx("option",{value:10,children:"10"}),y.jsx("option",{value:20,children:"20"}),y.jsx("option",{value:50,children:"50"}),y.jsx("option",{value:100,children:"100"})]})]})]}),y.jsx("div",{className:"grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-5 xl:grid-cols-6 gap-4",children:e.map(P=>y.jsx(E0,{item:P,onSelect:g},P.filename))}),i&&y.jsx(Lo,{isOpen:l,onRequestClose:()=>o(!1),style:_0,contentLabel:"Image Preview",children:y.jsxs("div",{className:"flex flex-col h-full w-full",children:[y.jsx("div",{className:"flex-grow flex items-center justify-center min-h-0",children:S()}),y.jsxs("div",{className:"flex-shrink-0 p-2 flex justify-center items-center space-x-4",children:[y.jsx("button",{onClick:h,className:"p-2 bg-base-300 text-gray-300 rounded-full hover:bg-base-300/70 transition-colors",children:y.jsx("svg",{xmlns:"http://www.w3.org/2000/svg",fill:"none",viewBox:"0 0 24 24",strokeWidth:1.5,stroke:"currentColor",className:"w-6 h-6",children:y.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",d:"M15.75 19.5L8.25 12l7.5-7.5"})})}),y.jsx("button",{onClick:()=>o(!1),className:"px-4 py-2 bg-accent text-white rounded-md hover:bg-accent-focus transition-colors",children:"Close"}),y.jsx("button",{onClick:p,className:"p-2 bg-base-300 text-gray-300 rounded-full hover:bg-base-300/70 transition-colors",children:y.jsx("svg",{xmlns:"http://www.w3.org/2000/svg",fill:"none",viewBox:"0 0 24 24",strokeWidth:1.5,stroke:"currentColor",className:"w-6 h-6",children:y.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",d:"M8.25 4.5l7.5 7.5-7.5 7.5"})})})]})]})})]})};function T0(){return y.jsx(Rv,{children:y.jsx(Ev,{children:y.jsxs(Ml,{path:"/",element:y.jsx(Uv,{}),children:[y.jsx(Ml,{index:!0,element:y.jsx(C0,{})}),y.jsx(Ml,{path:"gallery",element:y.jsx(O0,{})})]})})})}pi.createRoot(document.getElementById("root")).render(y.jsx(mt.StrictMode,{children:y.jsx(T0,{})}));
+`,qu={wrapper:"transform-component-module_wrapper__SPB86",content:"transform-component-module_content__FBWxo"};v0(g0);var np=function(e){var t=e.children,n=e.wrapperClass,r=n===void 0?"":n,l=e.contentClass,o=l===void 0?"":l,i=e.wrapperStyle,a=e.contentStyle,s=e.wrapperProps,u=s===void 0?{}:s,c=e.contentProps,f=c===void 0?{}:c,d=k.useContext(ws),v=d.init,g=d.cleanupWindowEvents,w=k.useRef(null),x=k.useRef(null);return k.useEffect(function(){var m=w.current,p=x.current;return m!==null&&p!==null&&v&&(v==null||v(m,p)),function(){g==null||g()}},[]),mt.createElement("div",Bt({},u,{ref:w,className:"".concat(va.wrapperClass," ").concat(qu.wrapper," ").concat(r),style:i}),mt.createElement("div",Bt({},f,{ref:x,className:"".concat(va.contentClass," ").concat(qu.content," ").concat(o),style:a}),t))};
+(() => {
+const __modules = {};
+// components/Layout.jsx
+__modules["components/Layout.jsx"] = (() => {
+const React = k;
+const Link = Nd;
+const NavLink = Mu;
+const Outlet = xv;
+const Layout = () => {
+  return /* @__PURE__ */ React.createElement("div", { className: "bg-base-100 text-gray-300 min-h-screen font-sans" }, /* @__PURE__ */ React.createElement("header", { className: "bg-base-200/80 backdrop-blur-sm shadow-lg sticky top-0 z-50" }, /* @__PURE__ */ React.createElement("nav", { className: "container mx-auto px-4 py-3 flex justify-between items-center" }, /* @__PURE__ */ React.createElement(Link, { to: "/" }, /* @__PURE__ */ React.createElement("h1", { className: "text-2xl font-bold text-white tracking-wider" }, "CozyGen")), /* @__PURE__ */ React.createElement("div", { className: "flex items-center space-x-4" }, /* @__PURE__ */ React.createElement(
+    NavLink,
+    {
+      to: "/",
+      className: ({ isActive }) => `px-3 py-2 rounded-md text-sm font-medium transition-colors ${isActive ? "bg-accent text-white" : "text-gray-300 hover:bg-base-300"}`
+    },
+    "Generate"
+  ), /* @__PURE__ */ React.createElement(
+    NavLink,
+    {
+      to: "/gallery",
+      className: ({ isActive }) => `px-3 py-2 rounded-md text-sm font-medium transition-colors ${isActive ? "bg-accent text-white" : "text-gray-300 hover:bg-base-300"}`
+    },
+    "Gallery"
+  )))), /* @__PURE__ */ React.createElement("main", { className: "container mx-auto p-4" }, /* @__PURE__ */ React.createElement(Outlet, null)));
+};
+const __default = Layout;
+return { default: __default };
+})();
+// components/WorkflowSelector.jsx
+__modules["components/WorkflowSelector.jsx"] = (() => {
+const React = k;
+const WorkflowSelector = ({ workflows, selectedWorkflow, onSelect }) => {
+  return /* @__PURE__ */ React.createElement("div", { className: "bg-base-200 shadow-lg rounded-lg p-3" }, /* @__PURE__ */ React.createElement("label", { htmlFor: "workflow-selector", className: "block text-lg font-semibold text-white mb-2" }, "Workflow"), /* @__PURE__ */ React.createElement(
+    "select",
+    {
+      id: "workflow-selector",
+      className: "block w-full p-3 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all",
+      value: selectedWorkflow || "",
+      onChange: (e) => onSelect(e.target.value)
+    },
+    /* @__PURE__ */ React.createElement("option", { value: "", disabled: true }, "-- Select a workflow --"),
+    workflows.map((wf) => /* @__PURE__ */ React.createElement("option", { key: wf, value: wf }, wf))
+  ));
+};
+const __default = WorkflowSelector;
+return { default: __default };
+})();
+// components/inputs/StringInput.jsx
+__modules["components/inputs/StringInput.jsx"] = (() => {
+const React = k;
+const StringInput = ({ value, onChange, multiline, disabled }) => {
+  const disabledClasses = "disabled:bg-base-300/50 disabled:cursor-not-allowed disabled:text-gray-400";
+  if (multiline) {
+    return /* @__PURE__ */ React.createElement(
+      "textarea",
+      {
+        rows: 6,
+        className: `block w-full p-2.5 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all h-40 min-h-24 resize-y ${disabledClasses}`,
+        value: value || "",
+        onChange: (e) => onChange(e.target.value),
+        disabled
+      }
+    );
+  }
+  return /* @__PURE__ */ React.createElement(
+    "input",
+    {
+      type: "text",
+      className: `block w-full p-2.5 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all ${disabledClasses}`,
+      value: value || "",
+      onChange: (e) => onChange(e.target.value),
+      disabled
+    }
+  );
+};
+const __default = StringInput;
+return { default: __default };
+})();
+// components/inputs/NumberInput.jsx
+__modules["components/inputs/NumberInput.jsx"] = (() => {
+const React = k;
+const NumberInput = ({ inputName, value, onChange, min, max, step, paramType, disabled }) => {
+  const handleValueChange = (e) => {
+    const val = e.target.value;
+    onChange(val);
+  };
+  let effectiveStep = step;
+  if (effectiveStep === 0 || effectiveStep === void 0 || effectiveStep === null) {
+    if (paramType === "INT") {
+      effectiveStep = 1;
+    } else if (paramType === "FLOAT") {
+      effectiveStep = 0.1;
+    }
+  }
+  return /* @__PURE__ */ React.createElement("div", { className: "w-full" }, /* @__PURE__ */ React.createElement("div", { className: "flex items-center space-x-2" }, /* @__PURE__ */ React.createElement(
+    "input",
+    {
+      type: "number",
+      className: "block w-full p-2.5 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all disabled:bg-base-300/50 disabled:cursor-not-allowed disabled:text-gray-400",
+      value: value || "",
+      onChange: handleValueChange,
+      min,
+      max,
+      step: effectiveStep,
+      disabled
+    }
+  )));
+};
+const __default = NumberInput;
+return { default: __default };
+})();
+// components/inputs/BooleanInput.jsx
+__modules["components/inputs/BooleanInput.jsx"] = (() => {
+const React = k;
+const BooleanInput = ({ value, onChange, disabled }) => {
+  return /* @__PURE__ */ React.createElement("div", { className: "w-full" }, /* @__PURE__ */ React.createElement(
+    "div",
+    {
+      onClick: () => !disabled && onChange(!value),
+      className: `w-14 h-8 flex items-center rounded-full p-1 cursor-pointer transition-colors ${value ? "bg-accent" : "bg-base-100"} ${disabled ? "opacity-50 cursor-not-allowed" : ""}`
+    },
+    /* @__PURE__ */ React.createElement("div", { className: `bg-white w-6 h-6 rounded-full shadow-md transform transition-transform ${value ? "translate-x-6" : ""}` })
+  ));
+};
+const __default = BooleanInput;
+return { default: __default };
+})();
+// components/inputs/DropdownInput.jsx
+__modules["components/inputs/DropdownInput.jsx"] = (() => {
+const React = k;
+const DropdownInput = ({ value, onChange, choices, disabled }) => {
+  return /* @__PURE__ */ React.createElement("div", { className: "w-full" }, /* @__PURE__ */ React.createElement(
+    "select",
+    {
+      className: "block w-full p-2.5 border border-base-300 bg-base-100 text-white rounded-md shadow-sm focus:outline-none focus:ring-2 focus:ring-accent focus:border-accent transition-all disabled:bg-base-300/50 disabled:cursor-not-allowed disabled:text-gray-400",
+      value: value || "",
+      onChange: (e) => onChange(e.target.value),
+      disabled
+    },
+    Array.isArray(choices) && choices.map((choice) => /* @__PURE__ */ React.createElement("option", { key: choice, value: choice }, choice))
+  ));
+};
+const __default = DropdownInput;
+return { default: __default };
+})();
+// components/DynamicForm.jsx
+__modules["components/DynamicForm.jsx"] = (() => {
+const React = k;
+const StringInput = __modules["components/inputs/StringInput.jsx"].default;
+const NumberInput = __modules["components/inputs/NumberInput.jsx"].default;
+const BooleanInput = __modules["components/inputs/BooleanInput.jsx"].default;
+const DropdownInput = __modules["components/inputs/DropdownInput.jsx"].default;
+const renderInput = (input, formData, onFormChange, randomizeState, onRandomizeToggle, bypassedState, onBypassToggle) => {
+  const { id, inputs } = input;
+  const param_name = inputs["param_name"];
+  const param_type = inputs["param_type"];
+  const defaultValue = inputs["default_value"];
+  const value = formData[param_name] !== void 0 ? formData[param_name] : defaultValue;
+  const displayBypass = inputs["display_bypass"];
+  const isBypassed = bypassedState[param_name] || false;
+  let inputComponent;
+  switch (param_type) {
+    case "STRING":
+      inputComponent = /* @__PURE__ */ React.createElement(
+        StringInput,
+        {
+          value,
+          onChange: (val) => onFormChange(param_name, val),
+          multiline: inputs["Multiline"],
+          disabled: isBypassed
+        }
+      );
+      break;
+    case "INT":
+    case "FLOAT":
+      inputComponent = /* @__PURE__ */ React.createElement(
+        NumberInput,
+        {
+          inputName: param_name,
+          value,
+          onChange: (val) => onFormChange(param_name, val),
+          onRandomizeToggle: inputs["add_randomize_toggle"] ? (isRandom) => onRandomizeToggle(param_name, isRandom) : null,
+          isRandomized: randomizeState[param_name] || false,
+          min: inputs["min_value"],
+          max: inputs["max_value"],
+          step: inputs["step"],
+          paramType: param_type,
+          disabled: isBypassed
+        }
+      );
+      break;
+    case "BOOLEAN":
+      inputComponent = /* @__PURE__ */ React.createElement(
+        BooleanInput,
+        {
+          value,
+          onChange: (val) => onFormChange(param_name, val),
+          disabled: isBypassed
+        }
+      );
+      break;
+    case "DROPDOWN":
+      inputComponent = /* @__PURE__ */ React.createElement(
+        DropdownInput,
+        {
+          value,
+          onChange: (val) => onFormChange(param_name, val),
+          choices: inputs["choices"],
+          disabled: isBypassed
+        }
+      );
+      break;
+    default:
+      inputComponent = /* @__PURE__ */ React.createElement("p", null, "Unsupported input type: ", param_type);
+  }
+  return /* @__PURE__ */ React.createElement("div", { className: "flex flex-col" }, " ", /* @__PURE__ */ React.createElement("div", { className: "flex justify-between items-center mb-1" }, " ", /* @__PURE__ */ React.createElement("label", { className: "block text-sm font-medium text-gray-300" }, param_name, inputs["add_randomize_toggle"] && /* @__PURE__ */ React.createElement("span", { className: "ml-2 text-xs text-gray-400" }, "(Randomize", /* @__PURE__ */ React.createElement(
+    "input",
+    {
+      type: "checkbox",
+      className: "toggle toggle-sm toggle-accent ml-1",
+      checked: randomizeState[param_name] || false,
+      onChange: (e) => onRandomizeToggle(param_name, e.target.checked)
+    }
+  ), ")"), displayBypass && /* @__PURE__ */ React.createElement("span", { className: "ml-2 text-xs text-gray-400" }, "(Bypass", /* @__PURE__ */ React.createElement(
+    "input",
+    {
+      type: "checkbox",
+      className: "toggle toggle-sm toggle-accent ml-1",
+      checked: isBypassed,
+      onChange: (e) => onBypassToggle(param_name, e.target.checked)
+    }
+  ), ")"))), inputComponent);
+};
+const DynamicForm = ({ inputs, formData, onFormChange, randomizeState, onRandomizeToggle, bypassedState, onBypassToggle }) => {
+  if (!inputs || inputs.length === 0) {
+    return /* @__PURE__ */ React.createElement("div", { className: "bg-base-200 shadow-lg rounded-lg p-3 text-center" }, /* @__PURE__ */ React.createElement("p", { className: "text-gray-400" }, "Select a workflow to see its controls."));
+  }
+  return /* @__PURE__ */ React.createElement("div", { className: "bg-base-200 shadow-lg rounded-lg p-3" }, /* @__PURE__ */ React.createElement("h2", { className: "text-lg font-semibold text-white mb-2" }, "Controls"), /* @__PURE__ */ React.createElement("div", { className: "grid grid-cols-1 xs:grid-cols-2 gap-x-4 gap-y-4" }, inputs.map((input) => /* @__PURE__ */ React.createElement("div", { key: input.id, className: input.inputs["Multiline"] ? "xs:col-span-2" : "" }, renderInput(input, formData, onFormChange, randomizeState, onRandomizeToggle, bypassedState, onBypassToggle)))));
+};
+const __default = DynamicForm;
+return { default: __default };
+})();
+// api.js
+__modules["api.js"] = (() => {
+const BASE_URL = '/cozygen';
+
+const getWorkflows = async () => {
+  const response = await fetch(`${BASE_URL}/workflows`);
+  if (!response.ok) {
+    throw new Error('Failed to fetch workflows');
+  }
+  return response.json();
+};
+
+const getWorkflow = async (filename) => {
+  const response = await fetch(`${BASE_URL}/workflows/${filename}`);
+  if (!response.ok) {
+    throw new Error(`Failed to fetch workflow: ${filename}`);
+  }
+  return response.json();
+};
+
+const getWorkflowBundle = async (filename) => {
+  const response = await fetch(`${BASE_URL}/workflows/${encodeURIComponent(filename)}/bundle`);
+  if (!response.ok) {
+    throw new Error(`Failed to fetch workflow: ${filename}`);
+  }
+  return response.json();
+};
+
+const queuePrompt = async (prompt) => {
+    const response = await fetch(window.location.protocol + '//' + window.location.host + '/prompt', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify(prompt)
+    });
+    if (!response.ok) {
+        throw new Error('Failed to queue prompt');
+    }
+    return response.json();
+};
+
+// Turns a {"error", "node_errors"} body (ComfyUI's /prompt shape) into readable lines
+const describeQueueError = (body) => {
+    const error = body.error;
+    let message = typeof error === 'string' ? error : (error && error.message) || '';
+    if (error && error.details) {
+        message += `: ${error.details}`;
+    }
+    const nodeMessages = Object.values(body.node_errors || {}).flatMap(node =>
+        (node.errors || []).map(e => `${node.class_type}: ${e.message}${e.details ? ` (${e.details})` : ''}`)
+    );
+    return [message, ...nodeMessages].filter(Boolean).join('\n');
+};
+
+const generate = async (request) => {
+    const response = await fetch(`${BASE_URL}/generate`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify(request)
+    });
+    if (!response.ok) {
+        const body = await response.json().catch(() => ({}));
+        const error = new Error(describeQueueError(body) || 'Failed to queue prompt');
+        error.status = response.status;
+        error.nodeErrors = body.node_errors || {};
+        throw error;
+    }
+    return response.json();
+};
+
+const getEvents = async (since = 0, clientId = '', epoch = null, wait = 0) => {
+    const params = new URLSearchParams({ since, client_id: clientId, wait });
+    if (epoch) {
+        params.set('epoch', epoch);
+    }
+    const response = await fetch(`${BASE_URL}/events?${params}`);
+    if (!response.ok) {
+        throw new Error('Failed to fetch events');
+    }
+    return response.json();
+};
+
+const getGallery = async (subfolder = '', page = 1, pageSize = 20) => {
+    const response = await fetch(`/cozygen/gallery?subfolder=${encodeURIComponent(subfolder)}&page=${page}&per_page=${pageSize}`);
+    if (!response.ok) {
+        throw new Error('Failed to fetch gallery items');
+    }
+    return response.json();
+};
+
+// Newest files anywhere under `subfolder`; pass the previous page's next_cursor to continue
+const getGalleryTimeline = async (subfolder = '', cursor = null, pageSize = 20) => {
+    const query = new URLSearchParams({ subfolder, per_page: pageSize });
+    if (cursor) {
+        query.set('cursor', cursor);
+    }
+    const response = await fetch(`${BASE_URL}/gallery/timeline?${query}`);
+    if (!response.ok) {
+        throw new Error('Failed to fetch the gallery timeline');
+    }
+    return response.json();
+};
+
+// filters: { q, seed, model, params: { [param_name]: value }, subfolder }
+const searchGallery = async (filters = {}, page = 1, pageSize = 20) => {
+    const query = new URLSearchParams({ page, per_page: pageSize });
+    for (const key of ['q', 'seed', 'model', 'subfolder']) {
+        if (filters[key] !== undefined && filters[key] !== '') {
+            query.set(key, filters[key]);
+        }
+    }
+    for (const [name, value] of Object.entries(filters.params || {})) {
+        query.set(`param.${name}`, value);
+    }
+    const response = await fetch(`${BASE_URL}/gallery/search?${query}`);
+    if (!response.ok) {
+        throw new Error('Failed to search the gallery');
+    }
+    return response.json();
+};
+
+const getThumbnailUrl = (filename, subfolder = '', type = 'output', width = 256) => {
+  return `${BASE_URL}/thumb?filename=${encodeURIComponent(filename)}&subfolder=${encodeURIComponent(subfolder)}&type=${type}&width=${width}`;
+};
+
+// A ZIP of a gallery folder, streamed by the server; use it as a download link
+const getGalleryExportUrl = (subfolder = '', recursive = false) => {
+  return `${BASE_URL}/gallery/export?subfolder=${encodeURIComponent(subfolder)}&recursive=${recursive ? 1 : 0}`;
+};
+
+// Gallery items come with a versioned `url`; this builds one for anything else
+const getMediaUrl = (filename, subfolder = '', type = 'output') => {
+  return `${BASE_URL}/media?filename=${encodeURIComponent(filename)}&subfolder=${encodeURIComponent(subfolder)}&type=${type}`;
+};
+
+const getChoices = async (type) => {
+  const response = await fetch(`${BASE_URL}/get_choices?type=${encodeURIComponent(type)}`);
+  if (!response.ok) {
+    throw new Error(`Failed to fetch choices for type: ${type}`);
+  }
+  return response.json();
+};
+
+// Files larger than this go through the resumable protocol, in chunks
+const RESUMABLE_UPLOAD_THRESHOLD = 4 * 1024 * 1024;
+const UPLOAD_RETRIES = 5;
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+// options: { normalize, maxSide } apply EXIF orientation and fit the image within maxSide on the server
+const uploadImage = async (imageFile, options = {}) => {
+  const normalize = { normalize: !!options.normalize, max_side: options.maxSide || 0 };
+  if (imageFile.size > RESUMABLE_UPLOAD_THRESHOLD) {
+    return uploadResumable(imageFile, normalize);
+  }
+  const formData = new FormData();
+  formData.append('image', imageFile);
+
+  const response = await fetch(`${BASE_URL}/upload_image?${new URLSearchParams(normalize)}`, {
+    method: 'POST',
+    body: formData,
+  });
+
+  if (!response.ok) {
+    throw new Error('Failed to upload image');
+  }
+  return response.json();
+};
+
+// Sends the file in chunks; after a network error it asks the server how
+// much arrived and continues from there instead of starting over.
+const uploadResumable = async (file, normalize) => {
+  const init = await fetch(`${BASE_URL}/upload`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ filename: file.name, size: file.size }),
+  });
+  if (!init.ok) {
+    throw new Error('Failed to start upload');
+  }
+  const { upload_id: uploadId, chunk_size: chunkSize } = await init.json();
+  const uploadUrl = `${BASE_URL}/upload/${uploadId}`;
+
+  let offset = 0;
+  let failures = 0;
+  while (offset < file.size) {
+    try {
+      const response = await fetch(`${uploadUrl}?offset=${offset}`, {
+        method: 'PUT',
+        body: file.slice(offset, offset + chunkSize),
+      });
+      const body = await response.json();
+      if (response.ok || response.status === 409) {
+        // 409 means the server has a different offset; continue from it
+        offset = body.offset;
+        failures = 0;
+        continue;
+      }
+      // 423: a dropped request is still writing to it; retried below
+      throw Object.assign(new Error(body.error || 'Failed to upload image'), { fatal: response.status !== 423 });
+    } catch (error) {
+      if (error.fatal || ++failures > UPLOAD_RETRIES) {
+        throw error;
+      }
+    }
+    await sleep(500 * 2 ** failures);
+    try {
+      const status = await fetch(uploadUrl);
+      if (status.ok) {
+        offset = (await status.json()).offset;
+      }
+    } catch (error) {
+      // Still offline; the next attempt will tell
+    }
+  }
+
+  const response = await fetch(`${uploadUrl}/finalize`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(normalize),
+  });
+  if (!response.ok) {
+    throw new Error('Failed to upload image');
+  }
+  return response.json();
+};
+return { getWorkflows, getWorkflow, getWorkflowBundle, queuePrompt, generate, getEvents, getGallery, getGalleryTimeline, searchGallery, getThumbnailUrl, getGalleryExportUrl, getMediaUrl, getChoices, uploadImage };
+})();
+// components/ImageInput.jsx
+__modules["components/ImageInput.jsx"] = (() => {
+const React = k;
+const useState = k.useState;
+const useEffect = k.useEffect;
+const getGallery = __modules["api.js"].getGallery;
+const getThumbnailUrl = __modules["api.js"].getThumbnailUrl;
+const uploadImage = __modules["api.js"].uploadImage;
+const ImageInput = ({ input, value, onFormChange }) => {
+  const [imageSource, setImageSource] = useState(value?.source || "Upload");
+  const [selectedGalleryImage, setSelectedGalleryImage] = useState(value?.path || "");
+  const [uploadedFile, setUploadedFile] = useState(null);
+  const [previewUrl, setPreviewUrl] = useState(value?.url || "");
+  const [galleryItems, setGalleryItems] = useState([]);
+  const [currentGalleryPath, setCurrentGalleryPath] = useState("");
+  const [smartResize, setSmartResize] = useState(true);
+  useEffect(() => {
+    const fetchGallery = async () => {
+      try {
+        const items = await getGallery(currentGalleryPath);
+        setGalleryItems(items);
+      } catch (error) {
+        console.error("Error fetching gallery items:", error);
+      }
+    };
+    if (input.class_type !== "CozyGenImageInput") {
+      fetchGallery();
+    }
+  }, [currentGalleryPath, input.class_type]);
+  useEffect(() => {
+    if (input.class_type === "CozyGenImageInput") {
+      if (value) {
+        setPreviewUrl(getThumbnailUrl(value, "", "input"));
+      } else {
+        setPreviewUrl("");
+      }
+    } else if (value?.url) {
+      setPreviewUrl(value.url);
+    } else if (value?.path && imageSource === "Gallery") {
+      setPreviewUrl(`/view?filename=${value.path}&subfolder=&type=output`);
+    }
+  }, [value, imageSource, input.class_type]);
+  const handleImageSourceChange = (e) => {
+    const newSource = e.target.value;
+    setImageSource(newSource);
+    setSelectedGalleryImage("");
+    setUploadedFile(null);
+    setPreviewUrl("");
+    onFormChange(input.inputs.param_name, { source: newSource, path: "", url: "" });
+  };
+  const handleFileChange = async (e) => {
+    const file = e.target.files[0];
+    if (file) {
+      setUploadedFile(file);
+      setPreviewUrl(URL.createObjectURL(file));
+      try {
+        const response = await uploadImage(file, { normalize: true });
+        onFormChange(input.inputs.param_name, { source: "Upload", path: response.filename, url: `/view?filename=${response.filename}&type=input` });
+      } catch (error) {
+        console.error("Error uploading image:", error);
+        setPreviewUrl("");
+      }
+    }
+  };
+  const handleGallerySelect = (e) => {
+    const selectedFilename = e.target.value;
+    setSelectedGalleryImage(selectedFilename);
+    const selectedItem = galleryItems.find((item) => item.filename === selectedFilename);
+    if (selectedItem) {
+      const imageUrl = `/view?filename=${selectedItem.filename}&subfolder=${selectedItem.subfolder}&type=${selectedItem.type}`;
+      setPreviewUrl(imageUrl);
+      onFormChange(input.inputs.param_name, { source: "Gallery", path: selectedItem.filename, subfolder: selectedItem.subfolder, url: imageUrl });
+    }
+  };
+  const handleClearImage = () => {
+    setImageSource("Upload");
+    setSelectedGalleryImage("");
+    setUploadedFile(null);
+    setPreviewUrl("");
+    onFormChange(input.inputs.param_name, { source: "Upload", path: "", url: "" });
+  };
+  const handleCozyGenFileChange = async (e) => {
+    const file = e.target.files[0];
+    if (!file)
+      return;
+    if (smartResize) {
+      const reader = new FileReader();
+      reader.onload = (event) => {
+        const img = new Image();
+        img.onload = async () => {
+          let { width, height } = img;
+          const sum = width + height;
+          if (sum > 2048) {
+            const ratio = width / height;
+            width = Math.floor(2048 * ratio / (ratio + 1));
+            height = 2048 - width;
+          }
+          const canvas = document.createElement("canvas");
+          canvas.width = width;
+          canvas.height = height;
+          const ctx = canvas.getContext("2d");
+          ctx.drawImage(img, 0, 0, width, height);
+          canvas.toBlob(async (blob) => {
+            const resizedFile = new File([blob], file.name, { type: file.type });
+            setPreviewUrl(URL.createObjectURL(resizedFile));
+            try {
+              const response = await uploadImage(resizedFile);
+              setPreviewUrl(getThumbnailUrl(response.filename, "", "input"));
+              onFormChange(input.inputs.param_name, response.filename);
+            } catch (error) {
+              console.error("Error uploading image:", error);
+              setPreviewUrl("");
+            }
+          }, file.type);
+        };
+        img.src = event.target.result;
+      };
+      reader.readAsDataURL(file);
+    } else {
+      setPreviewUrl(URL.createObjectURL(file));
+      try {
+        const response = await uploadImage(file, { normalize: true });
+        setPreviewUrl(getThumbnailUrl(response.filename, "", "input"));
+        onFormChange(input.inputs.param_name, response.filename);
+      } catch (error) {
+        console.error("Error uploading image:", error);
+        setPreviewUrl("");
+      }
+    }
+  };
+  const navigateGallery = (subfolder) => {
+    setCurrentGalleryPath(subfolder);
+    setSelectedGalleryImage("");
+  };
+  return /* @__PURE__ */ React.createElement("div", { className: "form-control mb-4 p-3 bg-base-200 rounded-box shadow-lg" }, /* @__PURE__ */ React.createElement("label", { className: "label" }, /* @__PURE__ */ React.createElement("span", { className: "label-text text-lg font-semibold" }, input.inputs.param_name)), input.class_type === "CozyGenImageInput" ? /* @__PURE__ */ React.createElement("div", { className: "flex flex-col sm:flex-row items-center gap-4 mb-4" }, /* @__PURE__ */ React.createElement("div", { className: "flex-grow w-full sm:w-auto" }, /* @__PURE__ */ React.createElement(
+    "input",
+    {
+      type: "file",
+      id: `cozyGenImageUploader-${input.id}`,
+      accept: "image/png, image/jpeg, image/webp",
+      onChange: handleCozyGenFileChange,
+      className: "file-input file-input-bordered w-full mb-2"
+    }
+  ), /* @__PURE__ */ React.createElement("div", { class: "form-control" }, /* @__PURE__ */ React.createElement("label", { class: "label cursor-pointer" }, /* @__PURE__ */ React.createElement("span", { class: "label-text" }, "Smart Resize"), /* @__PURE__ */ React.createElement("input", { type: "checkbox", class: "toggle", checked: smartResize, onChange: () => setSmartResize(!smartResize) })))), previewUrl && /* @__PURE__ */ React.createElement("div", { className: "flex-shrink-0 w-24 h-24 rounded-lg overflow-hidden shadow-md border border-base-300 flex items-center justify-center bg-base-300" }, /* @__PURE__ */ React.createElement("img", { src: previewUrl, alt: "Image Preview", className: "w-full h-full object-cover" }))) : (
+    // Existing UI for other image input types
+    /* @__PURE__ */ React.createElement(React.Fragment, null, /* @__PURE__ */ React.createElement("div", { className: "flex items-center space-x-2 mb-4" }, /* @__PURE__ */ React.createElement(
+      "select",
+      {
+        className: "select select-bordered w-full max-w-xs",
+        value: imageSource,
+        onChange: handleImageSourceChange
+      },
+      /* @__PURE__ */ React.createElement("option", { value: "Upload" }, "Upload Image"),
+      /* @__PURE__ */ React.createElement("option", { value: "Gallery" }, "Select from Gallery")
+    ), /* @__PURE__ */ React.createElement("button", { onClick: handleClearImage, className: "btn btn-sm btn-outline" }, "Clear")), imageSource === "Upload" && /* @__PURE__ */ React.createElement("div", { className: "mb-4" }, /* @__PURE__ */ React.createElement(
+      "input",
+      {
+        type: "file",
+        className: "file-input file-input-bordered w-full",
+        onChange: handleFileChange,
+        accept: "image/*"
+      }
+    )), imageSource === "Gallery" && /* @__PURE__ */ React.createElement("div", { className: "mb-4" }, /* @__PURE__ */ React.createElement("div", { className: "flex items-center space-x-2 mb-2" }, /* @__PURE__ */ React.createElement("span", { className: "text-sm text-gray-400" }, "Current Path: ", currentGalleryPath || "/"), currentGalleryPath && /* @__PURE__ */ React.createElement("button", { onClick: () => navigateGallery(""), className: "btn btn-xs btn-ghost" }, "Back to Root")), /* @__PURE__ */ React.createElement(
+      "select",
+      {
+        className: "select select-bordered w-full",
+        value: selectedGalleryImage,
+        onChange: handleGallerySelect
+      },
+      /* @__PURE__ */ React.createElement("option", { value: "" }, "-- Select an image or directory --"),
+      galleryItems.map((item, index) => /* @__PURE__ */ React.createElement("option", { key: index, value: item.filename }, item.type === "directory" ? `[DIR] ${item.filename}` : item.filename))
+    ), selectedGalleryImage && galleryItems.find((item) => item.filename === selectedGalleryImage && item.type === "directory") && /* @__PURE__ */ React.createElement("button", { onClick: () => navigateGallery(selectedGalleryImage), className: "btn btn-sm btn-primary mt-2" }, "Open Directory")), previewUrl && /* @__PURE__ */ React.createElement("div", { className: "mt-4 flex justify-center" }, /* @__PURE__ */ React.createElement("img", { src: previewUrl, alt: "Image Preview", className: "max-w-full h-auto rounded-lg shadow-md", style: { maxHeight: "300px" } })))
+  ));
+};
+const __default = ImageInput;
+return { default: __default };
+})();
+// components/VideoInput.jsx
+__modules["components/VideoInput.jsx"] = (() => {
+const React = k;
+const useState = k.useState;
+const useEffect = k.useEffect;
+const getGallery = __modules["api.js"].getGallery;
+const getMediaUrl = __modules["api.js"].getMediaUrl;
+const uploadImage = __modules["api.js"].uploadImage;
+const isVideo = (filename) => /\.(mp4|webm)$/i.test(filename);
+const OUTPUT_SUFFIX = " [output]";
+const previewUrlFor = (value) => {
+  if (!value)
+    return "";
+  if (value.endsWith(OUTPUT_SUFFIX)) {
+    const path = value.slice(0, -OUTPUT_SUFFIX.length);
+    const slash = path.lastIndexOf("/");
+    return getMediaUrl(path.slice(slash + 1), path.slice(0, Math.max(slash, 0)), "output");
+  }
+  return getMediaUrl(value, "", "input");
+};
+const VideoInput = ({ input, value, onFormChange }) => {
+  const [videoSource, setVideoSource] = useState(value && value.endsWith(OUTPUT_SUFFIX) ? "Gallery" : "Upload");
+  const [galleryItems, setGalleryItems] = useState([]);
+  const [currentGalleryPath, setCurrentGalleryPath] = useState("");
+  const [isUploading, setIsUploading] = useState(false);
+  const paramName = input.inputs.param_name;
+  useEffect(() => {
+    if (videoSource !== "Gallery")
+      return;
+    const fetchGallery = async () => {
+      try {
+        const data = await getGallery(currentGalleryPath, 1, 200);
+        setGalleryItems((data.items || []).filter((item) => item.type === "directory" || isVideo(item.filename)));
+      } catch (error) {
+        console.error("Error fetching gallery items:", error);
+      }
+    };
+    fetchGallery();
+  }, [videoSource, currentGalleryPath]);
+  const handleFileChange = async (e) => {
+    const file = e.target.files[0];
+    if (!file)
+      return;
+    setIsUploading(true);
+    try {
+      const response = await uploadImage(file);
+      onFormChange(paramName, response.filename);
+    } catch (error) {
+      console.error("Error uploading video:", error);
+    } finally {
+      setIsUploading(false);
+    }
+  };
+  const handleGallerySelect = (item) => {
+    if (item.type === "directory") {
+      setCurrentGalleryPath(item.subfolder);
+      return;
+    }
+    const path = item.subfolder ? `${item.subfolder.replace(/\\/g, "/")}/${item.filename}` : item.filename;
+    onFormChange(paramName, `${path}${OUTPUT_SUFFIX}`);
+  };
+  const previewUrl = previewUrlFor(value);
+  return /* @__PURE__ */ React.createElement("div", { className: "form-control mb-4 p-3 bg-base-200 rounded-box shadow-lg" }, /* @__PURE__ */ React.createElement("label", { className: "label" }, /* @__PURE__ */ React.createElement("span", { className: "label-text text-lg font-semibold" }, paramName)), /* @__PURE__ */ React.createElement("div", { className: "flex items-center space-x-2 mb-4" }, /* @__PURE__ */ React.createElement(
+    "select",
+    {
+      className: "select select-bordered w-full max-w-xs",
+      value: videoSource,
+      onChange: (e) => setVideoSource(e.target.value)
+    },
+    /* @__PURE__ */ React.createElement("option", { value: "Upload" }, "Upload Video"),
+    /* @__PURE__ */ React.createElement("option", { value: "Gallery" }, "Select from Gallery")
+  ), /* @__PURE__ */ React.createElement("button", { onClick: () => onFormChange(paramName, ""), className: "btn btn-sm btn-outline" }, "Clear")), videoSource === "Upload" ? /* @__PURE__ */ React.createElement(
+    "input",
+    {
+      type: "file",
+      accept: "video/*, image/gif",
+      onChange: handleFileChange,
+      disabled: isUploading,
+      className: "file-input file-input-bordered w-full mb-2"
+    }
+  ) : /* @__PURE__ */ React.createElement("div", { className: "mb-2" }, /* @__PURE__ */ React.createElement("div", { className: "flex items-center space-x-2 mb-2" }, /* @__PURE__ */ React.createElement("span", { className: "text-sm text-gray-400" }, "Current Path: ", currentGalleryPath || "/"), currentGalleryPath && /* @__PURE__ */ React.createElement("button", { onClick: () => setCurrentGalleryPath(""), className: "btn btn-xs btn-ghost" }, "Back to Root")), /* @__PURE__ */ React.createElement("div", { className: "grid grid-cols-3 gap-2 max-h-64 overflow-y-auto" }, galleryItems.map((item) => /* @__PURE__ */ React.createElement(
+    "button",
+    {
+      key: `${item.subfolder}/${item.filename}`,
+      onClick: () => handleGallerySelect(item),
+      className: "bg-base-300 rounded-md overflow-hidden text-xs text-left"
+    },
+    item.type === "directory" ? /* @__PURE__ */ React.createElement("div", { className: "h-16 flex items-center justify-center text-gray-400" }, "[DIR]") : /* @__PURE__ */ React.createElement("img", { src: item.poster, alt: item.filename, loading: "lazy", className: "w-full h-16 object-cover" }),
+    /* @__PURE__ */ React.createElement("p", { className: "p-1 truncate" }, item.filename)
+  )))), isUploading && /* @__PURE__ */ React.createElement("p", { className: "text-sm text-gray-400" }, "Uploading..."), previewUrl && /* @__PURE__ */ React.createElement("div", { className: "mt-2 flex justify-center" }, /\.gif( \[output\])?$/i.test(value) ? /* @__PURE__ */ React.createElement("img", { src: previewUrl, alt: "Video Preview", className: "max-w-full h-auto rounded-lg shadow-md", style: { maxHeight: "240px" } }) : /* @__PURE__ */ React.createElement("video", { src: previewUrl, muted: true, loop: true, autoPlay: true, playsInline: true, className: "max-w-full h-auto rounded-lg shadow-md", style: { maxHeight: "240px" } })));
+};
+const __default = VideoInput;
+return { default: __default };
+})();
+// pages/MainPage.jsx
+__modules["pages/MainPage.jsx"] = (() => {
+const React = k;
+const useState = k.useState;
+const useEffect = k.useEffect;
+const useRef = k.useRef;
+const WorkflowSelector = __modules["components/WorkflowSelector.jsx"].default;
+const DynamicForm = __modules["components/DynamicForm.jsx"].default;
+const ImageInput = __modules["components/ImageInput.jsx"].default;
+const VideoInput = __modules["components/VideoInput.jsx"].default;
+const getWorkflows = __modules["api.js"].getWorkflows;
+const getWorkflowBundle = __modules["api.js"].getWorkflowBundle;
+const generate = __modules["api.js"].generate;
+const getEvents = __modules["api.js"].getEvents;
+const Modal = Lo;
+const TransformWrapper = tp;
+const TransformComponent = np;
+const isVideo = (url) => /\.(mp4|webm)/i.test(url);
+const customStyles = {
+  content: {
+    position: "relative",
+    top: "auto",
+    left: "auto",
+    right: "auto",
+    bottom: "auto",
+    transform: "none",
+    marginRight: "0",
+    backgroundColor: "#2D3748",
+    border: "none",
+    borderRadius: "8px",
+    padding: "0rem",
+    maxHeight: "90vh",
+    width: "90vw",
+    maxWidth: "864px",
+    overflow: "auto",
+    flexShrink: 0
+  },
+  overlay: {
+    backgroundColor: "rgba(0, 0, 0, 0.75)",
+    display: "flex",
+    alignItems: "center",
+    justifyContent: "center",
+    zIndex: 1e3
+  }
+};
+Modal.setAppElement("#root");
+const renderPreviewContent = (url) => {
+  if (!url)
+    return null;
+  if (isVideo(url)) {
+    return /* @__PURE__ */ React.createElement("video", { src: url, controls: true, autoPlay: true, loop: true, muted: true, className: "max-w-full max-h-full object-contain rounded-lg" });
+  } else {
+    return /* @__PURE__ */ React.createElement("img", { src: url, alt: "Generated preview", className: "max-w-full max-h-full object-contain rounded-lg cursor-pointer" });
+  }
+};
+const renderModalContent = (url) => {
+  if (!url)
+    return null;
+  if (isVideo(url)) {
+    return /* @__PURE__ */ React.createElement("video", { src: url, controls: true, autoPlay: true, loop: true, className: "max-w-full max-h-full object-contain rounded-lg" });
+  } else {
+    return /* @__PURE__ */ React.createElement(
+      TransformWrapper,
+      {
+        initialScale: 1,
+        minScale: 0.5,
+        maxScale: 5,
+        limitToBounds: false,
+        doubleClick: { disabled: true },
+        wheel: true
+      },
+      /* @__PURE__ */ React.createElement(TransformComponent, null, /* @__PURE__ */ React.createElement("img", { src: url, alt: "Generated preview", className: "max-w-full max-h-full object-contain rounded-lg" }))
+    );
+  }
+};
+const findNodesByType = (workflow, type) => {
+  if (!workflow)
+    return [];
+  const nodes = Object.entries(workflow).map(([id, node]) => ({ ...node, id }));
+  return nodes.filter((node) => node.class_type === type);
+};
+const getClientId = () => {
+  let clientId = sessionStorage.getItem("cozygenClientId");
+  if (!clientId) {
+    clientId = Date.now().toString(36) + Math.random().toString(36).slice(2);
+    sessionStorage.setItem("cozygenClientId", clientId);
+  }
+  return clientId;
+};
+function App() {
+  const [workflows, setWorkflows] = useState([]);
+  const [selectedWorkflow, setSelectedWorkflow] = useState(
+    localStorage.getItem("selectedWorkflow") || null
+  );
+  const [workflowData, setWorkflowData] = useState(null);
+  const [dynamicInputs, setDynamicInputs] = useState([]);
+  const [formData, setFormData] = useState({});
+  const [randomizeState, setRandomizeState] = useState({});
+  const [bypassedState, setBypassedState] = useState({});
+  const [previewImages, setPreviewImages] = useState(JSON.parse(localStorage.getItem("lastPreviewImages")) || []);
+  const [selectedPreviewImage, setSelectedPreviewImage] = useState(null);
+  const [isLoading, setIsLoading] = useState(false);
+  const websocketRef = useRef(null);
+  const [progressValue, setProgressValue] = useState(0);
+  const [progressMax, setProgressMax] = useState(0);
+  const [modalIsOpen, setModalIsOpen] = useState(false);
+  const [statusText, setStatusText] = useState("Generating...");
+  const workflowDataRef = useRef(null);
+  const lastEventRef = useRef({ epoch: null, seq: 0 });
+  useEffect(() => {
+    workflowDataRef.current = workflowData;
+  }, [workflowData]);
+  const openModalWithImage = (imageSrc) => {
+    setSelectedPreviewImage(imageSrc);
+    setModalIsOpen(true);
+  };
+  useEffect(() => {
+    const handleResultEvent = (type, data) => {
+      if (typeof data.seq === "number") {
+        lastEventRef.current.seq = Math.max(lastEventRef.current.seq, data.seq);
+      }
+      if (type === "cozygen_batch_ready") {
+        const imageUrls = data.images.map((image) => image.url);
+        if (imageUrls.length > 0) {
+          setPreviewImages(imageUrls);
+          localStorage.setItem("lastPreviewImages", JSON.stringify(imageUrls));
+        }
+        setIsLoading(false);
+        setProgressValue(0);
+        setProgressMax(0);
+        setStatusText("Finished");
+      }
+    };
+    const catchUpResultEvents = async () => {
+      const { epoch, seq } = lastEventRef.current;
+      try {
+        const result = await getEvents(seq, getClientId(), epoch);
+        lastEventRef.current.epoch = result.epoch;
+        if (epoch === null) {
+          lastEventRef.current.seq = Math.max(seq, result.latest_seq);
+          return;
+        }
+        result.events.forEach((event) => handleResultEvent(event.type, event.data));
+      } catch (error) {
+        console.error("CozyGen: Could not fetch missed events: ", error);
+      }
+    };
+    const connectWebSocket = () => {
+      const protocol = window.location.protocol === "https" ? "wss" : "ws";
+      const host = window.location.host;
+      const wsUrl = `${protocol}://${host}/ws?clientId=${encodeURIComponent(getClientId())}`;
+      websocketRef.current = new WebSocket(wsUrl);
+      websocketRef.current.onopen = catchUpResultEvents;
+      websocketRef.current.onmessage = (event) => {
+        if (typeof event.data !== "string") {
+          console.log("CozyGen: Received binary WebSocket message, ignoring.");
+          return;
+        }
+        const msg = JSON.parse(event.data);
+        if (msg.type === "cozygen_batch_ready" || msg.type === "cozygen_video_ready") {
+          handleResultEvent(msg.type, msg.data);
+        } else if (msg.type === "executing") {
+          const nodeId = msg.data.node;
+          if (nodeId && workflowDataRef.current && workflowDataRef.current[nodeId]) {
+            const node = workflowDataRef.current[nodeId];
+            const nodeName = node.title || node.class_type;
+            setStatusText(`Executing: ${nodeName}`);
+          }
+        } else if (msg.type === "progress") {
+          setProgressValue(msg.data.value);
+          setProgressMax(msg.data.max);
+        }
+      };
+      websocketRef.current.onclose = () => {
+        setTimeout(connectWebSocket, 1e3);
+      };
+      websocketRef.current.onerror = (err) => {
+        console.error("CozyGen: WebSocket error: ", err);
+        websocketRef.current.close();
+      };
+    };
+    connectWebSocket();
+    return () => {
+      if (websocketRef.current) {
+        websocketRef.current.close();
+      }
+    };
+  }, []);
+  useEffect(() => {
+    const fetchWorkflows = async () => {
+      try {
+        const data = await getWorkflows();
+        setWorkflows(data.workflows || []);
+      } catch (error) {
+        console.error(error);
+      }
+    };
+    fetchWorkflows();
+  }, []);
+  useEffect(() => {
+    if (!selectedWorkflow)
+      return;
+    const fetchWorkflowData = async () => {
+      try {
+        const bundle = await getWorkflowBundle(selectedWorkflow);
+        setWorkflowData(bundle.workflow);
+        const inputsWithChoices = bundle.inputs;
+        setDynamicInputs(inputsWithChoices);
+        const savedFormData = JSON.parse(localStorage.getItem(`${selectedWorkflow}_formData`)) || {};
+        const initialFormData = {};
+        inputsWithChoices.forEach((input) => {
+          const param_name = input.inputs["param_name"];
+          if (savedFormData[param_name] === void 0) {
+            let defaultValue;
+            if (["CozyGenDynamicInput", "CozyGenFloatInput", "CozyGenIntInput", "CozyGenStringInput"].includes(input.class_type)) {
+              defaultValue = input.inputs["default_value"];
+              if (input.class_type === "CozyGenIntInput") {
+                defaultValue = parseInt(defaultValue, 10);
+              } else if (input.class_type === "CozyGenFloatInput") {
+                defaultValue = parseFloat(defaultValue);
+              }
+            } else if (input.class_type === "CozyGenChoiceInput") {
+              defaultValue = input.inputs.choices && input.inputs.choices.length > 0 ? input.inputs.choices[0] : "";
+            } else if (input.class_type === "CozyGenImageInput" || input.class_type === "CozyGenVideoInput") {
+              defaultValue = "";
+            }
+            initialFormData[param_name] = defaultValue;
+          } else {
+            initialFormData[param_name] = savedFormData[param_name];
+          }
+        });
+        setFormData(initialFormData);
+        const savedRandomizeState = JSON.parse(localStorage.getItem(`${selectedWorkflow}_randomizeState`)) || {};
+        setRandomizeState(savedRandomizeState);
+        const savedBypassedState = JSON.parse(localStorage.getItem(`${selectedWorkflow}_bypassedState`)) || {};
+        setBypassedState(savedBypassedState);
+      } catch (error) {
+        console.error(error);
+      }
+    };
+    fetchWorkflowData();
+  }, [selectedWorkflow]);
+  const handleWorkflowSelect = (workflow) => {
+    setSelectedWorkflow(workflow);
+    localStorage.setItem("selectedWorkflow", workflow);
+    setWorkflowData(null);
+    setDynamicInputs([]);
+    setFormData({});
+    setRandomizeState({});
+    setPreviewImage(null);
+  };
+  const handleFormChange = (inputName, value) => {
+    const newFormData = { ...formData, [inputName]: value };
+    setFormData(newFormData);
+    localStorage.setItem(`${selectedWorkflow}_formData`, JSON.stringify(newFormData));
+  };
+  const handleRandomizeToggle = (inputName, isRandom) => {
+    const newRandomizeState = { ...randomizeState, [inputName]: isRandom };
+    setRandomizeState(newRandomizeState);
+    localStorage.setItem(`${selectedWorkflow}_randomizeState`, JSON.stringify(newRandomizeState));
+  };
+  const handleBypassToggle = (inputName, isBypassed) => {
+    const newBypassedState = { ...bypassedState, [inputName]: isBypassed };
+    setBypassedState(newBypassedState);
+    localStorage.setItem(`${selectedWorkflow}_bypassedState`, JSON.stringify(newBypassedState));
+  };
+  const handleGenerate = async () => {
+    if (!workflowData)
+      return;
+    setIsLoading(true);
+    setPreviewImages([]);
+    setStatusText("Queuing prompt...");
+    try {
+      let updatedFormData = { ...formData };
+      dynamicInputs.forEach((dynamicNode) => {
+        const param_name = dynamicNode.inputs.param_name;
+        if (dynamicNode.class_type === "CozyGenImageInput" || dynamicNode.class_type === "CozyGenVideoInput")
+          return;
+        let valueToInject = randomizeState[param_name] ? dynamicNode.inputs.param_type === "FLOAT" ? Math.random() * ((dynamicNode.inputs.max_value || 1e6) - (dynamicNode.inputs.min_value || 0)) + (dynamicNode.inputs.min_value || 0) : Math.floor(Math.random() * ((dynamicNode.inputs.max_value || 1e6) - (dynamicNode.inputs.min_value || 0) + 1)) + (dynamicNode.inputs.min_value || 0) : formData[param_name];
+        updatedFormData[param_name] = valueToInject;
+      });
+      setFormData(updatedFormData);
+      localStorage.setItem(`${selectedWorkflow}_formData`, JSON.stringify(updatedFormData));
+      const fileInputNodes = dynamicInputs.filter((dn) => dn.class_type === "CozyGenImageInput" || dn.class_type === "CozyGenVideoInput");
+      for (const node of fileInputNodes) {
+        const filename = formData[node.inputs.param_name];
+        if (!filename) {
+          const kind = node.class_type === "CozyGenVideoInput" ? "a video" : "an image";
+          alert(`Please upload ${kind} for "${node.inputs.param_name}" before generating.`);
+          setIsLoading(false);
+          return;
+        }
+      }
+      await generate({
+        workflow: selectedWorkflow,
+        values: updatedFormData,
+        bypass: bypassedState,
+        client_id: getClientId()
+      });
+    } catch (error) {
+      console.error("Failed to queue prompt:", error);
+      setIsLoading(false);
+      setStatusText("Error queuing prompt");
+      if (error.status === 400) {
+        alert(error.message);
+      }
+    }
+  };
+  const handleClearPreview = () => {
+    setPreviewImages([]);
+    localStorage.removeItem("lastPreviewImages");
+  };
+  const hasImageInput = dynamicInputs.some((input) => input.class_type === "CozyGenImageInput");
+  return /* @__PURE__ */ React.createElement("div", { className: "max-w-7xl mx-auto" }, /* @__PURE__ */ React.createElement("div", { className: "grid grid-cols-1 lg:grid-cols-2 gap-4 pb-28" }, /* @__PURE__ */ React.createElement("div", { className: "flex flex-col space-y-2" }, /* @__PURE__ */ React.createElement("div", { className: "bg-base-200 shadow-lg rounded-lg p-3 min-h-[400px] lg:min-h-[500px] flex flex-col" }, /* @__PURE__ */ React.createElement("div", { className: "flex justify-between items-center mb-4" }, /* @__PURE__ */ React.createElement("h2", { className: "text-xl font-semibold text-white" }, "Preview"), /* @__PURE__ */ React.createElement(
+    "button",
+    {
+      onClick: handleClearPreview,
+      className: "px-3 py-1 bg-base-300 text-gray-300 rounded-md text-sm hover:bg-base-300/70 transition-colors"
+    },
+    "Clear"
+  )), /* @__PURE__ */ React.createElement("div", { className: "flex-grow flex items-center justify-center border-2 border-dashed border-base-300 rounded-lg p-2 overflow-y-auto" }, isLoading && /* @__PURE__ */ React.createElement("div", { className: "text-center w-full" }, /* @__PURE__ */ React.createElement("p", { className: "text-lg" }, statusText)), !isLoading && previewImages.length === 0 && /* @__PURE__ */ React.createElement("p", { className: "text-gray-400" }, "Your generated image or video will appear here."), !isLoading && previewImages.length === 1 && /* @__PURE__ */ React.createElement("div", { className: "w-full h-full flex items-center justify-center cursor-pointer", onClick: () => openModalWithImage(previewImages[0]) }, renderPreviewContent(previewImages[0])), !isLoading && previewImages.length > 1 && /* @__PURE__ */ React.createElement("div", { className: "grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 gap-2 w-full h-full" }, previewImages.map((src, index) => /* @__PURE__ */ React.createElement("div", { key: index, className: "aspect-square bg-base-300 rounded-lg overflow-hidden cursor-pointer", onClick: () => openModalWithImage(src) }, renderPreviewContent(src))))))), /* @__PURE__ */ React.createElement("div", { className: "flex flex-col space-y-2" }, /* @__PURE__ */ React.createElement(
+    WorkflowSelector,
+    {
+      workflows,
+      selectedWorkflow,
+      onSelect: handleWorkflowSelect
+    }
+  ), /* @__PURE__ */ React.createElement(
+    DynamicForm,
+    {
+      inputs: dynamicInputs.filter((input) => input.class_type !== "CozyGenImageInput" && input.class_type !== "CozyGenVideoInput").map((input) => {
+        if (["CozyGenFloatInput", "CozyGenIntInput", "CozyGenStringInput", "CozyGenChoiceInput"].includes(input.class_type)) {
+          let param_type = input.class_type.replace("CozyGen", "").replace("Input", "").toUpperCase();
+          if (param_type === "CHOICE") {
+            param_type = "DROPDOWN";
+          }
+          return {
+            ...input,
+            inputs: {
+              ...input.inputs,
+              param_type,
+              // Conform to the expected 'Multiline' prop
+              Multiline: input.inputs.display_multiline || false
+            }
+          };
+        }
+        return input;
+      }),
+      formData,
+      onFormChange: handleFormChange,
+      randomizeState,
+      onRandomizeToggle: handleRandomizeToggle,
+      bypassedState,
+      onBypassToggle: handleBypassToggle
+    }
+  ), dynamicInputs.filter((input) => input.class_type === "CozyGenImageInput").map((input) => /* @__PURE__ */ React.createElement(
+    ImageInput,
+    {
+      key: input.id,
+      input,
+      value: formData[input.inputs.param_name],
+      onFormChange: handleFormChange
+    }
+  )), dynamicInputs.filter((input) => input.class_type === "CozyGenVideoInput").map((input) => /* @__PURE__ */ React.createElement(
+    VideoInput,
+    {
+      key: input.id,
+      input,
+      value: formData[input.inputs.param_name],
+      onFormChange: handleFormChange
+    }
+  )))), /* @__PURE__ */ React.createElement("div", { className: "fixed bottom-0 left-0 right-0 bg-base-100/80 backdrop-blur-sm p-4 border-t border-base-300 z-10 shadow-lg" }, /* @__PURE__ */ React.createElement("div", { className: "max-w-2xl mx-auto" }, " ", /* @__PURE__ */ React.createElement(
+    "button",
+    {
+      onClick: handleGenerate,
+      disabled: isLoading || !workflowData,
+      className: "w-full bg-accent text-white font-bold text-lg py-4 px-4 rounded-lg hover:bg-accent-focus transition duration-300 disabled:bg-base-300 disabled:cursor-not-allowed shadow-lg"
+    },
+    isLoading ? "Generating..." : "Generate"
+  ), isLoading && progressMax > 0 && /* @__PURE__ */ React.createElement("div", { className: "w-full bg-base-300 rounded-full h-2.5 mt-2" }, /* @__PURE__ */ React.createElement(
+    "div",
+    {
+      className: "bg-accent h-2.5 rounded-full transition-all duration-1000 ease-out",
+      style: { width: `${progressValue / progressMax * 100}%` }
+    }
+  )))), selectedPreviewImage && /* @__PURE__ */ React.createElement(
+    Modal,
+    {
+      isOpen: modalIsOpen,
+      onRequestClose: () => setModalIsOpen(false),
+      style: customStyles,
+      contentLabel: "Image Preview"
+    },
+    /* @__PURE__ */ React.createElement("div", { className: "flex flex-col h-full w-full" }, /* @__PURE__ */ React.createElement("div", { className: "flex-grow flex items-center justify-center min-h-0" }, renderModalContent(selectedPreviewImage)), /* @__PURE__ */ React.createElement("div", { className: "flex-shrink-0 p-2 flex justify-center" }, /* @__PURE__ */ React.createElement(
+      "button",
+      {
+        onClick: () => setModalIsOpen(false),
+        className: "px-4 py-2 bg-accent text-white rounded-md hover:bg-accent-focus transition-colors"
+      },
+      "Close"
+    )))
+  ));
+}
+const __default = App;
+return { default: __default };
+})();
+// components/GalleryItem.jsx
+__modules["components/GalleryItem.jsx"] = (() => {
+const React = k;
+const getMediaUrl = __modules["api.js"].getMediaUrl;
+const isVideo = (filename) => /\.(mp4|webm)$/i.test(filename);
+const isAudio = (filename) => /\.(mp3|wav|flac)$/i.test(filename);
+const GalleryItem = ({ item, onSelect }) => {
+  const isDirectory = item.type === "directory";
+  const fileUrl = isDirectory ? "" : item.url || getMediaUrl(item.filename, item.subfolder);
+  const renderContent = () => {
+    if (isDirectory) {
+      return /* @__PURE__ */ React.createElement("div", { className: "flex flex-col items-center justify-center h-full bg-base-300/50" }, /* @__PURE__ */ React.createElement("svg", { className: "w-16 h-16 text-gray-500 group-hover:text-accent transition-colors", fill: "currentColor", viewBox: "0 0 20 20", xmlns: "http://www.w3.org/2000/svg" }, /* @__PURE__ */ React.createElement("path", { d: "M2 6a2 2 0 012-2h5l2 2h5a2 2 0 012 2v6a2 2 0 01-2 2H4a2 2 0 01-2-2V6z" })));
+    } else if (isVideo(item.filename)) {
+      if (item.preview || item.poster) {
+        return /* @__PURE__ */ React.createElement("img", { src: item.preview || item.poster, alt: item.filename, loading: "lazy", className: "w-full h-full object-cover" });
+      }
+      return /* @__PURE__ */ React.createElement("video", { src: fileUrl, muted: true, className: "w-full h-full object-cover" });
+    } else if (isAudio(item.filename)) {
+      return /* @__PURE__ */ React.createElement("div", { className: "flex flex-col items-center justify-center h-full bg-base-300/50" }, /* @__PURE__ */ React.createElement("svg", { className: "w-16 h-16 text-gray-500 group-hover:text-accent transition-colors", xmlns: "http://www.w3.org/2000/svg", fill: "none", viewBox: "0 0 24 24", strokeWidth: 1.5, stroke: "currentColor" }, /* @__PURE__ */ React.createElement("path", { strokeLinecap: "round", strokeLinejoin: "round", d: "M9 9l10.5-3m0 6.553v3.75a2.25 2.25 0 01-1.632 2.163l-1.32.377a1.803 1.803 0 11-.99-3.467l2.31-.66a2.25 2.25 0 001.632-2.163zm0 0V2.25L9 5.25v10.303m0 0v3.75a2.25 2.25 0 01-1.632 2.163l-1.32.377a1.803 1.803 0 01-.99-3.467l2.31-.66A2.25 2.25 0 009 15.553z" })));
+    } else {
+      return /* @__PURE__ */ React.createElement("img", { src: item.thumbnail || item.preview || fileUrl, alt: item.filename, loading: "lazy", className: "w-full h-full object-cover" });
+    }
+  };
+  return /* @__PURE__ */ React.createElement(
+    "div",
+    {
+      className: "bg-base-200 rounded-lg shadow-lg overflow-hidden cursor-pointer group transform hover:-translate-y-1 transition-all duration-300",
+      onClick: () => onSelect(item)
+    },
+    /* @__PURE__ */ React.createElement("div", { className: "relative w-full h-48" }, renderContent(), /* @__PURE__ */ React.createElement("div", { className: "absolute inset-0 bg-black/40 opacity-0 group-hover:opacity-100 transition-opacity" })),
+    /* @__PURE__ */ React.createElement("p", { className: "p-2 text-sm text-white truncate" }, item.filename)
+  );
+};
+const __default = GalleryItem;
+return { default: __default };
+})();
+// pages/Gallery.jsx
+__modules["pages/Gallery.jsx"] = (() => {
+const React = k;
+const useState = k.useState;
+const useEffect = k.useEffect;
+const useRef = k.useRef;
+const getGallery = __modules["api.js"].getGallery;
+const getGalleryTimeline = __modules["api.js"].getGalleryTimeline;
+const getMediaUrl = __modules["api.js"].getMediaUrl;
+const getGalleryExportUrl = __modules["api.js"].getGalleryExportUrl;
+const GalleryItem = __modules["components/GalleryItem.jsx"].default;
+const Modal = Lo;
+const TransformWrapper = tp;
+const TransformComponent = np;
+const customStyles = {
+  content: {
+    position: "relative",
+    top: "auto",
+    left: "auto",
+    right: "auto",
+    bottom: "auto",
+    transform: "none",
+    marginRight: "0",
+    backgroundColor: "#2D3748",
+    border: "none",
+    borderRadius: "8px",
+    padding: "0rem",
+    maxHeight: "90vh",
+    width: "90vw",
+    maxWidth: "864px",
+    overflow: "auto",
+    flexShrink: 0
+  },
+  overlay: {
+    backgroundColor: "rgba(0, 0, 0, 0.75)",
+    display: "flex",
+    alignItems: "center",
+    justifyContent: "center",
+    zIndex: 1e3
+  }
+};
+Modal.setAppElement("#root");
+const isVideo = (filename) => /\.(mp4|webm)$/i.test(filename);
+const isAudio = (filename) => /\.(mp3|wav|flac)$/i.test(filename);
+const Gallery = () => {
+  const [items, setItems] = useState([]);
+  const [path, setPath] = useState(localStorage.getItem("galleryPath") || "");
+  const [modalIsOpen, setModalIsOpen] = useState(false);
+  const [selectedItem, setSelectedItem] = useState(null);
+  const [page, setPage] = useState(1);
+  const [totalPages, setTotalPages] = useState(1);
+  const [pageSize, setPageSize] = useState(parseInt(localStorage.getItem("galleryPageSize"), 10) || 20);
+  const [timeline, setTimeline] = useState(localStorage.getItem("galleryTimeline") === "true");
+  const cursors = useRef([null]);
+  useEffect(() => {
+    const fetchGallery = async () => {
+      try {
+        if (timeline) {
+          const timelineData = await getGalleryTimeline(path, page > 1 ? cursors.current[page - 1] : null, pageSize);
+          cursors.current[page] = timelineData.next_cursor;
+          setItems(timelineData.items);
+          setTotalPages(timelineData.next_cursor ? Math.max(page + 1, Math.ceil(timelineData.total_items / pageSize)) : page);
+          return;
+        }
+        const galleryData = await getGallery(path, page, pageSize);
+        if (galleryData && galleryData.items) {
+          setItems(galleryData.items);
+          setTotalPages(galleryData.total_pages);
+        } else {
+          setItems([]);
+          setTotalPages(1);
+        }
+      } catch (error) {
+        console.error(error);
+        setItems([]);
+        setTotalPages(1);
+      }
+    };
+    fetchGallery();
+    localStorage.setItem("galleryPath", path);
+  }, [path, page, pageSize, timeline]);
+  const handleTimelineToggle = () => {
+    setTimeline(!timeline);
+    setPage(1);
+    localStorage.setItem("galleryTimeline", !timeline);
+  };
+  const handleSelect = (item) => {
+    if (item.type === "directory") {
+      setPath(item.subfolder);
+      setPage(1);
+    } else {
+      setSelectedItem(item);
+      setModalIsOpen(true);
+    }
+  };
+  const handlePageSizeChange = (e) => {
+    const newSize = parseInt(e.target.value, 10);
+    setPageSize(newSize);
+    setPage(1);
+    localStorage.setItem("galleryPageSize", newSize);
+  };
+  const handleBreadcrumbClick = (index) => {
+    const normalizedPath = path.replace(/\\/g, "/");
+    const pathSegments = normalizedPath.split("/").filter(Boolean);
+    const newPath = pathSegments.slice(0, index).join("/");
+    setPath(newPath);
+    setPage(1);
+  };
+  const handleFolderUp = () => {
+    const normalizedPath = path.replace(/\\/g, "/");
+    const pathSegments = normalizedPath.split("/").filter(Boolean);
+    if (pathSegments.length > 0) {
+      const newPath = pathSegments.slice(0, -1).join("/");
+      setPath(newPath);
+    } else {
+      setPath("");
+    }
+    setPage(1);
+  };
+  const handleNext = () => {
+    const mediaItems = items.filter((item) => item.type !== "directory");
+    if (mediaItems.length <= 1)
+      return;
+    const currentIndex = mediaItems.findIndex((item) => item.filename === selectedItem.filename && item.subfolder === selectedItem.subfolder);
+    const nextIndex = (currentIndex + 1) % mediaItems.length;
+    setSelectedItem(mediaItems[nextIndex]);
+  };
+  const handlePrevious = () => {
+    const mediaItems = items.filter((item) => item.type !== "directory");
+    if (mediaItems.length <= 1)
+      return;
+    const currentIndex = mediaItems.findIndex((item) => item.filename === selectedItem.filename && item.subfolder === selectedItem.subfolder);
+    const prevIndex = (currentIndex - 1 + mediaItems.length) % mediaItems.length;
+    setSelectedItem(mediaItems[prevIndex]);
+  };
+  const renderModalContent = () => {
+    if (!selectedItem)
+      return null;
+    const fileUrl = selectedItem.url || getMediaUrl(selectedItem.filename, selectedItem.subfolder);
+    if (isVideo(selectedItem.filename)) {
+      return /* @__PURE__ */ React.createElement("video", { src: fileUrl, controls: true, autoPlay: true, loop: true, className: "max-w-full max-h-full object-contain rounded-lg" });
+    } else if (isAudio(selectedItem.filename)) {
+      return /* @__PURE__ */ React.createElement("audio", { src: fileUrl, controls: true, autoPlay: true, loop: true, className: "w-full" });
+    } else {
+      return /* @__PURE__ */ React.createElement(
+        TransformWrapper,
+        {
+          initialScale: 1,
+          minScale: 0.5,
+          maxScale: 5,
+          limitToBounds: false,
+          doubleClick: { disabled: true },
+          wheel: true
+        },
+        /* @__PURE__ */ React.createElement(TransformComponent, null, /* @__PURE__ */ React.createElement("img", { src: fileUrl, alt: selectedItem.filename, className: "max-w-full max-h-full object-contain rounded-lg" }))
+      );
+    }
+  };
+  const breadcrumbs = path.split(/[\/]/).filter(Boolean);
+  return /* @__PURE__ */ React.createElement("div", { className: "p-4" }, /* @__PURE__ */ React.createElement("div", { className: "mb-4 bg-base-200 rounded-lg p-2 flex items-center text-lg" }, /* @__PURE__ */ React.createElement("span", { onClick: () => {
+    setPath("");
+    setPage(1);
+  }, className: "cursor-pointer hover:text-accent transition-colors" }, "Gallery"), breadcrumbs.map((segment, index) => /* @__PURE__ */ React.createElement(React.Fragment, { key: index }, /* @__PURE__ */ React.createElement("span", { className: "mx-2 text-gray-500" }, "/"), /* @__PURE__ */ React.createElement("span", { onClick: () => handleBreadcrumbClick(index + 1), className: "cursor-pointer hover:text-accent transition-colors" }, segment))), /* @__PURE__ */ React.createElement(
+    "button",
+    {
+      onClick: handleFolderUp,
+      disabled: path === "",
+      className: "ml-auto px-3 py-1 bg-base-300 text-gray-300 rounded-md text-sm hover:bg-base-300/70 transition-colors flex items-center"
+    },
+    /* @__PURE__ */ React.createElement("svg", { xmlns: "http://www.w3.org/2000/svg", fill: "none", viewBox: "0 0 24 24", strokeWidth: 1.5, stroke: "currentColor", className: "w-4 h-4 mr-1" }, /* @__PURE__ */ React.createElement("path", { strokeLinecap: "round", strokeLinejoin: "round", d: "M4.5 10.5 12 3m0 0 7.5 7.5M12 3v18" })),
+    "Up"
+  ), /* @__PURE__ */ React.createElement(
+    "button",
+    {
+      onClick: handleTimelineToggle,
+      className: `ml-2 px-3 py-1 rounded-md text-sm transition-colors flex items-center ${timeline ? "bg-accent text-white" : "bg-base-300 text-gray-300 hover:bg-base-300/70"}`
+    },
+    /* @__PURE__ */ React.createElement("svg", { xmlns: "http://www.w3.org/2000/svg", fill: "none", viewBox: "0 0 24 24", strokeWidth: 1.5, stroke: "currentColor", className: "w-4 h-4 mr-1" }, /* @__PURE__ */ React.createElement("path", { strokeLinecap: "round", strokeLinejoin: "round", d: "M12 6v6h4.5m4.5 0a9 9 0 1 1-18 0 9 9 0 0 1 18 0Z" })),
+    "Latest"
+  ), /* @__PURE__ */ React.createElement(
+    "a",
+    {
+      href: getGalleryExportUrl(path, true),
+      download: true,
+      className: "ml-2 px-3 py-1 bg-base-300 text-gray-300 rounded-md text-sm hover:bg-base-300/70 transition-colors flex items-center"
+    },
+    /* @__PURE__ */ React.createElement("svg", { xmlns: "http://www.w3.org/2000/svg", fill: "none", viewBox: "0 0 24 24", strokeWidth: 1.5, stroke: "currentColor", className: "w-4 h-4 mr-1" }, /* @__PURE__ */ React.createElement("path", { strokeLinecap: "round", strokeLinejoin: "round", d: "M3 16.5v2.25A2.25 2.25 0 0 0 5.25 21h13.5A2.25 2.25 0 0 0 21 18.75V16.5M16.5 12 12 16.5m0 0L7.5 12m4.5 4.5V3" })),
+    "Download"
+  )), /* @__PURE__ */ React.createElement("div", { className: "flex justify-center items-center space-x-4 mb-4" }, /* @__PURE__ */ React.createElement(
+    "button",
+    {
+      onClick: () => setPage(page > 1 ? page - 1 : 1),
+      disabled: page <= 1,
+      className: "px-4 py-2 bg-base-300 text-white rounded-md disabled:opacity-50"
+    },
+    "Previous"
+  ), /* @__PURE__ */ React.createElement("span", null, "Page ", page, " of ", totalPages), /* @__PURE__ */ React.createElement(
+    "button",
+    {
+      onClick: () => setPage(page < totalPages ? page + 1 : totalPages),
+      disabled: page >= totalPages,
+      className: "px-4 py-2 bg-base-300 text-white rounded-md disabled:opacity-50"
+    },
+    "Next"
+  ), /* @__PURE__ */ React.createElement("div", { className: "flex items-center space-x-2" }, /* @__PURE__ */ React.createElement("label", { htmlFor: "page-size-selector", className: "text-sm" }, "Per Page:"), /* @__PURE__ */ React.createElement(
+    "select",
+    {
+      id: "page-size-selector",
+      className: "select select-bordered select-sm bg-base-100",
+      value: pageSize,
+      onChange: handlePageSizeChange
+    },
+    /* @__PURE__ */ React.createElement("option", { value: 10 }, "10"),
+    /* @__PURE__ */ React.createElement("option", { value: 20 }, "20"),
+    /* @__PURE__ */ React.createElement("option", { value: 50 }, "50"),
+    /* @__PURE__ */ React.createElement("option", { value: 100 }, "100")
+  ))), /* @__PURE__ */ React.createElement("div", { className: "grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-5 xl:grid-cols-6 gap-4" }, items.map((item) => /* @__PURE__ */ React.createElement(GalleryItem, { key: `${item.subfolder}/${item.filename}`, item, onSelect: handleSelect }))), selectedItem && /* @__PURE__ */ React.createElement(
+    Modal,
+    {
+      isOpen: modalIsOpen,
+      onRequestClose: () => setModalIsOpen(false),
+      style: customStyles,
+      contentLabel: "Image Preview"
+    },
+    /* @__PURE__ */ React.createElement("div", { className: "flex flex-col h-full w-full" }, /* @__PURE__ */ React.createElement("div", { className: "flex-grow flex items-center justify-center min-h-0" }, renderModalContent()), /* @__PURE__ */ React.createElement("div", { className: "flex-shrink-0 p-2 flex justify-center items-center space-x-4" }, /* @__PURE__ */ React.createElement(
+      "button",
+      {
+        onClick: handlePrevious,
+        className: "p-2 bg-base-300 text-gray-300 rounded-full hover:bg-base-300/70 transition-colors"
+      },
+      /* @__PURE__ */ React.createElement("svg", { xmlns: "http://www.w3.org/2000/svg", fill: "none", viewBox: "0 0 24 24", strokeWidth: 1.5, stroke: "currentColor", className: "w-6 h-6" }, /* @__PURE__ */ React.createElement("path", { strokeLinecap: "round", strokeLinejoin: "round", d: "M15.75 19.5L8.25 12l7.5-7.5" }))
+    ), /* @__PURE__ */ React.createElement(
+      "button",
+      {
+        onClick: () => setModalIsOpen(false),
+        className: "px-4 py-2 bg-accent text-white rounded-md hover:bg-accent-focus transition-colors"
+      },
+      "Close"
+    ), /* @__PURE__ */ React.createElement(
+      "button",
+      {
+        onClick: handleNext,
+        className: "p-2 bg-base-300 text-gray-300 rounded-full hover:bg-base-300/70 transition-colors"
+      },
+      /* @__PURE__ */ React.createElement("svg", { xmlns: "http://www.w3.org/2000/svg", fill: "none", viewBox: "0 0 24 24", strokeWidth: 1.5, stroke: "currentColor", className: "w-6 h-6" }, /* @__PURE__ */ React.createElement("path", { strokeLinecap: "round", strokeLinejoin: "round", d: "M8.25 4.5l7.5 7.5-7.5 7.5" }))
+    )))
+  ));
+};
+const __default = Gallery;
+return { default: __default };
+})();
+// App.jsx
+__modules["App.jsx"] = (() => {
+const React = k;
+const HashRouter = Rv;
+const Routes = Ev;
+const Route = Ml;
+const Layout = __modules["components/Layout.jsx"].default;
+const MainPage = __modules["pages/MainPage.jsx"].default;
+const Gallery = __modules["pages/Gallery.jsx"].default;
+function App() {
+  return /* @__PURE__ */ React.createElement(HashRouter, null, /* @__PURE__ */ React.createElement(Routes, null, /* @__PURE__ */ React.createElement(Route, { path: "/", element: /* @__PURE__ */ React.createElement(Layout, null) }, /* @__PURE__ */ React.createElement(Route, { index: true, element: /* @__PURE__ */ React.createElement(MainPage, null) }), /* @__PURE__ */ React.createElement(Route, { path: "gallery", element: /* @__PURE__ */ React.createElement(Gallery, null) }))));
+}
+const __default = App;
+return { default: __default };
+})();
+// main.jsx
+__modules["main.jsx"] = (() => {
+const React = k;
+const ReactDOM = pi;
+const App = __modules["App.jsx"].default;
+
+ReactDOM.createRoot(document.getElementById("root")).render(
+  /* @__PURE__ */ React.createElement(React.StrictMode, null, /* @__PURE__ */ React.createElement(App, null))
+);
+return {  };
+})();
+})();
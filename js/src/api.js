@@ -16,6 +16,14 @@ export const getWorkflow = async (filename) => {
   return response.json();
 };
 
+export const getWorkflowBundle = async (filename) => {
+  const response = await fetch(`${BASE_URL}/workflows/${encodeURIComponent(filename)}/bundle`);
+  if (!response.ok) {
+    throw new Error(`Failed to fetch workflow: ${filename}`);
+  }
+  return response.json();
+};
+
 export const queuePrompt = async (prompt) => {
     const response = await fetch(window.location.protocol + '//' + window.location.host + '/prompt', {
         method: 'POST',
@@ -30,6 +38,49 @@ export const queuePrompt = async (prompt) => {
     return response.json();
 };
 
+// Turns a {"error", "node_errors"} body (ComfyUI's /prompt shape) into readable lines
+const describeQueueError = (body) => {
+    const error = body.error;
+    let message = typeof error === 'string' ? error : (error && error.message) || '';
+    if (error && error.details) {
+        message += `: ${error.details}`;
+    }
+    const nodeMessages = Object.values(body.node_errors || {}).flatMap(node =>
+        (node.errors || []).map(e => `${node.class_type}: ${e.message}${e.details ? ` (${e.details})` : ''}`)
+    );
+    return [message, ...nodeMessages].filter(Boolean).join('\n');
+};
+
+export const generate = async (request) => {
+    const response = await fetch(`${BASE_URL}/generate`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify(request)
+    });
+    if (!response.ok) {
+        const body = await response.json().catch(() => ({}));
+        const error = new Error(describeQueueError(body) || 'Failed to queue prompt');
+        error.status = response.status;
+        error.nodeErrors = body.node_errors || {};
+        throw error;
+    }
+    return response.json();
+};
+
+export const getEvents = async (since = 0, clientId = '', epoch = null, wait = 0) => {
+    const params = new URLSearchParams({ since, client_id: clientId, wait });
+    if (epoch) {
+        params.set('epoch', epoch);
+    }
+    const response = await fetch(`${BASE_URL}/events?${params}`);
+    if (!response.ok) {
+        throw new Error('Failed to fetch events');
+    }
+    return response.json();
+};
+
 export const getGallery = async (subfolder = '', page = 1, pageSize = 20) => {
     const response = await fetch(`/cozygen/gallery?subfolder=${encodeURIComponent(subfolder)}&page=${page}&per_page=${pageSize}`);
     if (!response.ok) {
@@ -38,6 +89,51 @@ export const getGallery = async (subfolder = '', page = 1, pageSize = 20) => {
     return response.json();
 };
 
+// Newest files anywhere under `subfolder`; pass the previous page's next_cursor to continue
+export const getGalleryTimeline = async (subfolder = '', cursor = null, pageSize = 20) => {
+    const query = new URLSearchParams({ subfolder, per_page: pageSize });
+    if (cursor) {
+        query.set('cursor', cursor);
+    }
+    const response = await fetch(`${BASE_URL}/gallery/timeline?${query}`);
+    if (!response.ok) {
+        throw new Error('Failed to fetch the gallery timeline');
+    }
+    return response.json();
+};
+
+// filters: { q, seed, model, params: { [param_name]: value }, subfolder }
+export const searchGallery = async (filters = {}, page = 1, pageSize = 20) => {
+    const query = new URLSearchParams({ page, per_page: pageSize });
+    for (const key of ['q', 'seed', 'model', 'subfolder']) {
+        if (filters[key] !== undefined && filters[key] !== '') {
+            query.set(key, filters[key]);
+        }
+    }
+    for (const [name, value] of Object.entries(filters.params || {})) {
+        query.set(`param.${name}`, value);
+    }
+    const response = await fetch(`${BASE_URL}/gallery/search?${query}`);
+    if (!response.ok) {
+        throw new Error('Failed to search the gallery');
+    }
+    return response.json();
+};
+
+export const getThumbnailUrl = (filename, subfolder = '', type = 'output', width = 256) => {
+  return `${BASE_URL}/thumb?filename=${encodeURIComponent(filename)}&subfolder=${encodeURIComponent(subfolder)}&type=${type}&width=${width}`;
+};
+
+// A ZIP of a gallery folder, streamed by the server; use it as a download link
+export const getGalleryExportUrl = (subfolder = '', recursive = false) => {
+  return `${BASE_URL}/gallery/export?subfolder=${encodeURIComponent(subfolder)}&recursive=${recursive ? 1 : 0}`;
+};
+
+// Gallery items come with a versioned `url`; this builds one for anything else
+export const getMediaUrl = (filename, subfolder = '', type = 'output') => {
+  return `${BASE_URL}/media?filename=${encodeURIComponent(filename)}&subfolder=${encodeURIComponent(subfolder)}&type=${type}`;
+};
+
 export const getChoices = async (type) => {
   const response = await fetch(`${BASE_URL}/get_choices?type=${encodeURIComponent(type)}`);
   if (!response.ok) {
@@ -46,15 +142,84 @@ export const getChoices = async (type) => {
   return response.json();
 };
 
-export const uploadImage = async (imageFile) => {
+// Files larger than this go through the resumable protocol, in chunks
+const RESUMABLE_UPLOAD_THRESHOLD = 4 * 1024 * 1024;
+const UPLOAD_RETRIES = 5;
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+// options: { normalize, maxSide } apply EXIF orientation and fit the image within maxSide on the server
+export const uploadImage = async (imageFile, options = {}) => {
+  const normalize = { normalize: !!options.normalize, max_side: options.maxSide || 0 };
+  if (imageFile.size > RESUMABLE_UPLOAD_THRESHOLD) {
+    return uploadResumable(imageFile, normalize);
+  }
   const formData = new FormData();
   formData.append('image', imageFile);
 
-  const response = await fetch(`${BASE_URL}/upload_image`, {
+  const response = await fetch(`${BASE_URL}/upload_image?${new URLSearchParams(normalize)}`, {
     method: 'POST',
     body: formData,
   });
 
+  if (!response.ok) {
+    throw new Error('Failed to upload image');
+  }
+  return response.json();
+};
+
+// Sends the file in chunks; after a network error it asks the server how
+// much arrived and continues from there instead of starting over.
+const uploadResumable = async (file, normalize) => {
+  const init = await fetch(`${BASE_URL}/upload`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ filename: file.name, size: file.size }),
+  });
+  if (!init.ok) {
+    throw new Error('Failed to start upload');
+  }
+  const { upload_id: uploadId, chunk_size: chunkSize } = await init.json();
+  const uploadUrl = `${BASE_URL}/upload/${uploadId}`;
+
+  let offset = 0;
+  let failures = 0;
+  while (offset < file.size) {
+    try {
+      const response = await fetch(`${uploadUrl}?offset=${offset}`, {
+        method: 'PUT',
+        body: file.slice(offset, offset + chunkSize),
+      });
+      const body = await response.json();
+      if (response.ok || response.status === 409) {
+        // 409 means the server has a different offset; continue from it
+        offset = body.offset;
+        failures = 0;
+        continue;
+      }
+      // 423: a dropped request is still writing to it; retried below
+      throw Object.assign(new Error(body.error || 'Failed to upload image'), { fatal: response.status !== 423 });
+    } catch (error) {
+      if (error.fatal || ++failures > UPLOAD_RETRIES) {
+        throw error;
+      }
+    }
+    await sleep(500 * 2 ** failures);
+    try {
+      const status = await fetch(uploadUrl);
+      if (status.ok) {
+        offset = (await status.json()).offset;
+      }
+    } catch (error) {
+      // Still offline; the next attempt will tell
+    }
+  }
+
+  const response = await fetch(`${uploadUrl}/finalize`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(normalize),
+  });
   if (!response.ok) {
     throw new Error('Failed to upload image');
   }
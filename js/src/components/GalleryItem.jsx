@@ -1,11 +1,12 @@
 import React from 'react';
+import { getMediaUrl } from '../api';
 
 const isVideo = (filename) => /\.(mp4|webm)$/i.test(filename);
 const isAudio = (filename) => /\.(mp3|wav|flac)$/i.test(filename);
 
 const GalleryItem = ({ item, onSelect }) => {
     const isDirectory = item.type === 'directory';
-    const fileUrl = isDirectory ? '' : `/view?filename=${item.filename}&subfolder=${item.subfolder}&type=output`;
+    const fileUrl = isDirectory ? '' : (item.url || getMediaUrl(item.filename, item.subfolder));
 
     const renderContent = () => {
         if (isDirectory) {
@@ -15,6 +16,9 @@ const GalleryItem = ({ item, onSelect }) => {
                 </div>
             );
         } else if (isVideo(item.filename)) {
+            if (item.preview || item.poster) {
+                return <img src={item.preview || item.poster} alt={item.filename} loading="lazy" className="w-full h-full object-cover" />;
+            }
             return <video src={fileUrl} muted className="w-full h-full object-cover" />;
         } else if (isAudio(item.filename)) {
             return (
@@ -23,7 +27,7 @@ const GalleryItem = ({ item, onSelect }) => {
                 </div>
             );
         } else {
-            return <img src={fileUrl} alt={item.filename} className="w-full h-full object-cover" />;
+            return <img src={item.thumbnail || item.preview || fileUrl} alt={item.filename} loading="lazy" className="w-full h-full object-cover" />;
         }
     };
 
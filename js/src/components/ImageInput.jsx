@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { getGallery, uploadImage } from '../api';
+import { getGallery, getThumbnailUrl, uploadImage } from '../api';
 
 const ImageInput = ({ input, value, onFormChange }) => {
     const [imageSource, setImageSource] = useState(value?.source || 'Upload'); // 'Upload' or 'Gallery'
@@ -28,7 +28,7 @@ const ImageInput = ({ input, value, onFormChange }) => {
         // When the component mounts or input changes, set the initial preview URL
         if (input.class_type === 'CozyGenImageInput') {
             if (value) { // If value (filename) exists
-                setPreviewUrl(`/view?filename=${value}&type=input`); // Construct URL from filename
+                setPreviewUrl(getThumbnailUrl(value, '', 'input')); // Construct URL from filename
             } else {
                 setPreviewUrl('');
             }
@@ -56,7 +56,8 @@ const ImageInput = ({ input, value, onFormChange }) => {
             setUploadedFile(file);
             setPreviewUrl(URL.createObjectURL(file)); // Local preview
             try {
-                const response = await uploadImage(file);
+                // The server applies the photo's EXIF orientation
+                const response = await uploadImage(file, { normalize: true });
                 // Update form data with the filename returned from the backend
                 onFormChange(input.inputs.param_name, { source: 'Upload', path: response.filename, url: `/view?filename=${response.filename}&type=input` });
             } catch (error) {
@@ -112,8 +113,7 @@ const ImageInput = ({ input, value, onFormChange }) => {
                         setPreviewUrl(URL.createObjectURL(resizedFile));
                         try {
                             const response = await uploadImage(resizedFile);
-                            const imageUrl = `/view?filename=${response.filename}&type=input`;
-                            setPreviewUrl(imageUrl);
+                            setPreviewUrl(getThumbnailUrl(response.filename, '', 'input'));
                             onFormChange(input.inputs.param_name, response.filename);
                         } catch (error) {
                             console.error("Error uploading image:", error);
@@ -127,9 +127,9 @@ const ImageInput = ({ input, value, onFormChange }) => {
         } else {
             setPreviewUrl(URL.createObjectURL(file));
             try {
-                const response = await uploadImage(file);
-                const imageUrl = `/view?filename=${response.filename}&subfolder=input&type=input`;
-                setPreviewUrl(imageUrl);
+                // The server applies the photo's EXIF orientation
+                const response = await uploadImage(file, { normalize: true });
+                setPreviewUrl(getThumbnailUrl(response.filename, '', 'input'));
                 onFormChange(input.inputs.param_name, response.filename);
             } catch (error) {
                 console.error("Error uploading image:", error);
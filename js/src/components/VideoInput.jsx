@@ -0,0 +1,132 @@
+import React, { useState, useEffect } from 'react';
+import { getGallery, getMediaUrl, uploadImage } from '../api';
+
+const isVideo = (filename) => /\.(mp4|webm)$/i.test(filename);
+
+// The node reads plain names from the input directory and "<path> [output]" from the gallery
+const OUTPUT_SUFFIX = ' [output]';
+
+const previewUrlFor = (value) => {
+    if (!value) return '';
+    if (value.endsWith(OUTPUT_SUFFIX)) {
+        const path = value.slice(0, -OUTPUT_SUFFIX.length);
+        const slash = path.lastIndexOf('/');
+        return getMediaUrl(path.slice(slash + 1), path.slice(0, Math.max(slash, 0)), 'output');
+    }
+    return getMediaUrl(value, '', 'input');
+};
+
+const VideoInput = ({ input, value, onFormChange }) => {
+    const [videoSource, setVideoSource] = useState(value && value.endsWith(OUTPUT_SUFFIX) ? 'Gallery' : 'Upload');
+    const [galleryItems, setGalleryItems] = useState([]);
+    const [currentGalleryPath, setCurrentGalleryPath] = useState('');
+    const [isUploading, setIsUploading] = useState(false);
+    const paramName = input.inputs.param_name;
+
+    useEffect(() => {
+        if (videoSource !== 'Gallery') return;
+        const fetchGallery = async () => {
+            try {
+                const data = await getGallery(currentGalleryPath, 1, 200);
+                setGalleryItems((data.items || []).filter(item => item.type === 'directory' || isVideo(item.filename)));
+            } catch (error) {
+                console.error("Error fetching gallery items:", error);
+            }
+        };
+        fetchGallery();
+    }, [videoSource, currentGalleryPath]);
+
+    const handleFileChange = async (e) => {
+        const file = e.target.files[0];
+        if (!file) return;
+        setIsUploading(true);
+        try {
+            // Uploads are stored by content hash, so picking the same clip again is free
+            const response = await uploadImage(file);
+            onFormChange(paramName, response.filename);
+        } catch (error) {
+            console.error("Error uploading video:", error);
+        } finally {
+            setIsUploading(false);
+        }
+    };
+
+    const handleGallerySelect = (item) => {
+        if (item.type === 'directory') {
+            setCurrentGalleryPath(item.subfolder);
+            return;
+        }
+        const path = item.subfolder ? `${item.subfolder.replace(/\\/g, '/')}/${item.filename}` : item.filename;
+        onFormChange(paramName, `${path}${OUTPUT_SUFFIX}`);
+    };
+
+    const previewUrl = previewUrlFor(value);
+
+    return (
+        <div className="form-control mb-4 p-3 bg-base-200 rounded-box shadow-lg">
+            <label className="label">
+                <span className="label-text text-lg font-semibold">{paramName}</span>
+            </label>
+
+            <div className="flex items-center space-x-2 mb-4">
+                <select
+                    className="select select-bordered w-full max-w-xs"
+                    value={videoSource}
+                    onChange={(e) => setVideoSource(e.target.value)}
+                >
+                    <option value="Upload">Upload Video</option>
+                    <option value="Gallery">Select from Gallery</option>
+                </select>
+                <button onClick={() => onFormChange(paramName, '')} className="btn btn-sm btn-outline">Clear</button>
+            </div>
+
+            {videoSource === 'Upload' ? (
+                <input
+                    type="file"
+                    accept="video/*, image/gif"
+                    onChange={handleFileChange}
+                    disabled={isUploading}
+                    className="file-input file-input-bordered w-full mb-2"
+                />
+            ) : (
+                <div className="mb-2">
+                    <div className="flex items-center space-x-2 mb-2">
+                        <span className="text-sm text-gray-400">Current Path: {currentGalleryPath || '/'}</span>
+                        {currentGalleryPath && (
+                            <button onClick={() => setCurrentGalleryPath('')} className="btn btn-xs btn-ghost">Back to Root</button>
+                        )}
+                    </div>
+                    <div className="grid grid-cols-3 gap-2 max-h-64 overflow-y-auto">
+                        {galleryItems.map(item => (
+                            <button
+                                key={`${item.subfolder}/${item.filename}`}
+                                onClick={() => handleGallerySelect(item)}
+                                className="bg-base-300 rounded-md overflow-hidden text-xs text-left"
+                            >
+                                {item.type === 'directory' ? (
+                                    <div className="h-16 flex items-center justify-center text-gray-400">[DIR]</div>
+                                ) : (
+                                    <img src={item.poster} alt={item.filename} loading="lazy" className="w-full h-16 object-cover" />
+                                )}
+                                <p className="p-1 truncate">{item.filename}</p>
+                            </button>
+                        ))}
+                    </div>
+                </div>
+            )}
+
+            {isUploading && <p className="text-sm text-gray-400">Uploading...</p>}
+            {previewUrl && (
+                <div className="mt-2 flex justify-center">
+                    {/\.gif( \[output\])?$/i.test(value) ? (
+                        <img src={previewUrl} alt="Video Preview" className="max-w-full h-auto rounded-lg shadow-md" style={{ maxHeight: '240px' }} />
+                    ) : (
+                        <video src={previewUrl} muted loop autoPlay playsInline className="max-w-full h-auto rounded-lg shadow-md" style={{ maxHeight: '240px' }} />
+                    )}
+                </div>
+            )}
+        </div>
+    );
+};
+
+export default VideoInput;
@@ -1,5 +1,5 @@
-import React, { useState, useEffect } from 'react';
-import { getGallery } from '../api';
+import React, { useState, useEffect, useRef } from 'react';
+import { getGallery, getGalleryTimeline, getMediaUrl, getGalleryExportUrl } from '../api';
 import GalleryItem from '../components/GalleryItem';
 import Modal from 'react-modal'; // Using react-modal for accessibility
 import { TransformWrapper, TransformComponent } from "react-zoom-pan-pinch";
@@ -46,10 +46,21 @@ const Gallery = () => {
     const [page, setPage] = useState(1);
     const [totalPages, setTotalPages] = useState(1);
     const [pageSize, setPageSize] = useState(parseInt(localStorage.getItem('galleryPageSize'), 10) || 20);
+    // Timeline mode lists the newest files from every sub-folder of `path`
+    const [timeline, setTimeline] = useState(localStorage.getItem('galleryTimeline') === 'true');
+    // Timeline pages are cursor-based: cursors.current[n] continues after page n
+    const cursors = useRef([null]);
 
     useEffect(() => {
         const fetchGallery = async () => {
             try {
+                if (timeline) {
+                    const timelineData = await getGalleryTimeline(path, page > 1 ? cursors.current[page - 1] : null, pageSize);
+                    cursors.current[page] = timelineData.next_cursor;
+                    setItems(timelineData.items);
+                    setTotalPages(timelineData.next_cursor ? Math.max(page + 1, Math.ceil(timelineData.total_items / pageSize)) : page);
+                    return;
+                }
                 const galleryData = await getGallery(path, page, pageSize);
                 if (galleryData && galleryData.items) {
                     setItems(galleryData.items);
@@ -66,7 +77,13 @@ const Gallery = () => {
         };
         fetchGallery();
         localStorage.setItem('galleryPath', path);
-    }, [path, page, pageSize]);
+    }, [path, page, pageSize, timeline]);
+
+    const handleTimelineToggle = () => {
+        setTimeline(!timeline);
+        setPage(1);
+        localStorage.setItem('galleryTimeline', !timeline);
+    };
 
     const handleSelect = (item) => {
         if (item.type === 'directory') {
@@ -124,7 +141,7 @@ const Gallery = () => {
     const renderModalContent = () => {
         if (!selectedItem) return null;
 
-        const fileUrl = `/view?filename=${selectedItem.filename}&subfolder=${selectedItem.subfolder}&type=output`;
+        const fileUrl = selectedItem.url || getMediaUrl(selectedItem.filename, selectedItem.subfolder);
 
         if (isVideo(selectedItem.filename)) {
             return <video src={fileUrl} controls autoPlay loop className="max-w-full max-h-full object-contain rounded-lg" />;
@@ -171,6 +188,27 @@ const Gallery = () => {
                     </svg>
                     Up
                 </button>
+                {/* Newest first across all sub-folders */}
+                <button
+                    onClick={handleTimelineToggle}
+                    className={`ml-2 px-3 py-1 rounded-md text-sm transition-colors flex items-center ${timeline ? 'bg-accent text-white' : 'bg-base-300 text-gray-300 hover:bg-base-300/70'}`}
+                >
+                    <svg xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" strokeWidth={1.5} stroke="currentColor" className="w-4 h-4 mr-1">
+                        <path strokeLinecap="round" strokeLinejoin="round" d="M12 6v6h4.5m4.5 0a9 9 0 1 1-18 0 9 9 0 0 1 18 0Z" />
+                    </svg>
+                    Latest
+                </button>
+                {/* Download the current folder and its sub-folders as a ZIP */}
+                <a
+                    href={getGalleryExportUrl(path, true)}
+                    download
+                    className="ml-2 px-3 py-1 bg-base-300 text-gray-300 rounded-md text-sm hover:bg-base-300/70 transition-colors flex items-center"
+                >
+                    <svg xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" strokeWidth={1.5} stroke="currentColor" className="w-4 h-4 mr-1">
+                        <path strokeLinecap="round" strokeLinejoin="round" d="M3 16.5v2.25A2.25 2.25 0 0 0 5.25 21h13.5A2.25 2.25 0 0 0 21 18.75V16.5M16.5 12 12 16.5m0 0L7.5 12m4.5 4.5V3" />
+                    </svg>
+                    Download
+                </a>
             </div>
 
             <div className="flex justify-center items-center space-x-4 mb-4">
@@ -209,7 +247,7 @@ const Gallery = () => {
 
             <div className="grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-5 xl:grid-cols-6 gap-4">
                 {items.map(item => (
-                    <GalleryItem key={item.filename} item={item} onSelect={handleSelect} />
+                    <GalleryItem key={`${item.subfolder}/${item.filename}`} item={item} onSelect={handleSelect} />
                 ))}
             </div>
 
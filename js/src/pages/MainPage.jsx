@@ -2,7 +2,8 @@ import React, { useState, useEffect, useRef } from 'react';
 import WorkflowSelector from '../components/WorkflowSelector';
 import DynamicForm from '../components/DynamicForm';
 import ImageInput from '../components/ImageInput'; // Import ImageInput
-import { getWorkflows, getWorkflow, queuePrompt, getChoices } from '../api';
+import VideoInput from '../components/VideoInput';
+import { getWorkflows, getWorkflowBundle, generate, getEvents } from '../api';
 import Modal from 'react-modal';
 import { TransformWrapper, TransformComponent } from "react-zoom-pan-pinch";
 
@@ -78,14 +79,15 @@ const findNodesByType = (workflow, type) => {
     return nodes.filter(node => node.class_type === type);
 };
 
-const choiceTypeMapping = {
-  "clip_name1": "clip",
-  "clip_name2": "clip",
-  "unet_name": "unet",
-  "vae_name": "vae",
-  "sampler_name": "sampler",
-  "scheduler": "scheduler",
-  // Add more mappings as needed
+// Identifies this tab to ComfyUI so results are only delivered here. It is
+// kept in sessionStorage, so a reload still receives earlier prompts' results.
+const getClientId = () => {
+  let clientId = sessionStorage.getItem('cozygenClientId');
+  if (!clientId) {
+    clientId = Date.now().toString(36) + Math.random().toString(36).slice(2);
+    sessionStorage.setItem('cozygenClientId', clientId);
+  }
+  return clientId;
 };
 
 function App() {
@@ -107,6 +109,7 @@ function App() {
   const [modalIsOpen, setModalIsOpen] = useState(false);
   const [statusText, setStatusText] = useState('Generating...');
   const workflowDataRef = useRef(null);
+  const lastEventRef = useRef({ epoch: null, seq: 0 });
 
   useEffect(() => {
     workflowDataRef.current = workflowData;
@@ -119,12 +122,47 @@ function App() {
 
   // --- WebSocket Connection ---
   useEffect(() => {
+    const handleResultEvent = (type, data) => {
+        if (typeof data.seq === 'number') {
+            lastEventRef.current.seq = Math.max(lastEventRef.current.seq, data.seq);
+        }
+        if (type === 'cozygen_batch_ready') {
+            const imageUrls = data.images.map(image => image.url);
+            if (imageUrls.length > 0) {
+                setPreviewImages(imageUrls);
+                localStorage.setItem('lastPreviewImages', JSON.stringify(imageUrls));
+            }
+            setIsLoading(false);
+            setProgressValue(0);
+            setProgressMax(0);
+            setStatusText('Finished');
+        }
+    };
+
+    // Fetch the result events sent while the socket was down
+    const catchUpResultEvents = async () => {
+      const { epoch, seq } = lastEventRef.current;
+      try {
+        const result = await getEvents(seq, getClientId(), epoch);
+        lastEventRef.current.epoch = result.epoch;
+        if (epoch === null) {
+            // First connection: only remember where the server is
+            lastEventRef.current.seq = Math.max(seq, result.latest_seq);
+            return;
+        }
+        result.events.forEach(event => handleResultEvent(event.type, event.data));
+      } catch (error) {
+        console.error('CozyGen: Could not fetch missed events: ', error);
+      }
+    };
+
     const connectWebSocket = () => {
       const protocol = window.location.protocol === 'https' ? 'wss' : 'ws';
       const host = window.location.host;
-      const wsUrl = `${protocol}://${host}/ws`;
+      const wsUrl = `${protocol}://${host}/ws?clientId=${encodeURIComponent(getClientId())}`;
 
       websocketRef.current = new WebSocket(wsUrl);
+      websocketRef.current.onopen = catchUpResultEvents;
 
       websocketRef.current.onmessage = (event) => {
         if (typeof event.data !== 'string') {
@@ -134,16 +172,8 @@ function App() {
 
         const msg = JSON.parse(event.data);
 
-        if (msg.type === 'cozygen_batch_ready') {
-            const imageUrls = msg.data.images.map(image => image.url);
-            if (imageUrls.length > 0) {
-                setPreviewImages(imageUrls);
-                localStorage.setItem('lastPreviewImages', JSON.stringify(imageUrls));
-            }
-            setIsLoading(false);
-            setProgressValue(0);
-            setProgressMax(0);
-            setStatusText('Finished');
+        if (msg.type === 'cozygen_batch_ready' || msg.type === 'cozygen_video_ready') {
+            handleResultEvent(msg.type, msg.data);
         } else if (msg.type === 'executing') {
             const nodeId = msg.data.node;
             // If nodeId is null, it means the prompt is finished, but we wait for our own message.
@@ -195,69 +225,11 @@ function App() {
 
     const fetchWorkflowData = async () => {
       try {
-        const data = await getWorkflow(selectedWorkflow);
-        setWorkflowData(data);
-
-        // Ensure param_name is present in CozyGenImageInput nodes within the workflowData
-        for (const nodeId in data) {
-            const node = data[nodeId];
-            if (node.class_type === 'CozyGenImageInput') {
-                if (!node.inputs.param_name) {
-                    node.inputs.param_name = "Image Input"; // Set default if missing
-                }
-            }
-        }
-
-        // New: Define all input types the UI should recognize
-        const COZYGEN_INPUT_TYPES = [
-            'CozyGenDynamicInput', 
-            'CozyGenImageInput', 
-            'CozyGenFloatInput', 
-            'CozyGenIntInput', 
-            'CozyGenStringInput',
-            'CozyGenChoiceInput'
-        ];
-
-        // Find all nodes that are one of our recognized input types
-        const allInputNodes = Object.values(data).filter(node => COZYGEN_INPUT_TYPES.includes(node.class_type));
-
-        // Add the node's ID to its object for easy reference
-        for (const nodeId in data) {
-            if (COZYGEN_INPUT_TYPES.includes(data[nodeId].class_type)) {
-                data[nodeId].id = nodeId;
-            }
-        }
-
-        // Sort all inputs by the priority field
-        allInputNodes.sort((a, b) => (a.inputs['priority'] || 0) - (b.inputs['priority'] || 0));
-
-        // Fetch choices for dropdowns (applies to both Dynamic and Choice inputs)
-        const inputsWithChoices = await Promise.all(allInputNodes.map(async (input) => {
-            const isDynamicDropdown = input.class_type === 'CozyGenDynamicInput' && input.inputs['param_type'] === 'DROPDOWN';
-            const isChoiceNode = input.class_type === 'CozyGenChoiceInput';
-
-            if (isDynamicDropdown || isChoiceNode) {
-                const param_name = input.inputs['param_name'];
-                let choiceType = input.inputs['choice_type'] || (input.properties && input.properties['choice_type']);
-
-                if (!choiceType && isDynamicDropdown) { // Fallback for older dynamic nodes
-                    choiceType = choiceTypeMapping[param_name];
-                }
-
-                if (choiceType) {
-                    try {
-                        const choicesData = await getChoices(choiceType);
-                        // For dynamic nodes, we put choices in a hidden field.
-                        // For the new choice node, the JS will handle it, but we can preload here.
-                        input.inputs.choices = choicesData.choices || [];
-                    } catch (error) {
-                        console.error(`Error fetching choices for ${param_name} (choiceType: ${choiceType}):`, error);
-                        input.inputs.choices = [];
-                    }
-                }
-            }
-            return input;
-        }));
+        // The workflow, its input nodes in priority order and all dropdown
+        // choices come back in a single request.
+        const bundle = await getWorkflowBundle(selectedWorkflow);
+        setWorkflowData(bundle.workflow);
+        const inputsWithChoices = bundle.inputs;
 
         setDynamicInputs(inputsWithChoices);
 
@@ -278,7 +250,7 @@ function App() {
                     }
                 } else if (input.class_type === 'CozyGenChoiceInput') {
                     defaultValue = input.inputs.choices && input.inputs.choices.length > 0 ? input.inputs.choices[0] : '';
-                } else if (input.class_type === 'CozyGenImageInput') {
+                } else if (input.class_type === 'CozyGenImageInput' || input.class_type === 'CozyGenVideoInput') {
                     defaultValue = '';
                 }
                 initialFormData[param_name] = defaultValue;
@@ -340,102 +312,45 @@ function App() {
     setStatusText('Queuing prompt...');
 
     try {
-        let finalWorkflow = JSON.parse(JSON.stringify(workflowData));
-
-        // --- Bypass and Value Injection Logic (condensed for brevity) ---
-        const COZYGEN_INPUT_TYPES_WITH_BYPASS = ['CozyGenDynamicInput', 'CozyGenChoiceInput'];
-        const bypassedNodes = dynamicInputs.filter(dn => bypassedState[dn.inputs.param_name] && COZYGEN_INPUT_TYPES_WITH_BYPASS.includes(dn.class_type));
-        
-        for (const bypassedNode of bypassedNodes) {
-            // Find the node that our CozyGen input is connected to (e.g., a LoraLoader).
-            let targetNodeId = Object.keys(finalWorkflow).find(id => 
-                Object.values(finalWorkflow[id].inputs).some(input => Array.isArray(input) && input[0] === bypassedNode.id)
-            );
-
-            if (!targetNodeId) continue;
-
-            const targetNode = finalWorkflow[targetNodeId];
-
-            // Find the "real" upstream input to the target node (e.g., the model output from a previous loader).
-            // This is the input we want to connect *past* the bypassed node.
-            const upstreamSources = {};
-            for (const inputName in targetNode.inputs) {
-                const input = targetNode.inputs[inputName];
-                if (Array.isArray(input) && finalWorkflow[input[0]] && !COZYGEN_INPUT_TYPES_WITH_BYPASS.includes(finalWorkflow[input[0]].class_type)) {
-                    upstreamSources[inputName] = input;
-                }
-            }
-
-            // If there's no other upstream source, we can't bypass.
-            if (Object.keys(upstreamSources).length === 0) continue;
-
-            // Find all nodes that are connected to our target node.
-            const downstreamConnections = [];
-            for (const nodeId in finalWorkflow) {
-                for (const inputName in finalWorkflow[nodeId].inputs) {
-                    const input = finalWorkflow[nodeId].inputs[inputName];
-                    if (Array.isArray(input) && input[0] === targetNodeId) {
-                        downstreamConnections.push({ nodeId, inputName });
-                    }
-                }
-            }
-
-            // Rewire the downstream connections to point to the upstream source, skipping the target.
-            for (const conn of downstreamConnections) {
-                // The input name on the downstream node should match the input name on the target node
-                // that had the upstream source. E.g., 'MODEL' -> 'MODEL'.
-                const upstreamSource = upstreamSources[conn.inputName];
-                if (upstreamSource) {
-                    finalWorkflow[conn.nodeId].inputs[conn.inputName] = upstreamSource;
-                }
-            }
-
-            // Delete the bypassed nodes from the workflow.
-            delete finalWorkflow[targetNodeId];
-            delete finalWorkflow[bypassedNode.id];
-        }
-
         let updatedFormData = { ...formData };
         dynamicInputs.forEach(dynamicNode => {
-            if (!finalWorkflow[dynamicNode.id]) return;
             const param_name = dynamicNode.inputs.param_name;
-            if (dynamicNode.class_type === 'CozyGenImageInput') return;
+            if (dynamicNode.class_type === 'CozyGenImageInput' || dynamicNode.class_type === 'CozyGenVideoInput') return;
             let valueToInject = randomizeState[param_name] 
                 ? (dynamicNode.inputs.param_type === 'FLOAT' ? Math.random() * ((dynamicNode.inputs.max_value || 1000000) - (dynamicNode.inputs.min_value || 0)) + (dynamicNode.inputs.min_value || 0) : Math.floor(Math.random() * ((dynamicNode.inputs.max_value || 1000000) - (dynamicNode.inputs.min_value || 0) + 1)) + (dynamicNode.inputs.min_value || 0))
                 : formData[param_name];
             updatedFormData[param_name] = valueToInject;
-
-            const nodeToUpdate = finalWorkflow[dynamicNode.id];
-            if (nodeToUpdate) {
-                if (['CozyGenFloatInput', 'CozyGenIntInput', 'CozyGenStringInput', 'CozyGenDynamicInput'].includes(dynamicNode.class_type)) {
-                    nodeToUpdate.inputs.default_value = valueToInject;
-                } else if (dynamicNode.class_type === 'CozyGenChoiceInput') {
-                    nodeToUpdate.inputs.value = valueToInject;
-                }
-            }
         });
         setFormData(updatedFormData);
         localStorage.setItem(`${selectedWorkflow}_formData`, JSON.stringify(updatedFormData));
 
-        const imageInputNodes = dynamicInputs.filter(dn => dn.class_type === 'CozyGenImageInput');
-        for (const node of imageInputNodes) {
-            const image_filename = formData[node.inputs.param_name];
-            if (!image_filename) {
-                alert(`Please upload an image for "${node.inputs.param_name}" before generating.`);
+        const fileInputNodes = dynamicInputs.filter(dn => dn.class_type === 'CozyGenImageInput' || dn.class_type === 'CozyGenVideoInput');
+        for (const node of fileInputNodes) {
+            const filename = formData[node.inputs.param_name];
+            if (!filename) {
+                const kind = node.class_type === 'CozyGenVideoInput' ? 'a video' : 'an image';
+                alert(`Please upload ${kind} for "${node.inputs.param_name}" before generating.`);
                 setIsLoading(false);
                 return;
             }
-            if (finalWorkflow[node.id]) {
-                finalWorkflow[node.id].inputs.image_filename = image_filename;
-            }
         }
 
-        await queuePrompt({ prompt: finalWorkflow });
+        // The server compiles the stored workflow (bypasses and value injection) and queues it
+        await generate({
+            workflow: selectedWorkflow,
+            values: updatedFormData,
+            bypass: bypassedState,
+            client_id: getClientId(),
+        });
 
     } catch (error) {
         console.error("Failed to queue prompt:", error);
         setIsLoading(false);
         setStatusText('Error queuing prompt');
+        // The workflow or a value was rejected (e.g. node validation); say why
+        if (error.status === 400) {
+            alert(error.message);
+        }
     }
   };
 
@@ -495,7 +410,7 @@ function App() {
                 {/* New, Corrected Rendering Logic */}
                 <DynamicForm
                     inputs={dynamicInputs
-                        .filter(input => input.class_type !== 'CozyGenImageInput')
+                        .filter(input => input.class_type !== 'CozyGenImageInput' && input.class_type !== 'CozyGenVideoInput')
                         .map(input => {
                             // Map new static node properties to the format DynamicForm expects
                             if (['CozyGenFloatInput', 'CozyGenIntInput', 'CozyGenStringInput', 'CozyGenChoiceInput'].includes(input.class_type)) {
@@ -533,6 +448,15 @@ function App() {
                         onFormChange={handleFormChange}
                     />
                 ))}
+
+                {dynamicInputs.filter(input => input.class_type === 'CozyGenVideoInput').map(input => (
+                    <VideoInput
+                        key={input.id}
+                        input={input}
+                        value={formData[input.inputs.param_name]}
+                        onFormChange={handleFormChange}
+                    />
+                ))}
             </div>
         </div>
 
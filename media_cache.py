@@ -0,0 +1,309 @@
+import os
+import hashlib
+import logging
+import threading
+import collections
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import folder_paths
+
+from . import metrics
+
+logger = logging.getLogger("CozyGen")
+
+# imageio, NumPy and Pillow are imported where they are used, so loading the
+# package stays cheap until the first thumbnail or preview is rendered.
+
+# Thumbnail widths are snapped up to one of these so the cache stays small and
+# the gallery and image pickers share entries.
+THUMBNAIL_WIDTHS = (128, 256, 384, 512, 768, 1024)
+THUMBNAIL_FORMATS = {
+    "webp": ("WEBP", "image/webp"),
+    "jpeg": ("JPEG", "image/jpeg"),
+}
+THUMBNAIL_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.avif', '.gif')
+
+# Video previews: a JPEG poster frame plus a short, looping animated WebP
+VIDEO_EXTENSIONS = ('.mp4', '.webm', '.gif')
+VIDEO_PREVIEW_KINDS = {
+    "poster": ("jpg", "image/jpeg"),
+    "preview": ("webp", "image/webp"),
+}
+PREVIEW_WIDTH = 256
+PREVIEW_FPS = 8
+PREVIEW_MAX_FRAMES = 24
+
+
+def snap_thumbnail_width(width):
+    for candidate in THUMBNAIL_WIDTHS:
+        if width <= candidate:
+            return candidate
+    return THUMBNAIL_WIDTHS[-1]
+
+
+def render_thumbnail(dest_path, src_path, width, fmt, quality=80):
+    """Writes a thumbnail of ``src_path`` that is at most ``width`` pixels wide."""
+    from PIL import Image, ImageOps
+    pil_format, _ = THUMBNAIL_FORMATS[fmt]
+    with Image.open(src_path) as img:
+        # Let the JPEG decoder downscale while decoding when it can
+        img.draft("RGB", (width, width))
+        img = ImageOps.exif_transpose(img)
+        if img.width > width:
+            img.thumbnail((width, max(1, round(img.height * width / img.width))), Image.Resampling.LANCZOS)
+        if pil_format == "JPEG" or img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if pil_format == "WEBP" and "A" in img.getbands() else "RGB")
+        tmp_path = f"{dest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        save_options = {"quality": quality}
+        if pil_format == "WEBP":
+            save_options["method"] = 4
+        img.save(tmp_path, format=pil_format, **save_options)
+    os.replace(tmp_path, dest_path)
+
+
+def sample_preview_frames(frame_count, fps):
+    """Returns the frame indices used for a video preview and the preview frame rate."""
+    step = max(1, round(fps / PREVIEW_FPS))
+    indices = list(range(0, frame_count, step))[:PREVIEW_MAX_FRAMES]
+    return indices, fps / step
+
+
+def preview_frame(frame):
+    """Downscales a uint8 HxWxC frame to the preview width."""
+    import numpy as np
+    from PIL import Image
+    img = Image.fromarray(np.asarray(frame)).convert("RGB")
+    if img.width > PREVIEW_WIDTH:
+        img = img.resize((PREVIEW_WIDTH, max(1, round(img.height * PREVIEW_WIDTH / img.width))), Image.Resampling.BILINEAR)
+    return img
+
+
+def read_preview_frames(src_path, max_frames=PREVIEW_MAX_FRAMES):
+    """Decodes only the frames needed for a preview of a video file."""
+    import imageio
+    reader = imageio.get_reader(src_path)
+    try:
+        meta = reader.get_meta_data()
+        if meta.get("fps"):
+            fps = meta["fps"]
+        elif meta.get("duration"):
+            fps = 1000.0 / meta["duration"]  # GIF frame duration in ms
+        else:
+            fps = PREVIEW_FPS
+        step = max(1, round(fps / PREVIEW_FPS))
+        frames = []
+        for i, frame in enumerate(reader):
+            if i % step:
+                continue
+            frames.append(preview_frame(frame))
+            if len(frames) >= max_frames:
+                break
+    finally:
+        reader.close()
+    return frames, fps / step
+
+
+def render_video_preview(dest_path, kind, frames, fps):
+    """Writes a poster JPEG or an animated WebP preview from downscaled PIL frames."""
+    tmp_path = f"{dest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    if kind == "poster":
+        frames[0].save(tmp_path, format="JPEG", quality=80)
+    else:
+        frames[0].save(tmp_path, format="WEBP", save_all=True, append_images=frames[1:],
+                       duration=round(1000 / fps), loop=0, quality=50, method=4)
+    os.replace(tmp_path, dest_path)
+
+
+def _render_video_preview_from_file(dest_path, src_path, kind):
+    frames, fps = read_preview_frames(src_path, max_frames=1 if kind == "poster" else PREVIEW_MAX_FRAMES)
+    if not frames:
+        raise OSError(f"No frames could be decoded from {src_path}")
+    render_video_preview(dest_path, kind, frames, fps)
+
+
+def _render_video_preview_from_frames(dest_path, frames, fps, kind):
+    render_video_preview(dest_path, kind, [preview_frame(frame) for frame in frames], fps)
+
+
+class MediaCache:
+    """Content-keyed disk cache for derived media (thumbnails, previews).
+
+    Entries are keyed by the source path, mtime and size plus the variant
+    parameters, so a changed source never serves a stale entry. The total size
+    is kept under ``max_bytes`` by evicting the least recently used entries;
+    recency survives restarts through the files' mtimes.
+    """
+
+    def __init__(self, cache_dir, max_bytes, workers=2):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self._entries = collections.OrderedDict()  # filename -> size, oldest first
+        self._total_bytes = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        # Called with the lock held
+        if self._loaded:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        found = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    st = entry.stat()
+                    found.append((st.st_mtime, entry.name, st.st_size))
+        for _, name, size in sorted(found):
+            self._entries[name] = size
+            self._total_bytes += size
+        self._loaded = True
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="cozygen_media")
+        return self._executor
+
+    @staticmethod
+    def make_key(src_path, st, *variant):
+        raw = "|".join([os.path.abspath(src_path), str(st.st_mtime_ns), str(st.st_size)] + [str(v) for v in variant])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, name):
+        """Returns the path of a cached entry, marking it as recently used, or None."""
+        with self._lock:
+            self._load()
+            if name not in self._entries:
+                return None
+            self._entries.move_to_end(name)
+        path = os.path.join(self.cache_dir, name)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self.discard(name)
+            return None
+        return path
+
+    def add(self, name):
+        """Registers a file written to ``cache_dir`` and evicts old entries if over budget."""
+        path = os.path.join(self.cache_dir, name)
+        size = os.path.getsize(path)
+        evicted = []
+        with self._lock:
+            self._load()
+            self._total_bytes += size - self._entries.pop(name, 0)
+            self._entries[name] = size
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                old_name, old_size = self._entries.popitem(last=False)
+                self._total_bytes -= old_size
+                evicted.append(old_name)
+        for old_name in evicted:
+            try:
+                os.remove(os.path.join(self.cache_dir, old_name))
+            except FileNotFoundError:
+                pass
+        return path
+
+    def discard(self, name):
+        with self._lock:
+            size = self._entries.pop(name, None)
+            if size is not None:
+                self._total_bytes -= size
+
+    def get_or_create(self, name, producer, *args):
+        """Returns a future resolving to the cached path for ``name``.
+
+        ``producer(dest_path, *args)`` runs on the worker pool on a miss.
+        Concurrent requests for the same entry share one job.
+        """
+        path = self.lookup(name)
+        if path is not None:
+            with self._lock:
+                self.hits += 1
+            return _completed_future(path)
+        with self._lock:
+            future = self._pending.get(name)
+            if future is not None:
+                self.hits += 1
+                return future
+            self.misses += 1
+            future = self._get_executor().submit(self._produce, name, producer, args)
+            self._pending[name] = future
+        return future
+
+    def _produce(self, name, producer, args):
+        try:
+            producer(os.path.join(self.cache_dir, name), *args)
+            return self.add(name)
+        finally:
+            with self._lock:
+                self._pending.pop(name, None)
+
+    def thumbnail(self, src_path, width, fmt="webp"):
+        """Returns a future resolving to the path of a thumbnail for ``src_path``."""
+        st = os.stat(src_path)
+        width = snap_thumbnail_width(width)
+        name = f"{self.make_key(src_path, st, 'thumb', width, fmt)}.{fmt}"
+        return self.get_or_create(name, render_thumbnail, src_path, width, fmt)
+
+    def video_preview(self, src_path, kind):
+        """Returns a future resolving to the poster or preview of a video, decoding it lazily."""
+        name = self._video_preview_name(src_path, os.stat(src_path), kind)
+        return self.get_or_create(name, _render_video_preview_from_file, src_path, kind)
+
+    def add_video_previews(self, src_path, frames, fps):
+        """Queues the poster and preview of a just-written video from frames already in memory.
+
+        ``frames`` are the uint8 frames picked with :func:`sample_preview_frames`.
+        """
+        st = os.stat(src_path)
+        for kind in VIDEO_PREVIEW_KINDS:
+            future = self.get_or_create(self._video_preview_name(src_path, st, kind), _render_video_preview_from_frames, frames, fps, kind)
+            future.add_done_callback(_report_failure)
+
+    def _video_preview_name(self, src_path, st, kind):
+        ext, _ = VIDEO_PREVIEW_KINDS[kind]
+        return f"{self.make_key(src_path, st, 'video', kind, PREVIEW_WIDTH)}.{ext}"
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._total_bytes, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses}
+
+
+def _report_failure(future):
+    error = future.exception()
+    if error is not None:
+        logger.exception("Could not create video preview", exc_info=error)
+
+
+def _completed_future(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def _default_cache_dir():
+    configured = os.environ.get("COZYGEN_CACHE_DIR")
+    if configured:
+        return configured
+    # Prefer the user directory (persistent) over the temp directory, which
+    # ComfyUI clears on startup.
+    if hasattr(folder_paths, "get_user_directory"):
+        return os.path.join(folder_paths.get_user_directory(), "cozygen_cache")
+    return os.path.join(folder_paths.get_temp_directory(), "cozygen_cache")
+
+
+media_cache = MediaCache(
+    cache_dir=_default_cache_dir(),
+    max_bytes=int(float(os.environ.get("COZYGEN_CACHE_MAX_MB", "1024")) * 1024 * 1024),
+    workers=int(os.environ.get("COZYGEN_MEDIA_WORKERS", "2")),
+)
+
+metrics.registry.callback("cozygen_media_cache_hits_total", "Thumbnail and preview requests served from the cache.", lambda: media_cache.hits, "counter")
+metrics.registry.callback("cozygen_media_cache_misses_total", "Thumbnails and previews that had to be rendered.", lambda: media_cache.misses, "counter")
+metrics.registry.callback("cozygen_media_cache_bytes", "Size of the thumbnail and preview cache.", lambda: media_cache.stats()["bytes"])
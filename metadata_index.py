@@ -0,0 +1,452 @@
+import os
+import json
+import time
+import queue
+import logging
+import threading
+
+import folder_paths
+
+from . import metrics
+from .gallery_index import GALLERY_EXTENSIONS
+from .workflow_compiler import COZYGEN_INPUT_TYPES, VALUE_INPUT_FIELDS, FILE_INPUT_FIELDS
+
+logger = logging.getLogger("CozyGen")
+
+# Bump when the tables or the extracted fields change; the index is then rebuilt
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outputs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    subfolder TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    fields TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outputs_by_time ON outputs (mtime_ns DESC, id DESC);
+CREATE INDEX IF NOT EXISTS outputs_by_subfolder ON outputs (subfolder);
+CREATE TABLE IF NOT EXISTS output_params (
+    output_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS output_params_lookup ON output_params (kind, name, value);
+CREATE INDEX IF NOT EXISTS output_params_by_output ON output_params (output_id);
+CREATE TABLE IF NOT EXISTS models (name TEXT PRIMARY KEY) WITHOUT ROWID;
+"""
+
+# Inputs that hold a sampler seed
+SEED_INPUTS = ("seed", "noise_seed")
+
+# String inputs ending in one of these name a model file
+MODEL_EXTENSIONS = (".safetensors", ".ckpt", ".pt", ".pth", ".bin", ".gguf", ".sft")
+
+# Formats ComfyUI-style savers embed the prompt and workflow in
+METADATA_EXTENSIONS = (".png", ".webp", ".jpg", ".jpeg", ".avif")
+
+# Files indexed per transaction, so searches see a long reindex make progress
+INDEX_BATCH_SIZE = 200
+
+
+def _loads(text):
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def read_embedded_metadata(path):
+    """Returns the ``(prompt, workflow)`` embedded in an output image; either may be None.
+
+    Only the file header is read: PNG text chunks are written before the
+    image data, and the other formats keep them in EXIF.
+    """
+    if not path.lower().endswith(METADATA_EXTENSIONS):
+        return None, None
+    from PIL import Image
+    texts = {}
+    with Image.open(path) as img:
+        for key in ("prompt", "workflow"):
+            if isinstance(img.info.get(key), str):
+                texts[key] = img.info[key]
+        if not texts:
+            # EXIF fields hold "prompt:<json>" and "<key>:<json>", as written by image_metadata_options
+            for value in img.getexif().values():
+                if isinstance(value, bytes):
+                    value = value.decode("utf-8", "replace")
+                if isinstance(value, str):
+                    key, _, data = value.partition(":")
+                    if key in ("prompt", "workflow"):
+                        texts.setdefault(key, data)
+    return _loads(texts.get("prompt")), _loads(texts.get("workflow"))
+
+
+def normalize_value(value):
+    """The string a parameter value is stored and matched as."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _as_seed(value):
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+        return int(value)
+    return None
+
+
+def _cozygen_param(class_type, inputs):
+    # (param_name, value) of a CozyGen input node, the same fields the web UI fills in
+    if class_type in FILE_INPUT_FIELDS:
+        field, default_name = FILE_INPUT_FIELDS[class_type]
+        return inputs.get("param_name") or default_name, inputs.get(field)
+    value = inputs.get(VALUE_INPUT_FIELDS.get(class_type, "default_value"))
+    if class_type == "CozyGenChoiceInput" and (not value or value == "None"):
+        value = inputs.get("default_choice")
+    return inputs.get("param_name"), value
+
+
+def extract_fields(prompt, workflow=None):
+    """Returns the searchable fields of an output's embedded metadata.
+
+    ``{"seeds": [...], "models": [...], "params": {param_name: value}, "text": [...]}``
+    where ``params`` are the values of the CozyGen input nodes and ``text``
+    the other string inputs (prompts and the like). Without a prompt, the
+    widget values of the editor ``workflow`` are used as text.
+    """
+    # Dicts keep the first occurrence order while dropping repeats
+    seeds, models, params, text = {}, {}, {}, {}
+    if isinstance(prompt, dict):
+        for node in prompt.values():
+            if not isinstance(node, dict) or not isinstance(node.get("inputs"), dict):
+                continue
+            inputs = node["inputs"]
+            if node.get("class_type") in COZYGEN_INPUT_TYPES:
+                param_name, value = _cozygen_param(node["class_type"], inputs)
+                if param_name and value is not None and not isinstance(value, (list, dict)):
+                    params[param_name] = normalize_value(value)
+                    if "seed" in param_name.lower() and _as_seed(value) is not None:
+                        seeds[_as_seed(value)] = None
+            for name, value in inputs.items():
+                if name in SEED_INPUTS and _as_seed(value) is not None:
+                    seeds[_as_seed(value)] = None
+                elif isinstance(value, str) and value.strip():
+                    if value.lower().endswith(MODEL_EXTENSIONS):
+                        models[value] = None
+                    elif name != "param_name":
+                        text[value] = None
+    elif isinstance(workflow, dict):
+        for node in workflow.get("nodes") or []:
+            widgets_values = node.get("widgets_values") if isinstance(node, dict) else None
+            for value in widgets_values if isinstance(widgets_values, list) else []:
+                if isinstance(value, str) and value.strip():
+                    (models if value.lower().endswith(MODEL_EXTENSIONS) else text)[value] = None
+    return {"seeds": list(seeds), "models": list(models), "params": params, "text": list(text)}
+
+
+def fts_query(query):
+    """Turns free text into an FTS5 query matching every word; a trailing * matches a prefix."""
+    terms = []
+    for word in query.split():
+        prefix = len(word) > 1 and word.endswith("*")
+        word = word.rstrip("*")
+        if word:
+            terms.append('"' + word.replace('"', '""') + '"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+def _escape_like(text):
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _walk_outputs(output_dir):
+    # Yields (relative path, stat) of every gallery file below output_dir
+    stack = [output_dir]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            if not entry.name.startswith("."):
+                                stack.append(entry.path)
+                        elif entry.name.lower().endswith(GALLERY_EXTENSIONS):
+                            yield os.path.relpath(entry.path, output_dir), entry.stat()
+                    except FileNotFoundError:
+                        pass
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+
+
+class MetadataIndex:
+    """SQLite full-text index of the prompts and parameters embedded in gallery outputs.
+
+    A background thread fills it. Files saved by the CozyGen output nodes are
+    indexed as they are written; a reconcile pass over the output directory,
+    run on first use and afterwards at most every ``rescan_interval`` seconds
+    when someone searches, picks up files added, touched or deleted by
+    anything else. Searches only read the database, never the images.
+    """
+
+    def __init__(self, db_path, rescan_interval=300.0):
+        self.db_path = db_path
+        self.rescan_interval = rescan_interval
+        self.enabled = bool(db_path)
+        self._local = threading.local()
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+        self._fts = True
+        self._reconcile_queued_at = None
+        self._reconciling = False
+
+    def _connection(self):
+        # One connection per thread; WAL lets searches read while the worker writes
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            import sqlite3
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._worker is not None:
+                return
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            self._create_schema(self._connection())
+            self._worker = threading.Thread(target=self._run, name="cozygen_metadata_index", daemon=True)
+            self._worker.start()
+
+    def _create_schema(self, conn):
+        import sqlite3
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.executescript("DROP TABLE IF EXISTS outputs; DROP TABLE IF EXISTS output_params; DROP TABLE IF EXISTS models; DROP TABLE IF EXISTS outputs_fts;")
+        conn.executescript(SCHEMA)
+        try:
+            conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS outputs_fts USING fts5(filename, text, models, params)")
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: the same columns in a plain table, searched with LIKE
+            self._fts = False
+            conn.execute("CREATE TABLE IF NOT EXISTS outputs_fts (rowid INTEGER PRIMARY KEY, filename, text, models, params)")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+
+    def record_file(self, file_path, prompt=None):
+        """Queues a freshly written output for indexing.
+
+        ``prompt`` is used instead of reading the metadata back from the
+        file, e.g. for videos, which don't embed it.
+        """
+        if not self.enabled or not file_path.lower().endswith(GALLERY_EXTENSIONS):
+            return
+        self._ensure_started()
+        self._queue.put(("file", os.path.normpath(file_path), prompt))
+
+    def request_reconcile(self, force=False):
+        """Queues a pass over the output directory, unless one ran in the last ``rescan_interval`` seconds."""
+        self._ensure_started()
+        now = time.monotonic()
+        with self._lock:
+            if not force and self._reconcile_queued_at is not None and now - self._reconcile_queued_at < self.rescan_interval:
+                return
+            self._reconcile_queued_at = now
+        self._queue.put(("reconcile",))
+
+    def _run(self):
+        conn = self._connection()
+        while True:
+            jobs = [self._queue.get()]
+            # A burst of saves is written in one transaction
+            while len(jobs) < INDEX_BATCH_SIZE:
+                try:
+                    jobs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for job in jobs:
+                try:
+                    if job[0] == "reconcile":
+                        self._reconcile(conn)
+                    else:
+                        self._index_path(conn, job[1], job[2])
+                except Exception:
+                    logger.exception("Metadata indexing failed")
+            conn.commit()
+
+    def _index_path(self, conn, file_path, prompt):
+        output_dir = os.path.normpath(folder_paths.get_output_directory())
+        rel_path = os.path.relpath(file_path, output_dir)
+        if rel_path.startswith(os.pardir):
+            return
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            self._remove(conn, rel_path)
+            return
+        self._index_file(conn, rel_path, file_path, st, prompt)
+
+    def _index_file(self, conn, rel_path, file_path, st, prompt=None):
+        workflow = None
+        if prompt is None:
+            try:
+                prompt, workflow = read_embedded_metadata(file_path)
+            except Exception:
+                pass  # Unreadable or truncated files are still found by name
+        fields = extract_fields(prompt, workflow)
+        if prompt is None and workflow is None:
+            # Keep what was indexed before (e.g. the prompt recorded with a video) when the file is touched
+            row = conn.execute("SELECT fields FROM outputs WHERE path = ?", (rel_path,)).fetchone()
+            if row is not None:
+                fields = json.loads(row[0])
+
+        self._remove(conn, rel_path)
+        subfolder, filename = os.path.split(rel_path)
+        output_id = conn.execute(
+            "INSERT INTO outputs (path, subfolder, filename, mtime_ns, size, fields) VALUES (?, ?, ?, ?, ?, ?)",
+            (rel_path, subfolder, filename, st.st_mtime_ns, st.st_size, json.dumps(fields)),
+        ).lastrowid
+        rows = [(output_id, "seed", "seed", str(seed)) for seed in fields["seeds"]]
+        rows += [(output_id, "model", "model", model) for model in fields["models"]]
+        rows += [(output_id, "param", name, value) for name, value in fields["params"].items()]
+        conn.executemany("INSERT INTO output_params (output_id, kind, name, value) VALUES (?, ?, ?, ?)", rows)
+        conn.executemany("INSERT OR IGNORE INTO models (name) VALUES (?)", [(model,) for model in fields["models"]])
+        conn.execute(
+            "INSERT INTO outputs_fts (rowid, filename, text, models, params) VALUES (?, ?, ?, ?, ?)",
+            (output_id, filename, "\n".join(fields["text"]), "\n".join(fields["models"]),
+             "\n".join(f"{name}: {value}" for name, value in fields["params"].items())),
+        )
+        metrics.metadata_files_indexed.inc()
+
+    @staticmethod
+    def _remove(conn, rel_path):
+        row = conn.execute("SELECT id FROM outputs WHERE path = ?", (rel_path,)).fetchone()
+        if row is None:
+            return
+        conn.execute("DELETE FROM outputs_fts WHERE rowid = ?", row)
+        conn.execute("DELETE FROM output_params WHERE output_id = ?", row)
+        conn.execute("DELETE FROM outputs WHERE id = ?", row)
+
+    def _reconcile(self, conn):
+        self._reconciling = True
+        try:
+            output_dir = os.path.normpath(folder_paths.get_output_directory())
+            known = {path: (mtime_ns, size) for path, mtime_ns, size in conn.execute("SELECT path, mtime_ns, size FROM outputs")}
+            seen = set()
+            changed = 0
+            for rel_path, st in _walk_outputs(output_dir):
+                seen.add(rel_path)
+                if known.get(rel_path) != (st.st_mtime_ns, st.st_size):
+                    self._index_file(conn, rel_path, os.path.join(output_dir, rel_path), st)
+                    changed += 1
+                    if changed % INDEX_BATCH_SIZE == 0:
+                        conn.commit()
+            for rel_path in known.keys() - seen:
+                self._remove(conn, rel_path)
+            conn.commit()
+        finally:
+            self._reconciling = False
+
+    def search(self, query="", seed=None, model=None, params=None, subfolder="", offset=0, limit=20):
+        """Returns ``(results, total)`` for outputs matching every given filter, newest first.
+
+        ``query`` is matched as words against the prompt text, models,
+        parameters and file name; ``seed`` exactly; ``model`` as a
+        case-insensitive substring of a model file; ``params`` maps CozyGen
+        param_names to exact values. ``subfolder`` limits the search to that
+        folder and the folders below it. Each result is a dict with
+        ``subfolder``, ``filename``, ``mtime`` (also as ``mtime_ns``) and the
+        ``seeds``, ``models`` and ``params`` of the output.
+        """
+        self.request_reconcile()
+        where = []
+        args = []
+        if query:
+            if self._fts:
+                match = fts_query(query)
+                if match:
+                    where.append("o.id IN (SELECT rowid FROM outputs_fts WHERE outputs_fts MATCH ?)")
+                    args.append(match)
+            else:
+                for word in query.split():
+                    where.append("o.id IN (SELECT rowid FROM outputs_fts WHERE filename || ' ' || text || ' ' || models || ' ' || params LIKE ? ESCAPE '\\')")
+                    args.append(f"%{_escape_like(word.rstrip('*'))}%")
+        if seed is not None:
+            where.append("o.id IN (SELECT output_id FROM output_params WHERE kind = 'seed' AND name = 'seed' AND value = ?)")
+            args.append(str(seed))
+        if model:
+            # Substring-match the few distinct model names, then look their outputs up by index
+            where.append("o.id IN (SELECT output_id FROM output_params WHERE kind = 'model' AND name = 'model' AND value IN "
+                         "(SELECT name FROM models WHERE name LIKE ? ESCAPE '\\'))")
+            args.append(f"%{_escape_like(model)}%")
+        for name, value in (params or {}).items():
+            candidates = {value}
+            try:
+                candidates.add(normalize_value(float(value)))
+            except ValueError:
+                pass
+            where.append(f"o.id IN (SELECT output_id FROM output_params WHERE kind = 'param' AND name = ? AND value IN ({', '.join('?' * len(candidates))}))")
+            args.append(name)
+            args.extend(candidates)
+        subfolder = os.path.normpath(subfolder) if subfolder else ""
+        if subfolder and subfolder != os.curdir:
+            where.append("(o.subfolder = ? OR o.subfolder LIKE ? ESCAPE '\\')")
+            args.extend([subfolder, _escape_like(subfolder + os.sep) + "%"])
+
+        where_sql = " WHERE " + " AND ".join(where) if where else ""
+        conn = self._connection()
+        total = conn.execute(f"SELECT COUNT(*) FROM outputs o{where_sql}", args).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT o.subfolder, o.filename, o.mtime_ns, o.fields FROM outputs o{where_sql} ORDER BY o.mtime_ns DESC, o.id DESC LIMIT ? OFFSET ?",
+            args + [limit, offset],
+        ).fetchall()
+        results = []
+        for subfolder, filename, mtime_ns, fields in rows:
+            fields = json.loads(fields)
+            results.append({
+                "subfolder": subfolder,
+                "filename": filename,
+                "mtime": mtime_ns / 1e9,
+                "mtime_ns": mtime_ns,
+                "seeds": fields["seeds"],
+                "models": fields["models"],
+                "params": fields["params"],
+            })
+        return results, total
+
+    def stats(self):
+        indexed = 0
+        if self._worker is not None:
+            indexed = self._connection().execute("SELECT COUNT(*) FROM outputs").fetchone()[0]
+        return {"indexed": indexed, "pending": self._queue.qsize(), "reconciling": self._reconciling}
+
+
+def _default_db_path():
+    if os.environ.get("COZYGEN_SEARCH_INDEX", "1").lower() in ("0", "false", "no"):
+        return None
+    configured = os.environ.get("COZYGEN_SEARCH_DB")
+    if configured:
+        return configured
+    # Not in the media cache directory, whose size budget would evict it
+    if hasattr(folder_paths, "get_user_directory"):
+        return os.path.join(folder_paths.get_user_directory(), "cozygen_search.sqlite3")
+    return os.path.join(folder_paths.get_temp_directory(), "cozygen_search.sqlite3")
+
+
+metadata_index = MetadataIndex(
+    db_path=_default_db_path(),
+    rescan_interval=float(os.environ.get("COZYGEN_SEARCH_RESCAN_SECONDS", "300")),
+)
@@ -0,0 +1,275 @@
+import os
+import time
+import math
+import bisect
+import threading
+import contextlib
+
+# Default histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames, labelvalues, extra=()):
+    pairs = list(zip(labelnames, labelvalues)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class _NullChild:
+    # Stands in for every metric child while metrics are disabled
+    def inc(self, amount=1):
+        pass
+
+    def dec(self, amount=1):
+        pass
+
+    def set(self, value):
+        pass
+
+    def observe(self, value):
+        pass
+
+    def time(self):
+        return _NULL_CONTEXT
+
+    def track_inprogress(self):
+        return _NULL_CONTEXT
+
+
+_NULL_CHILD = _NullChild()
+
+
+class _Metric:
+    type_name = None
+
+    def __init__(self, registry, name, documentation, labelnames=()):
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *labelvalues):
+        if not self._registry.enabled:
+            return _NULL_CHILD
+        child = self._children.get(labelvalues)
+        if child is None:
+            if len(labelvalues) != len(self.labelnames):
+                raise ValueError(f"{self.name} takes labels {self.labelnames}, got {labelvalues}")
+            with self._lock:
+                child = self._children.setdefault(labelvalues, self._new_child())
+        return child
+
+    # Unlabelled metrics can be used directly
+    def inc(self, amount=1):
+        self.labels().inc(amount)
+
+    def dec(self, amount=1):
+        self.labels().dec(amount)
+
+    def set(self, value):
+        self.labels().set(value)
+
+    def observe(self, value):
+        self.labels().observe(value)
+
+    def time(self):
+        return self.labels().time()
+
+    def track_inprogress(self):
+        return self.labels().track_inprogress()
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for labelvalues, child in sorted(self._children.items()):
+            lines.extend(child.render(self.name, self.labelnames, labelvalues))
+        return lines
+
+
+class _ValueChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount=1):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value):
+        self.value = value
+
+    @contextlib.contextmanager
+    def track_inprogress(self):
+        self.inc()
+        try:
+            yield
+        finally:
+            self.dec()
+
+    def render(self, name, labelnames, labelvalues):
+        return [f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(self.value)}"]
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def _new_child(self):
+        return _ValueChild()
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _ValueChild()
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "_lock")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        # The last bucket is +Inf, so every value lands in one
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.sum += value
+            self.counts[i] += 1
+
+    @contextlib.contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def render(self, name, labelnames, labelvalues):
+        with self._lock:
+            counts, total = list(self.counts), self.sum
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_format_labels(labelnames, labelvalues, [('le', _format_value(bound))])} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labelnames, labelvalues)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(labelnames, labelvalues)} {cumulative}")
+        return lines
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, registry, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+
+class _CallbackMetric:
+    # Read at scrape time from state the code keeps anyway (e.g. cache stats)
+    def __init__(self, name, documentation, type_name, callback):
+        self.name = name
+        self.documentation = documentation
+        self.type_name = type_name
+        self.callback = callback
+
+    def render(self):
+        try:
+            value = self.callback()
+        except Exception as e:
+            return [f"# {self.name} unavailable: {_escape(e)}"]
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}",
+                f"{self.name} {_format_value(value)}"]
+
+
+class MetricsRegistry:
+    """A small Prometheus-style metrics registry.
+
+    While ``enabled`` is False every metric operation is a no-op, so the
+    instrumented code paths only pay for a flag check.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._metrics = []
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(self, name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._register(Gauge(self, name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(self, name, documentation, labelnames, buckets))
+
+    def callback(self, name, documentation, callback, type_name="gauge"):
+        return self._register(_CallbackMetric(name, documentation, type_name, callback))
+
+    def render(self):
+        """Returns all metrics in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry(enabled=os.environ.get("COZYGEN_METRICS", "1").lower() not in ("0", "false", "no"))
+
+# Output nodes
+images_written = registry.counter("cozygen_images_written_total", "Images saved by CozyGenOutput.", ["format"])
+image_bytes_written = registry.counter("cozygen_image_bytes_written_total", "Bytes of images saved by CozyGenOutput.", ["format"])
+image_save_seconds = registry.histogram("cozygen_image_save_seconds", "Time to encode and write one CozyGenOutput batch.", ["format"])
+video_frames_encoded = registry.counter("cozygen_video_frames_encoded_total", "Frames encoded by CozyGenVideoOutput.", ["format"])
+video_bytes_written = registry.counter("cozygen_video_bytes_written_total", "Bytes of videos saved by CozyGenVideoOutput.", ["format"])
+video_save_seconds = registry.histogram("cozygen_video_save_seconds", "Time to encode and mux one CozyGenVideoOutput video.", ["format"])
+saves_in_progress = registry.gauge("cozygen_saves_in_progress", "Outputs currently being encoded and written.", ["kind"])
+
+# Gallery
+gallery_request_seconds = registry.histogram("cozygen_gallery_request_seconds", "Time to answer a /cozygen/gallery request.")
+gallery_items_listed = registry.counter("cozygen_gallery_items_listed_total", "Items returned by /cozygen/gallery.")
+gallery_scan_seconds = registry.histogram("cozygen_gallery_scan_seconds", "Time to scan one gallery folder.")
+gallery_entries_scanned = registry.counter("cozygen_gallery_entries_scanned_total", "Directory entries read while scanning gallery folders.")
+search_request_seconds = registry.histogram("cozygen_search_request_seconds", "Time to answer a /cozygen/gallery/search request.")
+metadata_files_indexed = registry.counter("cozygen_metadata_files_indexed_total", "Outputs added to or updated in the metadata search index.")
+gallery_exports = registry.counter("cozygen_gallery_exports_total", "ZIP exports from /cozygen/gallery/export.", ["result"])
+gallery_export_bytes = registry.counter("cozygen_gallery_export_bytes_total", "Bytes of ZIP archives sent by /cozygen/gallery/export.")
+
+# Uploads
+uploads = registry.counter("cozygen_uploads_total", "Files uploaded through /cozygen/upload_image or /cozygen/upload.", ["result"])
+upload_bytes = registry.counter("cozygen_upload_bytes_total", "Bytes received by /cozygen/upload_image and /cozygen/upload.")
+upload_seconds = registry.histogram("cozygen_upload_seconds", "Time to receive and store one /cozygen/upload_image upload.")
+upload_normalize_seconds = registry.histogram("cozygen_upload_normalize_seconds", "Time to rotate and downscale one uploaded image.")
+uploads_in_progress = registry.gauge("cozygen_uploads_in_progress", "Uploads currently being received.")
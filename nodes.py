@@ -1,18 +1,25 @@
 import os
 import json
-import torch
-import numpy as np
-from PIL import Image, ImageOps
-from PIL.PngImagePlugin import PngInfo
-import base64 # New import
-import io # New import
+import itertools
 
 import folder_paths
 from nodes import SaveImage
-import server # Import server
+from comfy.cli_args import args
 import asyncio # Import Import asyncio
 from comfy.comfy_types import node_typing
 
+from .gallery_index import gallery_index
+from .metadata_index import metadata_index
+from .media_cache import media_cache, sample_preview_frames
+from .tensor_cache import tensor_cache, tensor_cache_key
+from .choice_registry import choice_registry
+from .result_events import result_events
+from . import metrics
+from .output_writer import background_writer, image_encode_pool, save_image, image_save_options, image_metadata_options, image_formats, claim_counter, release_counter
+
+# torch, NumPy, Pillow and imageio are imported inside the node functions, so
+# registering the nodes doesn't pay for them before a workflow uses one.
+
 class _CozyGenDynamicTypes(str):
     basic_types = node_typing.IO.PRIMITIVE.split(",")
 
@@ -92,14 +99,31 @@ class CozyGenImageInput:
     FUNCTION = "load_image"
     CATEGORY = "CozyGen"
 
+    @classmethod
+    def IS_CHANGED(s, param_name, image_filename):
+        # Re-run only when the file itself changes; the same key indexes the tensor cache
+        image_path = folder_paths.get_input_directory() + os.sep + image_filename
+        return tensor_cache_key(image_path) or image_filename
+
     def load_image(self, param_name, image_filename):
         image_path = folder_paths.get_input_directory() + os.sep + image_filename
-        img = Image.open(image_path)
-        image_np = np.array(img).astype(np.float32) / 255.0
-        image_tensor = torch.from_numpy(image_np)[None,]
+        cache_key = tensor_cache_key(image_path)
+        cached = tensor_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            return cached
+
+        import torch
+        import numpy as np
+        from PIL import Image
+        with Image.open(image_path) as img:
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA" if 'A' in img.getbands() or 'transparency' in img.info else "RGB")
+            has_alpha = 'A' in img.getbands()
+            # Convert uint8 -> float32 in torch, skipping a float32 NumPy copy
+            image_tensor = torch.from_numpy(np.array(img)).to(torch.float32).div_(255.0)[None,]
 
         # Handle images with an alpha channel (transparency) to create a mask
-        if 'A' in img.getbands():
+        if has_alpha:
             mask = image_tensor[:, :, :, 3]
             image = image_tensor[:, :, :, :3] # Keep only the RGB channels for the image
         else:
@@ -107,9 +131,132 @@ class CozyGenImageInput:
             mask = torch.ones_like(image_tensor[:, :, :, 0])
             image = image_tensor
 
+        if cache_key:
+            tensor_cache.put(cache_key, (image, mask))
         return (image, mask)
 
 
+def _read_video_frames(video_path, force_rate, start_frame, frame_cap, select_every_nth, width, height):
+    """Decodes the sampled frames of a video into one float32 [N, H, W, 3] tensor.
+
+    ffmpeg does the resampling, frame selection and resizing, so only the
+    frames that are returned reach Python, and it stops once ``frame_cap``
+    frames are out. Each frame is read in place from ffmpeg's buffer and
+    converted to float straight into a tensor allocated up front from the
+    container's duration. Returns ``(images, fps)``.
+    """
+    import math
+    import torch
+    import warnings
+    import imageio_ffmpeg
+
+    # Same order as the usual ComfyUI video loaders: resample, skip, step, cap
+    filters = []
+    if force_rate > 0:
+        filters.append(f"fps={force_rate}")
+    if start_frame > 0:
+        filters.append(f"trim=start_frame={start_frame}")
+    if select_every_nth > 1:
+        filters.append(f"framestep=step={select_every_nth}")
+    if width > 0 or height > 0:
+        # -1 keeps the aspect ratio for the side that was left at 0
+        filters.append(f"scale={width or -1}:{height or -1}")
+    output_params = ["-vf", ",".join(filters)] if filters else []
+    if frame_cap > 0:
+        output_params += ["-frames:v", str(frame_cap)]
+
+    reader = imageio_ffmpeg.read_frames(video_path, output_params=output_params)
+    try:
+        meta = next(reader)
+        frame_width, frame_height = meta["size"]
+        rate = force_rate or meta["fps"]
+        expected = 0
+        if rate and meta["duration"]:
+            expected = math.ceil(max(0, round(meta["duration"] * rate) - start_frame) / select_every_nth)
+            if frame_cap > 0:
+                expected = min(expected, frame_cap)
+        # Without a duration, start small and grow
+        images = torch.empty((expected or 16, frame_height, frame_width, 3), dtype=torch.float32)
+        count = 0
+        with warnings.catch_warnings():
+            # ffmpeg hands out read-only bytes; the frame views are only read from
+            warnings.filterwarnings("ignore", message="The given buffer is not writable")
+            for data in reader:
+                if count == len(images):
+                    # The container understated the length; grow by half
+                    grown = torch.empty((count + count // 2 + 1,) + tuple(images.shape[1:]), dtype=torch.float32)
+                    grown[:count] = images
+                    images = grown
+                frame = torch.frombuffer(data, dtype=torch.uint8).view(frame_height, frame_width, 3)
+                images[count].copy_(frame).div_(255.0)
+                count += 1
+    finally:
+        reader.close()
+
+    if count == 0:
+        raise ValueError(f"No frames left in {video_path} after start_frame={start_frame}")
+    if count < len(images):
+        # A view would keep the whole buffer alive while the tensor cache only
+        # counts the frames in it, so trim it with a copy
+        images = images[:count].clone()
+    return images, (rate or 8.0) / select_every_nth
+
+
+class CozyGenVideoInput:
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "param_name": ("STRING", {"default": "Video Input"}),
+                # An upload in the input directory, or "<subfolder>/<file> [output]" from the gallery
+                "video_filename": ("STRING", {"default": ""}),
+                "force_rate": ("FLOAT", {"default": 0.0, "min": 0.0, "max": 120.0, "step": 1.0}),
+                "start_frame": ("INT", {"default": 0, "min": 0, "max": 1000000}),
+                "frame_cap": ("INT", {"default": 0, "min": 0, "max": 100000}),
+                "select_every_nth": ("INT", {"default": 1, "min": 1, "max": 1000}),
+                "width": ("INT", {"default": 0, "min": 0, "max": 8192, "step": 8}),
+                "height": ("INT", {"default": 0, "min": 0, "max": 8192, "step": 8}),
+            }
+        }
+
+    RETURN_TYPES = ("IMAGE", "INT", "FLOAT")
+    RETURN_NAMES = ("images", "frame_count", "fps")
+    FUNCTION = "load_video"
+    CATEGORY = "CozyGen"
+
+    @classmethod
+    def IS_CHANGED(s, param_name, video_filename, force_rate, start_frame, frame_cap, select_every_nth, width, height):
+        video_path = folder_paths.get_annotated_filepath(video_filename)
+        return tensor_cache_key(video_path, force_rate, start_frame, frame_cap, select_every_nth, width, height) or video_filename
+
+    def load_video(self, param_name, video_filename, force_rate, start_frame, frame_cap, select_every_nth, width, height):
+        video_path = folder_paths.get_annotated_filepath(video_filename)
+        # Keyed by the sampling too, so changing it decodes again but re-runs don't
+        cache_key = tensor_cache_key(video_path, force_rate, start_frame, frame_cap, select_every_nth, width, height)
+        cached = tensor_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            images, fps = cached
+            return (images, len(images), float(fps))
+
+        import torch
+        images, fps = _read_video_frames(video_path, force_rate, start_frame, frame_cap, select_every_nth, width, height)
+        if cache_key:
+            # Cache entries are tuples of tensors, so the rate is stored as one;
+            # float64 so a cached run returns exactly the same rate
+            tensor_cache.put(cache_key, (images, torch.tensor(fps, dtype=torch.float64)))
+        return (images, len(images), fps)
+
+
+def _announce_when_written(future, folder, filename, send, results, client_id):
+    # Runs when a background write finishes: frees its file counters and, if
+    # it succeeded, sends the result event (the writer logs failures).
+    def done(future):
+        release_counter(folder, filename)
+        if future.exception() is None:
+            send(results, client_id)
+    future.add_done_callback(done)
+
+
 class CozyGenOutput(SaveImage):
     def __init__(self):
         super().__init__()
@@ -123,6 +270,9 @@ class CozyGenOutput(SaveImage):
             },
             "optional": {
                 "filename_prefix": ("STRING", {"default": "CozyGen/output"}),
+                "format": (list(image_formats()), {"default": "image/png"}),
+                "compression_level": ("INT", {"default": 4, "min": 0, "max": 9}),
+                "async_save": ("BOOLEAN", {"default": False}),
             },
             "hidden": {
                 "prompt": "PROMPT",
@@ -133,33 +283,110 @@ class CozyGenOutput(SaveImage):
     FUNCTION = "save_images"
     CATEGORY = "CozyGen"
 
-    def save_images(self, images, filename_prefix="CozyGen/output", prompt=None, extra_pnginfo=None):
-        results = super().save_images(images, filename_prefix, prompt, extra_pnginfo)
-        server_instance = server.PromptServer.instance
-
-        if server_instance and results and 'ui' in results and 'images' in results['ui']:
-            batch_images_data = []
-            for saved_image in results['ui']['images']:
-                image_url = f"/view?filename={saved_image['filename']}&subfolder={saved_image['subfolder']}&type={saved_image['type']}"
-                batch_images_data.append({
-                    "url": image_url,
-                    "filename": saved_image['filename'],
-                    "subfolder": saved_image['subfolder'],
-                    "type": saved_image['type']
-                })
-            
-            if batch_images_data:
-                message_data = {
-                    "status": "images_generated",
-                    "images": batch_images_data
-                }
-                server_instance.send_sync("cozygen_batch_ready", message_data)
-                print(f"CozyGen: Sent batch WebSocket message: {message_data}")
+    def save_images(self, images, filename_prefix="CozyGen/output", prompt=None, extra_pnginfo=None, format="image/png", compression_level=4, async_save=False):
+        # Everything that needs the tensors happens here; encoding and writing
+        # the files can then run inline or on the background writer.
+        import numpy as np
+        if format not in image_formats():
+            raise ValueError(f"CozyGen: Unsupported output format '{format}'")
+        filename_prefix += self.prefix_append
+        full_output_folder, filename, counter, subfolder, filename_prefix = folder_paths.get_save_image_path(filename_prefix, self.output_dir, images[0].shape[1], images[0].shape[0])
 
-        return results
+        counter = claim_counter(full_output_folder, filename, counter, len(images))
 
+        save_options = image_save_options(format, compression_level)
+        if not args.disable_metadata:
+            save_options.update(image_metadata_options(format, prompt, extra_pnginfo))
 
-import imageio
+        pending = []
+        results = list()
+        for (batch_number, image) in enumerate(images):
+            image_np = np.clip(255. * image.cpu().numpy(), 0, 255).astype(np.uint8)
+            filename_with_batch_num = filename.replace("%batch_num%", str(batch_number))
+            file = f"{filename_with_batch_num}_{counter:05}_.{image_formats()[format]}"
+            pending.append((image_np, os.path.join(full_output_folder, file)))
+            results.append({
+                "filename": file,
+                "subfolder": subfolder,
+                "type": self.type
+            })
+            counter += 1
+
+        # Read the recipient now; the executing prompt may change before a background write finishes
+        client_id = result_events.current_client_id()
+        if async_save:
+            future = background_writer.submit(self._write_images, pending, save_options)
+            _announce_when_written(future, full_output_folder, filename, self._send_batch_ready, results, client_id)
+        else:
+            try:
+                self._write_images(pending, save_options)
+            finally:
+                release_counter(full_output_folder, filename)
+            self._send_batch_ready(results, client_id)
+
+        # With async_save the files land shortly after this returns; their
+        # names are already claimed, so ComfyUI's history can list them now
+        return { "ui": { "images": results } }
+
+    def _write_images(self, pending, save_options):
+        ext = os.path.splitext(pending[0][1])[1][1:] if pending else ""
+        with metrics.saves_in_progress.labels("image").track_inprogress(), metrics.image_save_seconds.labels(ext).time():
+            if len(pending) > 1:
+                list(image_encode_pool.map(lambda item: save_image(item[0], item[1], save_options), pending))
+            else:
+                for image_np, file_path in pending:
+                    save_image(image_np, file_path, save_options)
+        for _, file_path in pending:
+            gallery_index.record_file(file_path)
+            metadata_index.record_file(file_path)
+        if metrics.registry.enabled:
+            metrics.images_written.labels(ext).inc(len(pending))
+            metrics.image_bytes_written.labels(ext).inc(sum(os.path.getsize(file_path) for _, file_path in pending))
+
+    def _send_batch_ready(self, results, client_id=None):
+        batch_images_data = []
+        for saved_image in results:
+            image_url = f"/view?filename={saved_image['filename']}&subfolder={saved_image['subfolder']}&type={saved_image['type']}"
+            batch_images_data.append({
+                "url": image_url,
+                "filename": saved_image['filename'],
+                "subfolder": saved_image['subfolder'],
+                "type": saved_image['type']
+            })
+
+        if batch_images_data:
+            message_data = {
+                "status": "images_generated",
+                "images": batch_images_data
+            }
+            result_events.send("cozygen_batch_ready", message_data, client_id)
+
+
+# Number of frames converted to uint8 at a time while encoding a video
+VIDEO_ENCODE_CHUNK_FRAMES = 16
+
+def _iter_uint8_frames(images, start, stop, reverse=False, chunk_frames=VIDEO_ENCODE_CHUNK_FRAMES):
+    """Yields images[start:stop] as uint8 HxWxC frames, optionally in reverse order.
+
+    Frames are converted a chunk at a time into two reused buffers, so memory
+    stays bounded by the chunk size. A yielded frame is only valid until the
+    next one is requested.
+    """
+    if stop <= start:
+        return
+    import numpy as np
+    chunk_shape = (min(chunk_frames, stop - start),) + tuple(images.shape[1:])
+    float_buffer = np.empty(chunk_shape, dtype=np.float32)
+    uint8_buffer = np.empty(chunk_shape, dtype=np.uint8)
+    chunk_starts = range(start, stop, chunk_frames)
+    for chunk_start in (reversed(chunk_starts) if reverse else chunk_starts):
+        chunk_stop = min(chunk_start + chunk_frames, stop)
+        n = chunk_stop - chunk_start
+        # Same arithmetic as (frames * 255).astype(np.uint8), without temporaries
+        np.multiply(images[chunk_start:chunk_stop].cpu().numpy(), 255, out=float_buffer[:n])
+        np.copyto(uint8_buffer[:n], float_buffer[:n], casting='unsafe')
+        frames = uint8_buffer[:n]
+        yield from (frames[::-1] if reverse else frames)
 
 class CozyGenVideoOutput:
     def __init__(self):
@@ -177,6 +404,7 @@ class CozyGenVideoOutput:
                      "format": (["video/webm", "video/mp4", "image/gif"],),
                      "pingpong": ("BOOLEAN", {"default": False}),
                      },
+                "optional": {"async_save": ("BOOLEAN", {"default": False})},
                 "hidden": {"prompt": "PROMPT", "extra_pnginfo": "EXTRA_PNGINFO"},
                 }
 
@@ -186,9 +414,11 @@ class CozyGenVideoOutput:
 
     CATEGORY = "CozyGen"
 
-    def save_video(self, images, frame_rate, loop_count, filename_prefix="CozyGen/video", format="video/webm", pingpong=False, prompt=None, extra_pnginfo=None):
+    def save_video(self, images, frame_rate, loop_count, filename_prefix="CozyGen/video", format="video/webm", pingpong=False, prompt=None, extra_pnginfo=None, async_save=False):
+        import numpy as np
         filename_prefix += self.prefix_append
         full_output_folder, filename, counter, subfolder, filename_prefix = folder_paths.get_save_image_path(filename_prefix, self.output_dir, images[0].shape[1], images[0].shape[0])
+        counter = claim_counter(full_output_folder, filename, counter)
         results = list()
         
         if format == "image/gif":
@@ -199,17 +429,7 @@ class CozyGenVideoOutput:
             ext = "webm"
 
         file = f"{filename}_{counter:05}_.{ext}"
-        
-        # imageio requires uint8
-        video_data = (images.cpu().numpy() * 255).astype(np.uint8)
-
-        if pingpong:
-            video_data = np.concatenate((video_data, video_data[-2:0:-1]), axis=0)
-
-        if format == "image/gif":
-            imageio.mimsave(os.path.join(full_output_folder, file), video_data, duration=(1000/frame_rate)/1000, loop=loop_count)
-        else:
-            imageio.mimsave(os.path.join(full_output_folder, file), video_data, fps=frame_rate)
+        file_path = os.path.join(full_output_folder, file)
 
         results.append({
             "filename": file,
@@ -217,29 +437,70 @@ class CozyGenVideoOutput:
             "type": self.type
         })
 
-        server_instance = server.PromptServer.instance
-        if server_instance:
-            for result in results:
-                video_url = f"/view?filename={result['filename']}&subfolder={result['subfolder']}&type={result['type']}"
-                message_data = {
-                    "status": "video_generated",
-                    "video_url": video_url,
-                    "filename": result['filename'],
-                    "subfolder": result['subfolder'],
-                    "type": result['type']
-                }
-                server_instance.send_sync("cozygen_video_ready", message_data)
-                print(f"CozyGen: Sent custom WebSocket message: {{'type': 'cozygen_video_ready', 'data': {message_data}}}")
+        # A handful of sampled frames for the gallery poster and preview
+        frame_count = len(images)
+        preview_indices, preview_fps = sample_preview_frames(frame_count, frame_rate)
+        preview_frames = (images[preview_indices].cpu().numpy() * 255).astype(np.uint8)
+        client_id = result_events.current_client_id()
+        # Videos don't embed the prompt, so the search index is given it directly
+        search_prompt = None if args.disable_metadata else prompt
+
+        if async_save:
+            # The writer can't read the tensors after we return, so hand it the
+            # clip as uint8 (a quarter of the float32 size); the ping-pong tail
+            # is a reversed view of it.
+            video_data = np.empty(tuple(images.shape), dtype=np.uint8)
+            for i, frame in enumerate(_iter_uint8_frames(images, 0, frame_count)):
+                video_data[i] = frame
+            frames = itertools.chain(video_data, video_data[-2:0:-1] if pingpong else ())
+            future = background_writer.submit(self._write_video, file_path, format, frame_rate, loop_count, frames, preview_frames, preview_fps, search_prompt)
+            _announce_when_written(future, full_output_folder, filename, self._send_video_ready, results, client_id)
+        else:
+            # Stream the clip through the writer a chunk at a time instead of
+            # materializing it (and a ping-pong copy) as one uint8 array.
+            frames = _iter_uint8_frames(images, 0, frame_count)
+            if pingpong:
+                # Same frames as video_data[-2:0:-1], read back in reverse
+                frames = itertools.chain(frames, _iter_uint8_frames(images, 1, frame_count - 1, reverse=True))
+            try:
+                self._write_video(file_path, format, frame_rate, loop_count, frames, preview_frames, preview_fps, search_prompt)
+            finally:
+                release_counter(full_output_folder, filename)
+            self._send_video_ready(results, client_id)
 
         return { "ui": { "videos": results } }
 
-import comfy.samplers
-
-# Dynamically get model folder names
-models_path = folder_paths.models_dir
-model_folders = sorted([d.name for d in os.scandir(models_path) if d.is_dir()])
-static_choices = ["sampler", "scheduler"]
-all_choice_types = model_folders + static_choices
+    def _write_video(self, file_path, format, frame_rate, loop_count, frames, preview_frames, preview_fps, prompt=None):
+        import imageio
+        ext = os.path.splitext(file_path)[1][1:]
+        if format == "image/gif":
+            writer = imageio.get_writer(file_path, mode='I', duration=(1000/frame_rate)/1000, loop=loop_count)
+        else:
+            writer = imageio.get_writer(file_path, mode='I', fps=frame_rate)
+        frame_count = 0
+        with metrics.saves_in_progress.labels("video").track_inprogress(), metrics.video_save_seconds.labels(ext).time(), writer:
+            for frame in frames:
+                writer.append_data(frame)
+                frame_count += 1
+        if metrics.registry.enabled:
+            metrics.video_frames_encoded.labels(ext).inc(frame_count)
+            metrics.video_bytes_written.labels(ext).inc(os.path.getsize(file_path))
+
+        gallery_index.record_file(file_path)
+        metadata_index.record_file(file_path, prompt)
+        media_cache.add_video_previews(file_path, preview_frames, preview_fps)
+
+    def _send_video_ready(self, results, client_id=None):
+        for result in results:
+            video_url = f"/view?filename={result['filename']}&subfolder={result['subfolder']}&type={result['type']}"
+            message_data = {
+                "status": "video_generated",
+                "video_url": video_url,
+                "filename": result['filename'],
+                "subfolder": result['subfolder'],
+                "type": result['type']
+            }
+            result_events.send("cozygen_video_ready", message_data, client_id)
 
 class CozyGenFloatInput:
     @classmethod
@@ -302,20 +563,10 @@ class CozyGenChoiceInput:
     _NODE_CLASS_NAME = "CozyGenChoiceInput"
     @classmethod
     def INPUT_TYPES(cls):
-        # Create a flat list of all possible choices for the initial dropdown
-        all_choices = []
-        for choice_type in all_choice_types:
-            if choice_type == "sampler":
-                all_choices.extend(comfy.samplers.KSampler.SAMPLERS)
-            elif choice_type == "scheduler":
-                all_choices.extend(comfy.samplers.KSampler.SCHEDULERS)
-            else:
-                try:
-                    all_choices.extend(folder_paths.get_filename_list(choice_type))
-                except KeyError:
-                    pass # Ignore choice types that don't have a corresponding folder
-        # Add a "None" option to be safe
-        all_choices = ["None"] + sorted(list(set(all_choices)))
+        # A flat list of all possible choices for the initial dropdown, with a
+        # "None" option to be safe. The registry only relists changed folders.
+        all_choice_types = choice_registry.choice_types()
+        all_choices = ["None"] + choice_registry.all_choices()
 
         return {
             "required": {
@@ -341,14 +592,9 @@ class CozyGenChoiceInput:
 
         # If the final value is still None or empty, try to get a fallback
         if not final_value or final_value == "None":
-            if choice_type == "sampler":
-                return (comfy.samplers.KSampler.SAMPLERS[0],)
-            elif choice_type == "scheduler":
-                return (comfy.samplers.KSampler.SCHEDULERS[0],)
-            else:
-                choices = folder_paths.get_filename_list(choice_type)
-                if choices:
-                    return (choices[0],)
+            choices = choice_registry.get(choice_type)
+            if choices:
+                return (choices[0],)
         
         return (final_value,)
 
@@ -357,6 +603,7 @@ NODE_CLASS_MAPPINGS = {
     "CozyGenVideoOutput": CozyGenVideoOutput,
     "CozyGenDynamicInput": CozyGenDynamicInput,
     "CozyGenImageInput": CozyGenImageInput,
+    "CozyGenVideoInput": CozyGenVideoInput,
     "CozyGenFloatInput": CozyGenFloatInput,
     "CozyGenIntInput": CozyGenIntInput,
     "CozyGenStringInput": CozyGenStringInput,
@@ -368,6 +615,7 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "CozyGenVideoOutput": "CozyGen Video Output",
     "CozyGenDynamicInput": "CozyGen Dynamic Input",
     "CozyGenImageInput": "CozyGen Image Input",
+    "CozyGenVideoInput": "CozyGen Video Input",
     "CozyGenFloatInput": "CozyGen Float Input",
     "CozyGenIntInput": "CozyGen Int Input",
     "CozyGenStringInput": "CozyGen String Input",
@@ -0,0 +1,187 @@
+import os
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .result_events import RateLimitedLog
+
+logger = logging.getLogger("CozyGen")
+
+
+class BackgroundWriter:
+    """Bounded pool that encodes and writes outputs off the prompt execution thread.
+
+    At most ``max_pending`` jobs are queued or running at once; ``submit``
+    blocks when the queue is full, so a fast sampler can't pile up an
+    unbounded amount of frames in memory waiting to be written.
+    """
+
+    def __init__(self, workers=2, max_pending=8):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="cozygen_writer")
+            return self._executor
+
+    def submit(self, fn, *args):
+        self._slots.acquire()
+        try:
+            return self._get_executor().submit(self._run, fn, args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _run(self, fn, args):
+        try:
+            return fn(*args)
+        except Exception:
+            logger.exception("Background save failed")
+            raise
+        finally:
+            self._slots.release()
+
+
+_claimed_counters = {}  # (folder, filename) -> [first counter not handed out yet, unreleased claims]
+_counters_lock = threading.Lock()
+
+def claim_counter(folder, filename, counter, count=1):
+    """Returns the first of ``count`` consecutive file counters for ``filename``.
+
+    ComfyUI derives ``counter`` from the files already on disk, which misses
+    outputs still queued on the background writer, so counters handed out
+    earlier in this process are skipped as well. Call :func:`release_counter`
+    once the files are written.
+    """
+    key = (os.path.normpath(folder), filename)
+    with _counters_lock:
+        claim = _claimed_counters.setdefault(key, [0, 0])
+        counter = max(counter, claim[0])
+        claim[0] = counter + count
+        claim[1] += 1
+    return counter
+
+
+def release_counter(folder, filename):
+    """Ends a claim from :func:`claim_counter`.
+
+    Once no writes for ``filename`` are outstanding, its files are all on disk
+    where ComfyUI's own scan finds them, so the entry is dropped.
+    """
+    key = (os.path.normpath(folder), filename)
+    with _counters_lock:
+        claim = _claimed_counters.get(key)
+        if claim is not None:
+            claim[1] -= 1
+            if claim[1] <= 0:
+                del _claimed_counters[key]
+
+
+def _avif_supported():
+    from PIL import features
+    try:
+        if features.check_module("avif"):
+            return True
+    except ValueError:
+        pass  # Pillow before 11.2 has no built-in AVIF support
+    try:
+        import pillow_avif  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+_image_formats = None
+
+def image_formats():
+    """Output formats offered by CozyGenOutput, mapped to their file extension."""
+    global _image_formats
+    if _image_formats is None:
+        # Probing for AVIF imports Pillow (and maybe a plugin), so it waits for first use
+        formats = {
+            "image/png": "png",
+            "image/webp": "webp",
+            "image/jpeg": "jpg",
+        }
+        if _avif_supported():
+            formats["image/avif"] = "avif"
+        _image_formats = formats
+    return _image_formats
+
+# Largest EXIF block a JPEG APP1 segment can hold
+JPEG_MAX_EXIF_BYTES = 65533
+
+# Every image of a JPEG batch hits the size check, so it is reported once a minute at most
+_exif_too_large_log = RateLimitedLog(60.0)
+
+
+def image_save_options(fmt, compression_level):
+    """Maps a 0-9 compression level (higher = smaller and slower) to Pillow save options."""
+    if fmt == "image/png":
+        return {"format": "PNG", "compress_level": compression_level}
+    if fmt == "image/webp":
+        # In lossless mode quality selects the compression effort
+        return {"format": "WEBP", "lossless": True, "quality": round(compression_level * 100 / 9), "method": round(compression_level * 6 / 9)}
+    if fmt == "image/jpeg":
+        return {"format": "JPEG", "quality": 95, "subsampling": 0, "optimize": compression_level >= 5}
+    if fmt == "image/avif":
+        return {"format": "AVIF", "quality": 90, "speed": 10 - compression_level}
+    raise ValueError(f"Unsupported image format: {fmt}")
+
+
+def image_metadata_options(fmt, prompt=None, extra_pnginfo=None):
+    """Returns the Pillow save options that embed the prompt and workflow in ``fmt``.
+
+    PNG gets text chunks like SaveImage. The other formats get EXIF fields
+    laid out like ComfyUI's WebP savers, so ComfyUI can load workflows from them.
+    """
+    if prompt is None and not extra_pnginfo:
+        return {}
+    from PIL import Image
+    from PIL.PngImagePlugin import PngInfo
+    if fmt == "image/png":
+        metadata = PngInfo()
+        if prompt is not None:
+            metadata.add_text("prompt", json.dumps(prompt))
+        if extra_pnginfo is not None:
+            for x in extra_pnginfo:
+                metadata.add_text(x, json.dumps(extra_pnginfo[x]))
+        return {"pnginfo": metadata}
+
+    exif = Image.Exif()
+    if prompt is not None:
+        exif[0x0110] = "prompt:{}".format(json.dumps(prompt))
+    if extra_pnginfo is not None:
+        tag = 0x010f
+        for x in extra_pnginfo:
+            exif[tag] = "{}:{}".format(x, json.dumps(extra_pnginfo[x]))
+            tag -= 1
+    exif_bytes = exif.tobytes()
+    if fmt == "image/jpeg" and len(exif_bytes) > JPEG_MAX_EXIF_BYTES:
+        _exif_too_large_log.warning("CozyGen: Workflow metadata is too large for JPEG EXIF; saving without it.")
+        return {}
+    return {"exif": exif_bytes}
+
+
+def save_image(image_np, file_path, save_options):
+    from PIL import Image
+    Image.fromarray(image_np).save(file_path, **save_options)
+
+
+background_writer = BackgroundWriter(
+    workers=int(os.environ.get("COZYGEN_ASYNC_SAVE_WORKERS", "2")),
+    max_pending=int(os.environ.get("COZYGEN_ASYNC_SAVE_QUEUE", "8")),
+)
+
+# Pillow releases the GIL while compressing, so the images of a batch are
+# encoded in parallel on plain threads.
+image_encode_pool = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("COZYGEN_ENCODE_THREADS", "0")) or min(8, os.cpu_count() or 1),
+    thread_name_prefix="cozygen_encode",
+)
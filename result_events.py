@@ -0,0 +1,178 @@
+import os
+import time
+import uuid
+import asyncio
+import logging
+import threading
+import collections
+
+import server
+
+logger = logging.getLogger("CozyGen")
+
+
+class RateLimitedLog:
+    """Logs at most one line per ``interval`` seconds, counting what it skipped."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._last = 0.0
+        self._suppressed = 0
+        self._lock = threading.Lock()
+
+    def info(self, msg, *args):
+        self._log(logging.INFO, msg, args)
+
+    def warning(self, msg, *args):
+        self._log(logging.WARNING, msg, args)
+
+    def _log(self, level, msg, args):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last < self.interval:
+                self._suppressed += 1
+                return
+            suppressed, self._suppressed = self._suppressed, 0
+            self._last = now
+        logger.log(level, msg + " suppressed=%d", *args, suppressed)
+
+
+def _merge_messages(event, messages):
+    if len(messages) == 1:
+        return messages[0]
+    if event == "cozygen_batch_ready":
+        return {**messages[0], "images": [image for message in messages for image in message["images"]]}
+    # Video messages describe one video each: the first stays at the top level
+    # for existing clients and all of them are listed under "videos".
+    return {**messages[0], "videos": messages}
+
+
+class ResultEvents:
+    """Delivers the CozyGen output nodes' WebSocket events.
+
+    Events go only to the client that queued the prompt, unless ``broadcast``
+    is set (e.g. for a shared display) or the prompt was queued without a
+    client id. Events of the same type for the same client within
+    ``coalesce_window`` seconds are merged into a single message.
+
+    The last ``buffer_size`` delivered events are kept with increasing
+    sequence numbers (also sent as ``seq`` in the message), so a client that
+    was disconnected can fetch exactly the events it missed.
+    """
+
+    COALESCED_EVENTS = ("cozygen_batch_ready", "cozygen_video_ready")
+
+    def __init__(self, broadcast=False, coalesce_window=0.05, log_interval=10.0, buffer_size=256):
+        self.broadcast = broadcast
+        self.coalesce_window = coalesce_window
+        self._log = RateLimitedLog(log_interval)
+        self._pending = {}  # (event, sid) -> [message data]
+        self._lock = threading.Lock()
+        # Sequence numbers restart with the process; clients compare the epoch to notice
+        self.epoch = uuid.uuid4().hex
+        self._seq = 0
+        self._buffer = collections.deque(maxlen=buffer_size)  # (seq, event, data, sid), oldest first
+        self._waiters = set()  # (loop, future) of long-polling requests
+
+    @staticmethod
+    def current_client_id():
+        """The client id of the prompt being executed; call it from the node, not a background writer."""
+        return getattr(server.PromptServer.instance, "client_id", None)
+
+    def send(self, event, data, client_id=None):
+        sid = None if self.broadcast else client_id
+        if self.coalesce_window <= 0 or event not in self.COALESCED_EVENTS:
+            self._deliver(event, data, sid, 1)
+            return
+        key = (event, sid)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                pending.append(data)
+                return
+            self._pending[key] = [data]
+        timer = threading.Timer(self.coalesce_window, self._flush, (key,))
+        timer.daemon = True
+        timer.start()
+
+    def _flush(self, key):
+        with self._lock:
+            messages = self._pending.pop(key, None)
+        if messages:
+            event, sid = key
+            self._deliver(event, _merge_messages(event, messages), sid, len(messages))
+
+    def _deliver(self, event, data, sid, merged):
+        with self._lock:
+            self._seq += 1
+            data = {**data, "seq": self._seq}
+            self._buffer.append((self._seq, event, data, sid))
+            waiters, self._waiters = self._waiters, set()
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+
+        server_instance = server.PromptServer.instance
+        if not server_instance:
+            return
+        server_instance.send_sync(event, data, sid)
+        self._log.info("CozyGen: sent event=%s merged=%d recipient=%s", event, merged, sid or "all")
+
+    @property
+    def latest_seq(self):
+        return self._seq
+
+    def events_since(self, since, client_id=None):
+        """Returns ``(events, complete)`` for the events after sequence number ``since``.
+
+        Only events sent to ``client_id`` or to everyone are included.
+        ``complete`` is False when some of the events after ``since`` have
+        already been dropped from the buffer.
+        """
+        with self._lock:
+            missed = []
+            # Walk back from the newest event, so this costs O(events missed)
+            for seq, event, data, sid in reversed(self._buffer):
+                if seq <= since:
+                    break
+                if sid is None or sid == client_id:
+                    missed.append({"seq": seq, "type": event, "data": data})
+            oldest = self._buffer[0][0] if self._buffer else self._seq + 1
+        missed.reverse()
+        return missed, since >= oldest - 1
+
+    async def wait_for_events(self, since, client_id=None, timeout=0.0):
+        """Like :meth:`events_since`, but waits up to ``timeout`` seconds for a new event."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            seen = self._seq
+            events, complete = self.events_since(since, client_id)
+            remaining = deadline - loop.time()
+            if events or not complete or remaining <= 0:
+                return events, complete
+            future = loop.create_future()
+            waiter = (loop, future)
+            with self._lock:
+                if self._seq != seen:
+                    continue  # Something arrived since we looked
+                self._waiters.add(waiter)
+            try:
+                await asyncio.wait_for(future, remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    self._waiters.discard(waiter)
+
+
+def _wake(future):
+    if not future.done():
+        future.set_result(None)
+
+
+result_events = ResultEvents(
+    broadcast=os.environ.get("COZYGEN_BROADCAST_RESULTS", "0").lower() in ("1", "true", "yes"),
+    coalesce_window=float(os.environ.get("COZYGEN_EVENT_COALESCE_MS", "50")) / 1000,
+    log_interval=float(os.environ.get("COZYGEN_EVENT_LOG_INTERVAL", "10")),
+    buffer_size=int(os.environ.get("COZYGEN_EVENT_BUFFER", "256")),
+)
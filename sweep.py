@@ -0,0 +1,105 @@
+import json
+import math
+import random
+import itertools
+
+# Range used for random values when neither the axis nor the input node sets
+# one; the web UI's randomize toggle falls back to the same bounds.
+DEFAULT_RANDOM_MIN = 0
+DEFAULT_RANDOM_MAX = 1000000
+
+
+class SweepError(ValueError):
+    pass
+
+
+def _range_values(spec, max_values):
+    try:
+        start, stop, step = spec["start"], spec["stop"], spec.get("step", 1)
+    except (KeyError, TypeError):
+        raise SweepError("A range needs 'start' and 'stop' (and optionally 'step')")
+    if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in (start, stop, step)):
+        raise SweepError("Range 'start', 'stop' and 'step' must be numbers")
+    if step == 0 or (stop - start) * step < 0:
+        raise SweepError("Range 'step' must be non-zero and point from 'start' towards 'stop'")
+    # 'stop' is inclusive; the epsilon keeps 0.1-style float steps from losing the last value
+    count = math.floor((stop - start) / step + 1e-9) + 1
+    if count > max_values:
+        raise SweepError(f"The range has {count} values, more than the limit of {max_values}")
+    if all(isinstance(v, int) for v in (start, stop, step)):
+        return [start + i * step for i in range(count)]
+    return [round(start + i * step, 10) for i in range(count)]
+
+
+def _random_values(spec, node_inputs, max_values):
+    count = spec.get("count", 1)
+    if not isinstance(count, int) or count < 1:
+        raise SweepError("Random 'count' must be a positive integer")
+    if count > max_values:
+        raise SweepError(f"Random 'count' is more than the limit of {max_values}")
+    low = spec.get("min", node_inputs.get("min_value") or DEFAULT_RANDOM_MIN)
+    high = spec.get("max", node_inputs.get("max_value") or DEFAULT_RANDOM_MAX)
+    if high < low:
+        raise SweepError("Random 'max' must not be below 'min'")
+    # The same base seed always produces the same values, so a sweep can be re-run
+    rng = random.Random(spec.get("base_seed"))
+    if node_inputs.get("param_type") == "FLOAT" or isinstance(low, float) or isinstance(high, float):
+        return [rng.uniform(low, high) for _ in range(count)]
+    return [rng.randint(int(low), int(high)) for _ in range(count)]
+
+
+def axis_values(axis, node_inputs, max_values):
+    """Returns the list of values of one sweep axis, at most ``max_values`` of them.
+
+    An axis has exactly one of ``values`` (an explicit list), ``range``
+    (``{"start", "stop", "step"}``, stop inclusive) or ``random``
+    (``{"count", "base_seed", "min", "max"}``).
+    """
+    kinds = [kind for kind in ("values", "range", "random") if kind in axis]
+    if len(kinds) != 1:
+        raise SweepError(f"Axis '{axis.get('param')}' needs exactly one of 'values', 'range' or 'random'")
+    if kinds[0] == "values":
+        if not isinstance(axis["values"], list) or not axis["values"]:
+            raise SweepError(f"Axis '{axis.get('param')}' needs a non-empty 'values' list")
+        return axis["values"]
+    if kinds[0] == "range":
+        return _range_values(axis["range"], max_values)
+    if not isinstance(axis["random"], dict):
+        raise SweepError(f"Axis '{axis.get('param')}': 'random' must be an object")
+    return _random_values(axis["random"], node_inputs, max_values)
+
+
+def expand_sweep(compiled, axes, max_variants):
+    """Expands sweep ``axes`` over ``compiled``'s inputs.
+
+    Returns ``(variants, duplicates)``: the value dicts of the cartesian
+    product of the axes in the order given, and how many repeated
+    combinations were dropped. Raises SweepError for unknown parameters or
+    when the sweep would exceed ``max_variants``.
+    """
+    if not isinstance(axes, list) or not axes:
+        raise SweepError("'axes' must be a non-empty list")
+    inputs_by_param = {param_name: compiled.workflow[node_id].get('inputs', {})
+                       for node_id, _, param_name in compiled.input_nodes}
+
+    params = []
+    value_lists = []
+    requested = 1
+    for axis in axes:
+        param = axis.get("param") if isinstance(axis, dict) else None
+        if param not in inputs_by_param:
+            raise SweepError(f"Unknown sweep parameter: {param!r}")
+        if param in params:
+            raise SweepError(f"Parameter '{param}' appears in more than one axis")
+        params.append(param)
+        # Each parameter is on one axis, so repeated values within an axis are
+        # the only source of duplicate combinations
+        values = axis_values(axis, inputs_by_param[param], max_variants)
+        requested *= len(values)
+        value_lists.append(list({json.dumps(v, sort_keys=True): v for v in values}.values()))
+
+    total = math.prod(len(values) for values in value_lists)
+    if total > max_variants:
+        raise SweepError(f"The sweep has {total} variants, more than the limit of {max_variants}")
+    variants = [dict(zip(params, combination)) for combination in itertools.product(*value_lists)]
+    return variants, requested - total
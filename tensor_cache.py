@@ -0,0 +1,77 @@
+import os
+import threading
+import collections
+
+from . import metrics
+
+
+def tensor_cache_key(path, *variant):
+    """Returns a key identifying the current content of ``path``, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return ":".join([os.path.abspath(path), str(st.st_mtime_ns), str(st.st_size)] + [str(v) for v in variant])
+
+
+def _tensors_nbytes(tensors):
+    return sum(t.element_size() * t.nelement() for t in tensors)
+
+
+class TensorCache:
+    """Process-wide LRU of decoded tensors, bounded by their total size in bytes.
+
+    Values are tuples of tensors (e.g. ``(image, mask)``). Nodes must treat
+    them as read-only, the same as any other cached ComfyUI output.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = collections.OrderedDict()  # key -> (tensors, nbytes), oldest first
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, tensors):
+        nbytes = _tensors_nbytes(tensors)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+            self._entries[key] = (tensors, nbytes)
+            self._total_bytes += nbytes
+            while self._total_bytes > self.max_bytes:
+                _, (_, old_nbytes) = self._entries.popitem(last=False)
+                self._total_bytes -= old_nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._total_bytes, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses}
+
+
+tensor_cache = TensorCache(
+    max_bytes=int(float(os.environ.get("COZYGEN_TENSOR_CACHE_MB", "512")) * 1024 * 1024),
+)
+
+metrics.registry.callback("cozygen_tensor_cache_hits_total", "CozyGen image and video input loads served from the tensor cache.", lambda: tensor_cache.hits, "counter")
+metrics.registry.callback("cozygen_tensor_cache_misses_total", "CozyGen image and video input loads that decoded the file.", lambda: tensor_cache.misses, "counter")
+metrics.registry.callback("cozygen_tensor_cache_bytes", "Size of the decoded tensors in the tensor cache.", lambda: tensor_cache.stats()["bytes"])
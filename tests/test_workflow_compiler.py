@@ -0,0 +1,190 @@
+"""Pins the server-side prompt compiler to the bypass and injection logic the
+web UI used to run in MainPage.jsx before /cozygen/generate existed."""
+import importlib.util
+import os
+
+import pytest
+
+# workflow_compiler has no ComfyUI imports, so it loads without the package
+_spec = importlib.util.spec_from_file_location(
+    "cozygen_workflow_compiler", os.path.join(os.path.dirname(__file__), os.pardir, "workflow_compiler.py"))
+workflow_compiler = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(workflow_compiler)
+CompiledWorkflow = workflow_compiler.CompiledWorkflow
+WorkflowCompileError = workflow_compiler.WorkflowCompileError
+
+
+def node(class_type, **inputs):
+    return {"class_type": class_type, "inputs": inputs}
+
+
+def choice(param_name, priority=0):
+    return node("CozyGenChoiceInput", param_name=param_name, priority=priority, choice_type="loras", value="a.safetensors")
+
+
+def lora(model, clip, lora_name):
+    return node("LoraLoader", model=model, clip=clip, lora_name=lora_name, strength_model=1.0, strength_clip=1.0)
+
+
+def sampler(model, positive=None):
+    inputs = {"model": model, "seed": 1}
+    if positive is not None:
+        inputs["positive"] = positive
+    return node("KSampler", **inputs)
+
+
+def lora_workflow():
+    # checkpoint -> LoRA (name from a choice input) -> sampler and text encoder
+    return {
+        "1": node("CheckpointLoaderSimple", ckpt_name="m.safetensors"),
+        "3": lora(["1", 0], ["1", 1], ["10", 0]),
+        "5": sampler(["3", 0], positive=["6", 0]),
+        "6": node("CLIPTextEncode", clip=["3", 1], text="cat"),
+        "10": choice("Lora"),
+    }
+
+
+def test_no_bypass_returns_copy_with_values():
+    workflow = lora_workflow()
+    prompt = CompiledWorkflow(workflow).compile({"Lora": "b.safetensors"})
+    assert prompt["10"]["inputs"]["value"] == "b.safetensors"
+    assert set(prompt) == set(workflow)
+    # The cached workflow is never modified
+    assert workflow["10"]["inputs"]["value"] == "a.safetensors"
+
+
+def test_bypass_rewires_consumers_past_target():
+    prompt = CompiledWorkflow(lora_workflow()).compile({}, {"Lora": True})
+    assert sorted(prompt) == ["1", "5", "6"]
+    assert prompt["5"]["inputs"]["model"] == ["1", 0]
+    # The upstream link is copied as is, output slot included
+    assert prompt["6"]["inputs"]["clip"] == ["1", 1]
+
+
+def test_bypass_false_keeps_nodes():
+    prompt = CompiledWorkflow(lora_workflow()).compile({}, {"Lora": False})
+    assert "3" in prompt and "10" in prompt
+
+
+def test_bypassed_target_with_several_consumers():
+    workflow = lora_workflow()
+    workflow["7"] = sampler(["3", 0])
+    workflow["8"] = node("ModelSamplingFlux", model=["3", 0])
+    prompt = CompiledWorkflow(workflow).compile({}, {"Lora": True})
+    assert prompt["5"]["inputs"]["model"] == ["1", 0]
+    assert prompt["7"]["inputs"]["model"] == ["1", 0]
+    assert prompt["8"]["inputs"]["model"] == ["1", 0]
+
+
+@pytest.mark.parametrize("priorities", [(0, 1), (1, 0)])
+def test_chained_bypasses(priorities):
+    # checkpoint -> LoRA A -> LoRA B -> sampler, both LoRAs bypassed, in either order
+    workflow = {
+        "1": node("CheckpointLoaderSimple", ckpt_name="m.safetensors"),
+        "3": lora(["1", 0], ["1", 1], ["10", 0]),
+        "4": lora(["3", 0], ["3", 1], ["11", 0]),
+        "5": sampler(["4", 0]),
+        "6": node("CLIPTextEncode", clip=["4", 1], text="cat"),
+        "10": choice("Lora A", priorities[0]),
+        "11": choice("Lora B", priorities[1]),
+    }
+    prompt = CompiledWorkflow(workflow).compile({}, {"Lora A": True, "Lora B": True})
+    assert sorted(prompt) == ["1", "5", "6"]
+    assert prompt["5"]["inputs"]["model"] == ["1", 0]
+    assert prompt["6"]["inputs"]["clip"] == ["1", 1]
+
+
+def test_bypass_middle_of_chain():
+    workflow = {
+        "1": node("CheckpointLoaderSimple", ckpt_name="m.safetensors"),
+        "3": lora(["1", 0], ["1", 1], ["10", 0]),
+        "4": lora(["3", 0], ["3", 1], ["11", 0]),
+        "5": sampler(["4", 0]),
+        "10": choice("Lora A"),
+        "11": choice("Lora B"),
+    }
+    prompt = CompiledWorkflow(workflow).compile({}, {"Lora A": True})
+    assert sorted(prompt) == ["1", "11", "4", "5"]
+    assert prompt["4"]["inputs"]["model"] == ["1", 0]
+    assert prompt["4"]["inputs"]["clip"] == ["1", 1]
+    assert prompt["5"]["inputs"]["model"] == ["4", 0]
+
+
+def test_consumer_input_without_matching_upstream_is_left_alone():
+    # The sampler reads the LoRA through "positive", which the LoRA has no
+    # upstream input for, so that link isn't rewired (as in the old UI code)
+    workflow = lora_workflow()
+    workflow["5"] = sampler(["3", 0], positive=["3", 1])
+    prompt = CompiledWorkflow(workflow).compile({}, {"Lora": True})
+    assert prompt["5"]["inputs"]["model"] == ["1", 0]
+    assert prompt["5"]["inputs"]["positive"] == ["3", 1]
+    assert "3" not in prompt
+
+
+def test_target_without_upstream_source_is_not_bypassed():
+    # Everything the target reads comes from CozyGen inputs: nothing to connect past it
+    workflow = {
+        "2": node("EmptyLatentImage", width=["10", 0], height=512),
+        "5": sampler(["9", 0], positive=["2", 0]),
+        "9": node("CheckpointLoaderSimple", ckpt_name="m.safetensors"),
+        "10": node("CozyGenDynamicInput", param_name="Width", priority=0, default_value=512),
+    }
+    prompt = CompiledWorkflow(workflow).compile({"Width": 768}, {"Width": True})
+    assert set(prompt) == set(workflow)
+    assert prompt["10"]["inputs"]["default_value"] == 768
+
+
+def test_input_without_consumer_is_not_bypassed():
+    workflow = lora_workflow()
+    workflow["11"] = choice("Unused", 1)
+    prompt = CompiledWorkflow(workflow).compile({}, {"Unused": True})
+    assert "11" in prompt
+
+
+def test_only_dynamic_and_choice_inputs_are_bypassable():
+    workflow = lora_workflow()
+    workflow["3"]["inputs"]["strength_model"] = ["12", 0]
+    workflow["12"] = node("CozyGenFloatInput", param_name="Strength", priority=1, default_value=1.0)
+    prompt = CompiledWorkflow(workflow).compile({}, {"Strength": True})
+    assert "3" in prompt and "12" in prompt
+
+
+def test_target_is_first_consumer_in_js_key_order():
+    # The choice feeds two nodes. Object.keys() puts integer-like ids first in
+    # ascending order, so "3" is the target although "12" was inserted first.
+    workflow = {
+        "1": node("CheckpointLoaderSimple", ckpt_name="m.safetensors"),
+        "12": lora(["1", 0], ["1", 1], ["10", 0]),
+        "3": lora(["1", 0], ["1", 1], ["10", 0]),
+        "5": sampler(["3", 0]),
+        "6": sampler(["12", 0]),
+        "10": choice("Lora"),
+    }
+    prompt = CompiledWorkflow(workflow).compile({}, {"Lora": True})
+    assert sorted(prompt) == ["1", "12", "5", "6"]
+    assert prompt["5"]["inputs"]["model"] == ["1", 0]
+    assert prompt["6"]["inputs"]["model"] == ["12", 0]
+
+
+def test_js_key_order():
+    ranks = workflow_compiler._js_key_order(["12", "b", "3", "07", "5:1", "1"])
+    assert sorted(ranks, key=ranks.__getitem__) == ["1", "3", "12", "b", "07", "5:1"]
+
+
+def test_inputs_are_listed_by_priority():
+    workflow = {
+        "4": node("CozyGenIntInput", param_name="Steps", priority=2, default_value=20),
+        "2": node("CozyGenStringInput", param_name="Prompt", priority=1, default_value=""),
+        "9": node("CozyGenImageInput", priority=3, image_filename=""),
+    }
+    compiled = CompiledWorkflow(workflow)
+    assert [param for _, _, param in compiled.input_nodes] == ["Prompt", "Steps", "Image Input"]
+
+
+def test_file_inputs_require_a_file():
+    workflow = {"9": node("CozyGenImageInput", param_name="Photo", priority=0, image_filename="")}
+    compiled = CompiledWorkflow(workflow)
+    with pytest.raises(WorkflowCompileError, match="Photo"):
+        compiled.compile({})
+    prompt = compiled.compile({"Photo": "abc.png"})
+    assert prompt["9"]["inputs"]["image_filename"] == "abc.png"
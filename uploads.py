@@ -0,0 +1,348 @@
+import os
+import re
+import json
+import time
+import asyncio
+import uuid
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from .output_writer import JPEG_MAX_EXIF_BYTES
+from . import metrics
+
+# Uploads are stored as <sha256><ext> in the input directory
+UPLOAD_NAME_RE = re.compile(r"^[0-9a-f]{64}(\.[a-z0-9]{1,5})?$")
+_EXTENSION_RE = re.compile(r"^\.[a-z0-9]{1,5}$")
+
+TEMP_PREFIX = ".cozygen_upload_"
+
+# A resumable upload is TEMP_PREFIX<id>.part, the bytes received so far, and
+# TEMP_PREFIX<id>.json, its declared name and size
+PART_SUFFIX = ".part"
+INFO_SUFFIX = ".json"
+_UPLOAD_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+
+# Suggested size of each appended chunk; a dropped chunk is resent from where it broke off
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Normalized uploads keep the format of these and become PNGs otherwise
+NORMALIZED_FORMATS = {"JPEG": ".jpg", "MPO": ".jpg", "WEBP": ".webp"}
+
+# Decoding and re-encoding full-size photos is CPU-bound; Pillow releases the
+# GIL while doing it, so a few run in parallel off the event loop
+normalize_pool = ThreadPoolExecutor(max_workers=int(os.environ.get("COZYGEN_UPLOAD_WORKERS", "2")),
+                                    thread_name_prefix="cozygen_upload")
+
+
+class UploadError(Exception):
+    def __init__(self, message, status=400, offset=None):
+        super().__init__(message)
+        self.status = status
+        self.offset = offset
+
+
+def upload_extension(filename):
+    """Returns the sanitized, lower-case extension of an uploaded file name."""
+    ext = os.path.splitext(os.path.basename(filename))[1].lower()
+    return ext if _EXTENSION_RE.match(ext) else ""
+
+
+def finalize_upload(tmp_path, digest, ext, input_dir):
+    """Moves a fully written temp file to its content-addressed name.
+
+    Returns ``(filename, deduplicated)``. When a file with the same content
+    already exists the temp file is dropped and the existing one is reused.
+    """
+    filename = f"{digest}{ext}"
+    final_path = os.path.join(input_dir, filename)
+    if os.path.exists(final_path):
+        os.remove(tmp_path)
+        # Mark it as recently used for the retention policy
+        os.utime(final_path)
+        return filename, True
+    os.replace(tmp_path, final_path)
+    return filename, False
+
+
+def normalize_upload(tmp_path, digest, ext, input_dir, max_side=0):
+    """Like finalize_upload, but applies the image's EXIF orientation and fits it within ``max_side`` first.
+
+    The result is named after the source's digest and ``max_side``, so the
+    same photo uploaded again with the same setting is deduplicated before
+    anything is decoded. Files that need no change, are animated or can't be
+    decoded are stored as they are.
+    """
+    from PIL import Image
+    try:
+        img = Image.open(tmp_path)
+    except (OSError, Image.DecompressionBombError):
+        return finalize_upload(tmp_path, digest, ext, input_dir)
+    with img:
+        # Most phone JPEGs are MPO files, where extra frames hold depth maps or
+        # previews and the first frame is the photo, so only real animations are skipped
+        if getattr(img, "is_animated", False) and img.format != "MPO":
+            return finalize_upload(tmp_path, digest, ext, input_dir)
+        try:
+            result = _normalize_image(img, digest, input_dir, max_side)
+        except (OSError, SyntaxError, ValueError, Image.DecompressionBombError):
+            # Pillow reads only the header on open; a truncated or corrupt
+            # file fails once its pixels or EXIF are decoded
+            result = None
+    if result is None:
+        return finalize_upload(tmp_path, digest, ext, input_dir)
+    os.remove(tmp_path)
+    return result
+
+
+def _normalize_image(img, digest, input_dir, max_side):
+    # Returns (filename, deduplicated) for the normalized copy of ``img``, or
+    # None if it is already upright and within ``max_side``.
+    from PIL import Image, ImageOps
+    width, height = img.size
+    scale = min(1.0, max_side / max(width, height)) if max_side > 0 else 1.0
+    if img.getexif().get(0x0112, 1) == 1 and scale == 1.0:
+        return None
+
+    normalized_ext = NORMALIZED_FORMATS.get(img.format, ".png")
+    filename = hashlib.sha256(f"{digest}:normalized:{max_side}".encode()).hexdigest() + normalized_ext
+    final_path = os.path.join(input_dir, filename)
+    if os.path.exists(final_path):
+        os.utime(final_path)
+        return filename, True
+
+    started = time.perf_counter()
+    icc_profile = img.info.get("icc_profile")
+    if scale < 1.0:
+        # Let the JPEG decoder skip most of the pixels (1/2 to 1/8 scale)
+        img.draft(None, (max(1, round(width * scale)), max(1, round(height * scale))))
+    img = ImageOps.exif_transpose(img)
+    if scale < 1.0:
+        if img.mode in ("1", "P"):
+            # Resizing palette images would fall back to nearest neighbour
+            img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+        img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+
+    save_options = {"icc_profile": icc_profile} if icc_profile else {}
+    if normalized_ext == ".jpg":
+        if img.mode not in ("RGB", "L", "CMYK"):
+            img = img.convert("RGB")
+        save_options.update(format="JPEG", quality=95)
+        exif_bytes = img.getexif().tobytes()
+        if len(exif_bytes) <= JPEG_MAX_EXIF_BYTES:
+            save_options["exif"] = exif_bytes
+    elif normalized_ext == ".webp":
+        save_options.update(format="WEBP", quality=95, method=4)
+    else:
+        # Inputs are read once per change; favour a quick encode over a small file
+        save_options.update(format="PNG", compress_level=1)
+    out_path = os.path.join(input_dir, f"{TEMP_PREFIX}{uuid.uuid4().hex}.tmp")
+    try:
+        img.save(out_path, **save_options)
+        os.replace(out_path, final_path)
+    except BaseException:
+        if os.path.exists(out_path):
+            os.remove(out_path)
+        raise
+    metrics.upload_normalize_seconds.observe(time.perf_counter() - started)
+    return filename, False
+
+
+def hash_file(path, chunk_size=1024 * 1024):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class PartialUploads:
+    """Resumable uploads, received in chunks into the input directory.
+
+    The length of an upload's part file is its offset, so it can resume
+    where it stopped after a dropped connection or a server restart.
+    Uploads that receive nothing for ``expiry_seconds`` are deleted.
+    """
+
+    def __init__(self, expiry_seconds):
+        self.expiry_seconds = expiry_seconds
+        # upload_id -> (sha256 of the bytes received so far, their length);
+        # lost on restart, in which case finalize hashes the file instead
+        self._hashes = {}
+        # Uploads a request is appending to or finalizing right now
+        self._busy = set()
+        self._last_expiry = 0.0
+
+    def _paths(self, input_dir, upload_id):
+        if not _UPLOAD_ID_RE.match(upload_id):
+            return None
+        base = os.path.join(input_dir, TEMP_PREFIX + upload_id)
+        return base + PART_SUFFIX, base + INFO_SUFFIX
+
+    def create(self, input_dir, filename, size):
+        """Starts an upload of ``size`` bytes and returns its id."""
+        upload_id = uuid.uuid4().hex
+        part_path, info_path = self._paths(input_dir, upload_id)
+        with open(info_path, "w", encoding="utf-8") as f:
+            json.dump({"filename": os.path.basename(filename), "size": size}, f)
+        open(part_path, "wb").close()
+        self._hashes[upload_id] = (hashlib.sha256(), 0)
+        return upload_id
+
+    def status(self, input_dir, upload_id):
+        """Returns the upload's ``{"filename", "size", "offset"}``, or None if it is unknown or expired."""
+        paths = self._paths(input_dir, upload_id)
+        if paths is None:
+            return None
+        part_path, info_path = paths
+        try:
+            with open(info_path, encoding="utf-8") as f:
+                info = json.load(f)
+            info["offset"] = os.path.getsize(part_path)
+        except (OSError, ValueError):
+            return None
+        return info
+
+    def _claim(self, input_dir, upload_id):
+        info = self.status(input_dir, upload_id)
+        if info is None:
+            raise UploadError("Unknown or expired upload", status=404)
+        if upload_id in self._busy:
+            raise UploadError("Another request is writing to this upload", status=423, offset=info["offset"])
+        self._busy.add(upload_id)
+        return info
+
+    async def append(self, input_dir, upload_id, offset, stream, on_chunk=None):
+        """Appends the body ``stream`` (an aiohttp StreamReader) at ``offset`` and returns the new offset.
+
+        Whatever arrives before the connection drops is kept, so the client
+        asks for the status and resends from there.
+        """
+        info = self._claim(input_dir, upload_id)
+        try:
+            current = info["offset"]
+            if offset != current:
+                raise UploadError("Offset does not match the bytes received", status=409, offset=current)
+            hasher, hashed = self._hashes.get(upload_id, (None, None))
+            if hashed != current:
+                hasher = hashlib.sha256() if current == 0 else None
+            part_path, _ = self._paths(input_dir, upload_id)
+            with open(part_path, "ab") as f:
+                async for chunk in stream.iter_chunked(256 * 1024):
+                    if current + len(chunk) > info["size"]:
+                        raise UploadError("Chunk goes past the declared size", status=413, offset=current)
+                    f.write(chunk)
+                    current += len(chunk)
+                    if hasher is not None:
+                        hasher.update(chunk)
+                        self._hashes[upload_id] = (hasher, current)
+                    if on_chunk is not None:
+                        on_chunk(len(chunk))
+            return current
+        finally:
+            self._busy.discard(upload_id)
+
+    async def finalize(self, input_dir, upload_id, normalize=False, max_side=0):
+        """Stores a complete upload like a single-request one and returns ``(filename, deduplicated)``.
+
+        Hashing leftovers and normalizing run on ``normalize_pool``.
+        """
+        info = self._claim(input_dir, upload_id)
+        try:
+            if info["offset"] != info["size"]:
+                raise UploadError("Upload is incomplete", status=409, offset=info["offset"])
+            part_path, info_path = self._paths(input_dir, upload_id)
+            hasher, hashed = self._hashes.get(upload_id, (None, None))
+            digest = hasher.hexdigest() if hashed == info["size"] else None
+            ext = upload_extension(info["filename"])
+
+            def store():
+                file_digest = digest or hash_file(part_path)
+                if normalize:
+                    return normalize_upload(part_path, file_digest, ext, input_dir, max_side)
+                return finalize_upload(part_path, file_digest, ext, input_dir)
+            result = await asyncio.get_running_loop().run_in_executor(normalize_pool, store)
+            os.remove(info_path)
+            self._hashes.pop(upload_id, None)
+            return result
+        finally:
+            self._busy.discard(upload_id)
+
+    def cancel(self, input_dir, upload_id):
+        """Deletes an upload. Returns False if it was unknown."""
+        paths = self._paths(input_dir, upload_id)
+        if paths is None or upload_id in self._busy:
+            return False
+        self._hashes.pop(upload_id, None)
+        found = False
+        for path in paths:
+            try:
+                os.remove(path)
+                found = True
+            except FileNotFoundError:
+                pass
+        return found
+
+    def expire(self, input_dir, force=False):
+        """Deletes uploads, and temp files of interrupted ones, idle for ``expiry_seconds``.
+
+        Runs at most every tenth of ``expiry_seconds`` unless ``force`` is
+        set. Returns the number of files removed.
+        """
+        now = time.time()
+        if not force and now - self._last_expiry < self.expiry_seconds / 10:
+            return 0
+        self._last_expiry = now
+        with os.scandir(input_dir) as it:
+            mtimes = {entry.name: entry.stat().st_mtime for entry in it if entry.name.startswith(TEMP_PREFIX)}
+        removed = 0
+        for name, mtime in mtimes.items():
+            if name.endswith(INFO_SUFFIX):
+                # An upload is as old as the last write to its part file
+                mtime = mtimes.get(name[:-len(INFO_SUFFIX)] + PART_SUFFIX, mtime)
+            upload_id = name[len(TEMP_PREFIX):].rsplit(".", 1)[0]
+            if now - mtime <= self.expiry_seconds or upload_id in self._busy:
+                continue
+            try:
+                os.remove(os.path.join(input_dir, name))
+                removed += 1
+            except FileNotFoundError:
+                pass
+            self._hashes.pop(upload_id, None)
+        return removed
+
+
+partial_uploads = PartialUploads(
+    expiry_seconds=float(os.environ.get("COZYGEN_UPLOAD_EXPIRY_HOURS", "24")) * 3600,
+)
+
+
+def enforce_upload_budget(input_dir, max_bytes, keep=()):
+    """Deletes the least recently used uploads until they fit in ``max_bytes``.
+
+    Only content-addressed uploads are considered; other files in the input
+    directory are never touched.
+    """
+    uploads = []
+    total = 0
+    with os.scandir(input_dir) as it:
+        for entry in it:
+            if UPLOAD_NAME_RE.match(entry.name) and entry.is_file():
+                st = entry.stat()
+                uploads.append((st.st_mtime, entry.name, st.st_size))
+                total += st.st_size
+    if total <= max_bytes:
+        return []
+
+    removed = []
+    for _, name, size in sorted(uploads):
+        if total <= max_bytes:
+            break
+        if name in keep:
+            continue
+        try:
+            os.remove(os.path.join(input_dir, name))
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed.append(name)
+    return removed
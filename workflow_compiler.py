@@ -0,0 +1,182 @@
+import os
+import json
+import threading
+
+# Node types the web UI builds form controls for
+COZYGEN_INPUT_TYPES = (
+    'CozyGenDynamicInput',
+    'CozyGenImageInput',
+    'CozyGenVideoInput',
+    'CozyGenFloatInput',
+    'CozyGenIntInput',
+    'CozyGenStringInput',
+    'CozyGenChoiceInput',
+)
+
+# Inputs whose downstream node can be bypassed from the web UI
+BYPASSABLE_INPUT_TYPES = ('CozyGenDynamicInput', 'CozyGenChoiceInput')
+
+# File inputs: the node input that receives the chosen file, and the name
+# the web UI shows when the node has no param_name
+FILE_INPUT_FIELDS = {
+    'CozyGenImageInput': ('image_filename', "Image Input"),
+    'CozyGenVideoInput': ('video_filename', "Video Input"),
+}
+
+# Which node input receives the value chosen in the web UI
+VALUE_INPUT_FIELDS = {
+    'CozyGenDynamicInput': 'default_value',
+    'CozyGenFloatInput': 'default_value',
+    'CozyGenIntInput': 'default_value',
+    'CozyGenStringInput': 'default_value',
+    'CozyGenChoiceInput': 'value',
+}
+
+
+class WorkflowCompileError(ValueError):
+    pass
+
+
+def _is_link(value):
+    return isinstance(value, list) and len(value) == 2
+
+
+def _js_key_order(node_ids):
+    # Object.keys() order in the browser: integer-like keys ascending, then the
+    # rest in insertion order. The compiled prompt matches the old client-side
+    # code exactly, which relied on that order.
+    ranks = {}
+    integer_ids = sorted((int(node_id), node_id) for node_id in node_ids if node_id.isdigit() and str(int(node_id)) == node_id)
+    for rank, (_, node_id) in enumerate(integer_ids):
+        ranks[node_id] = rank
+    for node_id in node_ids:
+        if node_id not in ranks:
+            ranks[node_id] = len(ranks)
+    return ranks
+
+
+class CompiledWorkflow:
+    """An API-format workflow plus the indexes needed to turn it into a prompt.
+
+    ``consumers`` maps every node id to the ``(node_id, input_name)`` pairs
+    linked to it, so bypassing a node costs O(its connections) instead of a
+    scan of the whole graph.
+    """
+
+    def __init__(self, workflow, etag=None):
+        self.workflow = workflow
+        # Identifies this version of the workflow file for HTTP revalidation
+        self.etag = etag
+        self._body = None
+        self.ranks = _js_key_order(list(workflow))
+        self.consumers = {}
+        for node_id, node in workflow.items():
+            for input_name, value in node.get('inputs', {}).items():
+                if _is_link(value):
+                    self.consumers.setdefault(value[0], {})[(node_id, input_name)] = None
+
+        # CozyGen input nodes in the order the web UI lists them (by priority)
+        input_nodes = []
+        for node_id in sorted(workflow, key=self.ranks.__getitem__):
+            node = workflow[node_id]
+            class_type = node.get('class_type')
+            if class_type not in COZYGEN_INPUT_TYPES:
+                continue
+            inputs = node.get('inputs', {})
+            param_name = inputs.get('param_name')
+            if class_type in FILE_INPUT_FIELDS and not param_name:
+                param_name = FILE_INPUT_FIELDS[class_type][1]
+            input_nodes.append((node_id, class_type, param_name, inputs.get('priority') or 0))
+        input_nodes.sort(key=lambda n: n[3])
+        self.input_nodes = [(node_id, class_type, param_name) for node_id, class_type, param_name, _ in input_nodes]
+
+    @property
+    def body(self):
+        """The workflow serialized as JSON, encoded once per version of the file."""
+        if self._body is None:
+            self._body = json.dumps(self.workflow).encode('utf-8')
+        return self._body
+
+    def compile(self, values, bypass=None):
+        """Returns an executable prompt with ``values`` injected and ``bypass`` applied.
+
+        ``values`` maps param_name to the value to use (file names for image
+        and video inputs). ``bypass`` maps param_name to True for Dynamic/Choice
+        inputs whose target node (e.g. a LoRA loader) should be skipped.
+        """
+        bypass = bypass or {}
+        # Nodes are shallow-copied with their inputs; the workflow itself is never modified
+        prompt = {node_id: {**node, 'inputs': dict(node.get('inputs', {}))} for node_id, node in self.workflow.items()}
+        consumers = {source_id: dict(links) for source_id, links in self.consumers.items()}
+
+        for node_id, class_type, param_name in self.input_nodes:
+            if class_type in BYPASSABLE_INPUT_TYPES and bypass.get(param_name):
+                self._bypass(prompt, consumers, node_id)
+
+        for node_id, class_type, param_name in self.input_nodes:
+            if class_type in FILE_INPUT_FIELDS:
+                filename = values.get(param_name)
+                if not filename:
+                    kind = "a video" if class_type == 'CozyGenVideoInput' else "an image"
+                    raise WorkflowCompileError(f'Please upload {kind} for "{param_name}" before generating.')
+                if node_id in prompt:
+                    prompt[node_id]['inputs'][FILE_INPUT_FIELDS[class_type][0]] = filename
+            elif node_id in prompt and param_name in values:
+                prompt[node_id]['inputs'][VALUE_INPUT_FIELDS[class_type]] = values[param_name]
+
+        return prompt
+
+    def _bypass(self, prompt, consumers, node_id):
+        # The node the CozyGen input feeds (e.g. a LoraLoader)
+        linked = [consumer_id for consumer_id, _ in consumers.get(node_id, ()) if consumer_id in prompt]
+        if not linked:
+            return
+        target_id = min(linked, key=self.ranks.__getitem__)
+        target = prompt[target_id]
+
+        # The target's "real" upstream inputs, which we connect past it
+        upstream_sources = {}
+        for input_name, value in target['inputs'].items():
+            if _is_link(value) and value[0] in prompt and prompt[value[0]].get('class_type') not in BYPASSABLE_INPUT_TYPES:
+                upstream_sources[input_name] = value
+        if not upstream_sources:
+            return
+
+        # Rewire everything fed by the target to the upstream source of the same input name
+        for consumer in list(consumers.get(target_id, ())):
+            consumer_id, input_name = consumer
+            upstream_source = upstream_sources.get(input_name)
+            if upstream_source:
+                prompt[consumer_id]['inputs'][input_name] = upstream_source
+                del consumers[target_id][consumer]
+                consumers.setdefault(upstream_source[0], {})[consumer] = None
+
+        self._remove_node(prompt, consumers, target_id)
+        self._remove_node(prompt, consumers, node_id)
+
+    @staticmethod
+    def _remove_node(prompt, consumers, node_id):
+        node = prompt.pop(node_id, None)
+        if node is None:
+            return
+        for input_name, value in node['inputs'].items():
+            if _is_link(value) and value[0] in consumers:
+                consumers[value[0]].pop((node_id, input_name), None)
+
+
+_compiled_workflows = {}  # path -> (mtime_ns, size, CompiledWorkflow)
+_compiled_lock = threading.Lock()
+
+
+def load_compiled_workflow(path):
+    """Returns the CompiledWorkflow for a workflow file, reparsing it only when it changes."""
+    st = os.stat(path)
+    with _compiled_lock:
+        cached = _compiled_workflows.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+    with open(path, 'r', encoding='utf-8') as f:
+        compiled = CompiledWorkflow(json.load(f), etag=f'"{st.st_mtime_ns:x}-{st.st_size:x}"')
+    with _compiled_lock:
+        _compiled_workflows[path] = (st.st_mtime_ns, st.st_size, compiled)
+    return compiled